@@ -523,6 +523,255 @@ def calculate_401K(max_income: int, annual_contribution: int, growth_range: Tupl
 
     return retirement_yr, brokerage_yr, roth_yr, trad_yr, missed_from_taxes, tot_trad_taxes_yr
 
+
+######################################################################
+# Monte Carlo: every path (and every scenario of a grid) at once, as numpy arrays
+
+MC_PATHS = 10000
+MC_SEED = 401
+# Annual return draws, as weighted_returns()
+MC_MU = 0.06
+MC_SIGMA = 0.12
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def tax_on_incomes(incomes, tax_year: int = 1) -> np.ndarray:
+    """ total tax of each income (get_tax_on_income on an array of incomes)
+
+    Tax is piecewise linear in income, so it interpolates between the taxes at the thresholds
+    """
+    thresholds = np.array([0.0] + [thresh for thresh, _ in TAX_TABLE[tax_year]])
+    rates = np.array([rate for _, rate in TAX_TABLE[tax_year]])
+    bracket_taxes = np.concatenate(([0.0], np.cumsum(np.diff(thresholds) * rates)))
+    return np.interp(np.asarray(incomes, dtype=float), thresholds, bracket_taxes, left=0.0)
+
+
+def percentile_bands(values: np.ndarray, percentiles: tuple = PERCENTILES) -> dict:
+    """ {percentile: values at each step} over the paths (second to last axis) """
+    bands = np.percentile(values, percentiles, axis=-2)
+    return dict(zip(percentiles, bands))
+
+
+def grow_balances(growth: np.ndarray, contributions: np.ndarray) -> np.ndarray:
+    """ balances from 0.0 with b[i + 1] = b[i] * growth[i] + contributions[i], along the last axis
+
+    Closed form of the recursion: b[i + 1] = G[i] * sum(c[s] / G[s], s <= i), G = cumprod(growth)
+    """
+    cumulative = np.cumprod(growth, axis=-1)
+    balances = cumulative * np.cumsum(contributions / cumulative, axis=-1)
+    return np.concatenate((np.zeros(balances.shape[:-1] + (1,)), balances), axis=-1)
+
+
+def monte_carlo_ruth_vs_dale(paths: int = MC_PATHS, seed: int = MC_SEED, mu: float = MC_MU,
+                             sigma: float = MC_SIGMA) -> dict:
+    """ stochastic_basic over many paths (sigma=0.0 is basic_ruth_vs_dale_adjusted(mu))
+
+    Returns: 'age', 'ruth' & 'dale' (paths x months + 1), 'crossover' age of each path (nan: never)
+    """
+    months = 12 * 42
+    rng = np.random.default_rng(seed)
+    growth = 1.0 + rng.normal(mu, sigma, (paths, months)) / 12.0
+
+    ruth_contrib = np.where(np.arange(months) < 120, ANNUAL_CONTRIBUTION / 12.0, 0.0)
+    dale_contrib = ANNUAL_CONTRIBUTION / 12.0 - ruth_contrib
+    ruth = grow_balances(growth, ruth_contrib)
+    dale = grow_balances(growth, dale_contrib)
+
+    age = np.concatenate(([START_AGE], START_AGE + np.arange(months) / 12.0))
+    ahead = dale[:, 1:] > ruth[:, 1:]
+    crossover = np.where(
+        np.any(ahead, axis=1), np.round(age[1 + np.argmax(ahead, axis=1)], 1), np.nan)
+
+    return {'age': age, 'ruth': ruth, 'dale': dale, 'crossover': crossover}
+
+
+def monte_carlo_401K(max_income: int, annual_contribution, growth_range: Tuple[float, float],
+                     annual_withdrawal, **kwargs) -> dict:
+    """ calculate_401K over many paths of random growth, and over grids of scenarios at once
+
+    annual_contribution, annual_withdrawal, and roth_ratio broadcast against each other, so a
+    grid of scenarios (e.g. contributions[:, None] and ratios[None, :]) runs as one simulation.
+    Every scenario sees the same growth paths. Each year's growth is growth_curve (growth_range[1]
+    once retired) plus a normal draw of 'sigma'; sigma=0.0 is deterministic.
+
+    Each retirement year withdraws gap_withdrawal_calc, split by the mix ratio; from RMD_AGE the
+    traditional withdrawal is at least its RMD (balance / life expectancy), the excess deposited
+    in the brokerage. A short account is covered by the other, then by the brokerage. Traditional
+    withdrawals are taxed as the year's income, paid from the traditional account, then the
+    brokerage; brokerage withdrawals are taxed as well.
+
+    Returns: dict of 'age' and (scenarios..., paths, years) arrays: 'combined', 'brokerage',
+             'roth', 'traditional', 'missed' (missed_roth_gains), 'taxes' (total_traditional_taxes)
+    """
+    # pylint: disable=too-many-locals
+    years_worked = kwargs.get('years_worked', 43)
+    roth_ratio = np.asarray(kwargs.get('roth_ratio', 0.5), dtype=float)
+    paths = kwargs.get('paths', MC_PATHS)
+    seed = kwargs.get('seed', MC_SEED)
+    sigma = kwargs.get('sigma', MC_SIGMA)
+
+    contribution = np.asarray(annual_contribution, dtype=float)
+    withdrawal_base = np.asarray(annual_withdrawal, dtype=float)
+    shape = np.broadcast(contribution, withdrawal_base, roth_ratio).shape + (paths,)
+    contribution, withdrawal_base, roth_ratio = (
+        np.broadcast_to(value[..., None], shape) for value in np.broadcast_arrays(
+            contribution, withdrawal_base, roth_ratio))
+
+    gap_years = max(RMD_AGE - (years_worked + int(START_AGE)), 0)
+    years = years_worked + gap_years + len(RMD_LIFE_EXP)
+    curve = growth_curve(growth_range[0], growth_range[1], years_worked)
+    mean_growth = np.array(curve + [curve[-1]] * (years - years_worked))
+    rng = np.random.default_rng(seed)
+    growth = 1.0 + mean_growth + rng.normal(0.0, sigma, (paths, years))
+
+    # Roth contributions are taxed as income, and those taxes miss the market's gains
+    roth_contrib = roth_ratio * contribution
+    trad_contrib = contribution - roth_contrib
+    working = growth[:, :years_worked]
+    roth_in = np.broadcast_to(roth_contrib[..., None], shape + (years_worked,))
+    trad_in = np.broadcast_to(trad_contrib[..., None], shape + (years_worked,))
+    missed_in = np.broadcast_to(tax_on_incomes(roth_contrib)[..., None], roth_in.shape)
+    roth_yr = grow_balances(working, roth_in * working)[..., 1:]
+    trad_yr = grow_balances(working, trad_in * working)[..., 1:]
+    missed_yr = grow_balances(working, missed_in * working)[..., 1:]
+
+    roth = roth_yr[..., -1].copy()
+    trad = trad_yr[..., -1].copy()
+    missed = missed_yr[..., -1]
+    brokerage = np.zeros(shape)
+    taxes = np.zeros(shape)
+
+    retired = {key: [] for key in ('roth', 'traditional', 'brokerage', 'taxes')}
+    for retired_year in range(years - years_worked):
+        inflation = 1.0 + 0.03 * retired_year
+        withdrawal = np.maximum((roth + trad) * 0.04 * inflation, withdrawal_base * inflation)
+        want_roth = withdrawal * roth_ratio
+        want_trad = withdrawal - want_roth
+
+        rmd_year = retired_year - gap_years
+        if rmd_year >= 0:
+            want_trad = np.maximum(want_trad, trad / RMD_LIFE_EXP[rmd_year])
+
+        from_trad = np.minimum(trad, want_trad)
+        from_roth = np.minimum(roth, want_roth)
+        shortfall = np.maximum(withdrawal - from_trad - from_roth, 0.0)
+        deposit = np.maximum(from_trad + from_roth - withdrawal, 0.0)
+
+        extra = np.minimum(roth - from_roth, shortfall)
+        from_roth += extra
+        shortfall -= extra
+        extra = np.minimum(trad - from_trad, shortfall)
+        from_trad += extra
+        shortfall -= extra
+
+        roth -= from_roth
+        trad -= from_trad
+        tax = tax_on_incomes(from_trad)
+        tax_from_trad = np.minimum(trad, tax)
+        trad -= tax_from_trad
+
+        brokerage_tax = tax_on_incomes(shortfall)
+        brokerage = np.maximum(
+            brokerage + deposit - shortfall - brokerage_tax - (tax - tax_from_trad), 0.0)
+        taxes += tax + brokerage_tax
+
+        roth *= growth[:, years_worked + retired_year]
+        trad *= growth[:, years_worked + retired_year]
+        brokerage *= growth[:, years_worked + retired_year]
+
+        retired['roth'].append(roth.copy())
+        retired['traditional'].append(trad.copy())
+        retired['brokerage'].append(brokerage.copy())
+        retired['taxes'].append(taxes.copy())
+
+    content = {
+        'roth': np.concatenate((roth_yr, np.stack(retired['roth'], axis=-1)), axis=-1),
+        'traditional': np.concatenate(
+            (trad_yr, np.stack(retired['traditional'], axis=-1)), axis=-1),
+        'brokerage': np.concatenate(
+            (np.zeros(shape + (years_worked,)), np.stack(retired['brokerage'], axis=-1)), axis=-1),
+        'taxes': np.concatenate(
+            (np.zeros(shape + (years_worked,)), np.stack(retired['taxes'], axis=-1)), axis=-1),
+        'missed': np.concatenate(
+            (missed_yr, np.repeat(missed[..., None], years - years_worked, axis=-1)), axis=-1),
+        'age': np.arange(years) + int(START_AGE)
+    }
+    content['combined'] = content['roth'] + content['traditional'] + content['brokerage']
+    return content
+
+
+def emptied_age(combined: np.ndarray, age: np.ndarray) -> np.ndarray:
+    """ age at which each path's savings are gone (the last age + 1 if never) """
+    funded = combined > 0.0
+    last = age.shape[-1] - 1 - np.argmax(funded[..., ::-1], axis=-1)
+    return np.where(np.any(funded, axis=-1), age[last] + 1, age[0])
+
+
+def plot_bands(age: np.ndarray, values: np.ndarray, label: str):
+    """ median line and 5-95 / 25-75 percentile bands of (paths x steps) values """
+    bands = percentile_bands(values)
+    line, = plt.plot(age, bands[50], label=label)
+    plt.fill_between(age, bands[5], bands[95], color=line.get_color(), alpha=0.1)
+    plt.fill_between(age, bands[25], bands[75], color=line.get_color(), alpha=0.2)
+
+
+def monte_carlo_stochastic_basic(paths: int = MC_PATHS, seed: int = MC_SEED):
+    sim = monte_carlo_ruth_vs_dale(paths=paths, seed=seed)
+    crossover = sim['crossover']
+    never = np.mean(np.isnan(crossover)) * 100.0
+    median = np.nanmedian(crossover) if never < 100.0 else "NEVER"
+
+    fig = plt.figure()
+    plot_bands(sim['age'], sim['ruth'], 'Ruth')
+    plot_bands(sim['age'], sim['dale'], 'Dale')
+    plt.legend()
+    plt.ylabel('401K Value')
+    plt.xlabel('Age')
+    plt.title(f"Ruth vs. Dale ({paths} paths): median crossover {median}, never {round(never, 1)}%")
+    plt.show()
+    plt.close(fig)
+
+
+def monte_carlo_compare_mix_ratios(ranger: list = list(range(11)), paths: int = MC_PATHS,
+                                   seed: int = MC_SEED):
+    ratios = np.array(ranger) / 10.0
+    sim = monte_carlo_401K(60000, 4000, (0.08, 0.03), 25000, roth_ratio=ratios, paths=paths,
+                           seed=seed)
+
+    fig = plt.figure()
+    for i, r_pct in enumerate(ratios):
+        plot_bands(sim['age'], sim['combined'][i], f"R{round(r_pct, 1)} / T{round(1.0 - r_pct, 1)}")
+    plt.legend()
+    plt.title(f"Mixed 401K Ratios (Roth / Traditional), median & bands of {paths} paths")
+    plt.ylabel('Value of 401K')
+    plt.xlabel('Age')
+    plt.show()
+    plt.close(fig)
+
+
+def monte_carlo_mixes_with_inputs_and_growth(paths: int = 2000, seed: int = MC_SEED):
+    all_contribs = np.array([1000 + 500 * z for z in range(24)])
+    ratios = np.arange(11) / 10.0
+    sim = monte_carlo_401K(100000, all_contribs[:, None], (0.08, 0.03), 40000,
+                           roth_ratio=ratios[None, :], paths=paths, seed=seed)
+    ages = emptied_age(sim['combined'], sim['age'])
+
+    fig = plt.figure()
+    legend = []
+    for i, ratio in enumerate(ratios):
+        eols = np.median(ages[:, i], axis=-1)
+        if i == 10:
+            plt.plot(all_contribs, eols, color='black')
+        else:
+            plt.plot(all_contribs, eols)
+        legend.append(f"{round(ratio, 1)}R, {round(1.0 - ratio, 1)}T")
+    plt.legend(legend, loc='upper left')
+    plt.title(f"401K Mix Ratio vs. Contribution @ $40K Withdrawal (median of {paths} paths)")
+    plt.ylabel('Emptied 401k Age (Yrs)')
+    plt.xlabel('Annual 401K Mixed Contribution ($)')
+    plt.show()
+    plt.close(fig)
+
 ######################################################################
 
 
@@ -795,5 +1044,8 @@ compare_mix_ratios()
 mixes_with_inputs()
 mixes_with_inputs_and_growth()
 compare_contributions()
+# monte_carlo_stochastic_basic()
+# monte_carlo_compare_mix_ratios()
+# monte_carlo_mixes_with_inputs_and_growth()
 
 # contribution vs. growth = line; line_f(contribution) vs. end of life; different lines of age (75, 80, 90, 100)
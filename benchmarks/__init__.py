@@ -0,0 +1,7 @@
+""" benchmarks
+
+Offline timing suite for libs.tools indicators, feature detectors and composite indexes, run
+against seeded synthetic OHLCV data:
+
+    python -m benchmarks.run --sizes 1y 10y --repeat 3
+"""
@@ -0,0 +1,235 @@
+""" benchmark cases: every public tool, feature detector, date handling and composite index """
+import os
+import json
+from typing import Callable, List
+
+import pandas as pd
+
+from libs.tools import (
+    get_high_level_stats, cluster_oscillators, full_stochastic, relative_strength_indicator_rsi,
+    ultimate_oscillator, awesome_oscillator, momentum_oscillator, on_balance_volume,
+    triple_moving_average, triple_exp_mov_average, moving_average_swing_trade,
+    hull_moving_average, mov_avg_convergence_divergence, bear_bull_power, total_power,
+    bollinger_bands, commodity_channel_index, rate_of_change_oscillator, know_sure_thing,
+    average_true_range, average_directional_index, parabolic_sar, demand_index,
+    relative_strength, risk_comparison, find_resistance_support_lines, candlesticks,
+    get_trend_lines
+)
+from libs.features import feature_detection_head_and_shoulders, analyze_price_gaps
+from libs.metrics import (
+    market_composite_index, type_composite_index, correlation_composite_index, future_returns
+)
+from libs.metrics.bond_composite_index import composite_index as bond_composite
+from libs.utils import dates_extractor_list, dates_convert_from_index
+
+SECTORS_FILE = os.path.join("resources", "sectors.json")
+
+# Plots of a fund's (prod) report whose x-axis dates come from its index
+DATE_AXIS_PLOTS = 12
+
+# Bars the market and type composite indexes need (about their shortest '2y' run period)
+COMPOSITE_MIN_BARS = 500
+
+
+def tool_cases() -> List[dict]:
+    """Tool Cases
+
+    Each case is called as case['run'](fund, universe, view), with the same options prod uses
+
+    Returns:
+        List[dict] -- cases of group 'tools'
+    """
+    def common(view: str) -> dict:
+        return {'name': 'SYN', 'plot_output': False, 'view': view}
+
+    simple = [
+        ('full_stochastic', full_stochastic),
+        ('rsi', relative_strength_indicator_rsi),
+        ('ultimate_oscillator', ultimate_oscillator),
+        ('awesome_oscillator', awesome_oscillator),
+        ('momentum_oscillator', momentum_oscillator),
+        ('on_balance_volume', on_balance_volume),
+        ('triple_moving_average', triple_moving_average),
+        ('triple_exp_mov_average', triple_exp_mov_average),
+        ('moving_average_swing_trade', moving_average_swing_trade),
+        ('hull_moving_average', hull_moving_average),
+        ('macd', mov_avg_convergence_divergence),
+        ('bear_bull_power', bear_bull_power),
+        ('total_power', total_power),
+        ('bollinger_bands', bollinger_bands),
+        ('commodity_channel_index', commodity_channel_index),
+        ('rate_of_change', rate_of_change_oscillator),
+        ('know_sure_thing', know_sure_thing),
+        ('average_true_range', average_true_range),
+        ('parabolic_sar', parabolic_sar),
+        ('demand_index', demand_index),
+        ('resistance_support', find_resistance_support_lines),
+        ('candlesticks', candlesticks),
+        ('trendlines', get_trend_lines)
+    ]
+    cases = [
+        {'name': name, 'group': 'tools', 'run': _fund_case(function, common)}
+        for name, function in simple
+    ]
+
+    cases.extend([
+        {
+            'name': 'high_level_stats', 'group': 'tools',
+            'run': lambda fund, universe, view: get_high_level_stats(fund)
+        },
+        {
+            'name': 'cluster_oscillators', 'group': 'tools',
+            'run': lambda fund, universe, view: cluster_oscillators(
+                fund, function='all', filter_thresh=3, **common(view))
+        },
+        {
+            'name': 'ema_swing_trade', 'group': 'tools',
+            'run': lambda fund, universe, view: moving_average_swing_trade(
+                fund, function='ema', **common(view))
+        },
+        {
+            'name': 'adx', 'group': 'tools',
+            'run': lambda fund, universe, view: average_directional_index(
+                fund, atr=average_true_range(fund, **common(view))['tabular'], **common(view))
+        },
+        {
+            'name': 'relative_strength', 'group': 'tools',
+            'run': lambda fund, universe, view: relative_strength(
+                'SYN', full_data_dict=dict(universe, SYN=fund), config={'tickers': 'SYN'},
+                period=view, **common(view))
+        },
+        {
+            'name': 'risk_comparison', 'group': 'tools',
+            'run': lambda fund, universe, view: risk_comparison(
+                fund, universe['^GSPC'], universe['^IRX'])
+        },
+        {
+            'name': 'future_returns', 'group': 'tools',
+            'run': lambda fund, universe, view: future_returns(fund)
+        }
+    ])
+    return cases
+
+
+def feature_cases() -> List[dict]:
+    """Feature Cases
+
+    Returns:
+        List[dict] -- cases of group 'features'
+    """
+    return [
+        {
+            'name': 'head_and_shoulders', 'group': 'features',
+            'run': lambda fund, universe, view: feature_detection_head_and_shoulders(
+                fund, name='SYN', plot_output=False, view=view)
+        },
+        {
+            'name': 'price_gaps', 'group': 'features',
+            'run': lambda fund, universe, view: analyze_price_gaps(
+                fund, name='SYN', plot_output=False, view=view)
+        }
+    ]
+
+
+def util_cases() -> List[dict]:
+    """Util Cases
+
+    Returns:
+        List[dict] -- cases of group 'utils'
+    """
+    def date_handling(fund: pd.DataFrame) -> list:
+        # A copy has its own index, as each newly downloaded fund does
+        fund = fund.copy()
+        for _ in range(DATE_AXIS_PLOTS):
+            dates_extractor_list(fund)
+        return dates_convert_from_index(fund, [range(len(fund.index))], to_str=True)
+
+    return [
+        {
+            'name': 'date_handling', 'group': 'utils',
+            'run': lambda fund, universe, view: date_handling(fund)
+        }
+    ]
+
+
+def composite_cases() -> List[dict]:
+    """Composite Cases
+
+    Composite indexes are fed the synthetic universe in place of their downloads. The market and
+    type composites need more history than 1y (their cluster oscillators fail on it), so they
+    skip shorter sizes ('min_bars').
+
+    Returns:
+        List[dict] -- cases of group 'metrics'
+    """
+    sectors = composite_sectors()
+    properties = {'Indexes': {'Correlation': {'run': True, 'type': 'short'}}}
+
+    def bonds(universe: dict, bond_type: str) -> list:
+        weights = sectors['Bond_Weight']
+        return bond_composite(
+            universe, list(weights[bond_type]), weights, plot_output=False, bond_type=bond_type)
+
+    return [
+        {
+            'name': 'market_composite_index', 'group': 'metrics', 'min_bars': COMPOSITE_MIN_BARS,
+            'run': lambda fund, universe, view: market_composite_index(
+                period=view, data=universe, sectors=sectors['Market_Composite']['tickers'],
+                plot_output=False)
+        },
+        {
+            'name': 'type_composite_index', 'group': 'metrics', 'min_bars': COMPOSITE_MIN_BARS,
+            'run': lambda fund, universe, view: type_composite_index(
+                period=view, data=universe, sectors=sectors['Type_Composite']['Components'],
+                plot_output=False)
+        },
+        {
+            'name': 'correlation_composite_index', 'group': 'metrics',
+            'run': lambda fund, universe, view: correlation_composite_index(
+                {'properties': properties}, data=universe,
+                sectors=sectors['Correlation']['tickers'], plot_output=False)
+        },
+        {
+            'name': 'bond_composite_index', 'group': 'metrics',
+            'run': lambda fund, universe, view: [
+                bonds(universe, bond_type) for bond_type in sectors['Bond_Weight']
+            ]
+        }
+    ]
+
+
+def composite_sectors() -> dict:
+    """Composite Sectors
+
+    Returns:
+        dict -- content of resources/sectors.json
+    """
+    with open(SECTORS_FILE, 'r', encoding='utf-8') as sectors_file:
+        return json.load(sectors_file)
+
+
+def universe_tickers() -> List[str]:
+    """Universe Tickers
+
+    Returns:
+        List[str] -- every fund the composite indexes (and relative strength) read
+    """
+    sectors = composite_sectors()
+    tickers = ['^GSPC', '^IRX']
+    tickers.extend(sectors['Market_Composite']['tickers'])
+    tickers.extend(sectors['Type_Composite']['Components'])
+    tickers.extend(sectors['Correlation']['tickers'])
+    for weights in sectors['Bond_Weight'].values():
+        tickers.extend(weights)
+    return list(dict.fromkeys(tickers))
+
+
+def all_cases() -> List[dict]:
+    """ every benchmark case, in run order """
+    return tool_cases() + feature_cases() + util_cases() + composite_cases()
+
+
+def _fund_case(function: Callable, common: Callable) -> Callable:
+    def run(fund: pd.DataFrame, _universe: dict, view: str):
+        return function(fund, **common(view))
+    return run
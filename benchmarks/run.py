@@ -0,0 +1,194 @@
+""" benchmark runner
+
+    python -m benchmarks.run [--sizes 1y 10y] [--groups tools] [--cases rsi macd] [--repeat 3]
+                             [--compare benchmarks/results/<earlier>.json]
+
+Results are written to benchmarks/results/<date>_<commit>.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import contextlib
+import subprocess
+from datetime import datetime
+from typing import Union
+
+import matplotlib
+matplotlib.use('Agg')
+
+# pylint: disable=wrong-import-position
+import numpy as np
+import pandas as pd
+
+from libs.utils import STANDARD_COLORS
+
+from .synthetic import SIZES, synthetic_ohlcv, synthetic_universe
+from .cases import all_cases, universe_tickers
+
+WARNING = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def run_benchmarks(sizes: list, cases: list, repeat: int = 3, seed: int = 0) -> dict:
+    """Run Benchmarks
+
+    Arguments:
+        sizes {list} -- keys of SIZES
+        cases {list} -- benchmark cases (see cases.py)
+
+    Keyword Arguments:
+        repeat {int} -- timed runs per case; the best is the headline number (default: {3})
+        seed {int} -- random seed of the synthetic data (default: {0})
+
+    Returns:
+        dict -- {size: {case: timing}}
+    """
+    results = {}
+    for size in sizes:
+        bars, interval = SIZES[size]
+        fund = synthetic_ohlcv(bars, seed=seed, interval=interval)
+        universe = synthetic_universe(universe_tickers(), bars, seed=seed + 1, interval=interval)
+
+        results[size] = {}
+        for case in cases:
+            if bars < case.get('min_bars', 0):
+                print(f"{size:>8} {case['group']:>8} {case['name']:<30} " +
+                      f"skipped (needs {case['min_bars']} bars)")
+                continue
+            timing = time_case(case, fund, universe, size, repeat)
+            results[size][case['name']] = timing
+            status = f"{timing['best']:9.4f}s" if timing['error'] is None else \
+                f"{WARNING}{timing['error']}{NORMAL}"
+            print(f"{size:>8} {case['group']:>8} {case['name']:<30} {status}")
+
+    return results
+
+
+def time_case(case: dict, fund: pd.DataFrame, universe: dict, view: str, repeat: int) -> dict:
+    """Time Case
+
+    Arguments:
+        case {dict} -- benchmark case
+        fund {pd.DataFrame} -- synthetic fund
+        universe {dict} -- synthetic funds of the composite indexes
+        view {str} -- size name, passed as the tools' 'view'
+        repeat {int} -- timed runs
+
+    Returns:
+        dict -- best, mean (seconds), bars, group, error (None if every run succeeded)
+    """
+    times = []
+    error = None
+    for _ in range(repeat):
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                case['run'](fund, universe, view)
+                times.append(time.perf_counter() - start)
+        except Exception as exc:  # pylint: disable=broad-except
+            error = f"{type(exc).__name__}: {exc}"
+            break
+
+    timing = {'group': case['group'], 'bars': len(fund.index), 'error': error}
+    timing['best'] = float(np.min(times)) if times else None
+    timing['mean'] = float(np.mean(times)) if times else None
+    return timing
+
+
+def compare_results(results: dict, baseline: dict, threshold: float = 1.25) -> list:
+    """Compare Results
+
+    Arguments:
+        results {dict} -- {size: {case: timing}} of this run
+        baseline {dict} -- same, of an earlier run
+
+    Keyword Arguments:
+        threshold {float} -- best-time ratio above which a case counts as a regression
+                             (default: {1.25})
+
+    Returns:
+        list -- regressions as (size, case, ratio)
+    """
+    regressions = []
+    for size, cases in results.items():
+        for name, timing in cases.items():
+            before = baseline.get(size, {}).get(name, {}).get('best')
+            if (before is None) or (timing['best'] is None) or (before == 0.0):
+                continue
+            ratio = timing['best'] / before
+            marker = ''
+            if ratio > threshold:
+                marker = f"{WARNING}  <-- regression{NORMAL}"
+                regressions.append((size, name, ratio))
+            print(f"{size:>8} {name:<30} {before:9.4f}s -> {timing['best']:9.4f}s " +
+                  f"({ratio:5.2f}x){marker}")
+    return regressions
+
+
+def git_commit() -> Union[str, None]:
+    """ short hash of HEAD (None outside of a git checkout) """
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Union[list, None] = None) -> int:
+    """ command line entry point; returns a process exit code """
+    parser = argparse.ArgumentParser(description="Time libs.tools, features, utils and metrics.")
+    parser.add_argument('--sizes', nargs='+', default=['1y', '5y', '10y'], choices=list(SIZES))
+    parser.add_argument('--groups', nargs='+', default=['tools', 'features', 'utils', 'metrics'])
+    parser.add_argument('--cases', nargs='+', default=None,
+                        help="only run cases whose name contains one of these")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=RESULTS_DIR)
+    parser.add_argument('--compare', default=None, help="earlier results json to compare to")
+    parser.add_argument('--threshold', type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases() if case['group'] in args.groups]
+    if args.cases is not None:
+        cases = [case for case in cases if any(key in case['name'] for key in args.cases)]
+
+    results = run_benchmarks(args.sizes, cases, repeat=args.repeat, seed=args.seed)
+
+    commit = git_commit()
+    content = {
+        'commit': commit,
+        'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'results': results
+    }
+
+    if not os.path.exists(args.output):
+        os.makedirs(args.output)
+    filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit or 'local'}.json"
+    filename = os.path.join(args.output, filename)
+    with open(filename, 'w', encoding='utf-8') as out_file:
+        json.dump(content, out_file, indent=2)
+    print(f"\r\nResults written to {filename}")
+
+    if args.compare is not None:
+        with open(args.compare, 'r', encoding='utf-8') as base_file:
+            baseline = json.load(base_file)
+        print(f"\r\nCompared to {baseline.get('commit')} ({baseline.get('date')}):")
+        if compare_results(results, baseline['results'], threshold=args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+""" seeded synthetic OHLCV fixtures """
+import io
+import contextlib
+import numpy as np
+import pandas as pd
+
+from libs.utils.data import data_format
+
+# name -> (number of bars, bar interval)
+SIZES = {
+    '1y': (252, '1d'),
+    '5y': (1260, '1d'),
+    '10y': (2520, '1d'),
+    '30y': (7560, '1d'),
+    '5d_1m': (1950, '1m'),
+    '1mo_15m': (546, '15m'),
+    '1y_60m': (1764, '60m')
+}
+
+END_DATE = '2023-01-31'
+SESSION_MINUTES = 390
+
+
+def synthetic_ohlcv(bars: int, seed: int = 0, **kwargs) -> pd.DataFrame:
+    """Synthetic OHLCV
+
+    Random-walk prices with clustered volatility, overnight gaps, volume that rises with the
+    size of the move, and NaN gaps (cleansed the same way as a yfinance download).
+
+    Arguments:
+        bars {int} -- number of bars
+
+    Keyword Arguments:
+        seed {int} -- random seed (default: {0})
+
+    Optional Args:
+        interval {str} -- '1d' or an intraday interval like '15m' (default: {'1d'})
+        start_price {float} -- first close (default: {100.0})
+        drift {float} -- mean log return per bar (default: {0.0003})
+        volatility {float} -- mean stdev of log returns per bar (default: {0.012})
+        nan_rate {float} -- fraction of rows blanked to NaN before cleansing (default: {0.002})
+        name {str} -- ticker name (default: {'SYN'})
+
+    Returns:
+        pd.DataFrame -- fund dataset (Open, Close, High, Low, Adj Close, Volume)
+    """
+    # pylint: disable=too-many-locals
+    interval = kwargs.get('interval', '1d')
+    start_price = kwargs.get('start_price', 100.0)
+    drift = kwargs.get('drift', 0.0003)
+    volatility = kwargs.get('volatility', 0.012)
+    nan_rate = kwargs.get('nan_rate', 0.002)
+    name = kwargs.get('name', 'SYN')
+
+    rng = np.random.default_rng(seed)
+    dates = synthetic_dates(bars, interval)
+
+    # Slowly wandering volatility regime, scaled down for intraday bars
+    scale = 1.0
+    if interval != '1d':
+        scale = np.sqrt(interval_minutes(interval) / SESSION_MINUTES)
+    regime = np.exp(np.convolve(rng.normal(0.0, 0.25, bars), np.ones(20) / 20.0, mode='same'))
+    sigma = volatility * scale * regime
+
+    returns = rng.normal(drift * scale ** 2, sigma)
+    close = start_price * np.exp(np.cumsum(returns))
+    prev_close = np.concatenate(([start_price], close[:-1]))
+    open_ = prev_close * np.exp(rng.normal(0.0, 0.3 * sigma))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0.0, 0.5 * sigma)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0.0, 0.5 * sigma)))
+    volume = np.round(
+        rng.lognormal(np.log(2.0e6 * scale ** 2), 0.35, bars) * (1.0 + 25.0 * np.abs(returns)))
+
+    raw = pd.DataFrame({
+        'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Adj Close': close,
+        'Volume': volume
+    }, index=dates)
+
+    blanks = rng.random(bars) < nan_rate
+    blanks[0] = False
+    raw.loc[blanks, ['Open', 'High', 'Low', 'Close', 'Adj Close']] = np.nan
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        fund = data_format(raw, config=None, single_fund_name=name)[name]
+    return fund
+
+
+def synthetic_universe(tickers: list, bars: int, seed: int = 0, **kwargs) -> dict:
+    """Synthetic Universe
+
+    Arguments:
+        tickers {list} -- fund names (sector funds, '^GSPC', '^IRX', ...)
+        bars {int} -- number of bars
+
+    Keyword Arguments:
+        seed {int} -- random seed of the first fund (default: {0})
+
+    Optional Args:
+        interval {str} -- (default: {'1d'})
+
+    Returns:
+        dict -- fund datasets by name, all on the same dates
+    """
+    interval = kwargs.get('interval', '1d')
+    universe = {}
+    for i, ticker in enumerate(tickers):
+        options = {'interval': interval, 'name': ticker}
+        if ticker == '^IRX':
+            # Rates index: low level, no volume to speak of
+            options.update({'start_price': 2.0, 'drift': 0.0, 'volatility': 0.02})
+        universe[ticker] = synthetic_ohlcv(bars, seed=seed + i, **options)
+        if ticker == '^IRX':
+            universe[ticker]['Volume'] = 0.0
+    return universe
+
+
+def synthetic_dates(bars: int, interval: str = '1d') -> pd.DatetimeIndex:
+    """Synthetic Dates
+
+    Arguments:
+        bars {int} -- number of bars
+
+    Keyword Arguments:
+        interval {str} -- '1d' or an intraday interval (default: {'1d'})
+
+    Returns:
+        pd.DatetimeIndex -- business days (or regular-session bars) ending on END_DATE
+    """
+    if interval == '1d':
+        return pd.bdate_range(end=END_DATE, periods=bars)
+
+    minutes = interval_minutes(interval)
+    per_day = SESSION_MINUTES // minutes
+    days = pd.bdate_range(end=END_DATE, periods=int(np.ceil(bars / per_day)))
+    offsets = pd.to_timedelta(570 + minutes * np.arange(per_day), unit='min')
+    stamps = (days.values[:, None] + offsets.values[None, :]).ravel()
+    return pd.DatetimeIndex(stamps[-bars:])
+
+
+def interval_minutes(interval: str) -> int:
+    """Interval Minutes
+
+    Arguments:
+        interval {str} -- intraday interval, e.g. '1m', '15m', '1h'
+
+    Returns:
+        int -- minutes per bar
+    """
+    if interval.endswith('h'):
+        return int(interval[:-1]) * 60
+    return int(interval[:-1])
@@ -1,148 +1,60 @@
-import pandas as pd 
-import numpy as np 
-import yfinance as yf
+""" buy-and-hold vs. trading each fund on its clustered oscillators (see libs.backtest) """
 import pprint
-import copy
 
-def test_competitive(ticker_set, analysis: dict, start_invest=100000):
-    """ Compare technical traits on when to buy sell securities """
-
-    test_analysis = {}
-
-    ticks = list(analysis.keys())
-    test_analysis['benchmark'] = init_benchmark(ticker_set, ticks, start_invest)
-    test_analysis['cluster'] = run_clusters(ticker_set, ticks, analysis, start_invest)
-    test_analysis = restructure_analysis(test_analysis)
-    pprint.pprint(test_analysis)
-
-    return test_analysis 
-
-
-def restructure_analysis(test_analysis: dict) -> dict:
-    bench = copy.deepcopy(test_analysis['benchmark'])
-    cluster = copy.deepcopy(test_analysis['cluster'])
-
-    new_analysis = dict()
-    for key in bench.keys():
-        new_analysis[key] = {}
-        for k2 in bench[key].keys():
-            k3 = f'bench_{k2}'
-            new_analysis[key][k3] = bench[key][k2]
-        for k2 in cluster[key].keys():
-            k3 = f'cluster_{k2}'
-            new_analysis[key][k3] = cluster[key][k2]
-
-    return new_analysis
-
-#######################################################################################
-
-def run_clusters(ticker_set, tickers: list, analysis: dict, start_invest: int) -> dict:
-    cluster = {}
-
-    # Note: as trends are determined, THs will increase/decrease (rise=>SELL higher,BUY=> lower)
-    SELL_TH = 0.6
-    BUY_TH = 0.4
-    SELL_AMT = 0.3
-    BUY_AMT = 1.0
-    ACCELERATOR = 1.2
-
-    for tick in tickers:
-        cluster[tick] = {}
-        cluster[tick]['init_amt'] = start_invest
-        shares, cash = init_shares(ticker_set, tick, start_invest)
-        cluster[tick]['init_shares'] = shares
-        cluster[tick]['cash'] = cash
+import numpy as np
+import pandas as pd
 
-        data = yf.Ticker(tick)
-        dividends = data.dividends
+from libs.backtest import backtest_funds, stack_prices, bar_returns, scaled_threshold_targets
+from libs.utils import download_dividends
 
-        cluster_vals = []
-        for clus in analysis[tick]['clustered_osc']['all']:
-            cluster_vals.append(clus[2])
-        sell = SELL_TH * np.max(cluster_vals)
-        diff_s = np.max(cluster_vals) - sell
-        buy = BUY_TH * np.min(cluster_vals)
-        diff_b = np.min(cluster_vals) - buy
-        print(f"clusters: {analysis[tick]['clustered_osc']['all'][0]}")
-        print(f"tickers: {ticker_set[tick]['Close'][27]}")
+# Sell above this fraction of the highest cluster value, buy below this fraction of the lowest
+SELL_TH = 0.6
+BUY_TH = 0.4
+# Fraction of the shares sold at the highest value / of the cash bought with at the lowest
+SELL_AMT = 0.3
+BUY_AMT = 1.0
+ACCELERATOR = 1.2
 
-        start_date = ticker_set[tick]['Close'].index[0]
-        if len(dividends) > 0:
-            start_index = 0
-            while ((start_index < len(dividends)) and (start_date > dividends.index[start_index])):
-                start_index += 1
-            if start_index < len(dividends):
-                print("dividend set here")
 
-        for clus in analysis[tick]['clustered_osc']['all']:
-            if clus[2] > sell:
-                samt = SELL_AMT * (float(clus[2]) - sell) / diff_s
-                sells = np.floor(float(shares) * samt)
-                shares -= sells
-                cash += np.round(float(sells) * clus[1], 2)
-            if clus[2] < buy:
-                bamt = BUY_AMT * (float(clus[2]) - buy) / diff_b * ACCELERATOR
-                if bamt > 1.0:
-                    bamt = 1.0
-                b_cash = bamt * float(cash)
-                shs = np.floor(b_cash / clus[1])
-                cash = np.round(float(cash) - (float(shs) * clus[1]), 2)
-                shares += shs 
-
-        cluster[tick]['cash'] = cash
-        cluster[tick]['final_shares'] = shares 
-        final_price = ticker_set[tick]['Close'][len(ticker_set[tick]['Close'])-1]
-        cluster[tick]['final_amt'] = np.round(final_price * cluster[tick]['final_shares'] + cluster[tick]['cash'], 2)
-
-    return cluster
-
-
-#######################################################################################
-
-def init_benchmark(ticker_set, tickers: list, invest_amt: int) -> dict:
-    bench = {}
-
-    for tick in tickers:
-        bench[tick] = {}
-
-        bench[tick]['init_amt'] = invest_amt
-        shares, cash = init_shares(ticker_set, tick, invest_amt)
-        bench[tick]['init_shares'] = shares
-        bench[tick]['cash'] = cash
-
-        bench = final_amount(ticker_set, tick, bench, ticker_set[tick]['Close'].index[0])
-
-    return bench
-
-
-def init_shares(ticker_set, ticker: str, invest_amt: int):
-    sh_price = ticker_set[ticker]['Close'][0]
-    shares = np.floor(float(invest_amt) / sh_price)
-    cash = np.round(float(invest_amt) - (shares * sh_price), 2)
-    return shares, cash
+def test_competitive(ticker_set, analysis: dict, start_invest=100000):
+    """ Compare technical traits on when to buy sell securities """
+    # pylint: disable=too-many-locals
+    ticks = list(analysis.keys())
 
+    start = min(ticker_set[tick].index[0] for tick in ticks)
+    end = max(ticker_set[tick].index[-1] for tick in ticks)
+    dividends = download_dividends(
+        ticks, start=start.strftime('%Y-%m-%d'),
+        end=(end + pd.Timedelta(days=1)).strftime('%Y-%m-%d'))
 
-def final_amount(ticker_set, ticker: str, benchmark: dict, start_date) -> dict:
-    data = yf.Ticker(ticker)
-    dividends = data.dividends
-    shares = benchmark[ticker]['init_shares']
+    targets = {}
+    for tick in ticks:
+        # Shares drift with the total return (dividends reinvested) between trades
+        stacked = stack_prices(ticker_set, [tick], dividends=dividends)
+        total_return = np.cumprod(1.0 + bar_returns(stacked['prices'], stacked['dividends'])[0])
 
-    if len(dividends) > 0:
-        start_index = 0
-        while ((start_index < len(dividends)) and (start_date > dividends.index[start_index])):
-            start_index += 1
-        if start_index < len(dividends):
-            # print(dividends.index[start_index])
-            for index in range(start_index, len(dividends)):
-                date = dividends.index[index]
-                price = ticker_set[ticker]['Close'][date]
-                div_price = dividends[index]
-                shares = np.round(float(shares) * (div_price/price + 1.0), 3)
+        clusters = np.asarray(analysis[tick]['clustered_osc']['tabular'], dtype=float)
+        targets[tick] = scaled_threshold_targets(
+            clusters, SELL_TH * np.max(clusters), BUY_TH * np.min(clusters),
+            sell_amount=SELL_AMT, buy_amount=BUY_AMT, accelerator=ACCELERATOR,
+            prices=total_return)
 
-    benchmark[ticker]['final_shares'] = float(shares)
-    final_price = ticker_set[ticker]['Close'][len(ticker_set[ticker]['Close'])-1]
-    benchmark[ticker]['final_amt'] = np.round(final_price * benchmark[ticker]['final_shares'] + benchmark[ticker]['cash'], 2)
+    # Trades at the close of the cluster reading, as the original share / cash loop
+    result = backtest_funds(
+        ticker_set, targets, dividends=dividends, initial=start_invest, delay=0)
 
-    return benchmark
+    test_analysis = {}
+    for row, tick in enumerate(result['funds']):
+        test_analysis[tick] = {
+            'bench_init_amt': start_invest,
+            'bench_final_amt': np.round(result['benchmark'][row][-1], 2),
+            'cluster_init_amt': start_invest,
+            'cluster_final_amt': np.round(result['equity'][row][-1], 2)
+        }
+        for key, value in result['benchmark_stats'][tick].items():
+            test_analysis[tick][f'bench_{key}'] = value
+        for key, value in result['stats'][tick].items():
+            test_analysis[tick][f'cluster_{key}'] = value
 
-    
\ No newline at end of file
+    pprint.pprint(test_analysis)
+    return test_analysis
@@ -0,0 +1,9 @@
+""" Backtesting """
+from .engine import (
+    backtest, backtest_funds, stack_prices, stack_targets, bar_returns, drawdowns, performance,
+    walk_forward_windows, forward_fill
+)
+from .signals import signals_to_targets, threshold_targets, scaled_threshold_targets
+from .sweep import (
+    sweep_tool, sweep_fund, score_signals, sweep_summary, config_grid, SWEEP_TOOLS, SWEEP_FUTURES
+)
@@ -0,0 +1,356 @@
+""" vectorized backtests of target positions, one fund per row """
+from typing import List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from libs.tools.returns_kernel import YEAR_PERIODS
+from libs.utils import naive_dates
+
+STAT_KEYS = ['total_return', 'cagr', 'volatility', 'sharpe', 'max_drawdown', 'exposure', 'trades']
+
+
+def stack_prices(data: dict, funds: list, **kwargs) -> dict:
+    """Stack Prices
+
+    Aligns the funds' prices (and dividends) on the union of their dates. Prices are carried
+    forward over a fund's missing dates between its first and last dates, and are NaN outside
+    them.
+
+    Arguments:
+        data {dict} -- fund datasets
+        funds {list} -- fund tickers
+
+    Optional Args:
+        field {str} -- price column; use 'Close' with dividends, 'Adj Close' (which already
+                       includes them) without (default: {'Close'})
+        dividends {dict} -- cash dividends per share by fund, pd.Series by ex-date
+                            (default: {{}})
+
+    Returns:
+        dict -- 'funds', 'index' (pd.DatetimeIndex), 'prices', 'dividends' and 'valid' (np.ndarray,
+                a row per fund; 'valid' is True from a fund's first date to its last), 'positions'
+                (each fund's bars in 'index', by fund)
+    """
+    field = kwargs.get('field', 'Close')
+    dividends = kwargs.get('dividends', {})
+
+    index = pd.DatetimeIndex([])
+    for fund in funds:
+        index = index.union(naive_dates(data[fund].index))
+
+    prices = np.full((len(funds), len(index)), np.nan)
+    divs = np.zeros((len(funds), len(index)))
+    valid = np.zeros((len(funds), len(index)), dtype=bool)
+    positions = {}
+    for row, fund in enumerate(funds):
+        positions[fund] = index.get_indexer(naive_dates(data[fund].index))
+        prices[row, positions[fund]] = data[fund][field].to_numpy(dtype=float)
+        if len(positions[fund]) > 0:
+            valid[row, positions[fund].min():positions[fund].max() + 1] = True
+
+        fund_divs = dividends.get(fund)
+        if fund_divs is not None and len(fund_divs) > 0:
+            # Ex-dates that are not trading dates apply on the next bar
+            bars = index.searchsorted(naive_dates(fund_divs.index))
+            keep = bars < len(index)
+            np.add.at(divs[row], bars[keep], np.asarray(fund_divs, dtype=float)[keep])
+
+    prices = np.where(valid, forward_fill(prices), np.nan)
+    valid &= np.isfinite(prices)
+
+    return {
+        'funds': list(funds),
+        'index': index,
+        'prices': prices,
+        'dividends': divs,
+        'valid': valid,
+        'positions': positions
+    }
+
+
+def backtest_funds(data: dict, targets: dict, **kwargs) -> dict:
+    """Backtest Funds
+
+    Backtests the targets of many funds at once (see backtest)
+
+    Arguments:
+        data {dict} -- fund datasets
+        targets {dict} -- target positions by fund, on the fund's own bars (see signals)
+
+    Optional Args:
+        field {str} -- price column (default: {'Close'})
+        dividends {dict} -- cash dividends per share by fund, pd.Series by ex-date
+                            (default: {{}})
+        All backtest keyword arguments (e.g. cost, size, initial)
+
+    Returns:
+        dict -- backtest content, with 'funds', 'index', and 'stats' / 'benchmark_stats' by fund
+    """
+    funds = list(targets)
+    stacked = stack_prices(
+        data, funds, field=kwargs.pop('field', 'Close'), dividends=kwargs.pop('dividends', {}))
+    result = backtest(
+        stacked['prices'], stack_targets(targets, stacked), dividends=stacked['dividends'],
+        valid=stacked['valid'], **kwargs)
+
+    result['funds'] = funds
+    result['index'] = stacked['index']
+    result['stats'] = dict(zip(funds, result['stats']))
+    result['benchmark_stats'] = dict(zip(funds, result['benchmark_stats']))
+    return result
+
+
+def stack_targets(targets: dict, stacked: dict) -> np.ndarray:
+    """Stack Targets
+
+    Arguments:
+        targets {dict} -- target positions by fund, on the fund's own bars (see signals)
+        stacked {dict} -- stack_prices content
+
+    Returns:
+        np.ndarray -- targets on the stacked dates (NaN where a fund has no target)
+    """
+    matrix = np.full(stacked['prices'].shape, np.nan)
+    for row, fund in enumerate(stacked['funds']):
+        if fund in targets:
+            matrix[row, stacked['positions'][fund]] = targets[fund]
+    return matrix
+
+
+def forward_fill(values: np.ndarray) -> np.ndarray:
+    """ carries the last finite value of each row forward over NaNs """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    last = np.where(np.isfinite(values), np.arange(values.shape[1]), 0)
+    np.maximum.accumulate(last, axis=1, out=last)
+    filled = np.take_along_axis(values, last, axis=1)
+    return filled
+
+
+def backtest(prices: np.ndarray, targets: np.ndarray, **kwargs) -> dict:
+    """Backtest
+
+    Simulates each fund (row) as its own account of shares and cash that rebalances to the target
+    position (fraction of the account invested) whenever the target changes. Between changes the
+    shares and cash are held, so the invested fraction drifts with the price. Trades are made at
+    the close 'delay' bars after the signal (by default the next bar's, so a signal never trades
+    on the close it was computed from). Dividends are reinvested; costs are charged on the value
+    traded. A fund whose dates end before the others' is sold on its last bar.
+
+    Arguments:
+        prices {np.ndarray} -- prices, a row per fund (NaN outside a fund's dates)
+        targets {np.ndarray} -- target positions, same shape (NaN keeps the current position)
+
+    Optional Args:
+        dividends {np.ndarray} -- cash dividends per share on their ex-dates (default: {None})
+        valid {np.ndarray} -- bars each fund existed, e.g. stack_prices 'valid'
+                              (default: {the finite prices})
+        initial {float} -- starting value of each account (default: {10000.0})
+        size {float} -- fraction of each target to take, e.g. 0.5 (default: {1.0})
+        cost {float} -- costs (commission, slippage) as a fraction of value traded
+                        (default: {0.0})
+        delay {int} -- bars between a signal and its trade (default: {1})
+        periods_per_year {int} -- for annualized stats (default: {250})
+
+    Returns:
+        dict -- 'equity', 'benchmark' (buy-and-hold equity), 'positions' (target held),
+                'weights' (fraction invested, after the drift), 'drawdown', 'valid' (a row per
+                fund), 'portfolio' (summed equity), and 'stats', 'benchmark_stats',
+                'portfolio_stats' (see performance)
+    """
+    # pylint: disable=too-many-locals
+    dividends = kwargs.get('dividends')
+    initial = kwargs.get('initial', 10000.0)
+    size = kwargs.get('size', 1.0)
+    cost = kwargs.get('cost', 0.0)
+    delay = max(int(kwargs.get('delay', 1)), 0)
+    periods_per_year = kwargs.get('periods_per_year', YEAR_PERIODS)
+
+    prices = np.atleast_2d(np.asarray(prices, dtype=float))
+    valid = kwargs.get('valid')
+    if valid is None:
+        valid = np.isfinite(prices)
+    valid = np.asarray(valid, dtype=bool).reshape(prices.shape)
+    length = prices.shape[1]
+
+    returns = bar_returns(prices, dividends)
+    total_return = np.cumprod(1.0 + returns, axis=1)
+
+    # Targets held from their trade on; no position outside a fund's dates (and out on the last
+    # bar of a fund that ends early)
+    held = forward_fill(np.asarray(targets, dtype=float).reshape(prices.shape)) * size
+    held = np.nan_to_num(held, nan=0.0)
+    positions = np.zeros(prices.shape)
+    if delay < length:
+        positions[:, delay:] = held[:, :length - delay]
+    open_bars = valid.copy()
+    open_bars[:, :-1] &= valid[:, 1:]
+    positions = np.where(open_bars, positions, 0.0)
+
+    # Rebalances are the bars where the target changes; 'last' is each bar's latest rebalance
+    rows = np.arange(prices.shape[0])[:, None]
+    trades = np.diff(positions, axis=1, prepend=0.0) != 0.0
+    last = np.where(trades, np.arange(length), -1)
+    np.maximum.accumulate(last, axis=1, out=last)
+    before = np.full(prices.shape, -1)
+    before[:, 1:] = last[:, :-1]
+
+    # Shares and cash held since the previous rebalance grow by 1 - w + w * (price change), w its
+    # target; all cash before the first
+    weights_before = np.where(before >= 0, positions[rows, before], 0.0)
+    drift = total_return / total_return[rows, np.maximum(before, 0)]
+    growth = 1.0 - weights_before + weights_before * drift
+    drifted = weights_before * drift / growth
+    weights = np.where(trades, positions, drifted)
+
+    # Account value after each rebalance (and its cost on the fraction traded), times the growth
+    # since for the bars between
+    step = np.where(trades, growth * (1.0 - cost * np.abs(positions - drifted)), 1.0)
+    settled = initial * np.cumprod(step, axis=1)
+    equity = settled * np.where(trades, 1.0, growth)
+
+    benchmark = initial * total_return
+    portfolio = np.sum(equity, axis=0)
+
+    return {
+        'equity': equity,
+        'benchmark': benchmark,
+        'positions': positions,
+        'weights': weights,
+        'drawdown': drawdowns(equity),
+        'valid': valid,
+        'portfolio': portfolio,
+        'stats': performance(equity, positions=positions, periods_per_year=periods_per_year,
+                             valid=valid),
+        'benchmark_stats': performance(
+            benchmark, positions=valid.astype(float), periods_per_year=periods_per_year,
+            valid=valid),
+        'portfolio_stats': performance(portfolio, periods_per_year=periods_per_year)
+    }
+
+
+def bar_returns(prices: np.ndarray, dividends: Union[np.ndarray, None] = None) -> np.ndarray:
+    """Bar Returns
+
+    Arguments:
+        prices {np.ndarray} -- prices, a row per fund
+
+    Keyword Arguments:
+        dividends {np.ndarray} -- cash dividends per share on their ex-dates (default: {None})
+
+    Returns:
+        np.ndarray -- fractional total return of each bar (0.0 for the first and where unpriced)
+    """
+    prices = np.atleast_2d(np.asarray(prices, dtype=float))
+    income = prices.copy()
+    if dividends is not None:
+        income = income + np.atleast_2d(dividends)
+
+    returns = np.zeros(prices.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns[:, 1:] = income[:, 1:] / prices[:, :-1] - 1.0
+    returns[~np.isfinite(returns)] = 0.0
+    return returns
+
+
+def drawdowns(equity: np.ndarray) -> np.ndarray:
+    """ fractional drop of equity from its running peak (0.0 at new highs) """
+    equity = np.asarray(equity, dtype=float)
+    return equity / np.maximum.accumulate(equity, axis=-1) - 1.0
+
+
+def performance(equity: np.ndarray, **kwargs) -> Union[List[dict], dict]:
+    """Performance
+
+    Arguments:
+        equity {np.ndarray} -- equity curves, a row per account (or a single curve)
+
+    Optional Args:
+        positions {np.ndarray} -- positions held, for exposure and trades (default: {None})
+        window {slice} -- bars to evaluate, e.g. a walk-forward test window (default: {None})
+        valid {np.ndarray} -- bars each account existed (default: {all})
+        periods_per_year {int} -- (default: {250})
+
+    Returns:
+        list -- for each row: total_return (%), cagr (%), volatility (annualized %), sharpe,
+                max_drawdown (%), exposure (fraction of bars invested), trades
+                (a single dict for a single curve)
+    """
+    # pylint: disable=too-many-locals
+    positions = kwargs.get('positions')
+    window = kwargs.get('window', slice(None))
+    valid = kwargs.get('valid')
+    periods_per_year = kwargs.get('periods_per_year', YEAR_PERIODS)
+
+    single = np.ndim(equity) == 1
+    equity = np.atleast_2d(np.asarray(equity, dtype=float))[:, window]
+    if valid is None:
+        valid = np.ones(equity.shape, dtype=bool)
+    else:
+        valid = np.atleast_2d(valid)[:, window]
+
+    bars = np.sum(valid, axis=1)
+    first = np.argmax(valid, axis=1)
+    last = valid.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    rows = np.arange(equity.shape[0])
+    start = equity[rows, first]
+
+    total = equity[rows, last] / start - 1.0
+    years = np.maximum(bars - 1, 1) / periods_per_year
+    cagr = (1.0 + total) ** (1.0 / years) - 1.0
+
+    # Returns of the bars after each account's first
+    period_returns = np.full(equity.shape, np.nan)
+    period_returns[:, 1:] = np.where(
+        valid[:, :-1] & valid[:, 1:], equity[:, 1:] / equity[:, :-1] - 1.0, np.nan)
+    mean = np.nanmean(period_returns, axis=1)
+    std = np.nanstd(period_returns, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0.0, mean / std * np.sqrt(periods_per_year), 0.0)
+
+    # Equity held at its start before an account's first bar and at its end after its last
+    held = forward_fill(np.where(valid, equity, np.nan))
+    max_drawdown = np.min(drawdowns(np.where(np.isfinite(held), held, start[:, None])), axis=1)
+
+    exposure = np.zeros(len(rows))
+    trades = np.zeros(len(rows), dtype=int)
+    if positions is not None:
+        positions = np.atleast_2d(positions)[:, window]
+        exposure = np.sum((positions != 0.0) & valid, axis=1) / np.maximum(bars, 1)
+        trades = np.sum((np.diff(positions, axis=1, prepend=0.0) != 0.0) & valid, axis=1)
+
+    stats = [
+        dict(zip(STAT_KEYS, [
+            float(total[i] * 100.0), float(cagr[i] * 100.0),
+            float(std[i] * np.sqrt(periods_per_year) * 100.0), float(sharpe[i]),
+            float(max_drawdown[i] * 100.0), float(exposure[i]), int(trades[i])
+        ]))
+        for i in rows
+    ]
+    if single:
+        return stats[0]
+    return stats
+
+
+def walk_forward_windows(length: int, train: int, test: int,
+                         step: Union[int, None] = None) -> List[Tuple[slice, slice]]:
+    """Walk Forward Windows
+
+    Arguments:
+        length {int} -- number of bars
+        train {int} -- bars of each in-sample (fitting) window
+        test {int} -- bars of the out-of-sample window that follows it
+
+    Keyword Arguments:
+        step {int} -- bars between windows (default: {None}, test)
+
+    Returns:
+        List[Tuple[slice, slice]] -- (train, test) windows, oldest first
+    """
+    step = step or test
+    windows = []
+    start = 0
+    while start + train + test <= length:
+        windows.append((slice(start, start + train), slice(start + train, start + train + test)))
+        start += step
+    return windows
@@ -0,0 +1,135 @@
+""" target positions from the tools' signals and metrics """
+import numpy as np
+
+
+def signals_to_targets(signals: list, length: int, **kwargs) -> np.ndarray:
+    """Signals to Targets
+
+    Arguments:
+        signals {list} -- a tool's 'signals' ('index', 'type', 'value' each)
+        length {int} -- number of bars of the fund
+
+    Optional Args:
+        bullish {float} -- target position of a bullish signal (default: {1.0})
+        bearish {float} -- target position of a bearish signal (default: {0.0})
+        values {list} -- only signals of these 'value's, e.g. ['swing rejection']
+                         (default: {None}, all)
+
+    Returns:
+        np.ndarray -- target position of each bar (NaN where there is no signal; the last signal
+                      of a bar wins)
+    """
+    bullish = kwargs.get('bullish', 1.0)
+    bearish = kwargs.get('bearish', 0.0)
+    values = kwargs.get('values')
+
+    targets = np.full(length, np.nan)
+    kept = [
+        signal for signal in signals
+        if signal['type'] in ('bullish', 'bearish') and 0 <= signal['index'] < length
+        and (values is None or signal['value'] in values)
+    ]
+    if not kept:
+        return targets
+
+    indexes = np.array([signal['index'] for signal in kept])
+    weights = np.array([bullish if signal['type'] == 'bullish' else bearish for signal in kept])
+
+    # Last signal of each bar (np.unique keeps the first of the reversed order)
+    bars, last = np.unique(indexes[::-1], return_index=True)
+    targets[bars] = weights[::-1][last]
+    return targets
+
+
+def threshold_targets(values: list, upper: float, lower: float, **kwargs) -> np.ndarray:
+    """Threshold Targets
+
+    Targets from an oscillating metric, e.g. a clustered oscillator's 'tabular' or the
+    'metrics' of last_signals
+
+    Arguments:
+        values {list} -- metric of each bar
+        upper {float} -- values at or above are bullish (bearish if contrarian)
+        lower {float} -- values at or below are bearish (bullish if contrarian)
+
+    Optional Args:
+        contrarian {bool} -- True for overbought / oversold readings, where a high value is a
+                             sell (default: {False})
+        bullish {float} -- target position of a bullish reading (default: {1.0})
+        bearish {float} -- target position of a bearish reading (default: {0.0})
+
+    Returns:
+        np.ndarray -- target position of each bar (NaN between the thresholds)
+    """
+    contrarian = kwargs.get('contrarian', False)
+    bullish = kwargs.get('bullish', 1.0)
+    bearish = kwargs.get('bearish', 0.0)
+
+    values = np.asarray(values, dtype=float)
+    high, low = (bearish, bullish) if contrarian else (bullish, bearish)
+
+    targets = np.full(values.shape, np.nan)
+    targets[values >= upper] = high
+    targets[values <= lower] = low
+    return targets
+
+
+def scaled_threshold_targets(values: list, upper: float, lower: float, **kwargs) -> np.ndarray:
+    """Scaled Threshold Targets
+
+    Targets that scale in and out of a position on an overbought / oversold metric: a reading
+    above 'upper' sells a part of the position (up to 'sell_amount' of it at the metric's highest
+    value) and a reading below 'lower' buys with a part of the cash ('buy_amount' times
+    'accelerator' of it at the metric's lowest value, at most all of it)
+
+    Arguments:
+        values {list} -- metric of each bar
+        upper {float} -- values above are sells
+        lower {float} -- values below are buys
+
+    Optional Args:
+        sell_amount {float} -- fraction of the position sold at the highest value (default: {0.3})
+        buy_amount {float} -- fraction of the cash bought with at the lowest value (default: {1.0})
+        accelerator {float} -- multiplier of the buys (default: {1.0})
+        initial {float} -- position before the first bar (default: {1.0})
+        prices {list} -- prices of the bars the trades are made at (e.g. the closes, for a
+                         backtest with delay 0); between trades the position drifts with them
+                         as shares and cash are held (default: {None}, no drift)
+
+    Returns:
+        np.ndarray -- target position of each bar (NaN where there is no trade; the first bar is
+                      'initial')
+    """
+    sell_amount = kwargs.get('sell_amount', 0.3)
+    buy_amount = kwargs.get('buy_amount', 1.0)
+    accelerator = kwargs.get('accelerator', 1.0)
+    position = kwargs.get('initial', 1.0)
+    prices = kwargs.get('prices')
+
+    values = np.asarray(values, dtype=float)
+    targets = np.full(values.shape, np.nan)
+    if len(values) == 0:
+        return targets
+    targets[0] = position
+
+    # Fraction of the position sold / of the cash bought with on each bar
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sells = np.where(
+            values > upper, sell_amount * (values - upper) / (np.max(values) - upper), 0.0)
+        buys = np.where(
+            values < lower,
+            buy_amount * (values - lower) / (np.min(values) - lower) * accelerator, 0.0)
+    sells = np.clip(np.nan_to_num(sells), 0.0, 1.0)
+    buys = np.clip(np.nan_to_num(buys), 0.0, 1.0)
+
+    # Each trade scales the position left by the one before (as it has drifted since)
+    previous = 0
+    for index in np.flatnonzero((sells > 0.0) | (buys > 0.0)):
+        if prices is not None:
+            change = prices[index] / prices[previous]
+            position = position * change / (1.0 - position + position * change)
+            previous = index
+        position *= 1.0 - sells[index]
+        position = 1.0 - (1.0 - position) * (1.0 - buys[index])
+        targets[index] = position
+    return targets
@@ -0,0 +1,270 @@
+"""
+sweep.py
+
+Parameter sweeps of a tool: every config of a grid runs on every fund (the configs of a fund in
+one process, so they share its price arrays and the cached kernels of momentum_engine), and each
+config's signals are scored with a backtest and with the forward returns that follow them.
+"""
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from libs.tools import (
+    relative_strength_indicator_rsi, full_stochastic, ultimate_oscillator, hull_moving_average,
+    know_sure_thing, bollinger_bands, parabolic_sar, forward_returns
+)
+from libs.utils import ProgressBar, suppress_renders
+
+from .engine import backtest, performance, STAT_KEYS
+from .signals import signals_to_targets
+
+# Tool -> (function, grid of its keyword arguments; the tool's defaults are in each grid)
+SWEEP_TOOLS = {
+    'rsi': (relative_strength_indicator_rsi, {
+        'period': [10, 14, 20], 'overbought': [70.0, 80.0], 'oversold': [20.0, 30.0]
+    }),
+    'full_stochastic': (full_stochastic, {
+        'config': [[10, 3, 3], [14, 3, 3], [20, 5, 5]]
+    }),
+    'ultimate': (ultimate_oscillator, {
+        'config': [[5, 10, 20], [7, 14, 28], [10, 20, 40]]
+    }),
+    'hull_moving_average': (hull_moving_average, {
+        'period': [[6, 12, 24], [9, 16, 36], [12, 24, 48]]
+    }),
+    'know_sure_thing': (know_sure_thing, {
+        'periods': [[10, 15, 20, 30], [6, 10, 15, 20]],
+        'sma_intervals': [[10, 10, 10, 15], [6, 6, 6, 10]]
+    }),
+    'bollinger_bands': (bollinger_bands, {
+        'period': [20, 30], 'stdev': [1.5, 2.0, 2.5]
+    }),
+    'parabolic_sar': (parabolic_sar, {
+        'af': [[0.02, 0.01], [0.03, 0.015], [0.04, 0.02]], 'max_factor': [0.2, 0.3]
+    })
+}
+
+# Forward windows (trading periods) of the signal scores
+SWEEP_FUTURES = [5, 15, 45, 90]
+
+
+def config_grid(grid: dict) -> list:
+    """Config Grid
+
+    Arguments:
+        grid {dict} -- keyword argument -> list of values to try
+
+    Returns:
+        list -- every combination of the values, a dict of keyword arguments each
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def sweep_tool(data: dict, funds: list, tool: str, **kwargs) -> dict:
+    """Sweep Tool
+
+    Arguments:
+        data {dict} -- fund datasets
+        funds {list} -- fund tickers to sweep over
+        tool {str} -- SWEEP_TOOLS key
+
+    Optional Args:
+        grid {dict} -- keyword argument -> values to try (default: {SWEEP_TOOLS grid})
+        futures {list} -- forward windows of the signal scores (default: {SWEEP_FUTURES})
+        holdout {float} -- fraction of each fund's most recent bars scored separately, as
+                           out-of-sample ('oos_' stats) (default: {0.0})
+        rank_by {str} -- summary column to rank the configs by (default: {'sharpe'})
+        workers {int} -- processes to sweep in (default: {os.cpu_count()})
+        clock {float} -- time for prog_bar (default: {None})
+        All backtest keyword arguments (e.g. cost, delay, size)
+
+    Returns:
+        dict -- 'summary': pd.DataFrame of the configs ranked (means over the funds), 'results':
+                pd.DataFrame with a row per config and fund, 'configs': list of the configs
+    """
+    # pylint: disable=too-many-locals
+    grid = kwargs.pop('grid', None) or SWEEP_TOOLS[tool][1]
+    rank_by = kwargs.pop('rank_by', 'sharpe')
+    workers = kwargs.pop('workers', os.cpu_count() or 1)
+    clock = kwargs.pop('clock', None)
+
+    configs = config_grid(grid)
+    funds = [fund for fund in funds if data.get(fund) is not None]
+    results = {}
+
+    progress_bar = ProgressBar(len(funds), name=f'Sweep ({tool})', offset=clock)
+    progress_bar.start()
+
+    if min(workers, len(funds)) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(funds))) as executor:
+                futures = {
+                    executor.submit(sweep_fund, data[fund], tool, configs, name=fund, **kwargs):
+                    fund for fund in funds
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    progress_bar.uptick()
+
+        except (OSError, BrokenProcessPool):
+            # Processes unavailable (e.g. restricted platforms); finish the remainder in this one
+            pass
+
+    for fund in funds:
+        if fund not in results:
+            results[fund] = sweep_fund(data[fund], tool, configs, name=fund, **kwargs)
+            progress_bar.uptick()
+
+    progress_bar.end()
+
+    rows = []
+    for fund in funds:
+        for number, row in enumerate(results[fund]):
+            rows.append({'config_id': number, 'fund': fund, **row})
+    table = pd.DataFrame(rows)
+
+    return {
+        'summary': sweep_summary(table, configs, rank_by=rank_by),
+        'results': table,
+        'configs': configs
+    }
+
+
+def sweep_fund(fund: pd.DataFrame, tool: str, configs: list, **kwargs) -> list:
+    """Sweep Fund
+
+    Runs the tool with each config on one fund (without plotting) and scores the signals
+
+    Arguments:
+        fund {pd.DataFrame} -- fund dataset
+        tool {str} -- SWEEP_TOOLS key
+        configs {list} -- keyword arguments of each run
+
+    Optional Args:
+        name {str} -- (default: {''})
+        futures {list} -- forward windows of the signal scores (default: {SWEEP_FUTURES})
+        holdout {float} -- fraction of the most recent bars scored as out-of-sample
+                           (default: {0.0})
+        All backtest keyword arguments (e.g. cost, delay, size)
+
+    Returns:
+        list -- scores of each config (see score_signals)
+    """
+    name = kwargs.pop('name', '')
+    function = SWEEP_TOOLS[tool][0]
+
+    signals = []
+    with suppress_renders():
+        for config in configs:
+            content = function(fund, name=name, plot_output=False, view='', **config)
+            signals.append(content.get('signals', []))
+
+    return score_signals(fund, signals, **kwargs)
+
+
+def score_signals(fund: pd.DataFrame, signals: list, **kwargs) -> list:
+    """Score Signals
+
+    Backtests each set of signals (long on bullish signals, out on bearish) as a row of one
+    backtest, and scores the signals by the forward returns that follow them: 'edge_<n>' is the
+    mean return 'n' periods after a signal (negated for bearish signals), 'hit_<n>' the fraction of
+    signals that were right
+
+    Arguments:
+        fund {pd.DataFrame} -- fund dataset
+        signals {list} -- 'signals' list of each config
+
+    Optional Args:
+        futures {list} -- forward windows (default: {SWEEP_FUTURES})
+        holdout {float} -- fraction of the most recent bars scored as out-of-sample
+                           (default: {0.0})
+        All backtest keyword arguments (e.g. cost, delay, size)
+
+    Returns:
+        list -- a dict of scores per set of signals
+    """
+    # pylint: disable=too-many-locals
+    futures = kwargs.pop('futures', SWEEP_FUTURES)
+    holdout = kwargs.pop('holdout', 0.0)
+
+    field = 'Adj Close' if 'Adj Close' in fund else 'Close'
+    closes = fund[field].to_numpy(dtype=float)
+    length = len(closes)
+    split = length - int(length * holdout)
+
+    targets = np.vstack([signals_to_targets(sigs, length) for sigs in signals])
+    prices = np.broadcast_to(closes, targets.shape)
+    result = backtest(prices, targets, **kwargs)
+
+    stats = {'': result['stats']}
+    if split < length:
+        stats[''] = _window_stats(result, slice(0, split), **kwargs)
+        stats['oos_'] = _window_stats(result, slice(split, length), **kwargs)
+    returns = forward_returns(closes, futures)
+
+    scores = []
+    for row, sigs in enumerate(signals):
+        score = {'signals': len(sigs)}
+        for prefix, window_stats in stats.items():
+            for key in STAT_KEYS:
+                score[f'{prefix}{key}'] = window_stats[row][key]
+        score['bench_total_return'] = result['benchmark_stats'][row]['total_return']
+        score.update(_signal_edges(sigs, returns, futures, length))
+        scores.append(score)
+    return scores
+
+
+def sweep_summary(table: pd.DataFrame, configs: list, rank_by: str = 'sharpe') -> pd.DataFrame:
+    """Sweep Summary
+
+    Arguments:
+        table {pd.DataFrame} -- a row per config and fund (see sweep_tool)
+        configs {list} -- keyword arguments of each config
+
+    Keyword Arguments:
+        rank_by {str} -- column to rank by, highest first (default: {'sharpe'})
+
+    Returns:
+        pd.DataFrame -- a row per config: its keyword arguments and the mean of each score over
+                        the funds, ranked
+    """
+    if table.empty:
+        return pd.DataFrame()
+
+    scores = table.drop(columns=['fund']).groupby('config_id').mean()
+    params = pd.DataFrame(
+        [{key: str(value) for key, value in config.items()} for config in configs])
+    summary = params.join(scores)
+    summary.insert(len(params.columns), 'funds', table.groupby('config_id').size())
+
+    if rank_by in summary:
+        summary = summary.sort_values(rank_by, ascending=False, kind='stable')
+    summary.index.name = 'config_id'
+    return summary
+
+
+def _window_stats(result: dict, window: slice, **kwargs) -> list:
+    options = {'positions': result['positions'], 'valid': result['valid'], 'window': window}
+    if 'periods_per_year' in kwargs:
+        options['periods_per_year'] = kwargs['periods_per_year']
+    return performance(result['equity'], **options)
+
+
+def _signal_edges(signals: list, returns: np.ndarray, futures: list, length: int) -> dict:
+    edges = {}
+    indexes = np.array([sig['index'] for sig in signals if sig['type'] in ('bullish', 'bearish')],
+                       dtype=int)
+    sides = np.array([1.0 if sig['type'] == 'bullish' else -1.0
+                      for sig in signals if sig['type'] in ('bullish', 'bearish')])
+    for future, future_returns in zip(futures, returns):
+        # Signals with the whole window ahead of them
+        keep = (indexes >= 0) & (indexes < length - future)
+        signed = sides[keep] * future_returns[indexes[keep]]
+        edges[f'edge_{future}'] = float(np.mean(signed)) if len(signed) > 0 else np.nan
+        edges[f'hit_{future}'] = float(np.mean(signed > 0.0)) if len(signed) > 0 else np.nan
+    return edges
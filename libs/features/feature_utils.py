@@ -1,10 +1,11 @@
 """ Utility functions for Feature Detection """
-from typing import List
+from typing import List, Tuple, Union
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from libs.utils import date_extractor, PlotType, generate_plot, INDEXES
+from libs.utils import date_axis, PlotType, generate_plot, INDEXES
 
 
 def find_local_extrema(position: list, threshold: float = 0.03, points: bool = False) -> List[dict]:
@@ -26,56 +27,104 @@ def find_local_extrema(position: list, threshold: float = 0.03, points: bool = F
     Returns:
         List[dict] -- list of objects detailing extrema info (index, value, min/max)
     """
-    # pylint: disable=too-many-branches
-    features = []
-    max_val = 0.0
-    max_ind = 0
-    min_val = 0.0
-    min_ind = 0
-    trend = 'none'
-
-    for i, close in enumerate(position):
-        if trend == 'none':
-            if close > max_val:
-                max_val = close
-                max_ind = i
-                trend = 'up'
-            else:
-                min_val = close
-                min_ind = i
-                trend = 'down'
-        elif trend == 'up':
-            if points:
-                denote = threshold * 100.0
-            else:
-                denote = max_val * threshold
-
-            if close > max_val:
-                max_val = close
-                max_ind = i
-            elif close < max_val - denote:
-                obj = {"val": max_val, "index": max_ind, "type": "max"}
-                features.append(obj)
-                trend = 'down'
-                min_val = close
-                min_ind = i
-        elif trend == 'down':
-            if points:
-                denote = threshold * 100.0
-            else:
-                denote = min_val * threshold
+    indexes, values, is_max = threshold_extrema(position, threshold=threshold, points=points)
+    return [
+        {"val": val, "index": index, "type": "max" if maximum else "min"}
+        for index, val, maximum in zip(indexes.tolist(), values.tolist(), is_max.tolist())
+    ]
+
+
+def threshold_extrema(position: list,
+                      threshold: float = 0.03,
+                      points: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Threshold Extrema
+
+    Hysteresis extrema detector: a running max (min) is confirmed as an extrema once the signal
+    reverses 'threshold' away from it.
+
+    Arguments:
+        position {list} -- position or dataset to find local extrema
 
-            if close < min_val:
-                min_val = close
-                min_ind = i
-            elif close > min_val + denote:
-                obj = {"val": min_val, "index": min_ind, "type": "min"}
-                features.append(obj)
-                trend = 'up'
-                max_val = close
-                max_ind = i
+    Keyword Arguments:
+        threshold {float} -- percent/100 or raw value (if points=True) reversal (default: {0.03})
+        points {bool} -- True for a raw value threshold (default: {False})
 
-    return features
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray] -- indexes, values, True where a maximum
+    """
+    signal = np.asarray(position, dtype=float)
+    indexes = []
+    is_max = []
+
+    if len(signal) > 0:
+        # Seeded as if the running max started at 0.0
+        direction = 1 if signal[0] > 0.0 else -1
+        start = 0
+        while True:
+            extreme, start = _trend_leg(signal, start, direction, threshold, points)
+            if start is None:
+                break
+            indexes.append(extreme)
+            is_max.append(direction == 1)
+            direction = -direction
+
+    indexes = np.array(indexes, dtype=int)
+    return indexes, signal[indexes], np.array(is_max, dtype=bool)
+
+
+def _trend_leg(signal: np.ndarray,
+               start: int,
+               direction: int,
+               threshold: float,
+               points: bool) -> Tuple[int, Union[int, None]]:
+    """Trend Leg
+
+    Follows a single up (direction=1) or down (direction=-1) leg beginning at 'start', in blocks
+    of growing size.
+
+    Arguments:
+        signal {np.ndarray} -- signal to find extrema
+        start {int} -- index that begins the leg
+        direction {int} -- 1 for an up leg, -1 for a down leg
+        threshold {float} -- percent/100 or raw value (if points=True) reversal
+        points {bool} -- True for a raw value threshold
+
+    Returns:
+        Tuple[int, Union[int, None]] -- index of the leg's extreme, index of the reversal
+                                        (None if the signal ends first)
+    """
+    # pylint: disable=too-many-arguments
+    extreme = start
+    running = signal[start]
+    if np.isnan(running):
+        return extreme, None
+
+    accumulate = np.fmax.accumulate if direction == 1 else np.fmin.accumulate
+    position = start + 1
+    block = 64
+    while position < len(signal):
+        chunk = signal[position:position + block]
+        prior = accumulate(np.concatenate(([running], chunk)))
+        denote = threshold * 100.0 if points else prior[:-1] * threshold
+
+        if direction == 1:
+            reversal = ~(chunk > prior[:-1]) & (chunk < prior[:-1] - denote)
+        else:
+            reversal = ~(chunk < prior[:-1]) & (chunk > prior[:-1] + denote)
+
+        end = int(np.argmax(reversal)) if reversal.any() else len(chunk)
+        if prior[end] != running:
+            # The first occurrence of a new extreme is where it was set
+            running = prior[end]
+            extreme = position + int(np.argmax(chunk[:end] == running))
+
+        if end < len(chunk):
+            return extreme, position + end
+
+        position += block
+        block *= 2
+
+    return extreme, None
 
 
 def find_filtered_local_extrema(filtered: list, raw: bool = False) -> dict:
@@ -93,30 +142,43 @@ def find_filtered_local_extrema(filtered: list, raw: bool = False) -> dict:
         extrema - dict() -> dictionary of lists of extrema indices of 'filtered'
             keys: 'min', 'max'
     """
+    if raw:
+        return raw_signal_extrema(filtered)
+
+    maxima, minima = filtered_extrema(filtered)
     extrema = {}
-    extrema['max'] = []
-    extrema['min'] = []
-    direct = 0
-    if not raw:
-        for i in range(1, len(filtered)):
-            if direct == 0:
-                if filtered[i] > filtered[i-1]:
-                    direct = 1
-                else:
-                    direct = -1
-            elif direct == 1:
-                if filtered[i] < filtered[i-1]:
-                    direct = -1
-                    extrema['max'].append(i-1)
-            else:
-                if filtered[i] > filtered[i-1]:
-                    direct = 1
-                    extrema['min'].append(i-1)
+    extrema['max'] = maxima.tolist()
+    extrema['min'] = minima.tolist()
+    return extrema
 
-    else:
-        extrema = raw_signal_extrema(filtered)
 
-    return extrema
+def filtered_extrema(filtered: list) -> Tuple[np.ndarray, np.ndarray]:
+    """Filtered Extrema
+
+    Extrema of a filtered signal are the sign changes of its differences. Flat steps keep the
+    direction they were entered with (the first step counts as falling if flat).
+
+    Arguments:
+        filtered {list} -- filtered signal
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- indexes of maxima, indexes of minima
+    """
+    signal = np.asarray(filtered, dtype=float)
+    if len(signal) < 3:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    diffs = signal[1:] - signal[:-1]
+    steps = np.where(diffs > 0.0, 1, np.where(diffs < 0.0, -1, 0))
+    if steps[0] == 0:
+        steps[0] = -1
+
+    last_move = np.where(steps != 0, np.arange(len(steps)), 0)
+    direction = steps[np.maximum.accumulate(last_move)]
+
+    # A step against the direction held through the previous step turns at that point
+    turns = np.flatnonzero(steps[1:] == -direction[:-1]) + 1
+    return turns[direction[turns - 1] == 1], turns[direction[turns - 1] == -1]
 
 
 def reconstruct_extrema(original: pd.DataFrame,
@@ -143,70 +205,72 @@ def reconstruct_extrema(original: pd.DataFrame,
     recon = {}
     recon['max'] = []
     recon['min'] = []
-    original_list = list(original['Close'])
-
-    if ma_type == 'simple':
-        for _max in extrema['max']:
-            start = _max - ma_size
-            start = max(start, 0)
-
-            # Search for the maximum on the original signal between 'start' and '_max'.
-            recon['max'].append(
-                [
-                    original_list.index(np.max(original_list[start:_max]), start, _max),
-                    np.max(original_list[start:_max+1])
-                ]
-            )
-
-        for _min in extrema['min']:
-            start = _min - ma_size
-            start = max(start, 0)
-
-            # Search for the maximum on the original signal between 'start' and '_min'.
-            recon['min'].append(
-                [
-                    original_list.index(np.min(original_list[start:_min]), start, _min),
-                    np.min(original_list[start:_min+1])
-                ]
-            )
+    closes = original['Close'].to_numpy(dtype=float)
 
-    if ma_type == 'windowed':
-        ma_size_adj = int(np.floor(float(ma_size)/2.0))
-        for _max in extrema['max']:
-            start = _max - ma_size_adj
-            end = _max + ma_size_adj
-            if start == end:
-                end += 1
-            start = max(start, 0)
-            end = min(end, len(original_list))
-
-            # Search for the maximum on the original signal between 'start' and 'end'.
-            recon['max'].append(
-                [
-                    original_list.index(np.max(original_list[start:end]), start, end),
-                    np.max(original_list[start:end])
-                ]
-            )
-
-        for _min in extrema['min']:
-            start = _min - ma_size_adj
-            end = _min + ma_size_adj
-            if start == end:
-                end += 1
-            start = max(start, 0)
-            end = min(end, len(original_list))
-
-            # Search for the maximum on the original signal between 'start' and 'end'.
-            recon['min'].append(
-                [
-                    original_list.index(np.min(original_list[start:end]), start, end),
-                    np.min(original_list[start:end])
-                ]
-            )
+    if ma_type not in ('simple', 'windowed'):
+        return recon
+
+    for key, is_max in (('max', True), ('min', False)):
+        indexes, values = windowed_extrema(
+            closes, np.asarray(extrema[key], dtype=int), ma_size, is_max, ma_type=ma_type)
+        recon[key] = [[index, value] for index, value in zip(indexes.tolist(), values.tolist())]
 
     return recon
 
 
+def windowed_extrema(signal: np.ndarray,
+                     centers: np.ndarray,
+                     ma_size: int,
+                     is_max: bool,
+                     ma_type: str = 'simple') -> Tuple[np.ndarray, np.ndarray]:
+    """Windowed Extrema
+
+    Max (or min) of 'signal' in a window about each of 'centers', all windows at once.
+
+    'simple': window of 'ma_size' ending at the center (center excluded for the index, included
+              for the value)
+    'windowed': window of 'ma_size' (at least 1) centered on the center
+
+    Arguments:
+        signal {np.ndarray} -- original signal
+        centers {np.ndarray} -- indexes of extrema on the filtered signal
+        ma_size {int} -- moving average filter size
+        is_max {bool} -- True for maxima, False for minima
+
+    Keyword Arguments:
+        ma_type {str} -- 'simple' or 'windowed' (default: {'simple'})
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- indexes of the extrema on 'signal', values
+    """
+    # pylint: disable=too-many-arguments
+    if len(centers) == 0:
+        return np.array([], dtype=int), np.array([], dtype=float)
+
+    if ma_type == 'windowed':
+        left = int(np.floor(float(ma_size) / 2.0))
+        width = max(2 * left, 1)
+    else:
+        left = ma_size
+        width = ma_size
+
+    # Pad so that windows running off either end are clipped ('inf' never wins)
+    fill = -np.inf if is_max else np.inf
+    padded = np.concatenate((np.full(left, fill), signal, np.full(width, fill)))
+    windows = sliding_window_view(padded, width + 1)[centers]
+
+    find = np.argmax if is_max else np.argmin
+    reduce = np.max if is_max else np.min
+    offsets = find(windows[:, :width], axis=1)
+    indexes = centers - left + offsets
+    if ma_type == 'windowed':
+        values = reduce(windows[:, :width], axis=1)
+    else:
+        values = reduce(windows, axis=1)
+
+    return indexes, values
+
+
 def remove_duplicates(recon: dict, method='threshold', threshold=0.01) -> dict:
     """ Remove Duplicates
 
@@ -223,49 +287,25 @@ def remove_duplicates(recon: dict, method='threshold', threshold=0.01) -> dict:
     Returns:
         dict -- reconstruction features data object
     """
-    if method == 'threshold':
-        most_recent = 0
-        newlist = []
-        for i in range(1, len(recon['max'])):
-            if (recon['max'][i][0] != most_recent) and \
-                ((recon['max'][i][1] > recon['max'][i-1][1] * (1+threshold)) or
-                    (recon['max'][i][1] < recon['max'][i-1][1] * (1-threshold))):
-                most_recent = recon['max'][i][0]
-                newlist.append(recon['max'][i])
-
-        recon['max'] = newlist
-        newlist = []
-        most_recent = 0
-
-        for i in range(1, len(recon['min'])):
-            if (recon['min'][i][0] != most_recent) and \
-                ((recon['min'][i][1] > recon['min'][i-1][1] * (1+threshold)) or
-                    (recon['min'][i][1] < recon['min'][i-1][1] * (1-threshold))):
-                most_recent = recon['min'][i][0]
-                newlist.append(recon['min'][i])
-        recon['min'] = newlist
-
-    # In some extrema dicts, we want granularity but not duplicated points. If an x-axis value
-    # matches one in the list, do not add it.  Simple!
-    if method == 'point':
-        most_recent = 0
-        newlist = []
-
-        for _max in recon['max']:
-            if _max[0] != most_recent:
-                most_recent = _max[0]
-                newlist.append(_max)
-
-        recon['max'] = newlist.copy()
-        newlist = []
-        most_recent = 0
-
-        for _min in recon['min']:
-            if _min[0] != most_recent:
-                most_recent = _min[0]
-                newlist.append(_min)
-
-        recon['min'] = newlist.copy()
+    if method not in ('threshold', 'point'):
+        return recon
+
+    for key in ('max', 'min'):
+        points = recon[key]
+        if method == 'threshold':
+            # Only points that move 'threshold' away from the previous point are candidates
+            values = np.array([point[1] for point in points], dtype=float)
+            candidates = np.flatnonzero(
+                (values[1:] > values[:-1] * (1+threshold)) |
+                (values[1:] < values[:-1] * (1-threshold))) + 1
+        else:
+            candidates = np.arange(len(points))
+
+        # In some extrema dicts, we want granularity but not duplicated points. If an x-axis
+        # value matches the one last kept, do not add it. Simple!
+        indexes = np.array([points[i][0] for i in candidates], dtype=int)
+        keep = indexes != np.concatenate(([0], indexes[:-1]))
+        recon[key] = [points[i] for i in candidates[keep]]
 
     return recon
 
@@ -287,8 +327,8 @@ def add_date_range(original: pd.DataFrame, extrema: dict, num_feature_points: in
         if feat:
             first_ind = feat['indexes'][0][0]
             last_ind = feat['indexes'][num_feature_points-1][0]
-            start = date_extractor(original.index[first_ind], _format='str')
-            end = date_extractor(original.index[last_ind], _format='str')
+            start = date_axis(original).strings[first_ind]
+            end = date_axis(original).strings[last_ind]
             feat['daterange'] = start + ' : ' + end
 
     return extrema
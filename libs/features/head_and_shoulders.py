@@ -3,6 +3,7 @@ from typing import List, Tuple
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from libs.tools import windowed_moving_avg
 
@@ -76,170 +77,123 @@ def find_head_shoulders(extrema: dict, fund: pd.DataFrame) -> dict:
         dict -- extrema data object with head and shoulders content
     """
     extrema['features'] = []
-    len_max = len(extrema['max'])
-    len_min = len(extrema['min'])
-    i = 0
-    j = 0
-
-    # indexes for potential features
-    feature = []
-
-    while i < len_max or j < len_min:
-        if i < len_max and j < len_min:
-            if extrema['max'][i][0] < extrema['min'][j][0]:
-                feature.append(
-                    [
-                        extrema['max'][i][0],
-                        extrema['max'][i][1],
-                        fund['Volume'][extrema['max'][i][0]]
-                    ]
-                )
-                i += 1
-            else:
-                feature.append(
-                    [
-                        extrema['min'][j][0],
-                        extrema['min'][j][1],
-                        fund['Volume'][extrema['min'][j][0]]
-                    ]
-                )
-                j += 1
-
-        elif j < len_min:
-            feature.append(
-                [
-                    extrema['min'][j][0],
-                    extrema['min'][j][1],
-                    fund['Volume'][extrema['min'][j][0]]
-                ]
-            )
-            j += 1
-
-        elif i < len_max:
-            feature.append(
-                [
-                    extrema['max'][i][0],
-                    extrema['max'][i][1],
-                    fund['Volume'][extrema['max'][i][0]]
-                ]
-            )
-            i += 1
-
-        else:
-            break
-
-        if len(feature) > 6:
-            feature.pop(0)
-
-        if len(feature) == 6:
-            extrema['features'].append(feature_detection(feature))
+    points = merge_extrema(extrema, fund)
+    if len(points) < 6:
+        return extrema
+
+    indexes = np.array([point[0] for point in points], dtype=float)
+    values = np.array([point[1] for point in points], dtype=float)
+    volumes = np.array([point[2] for point in points], dtype=float)
+    bearish, bullish = feature_detection(indexes, values, volumes)
+
+    for i in np.flatnonzero(bearish | bullish).tolist():
+        extrema['features'].append(
+            detected_feature(points[i:i+6], 'bearish' if bearish[i] else 'bullish'))
 
     return extrema
 
 
-def feature_detection(features: list) -> dict:
+def merge_extrema(extrema: dict, fund: pd.DataFrame) -> List[list]:
+    """Merge Extrema
+
+    Interleaves maxima and minima in index order (minima first on ties) as [index, value, volume]
+
+    Arguments:
+        extrema {dict} -- extrema data object
+        fund {pd.DataFrame} -- fund dataset
+
+    Returns:
+        List[list] -- merged extrema points
+    """
+    merged = extrema['min'] + extrema['max']
+
+    # A stable sort on running maxima of each list's indexes is equivalent to a merge of the two
+    # lists (even where either is not quite in order).
+    keys = np.concatenate([
+        np.maximum.accumulate(np.array([point[0] for point in extrema[key]], dtype=int))
+        for key in ('min', 'max')
+    ])
+    order = np.argsort(keys, kind='stable').tolist()
+
+    volumes = fund['Volume'].to_numpy()
+    return [[merged[i][0], merged[i][1], volumes[merged[i][0]]] for i in order]
+
+
+def feature_detection(indexes: np.ndarray,
+                      values: np.ndarray,
+                      volumes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """Feature Detection
 
-    Continuation of 'find_head_shoulders' above. If feature detected, add various feature
-    details as well.
+    Continuation of 'find_head_shoulders' above. Tests every 6-point sliding window of the merged
+    extrema at once.
 
     Arguments:
-        features {list} -- list of features objects
+        indexes {np.ndarray} -- indexes of merged extrema
+        values {np.ndarray} -- values of merged extrema
+        volumes {np.ndarray} -- volumes of merged extrema
 
     Returns:
-        dict -- detected feature object (if any)
+        Tuple[np.ndarray, np.ndarray] -- bearish mask, bullish mask (one per window)
     """
-    # pylint: disable=too-many-statements
-    detected = {}
+    index = sliding_window_view(indexes, 6)
+    val = sliding_window_view(values, 6)
+    vol = sliding_window_view(volumes, 6)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (val[:, 3] - val[:, 1]) / (index[:, 3] - index[:, 1])
+        intercept = val[:, 1] - slope * index[:, 1]
+        line = intercept + slope * index[:, 5]
+
+    # potential TOP ('W') case (bearish)
+    top = val[:, 0] > val[:, 1]
+    bearish = top & (val[:, 2] > val[:, 0]) & (val[:, 2] > val[:, 1]) & \
+        (val[:, 4] < val[:, 2]) & (val[:, 4] > val[:, 3]) & (vol[:, 4] < vol[:, 0]) & \
+        (val[:, 5] < line)
+
+    # potential BOTTOM ('M') case (bullish)
+    bullish = ~top & (val[:, 2] < val[:, 0]) & (val[:, 2] < val[:, 1]) & \
+        (val[:, 4] > val[:, 2]) & (val[:, 4] < val[:, 3]) & (vol[:, 3] > vol[:, 0]) & \
+        (val[:, 5] > line) & (vol[:, 5] > vol[:, 3])
+
+    return bearish, bullish
+
 
-    if features[0][1] > features[1][1]:
-        # potential TOP ('W') case (bearish)
-        max1 = features[0][1]
-        min1 = features[1][1]
-        vol_low = features[0][2]
-
-        if (features[2][1] > max1) and (features[2][1] > min1):
-            max2 = features[2][1]
-            min2 = features[3][1]
-            vol_top = features[2][2]
-
-            if (features[4][1] < max2) and (features[4][1] > min2) and (features[4][2] < vol_low):
-                # m3 = features[4][1]
-                # n3 = features[5][1]
-                # vol_R = features[4][2]
-                neckline = {'slope': 0.0, 'intercept': 0.0}
-                slope = (min2 - min1) / float(features[3][0] - features[1][0])
-                neckline['slope'] = float(slope)
-                intercept = min1 - slope * float(features[1][0])
-                neckline['intercept'] = float(intercept)
-                line = neckline['intercept'] + \
-                    neckline['slope'] * float(features[5][0])
-
-                if features[5][1] < line:
-                    # Head and shoulders -> bearish
-                    detected['type'] = 'bearish'
-                    # {'slope': 0.0, 'intercept': 0.0}
-                    detected['neckline'] = neckline
-                    detected['indexes'] = features.copy()
-                    detected['stats'] = {
-                        'width': 0, 'avg': 0.0, 'stdev': 0.0, 'percent': 0.0}
-                    detected['stats']['width'] = features[4][0] - \
-                        features[0][0]
-
-                    feats = features.copy()
-                    feats = [feat[1] for feat in feats]
-                    detected['stats']['avg'] = float(np.round(np.mean(feats), 3))
-                    detected['stats']['stdev'] = float(np.round(np.std(feats), 3))
-                    detected['stats']['percent'] = float(
-                        np.round(100.0 * np.std(feats) / np.mean(feats), 3))
+def detected_feature(features: list, feature_type: str) -> dict:
+    """Detected Feature
 
+    Arguments:
+        features {list} -- the 6 [index, value, volume] points of a detected window
+        feature_type {str} -- 'bearish' or 'bullish'
+
+    Returns:
+        dict -- detected feature object
+    """
+    min1 = features[1][1]
+    min2 = features[3][1]
+    slope = (min2 - min1) / float(features[3][0] - features[1][0])
+    intercept = min1 - slope * float(features[1][0])
+    feats = [feat[1] for feat in features]
+
+    detected = {}
+    detected['type'] = feature_type
+    if feature_type == 'bearish':
+        detected['neckline'] = {'slope': float(slope), 'intercept': float(intercept)}
     else:
-        # potential BOTTOM ('M') case (bullish)
-        max1 = features[0][1]
-        min1 = features[1][1]
-        vol_low = features[0][2]
-
-        if (features[2][1] < max1) and (features[2][1] < min1):
-            max2 = features[2][1]
-            min2 = features[3][1]
-            vol_top = features[3][2]
-
-            if (features[4][1] > max2) and (features[4][1] < min2) and (vol_top > vol_low):
-                # m3 = features[4][1]
-                # n3 = features[5][1]
-                # vol_R = features[4][2]
-                neckline = {'slope': 0.0, 'intercept': 0.0}
-                slope = (min2 - min1) / float(features[3][0] - features[1][0])
-                neckline['slope'] = float(slope)
-                intercept = min1 - slope * float(features[1][0])
-                neckline['intercept'] = float(intercept)
-                line = neckline['intercept'] + \
-                    neckline['slope'] * float(features[5][0])
-
-                if (features[5][1] > line) and (features[5][2] > vol_top):
-                    # Head and shoulders -> bullish
-                    detected['type'] = 'bullish'
-                    detected['neckline'] = {'slope': 0.0, 'intercept': 0.0}
-                    slope = (min2 - min1) / float(features[3][0] - features[1][0])
-                    detected['neckline']['slope'] = slope
-                    intercept = min1 - slope * float(features[1][0])
-
-                    detected['neckline']['intercept'] = intercept
-                    detected['indexes'] = features.copy()
-                    detected['stats'] = {
-                        'width': 0,
-                        'avg': 0.0,
-                        'stdev': 0.0,
-                        'percent': 0.0
-                    }
-                    detected['stats']['width'] = features[4][0] - features[0][0]
-
-                    feats = features.copy()
-                    feats = [feat[1] for feat in feats]
-                    detected['stats']['avg'] = np.round(np.mean(feats), 3)
-                    detected['stats']['stdev'] = np.round(np.std(feats), 3)
-                    detected['stats']['percent'] = np.round(
-                        100.0 * np.std(feats) / np.mean(feats), 3)
+        detected['neckline'] = {'slope': slope, 'intercept': intercept}
+    detected['indexes'] = features
+    stats = [
+        np.round(np.mean(feats), 3),
+        np.round(np.std(feats), 3),
+        np.round(100.0 * np.std(feats) / np.mean(feats), 3)
+    ]
+    if feature_type == 'bearish':
+        stats = [float(stat) for stat in stats]
+    detected['stats'] = {
+        'width': features[4][0] - features[0][0],
+        'avg': stats[0],
+        'stdev': stats[1],
+        'percent': stats[2]
+    }
 
     return detected
 
@@ -2,6 +2,7 @@
 import pandas as pd
 
 from libs.tools import trends
+from libs.utils import date_axis
 from .feature_utils import feature_plotter
 
 NEXT_STATE = {
@@ -74,14 +75,14 @@ def get_gaps(fund: pd.DataFrame, threshold: float = 0.0) -> dict:
         if fund['High'][i-1] < fund['Low'][i] * (1.0 - threshold):
             # Positive price gap
             gap_index.append(i)
-            gap_date.append(fund.index[i].strftime("%Y-%m-%d"))
+            gap_date.append(date_axis(fund).strings[i])
             gap_direction.append("up")
             diff.append(fund['High'][i] - fund['High'][i-1])
 
         elif fund['High'][i] < fund['Low'][i-1] * (1.0 - threshold):
             # Negative price gap
             gap_index.append(i)
-            gap_date.append(fund.index[i].strftime("%Y-%m-%d"))
+            gap_date.append(date_axis(fund).strings[i])
             gap_direction.append("down")
             diff.append(fund['Low'][i] - fund['Low'][i-1])
 
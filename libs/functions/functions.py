@@ -27,6 +27,8 @@ from libs.functions.sub_functions.outputs import (
 from libs.functions.sub_functions.misc import (
     relative_strength_function, risk_function
 )
+from libs.functions.sub_functions.screener import screener_function
+from libs.functions.sub_functions.sweep import sweep_function
 
 
 def run_function(config: dict, function_to_run: FunctionType, **kwargs):
@@ -88,6 +90,8 @@ FUNCTION_MAP = {
     'ledger': [ledger_function],
     'synopsis': [synopsis_function],
     'last_signals':  [assemble_last_signals_function],
+    'screen': [screener_function],
+    'sweep': [sweep_function],
     'metadata': [metadata_function],
     'pptx': [pptx_output_function],
     'pdf': [pdf_output_function]
@@ -72,46 +72,36 @@ def nasit_build(data: dict, makeup: dict, has_cash=False, by_price=True) -> list
     Returns:
         list: The new price of a particular NASIT fund
     """
-    # pylint: disable=too-many-locals,invalid-name
+    # pylint: disable=invalid-name
     CASH_PERCENT = 0.01
     START_VALUE = 25.0
-    deltas = {}
-    data_len = 0
 
     if by_price:
         key = 'Close'
     else:
         key = 'Adj Close'
 
+    deltas = {}
+    data_len = 0
     for tick in data:
-        deltas[tick] = []
-        deltas[tick].append(0.0)
-        data_len = len(data[tick][key])
-        for i in range(1, data_len):
-            diff = (data[tick][key][i] - data[tick][key][i-1]) / data[tick][key][i-1]
-            deltas[tick].append(diff)
+        closes = data[tick][key].to_numpy(dtype=float)
+        data_len = len(closes)
+        deltas[tick] = np.zeros(data_len)
+        deltas[tick][1:] = (closes[1:] - closes[:-1]) / closes[:-1]
 
     if has_cash:
-        DIVISOR = CASH_PERCENT / float(data_len) / 2.0
-        deltas['cash'] = [0.0]
-        for i in range(1, data_len):
-            deltas['cash'].append(DIVISOR)
+        deltas['cash'] = np.full(data_len, CASH_PERCENT / float(data_len) / 2.0)
+        deltas['cash'][0] = 0.0
 
-    new_fund = [0.0] * data_len
+    new_fund = np.zeros(data_len)
     for component in makeup:
         sym = component['symbol']
-        amt = component['allocation']
         if sym == 'xCASHx':
             sym = 'cash'
-        for i, val in enumerate(deltas[sym]):
-            new_fund[i] += val * amt
-
-    new_closes = [START_VALUE]
-    for i in range(1, len(new_fund)):
-        close = new_closes[-1] * (1.0 + new_fund[i])
-        new_closes.append(close)
+        new_fund += deltas[sym] * component['allocation']
 
-    return new_closes
+    new_closes = np.cumprod(np.concatenate(([START_VALUE], 1.0 + new_fund[1:])))
+    return new_closes.tolist()
 
 
 def nasit_generation_function(config: dict, print_only=False):
@@ -0,0 +1,106 @@
+""" screener function """
+import os
+import json
+from datetime import datetime
+
+from libs.metrics import screen_universe, DEFAULT_SCREEN_TOOLS
+from libs.utils import start_clock
+
+from .utils import TICKER, NORMAL, WARNING, UP_COLOR, DOWN_COLOR, function_data_download
+
+SCREEN_DIR = os.path.join("output", "screen")
+
+
+def screener_function(config: dict):
+    """screener_function
+
+    Screens the run's tickers (e.g. a universe in core.json) with a subset of the tools and prints
+    the funds ranked by their latest metrics. Settings come from the 'Screen' property of a
+    core.json-like file: {"Screen": {"tools": [...], "lookback": 10, "workers": 4, "top": 25}}
+
+    Args:
+        config (dict): configuration dictionary
+    """
+    props = config.get('properties', {}).get('Screen', {})
+    tools = props.get('tools', DEFAULT_SCREEN_TOOLS)
+    lookback = props.get('lookback', 10)
+    top = props.get('top', 25)
+
+    data, fund_list = function_data_download(config)
+    funds = [fund for fund in fund_list if fund != '^GSPC']
+    if len(funds) == 0:
+        print(f"{WARNING}Warning: no funds to screen.{NORMAL}")
+        return
+
+    print(f"Screening {TICKER}{len(funds)}{NORMAL} funds with {len(tools)} tools...")
+    kwargs = {'tools': tools, 'lookback': lookback, 'clock': start_clock()}
+    if 'workers' in props:
+        kwargs['workers'] = props['workers']
+    screen = screen_universe(data, funds, **kwargs)
+
+    screen_printer(screen['table'], top=top, failed=screen['failed'])
+    screen_writer(screen)
+
+
+def screen_printer(table, top: int = 25, failed: dict = None):
+    """screen_printer
+
+    Args:
+        table (pd.DataFrame): ranked screen table
+        top (int, optional): funds printed from each end of the ranking. Defaults to 25.
+        failed (dict, optional): reason by fund of the funds not screened. Defaults to None.
+    """
+    print("\r\n")
+    print(f"{'Rank':>5}  {'Fund':<8}{'Metric':>9}{'Chg (5)':>9}{'Bull':>6}{'Bear':>6}  " +
+          "Latest Signal (Ago)")
+    rows = table if len(table) <= 2 * top else table.head(top)
+    for rank, row in rows.iterrows():
+        color = UP_COLOR if row['metric'] > 0.0 else DOWN_COLOR
+        latest = row['latest_signal']
+        if latest:
+            latest = f"{latest} ({int(row['days_ago'])})"
+        print(f"{rank:>5}  {TICKER}{row['fund']:<8}{NORMAL}{color}{row['metric']:>9.2f}{NORMAL}" +
+              f"{row['metric_change']:>9.2f}{row['bullish']:>6}{row['bearish']:>6}  {latest}")
+    if len(table) > 2 * top:
+        print(f"{'...':>5}")
+        for rank, row in table.tail(top).iterrows():
+            color = UP_COLOR if row['metric'] > 0.0 else DOWN_COLOR
+            print(f"{rank:>5}  {TICKER}{row['fund']:<8}{NORMAL}{color}" +
+                  f"{row['metric']:>9.2f}{NORMAL}{row['metric_change']:>9.2f}" +
+                  f"{row['bullish']:>6}{row['bearish']:>6}")
+    for fund, reason in (failed or {}).items():
+        print(f"{'--':>5}  {TICKER}{fund:<8}{NORMAL}{WARNING}not screened: {reason}{NORMAL}")
+    print("")
+
+
+def screen_writer(screen: dict):
+    """screen_writer
+
+    Writes the ranked table (CSV) and the signals and metrics of each fund (JSON) to output/screen
+
+    Args:
+        screen (dict): content of screen_universe
+    """
+    if not os.path.exists(SCREEN_DIR):
+        os.makedirs(SCREEN_DIR)
+    stamp = datetime.now().strftime('%Y-%m-%d')
+    filename = os.path.join(SCREEN_DIR, f"screen_{stamp}")
+
+    screen['table'].to_csv(f"{filename}.csv", index_label='rank')
+
+    content = {
+        'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'signals': screen['signals'],
+        'last_signals': {
+            fund: {
+                'signals': fund_content['signals'],
+                'metrics': [float(metric) for metric in fund_content['metrics']]
+            }
+            for fund, fund_content in screen['last_signals'].items()
+        },
+        'failed': screen['failed']
+    }
+    with open(f"{filename}.json", 'w', encoding='utf-8') as screen_file:
+        json.dump(content, screen_file, indent=4)
+
+    print(f"Screen written to '{filename}.csv' / '.json'.")
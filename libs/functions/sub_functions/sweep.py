@@ -0,0 +1,79 @@
+""" parameter sweep function """
+import os
+from datetime import datetime
+
+from libs.backtest import sweep_tool, SWEEP_TOOLS
+from libs.utils import start_clock
+
+from .utils import TICKER, NORMAL, WARNING, function_data_download
+
+SWEEP_DIR = os.path.join("output", "sweep")
+
+
+def sweep_function(config: dict):
+    """sweep_function
+
+    Sweeps grids of a tool's parameters over the run's tickers and prints the configs ranked by
+    their scores. Settings come from the 'Sweep' property of a core.json-like file:
+    {"Sweep": {"tool": "rsi", "grid": {"period": [10, 14, 20]}, "holdout": 0.3, "cost": 0.001,
+    "rank_by": "sharpe", "workers": 4, "top": 10}}
+
+    Args:
+        config (dict): configuration dictionary
+    """
+    props = config.get('properties', {}).get('Sweep', {})
+    tool = props.get('tool', 'rsi')
+    top = props.get('top', 10)
+
+    if tool not in SWEEP_TOOLS:
+        print(f"{WARNING}Warning: no sweep of '{tool}'; tools are {list(SWEEP_TOOLS)}.{NORMAL}")
+        return
+
+    data, fund_list = function_data_download(config)
+    funds = [fund for fund in fund_list if fund != '^GSPC']
+    if len(funds) == 0:
+        print(f"{WARNING}Warning: no funds to sweep.{NORMAL}")
+        return
+
+    kwargs = {
+        key: props[key] for key in ('grid', 'futures', 'holdout', 'rank_by', 'workers', 'cost',
+                                    'delay', 'size')
+        if key in props
+    }
+    print(f"Sweeping {tool} over {TICKER}{len(funds)}{NORMAL} funds...")
+    sweep = sweep_tool(data, funds, tool, clock=start_clock(), **kwargs)
+
+    sweep_printer(sweep['summary'], top=top)
+    sweep_writer(sweep, tool)
+
+
+def sweep_printer(summary, top: int = 10):
+    """sweep_printer
+
+    Args:
+        summary (pd.DataFrame): ranked sweep summary
+        top (int, optional): configs printed. Defaults to 10.
+    """
+    print("\r\n")
+    print(summary.head(top).to_string(float_format=lambda value: f"{value:.2f}"))
+    print("")
+
+
+def sweep_writer(sweep: dict, tool: str):
+    """sweep_writer
+
+    Writes the ranked summary and the scores of every config and fund (CSV) to output/sweep
+
+    Args:
+        sweep (dict): content of sweep_tool
+        tool (str): tool swept
+    """
+    if not os.path.exists(SWEEP_DIR):
+        os.makedirs(SWEEP_DIR)
+    stamp = datetime.now().strftime('%Y-%m-%d')
+    filename = os.path.join(SWEEP_DIR, f"sweep_{tool}_{stamp}")
+
+    sweep['summary'].to_csv(f"{filename}.csv")
+    sweep['results'].to_csv(f"{filename}_funds.csv", index=False)
+
+    print(f"Sweep written to '{filename}.csv' / '_funds.csv'.")
@@ -1,4 +1,5 @@
 """ Metrics """
+from .sector_analysis import sector_analysis
 from .market_composite_index import market_composite_index
 from .bond_composite_index import bond_composite_index
 from .type_composite_index import type_composite_index
@@ -6,3 +7,6 @@ from .correlation_index import correlation_composite_index
 from .metrics_utils import future_returns, metadata_to_dataset
 from .synopsis import generate_synopsis
 from .content_list import assemble_last_signals
+from .screener import (
+    screen_universe, screen_funds, screen_table, screen_signals, SCREEN_TOOLS, DEFAULT_SCREEN_TOOLS
+)
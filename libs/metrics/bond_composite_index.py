@@ -6,19 +6,19 @@ for various bond types of the bond market represented by the Vanguard ETFs liste
 'tickers' below in 'metrics_initializer'. Note - bond oscillators are not as accurate
 as market oscillators, but the metrics can still provide buy-sell signals.
 """
-import os
-import json
 from typing import Tuple, Union
 
 import pandas as pd
 import numpy as np
 
-from libs.tools import cluster_oscillators, windowed_moving_avg
+from libs.tools import generate_cluster, windowed_moving_avg
 from libs.utils import (
     generate_plot, ProgressBar, dates_extractor_list, download_data_indexes, STANDARD_COLORS,
-    PlotType
+    PlotType, get_resources
 )
 
+from .sector_analysis import sector_analysis
+
 WARNING = STANDARD_COLORS["warning"]
 NORMAL = STANDARD_COLORS["normal"]
 
@@ -27,7 +27,7 @@ BOND_NAME_MAP = {
 }
 
 
-def bond_composite_index(config: dict, **kwargs):
+def bond_composite_index(config: dict, **kwargs) -> dict:
     """Bond Composite Index (BCI)
 
     Arguments:
@@ -36,13 +36,17 @@ def bond_composite_index(config: dict, **kwargs):
     Optional Args:
         plot_output {bool} -- True to render plot in realtime (default: {True})
         clock {float} -- time for prog_bar (default: {None})
+
+    Returns:
+        dict -- composite signal, index, and dates of each bond type
     """
-    # pylint: disable=too-many-branches,too-many-locals
+    # pylint: disable=too-many-locals
     plot_output = kwargs.get('plot_output', True)
     clock = kwargs.get('clock')
 
     period = config['period']
     properties = config['properties']
+    bci = {}
     plots = []
     legend = []
 
@@ -50,19 +54,36 @@ def bond_composite_index(config: dict, **kwargs):
     if properties is not None:
         if 'Indexes' in properties:
             props = properties['Indexes']
-            for bond_type in ('Treasury Bond', 'Corporate Bond', 'International Bond'):
-                if bond_type in props:
-                    bond_type_name = bond_type.split(' ', maxsplit=1)[0]
-                    data, sectors, index_type, m_data = metrics_initializer(
-                        period=period, bond_type=bond_type_name)
-                    if m_data:
-                        _, data, dates = composite_index(data, sectors, m_data,
-                                                            plot_output=plot_output,
-                                                            bond_type=bond_type_name,
-                                                            index_type=index_type,
-                                                            clock=clock)
-                        plots.append(data)
-                        legend.append(bond_type_name)
+            bond_types = [
+                bond_type.split(' ', maxsplit=1)[0]
+                for bond_type in ('Treasury Bond', 'Corporate Bond', 'International Bond')
+                if bond_type in props
+            ]
+            if len(bond_types) == 0:
+                return bci
+
+            data, m_data = metrics_initializer(period=period, bond_types=bond_types)
+            if m_data:
+                # Oscillators of every bond fund (of all of the bond types) generated at once
+                tickers = bond_tickers(m_data, bond_types)
+                clusters = sector_analysis(data, tickers, clock=clock)['market']
+
+                for bond_type_name in bond_types:
+                    composite, index_chart, dates = composite_index(
+                        data, list(m_data[bond_type_name]), m_data,
+                        plot_output=plot_output,
+                        bond_type=bond_type_name,
+                        index_type=BOND_NAME_MAP.get(bond_type_name, bond_type_name),
+                        clock=clock,
+                        clusters=clusters)
+                    plots.append(index_chart)
+                    legend.append(bond_type_name)
+
+                    bci[bond_type_name] = {
+                        'tabular': composite,
+                        'index': index_chart,
+                        'date': [date.strftime("%Y-%m-%d") for date in dates]
+                    }
 
             if len(plots) > 0:
                 generate_plot(
@@ -73,45 +94,64 @@ def bond_composite_index(config: dict, **kwargs):
                     )
                 )
 
+    return bci
+
 
 def metrics_initializer(period='2y',
-                        bond_type='Treasury') -> Tuple[dict, list, str, Union[dict, None]]:
+                        bond_types: Union[list, None] = None) -> Tuple[dict, Union[dict, None]]:
     """Metrics Initializer
 
+    Downloads the funds of all of the bond types together
+
     Keyword Arguments:
         period {str} -- (default: {'2y'})
-        bond_type {str} -- (default: {'Treasury'})
+        bond_types {list} -- (default: {['Treasury']})
 
     Returns:
-        list -- downloaded_data, sector_list, index, metrics_file data
+        list -- downloaded_data, metrics file data
     """
-    metrics_file = os.path.join("resources", "sectors.json")
-    if not os.path.exists(metrics_file):
+    if not bond_types:
+        bond_types = ['Treasury']
+
+    resources = get_resources()
+    if not resources.has('sectors'):
         print(
-            f"{WARNING}WARNING: '{metrics_file}' not found for " +
+            f"{WARNING}WARNING: '{resources.file('sectors')}' not found for " +
             f"'metrics_initializer'. Failed.{NORMAL}")
-        return {}, [], '', None
+        return {}, None
 
-    with open(metrics_file, 'r', encoding='utf-8') as m_file:
-        m_data = json.load(m_file)
-        m_file.close()
-        m_data = m_data.get("Bond_Weight")
+    m_data = resources.bond_weights
 
-    data = m_data[bond_type]
-    tickers = list(data.keys())
-    tickers = ' '.join(tickers)
-    index = BOND_NAME_MAP.get(bond_type, bond_type)
+    sectors = bond_tickers(m_data, bond_types)
+    tickers = ' '.join(sectors)
 
     if isinstance(period, (list)):
         period = period[0]
 
-    sectors = tickers.split(' ')
     print(" ")
-    print(f'Fetching {bond_type} Bond Composite Index funds for {period}...')
+    print(f'Fetching {", ".join(bond_types)} Bond Composite Index funds for {period}...')
     data, _ = download_data_indexes(
         indexes=sectors, tickers=tickers, period=period, interval='1d')
     print(" ")
-    return data, sectors, index, m_data
+    return data, m_data
+
+
+def bond_tickers(m_data: dict, bond_types: list) -> list:
+    """Bond Tickers
+
+    Arguments:
+        m_data {dict} -- bond content from sectors.json
+        bond_types {list} -- e.g. 'Treasury', 'International', or 'Corporate'
+
+    Returns:
+        list -- funds of the bond types (each once)
+    """
+    tickers = []
+    for bond_type in bond_types:
+        for tick in m_data[bond_type]:
+            if tick not in tickers:
+                tickers.append(tick)
+    return tickers
 
 
 def bond_type_index_generator(data: pd.DataFrame, m_data: dict, bond_type='Treasury') -> list:
@@ -166,12 +206,15 @@ def composite_index(data: dict,
 
     Optional Args:
         clock {uint64_t} -- timekeeping for prog_bar (default: {None})
+        clusters {dict} -- 'market' clustered oscillator signal of each fund, e.g. from
+                           sector_analysis (default: {None}, generated here)
 
     Returns:
         list -- composite signal, plots, dates
     """
     # pylint: disable=too-many-locals
     clock = kwargs.get('clock')
+    clusters = kwargs.get('clusters')
 
     progress = len(sectors) + 2
     prog_bar = ProgressBar(progress, name=f'{bond_type} Bond Composite Index', offset=clock)
@@ -180,9 +223,10 @@ def composite_index(data: dict,
     composite = []
     for tick in sectors:
         if tick != index_type:
-            cluster = cluster_oscillators(
-                data[tick], plot_output=False, function='market', wma=False)
-            graph = cluster['tabular']
+            if clusters is not None:
+                graph = clusters[tick]
+            else:
+                graph = generate_cluster(data[tick], 'market')
             prog_bar.uptick()
             composite.append(graph)
 
@@ -199,10 +243,9 @@ def composite_index(data: dict,
     max_ = np.max(np.abs(composite2))
     composite2 = [x / max_ for x in composite2]
 
-    key = list(data.keys())[0]
     data_to_plot = bond_type_index_generator(
         data, index_dict, bond_type=bond_type)
-    dates = dates_extractor_list(data[key])
+    dates = dates_extractor_list(data[sectors[0]])
 
     generate_plot(
         PlotType.DUAL_PLOTTING,
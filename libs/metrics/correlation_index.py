@@ -1,12 +1,10 @@
 """ Correlation Composite Index """
-import os
-import json
 from datetime import datetime, timedelta
 
 import numpy as np
 
 from libs.utils import (
-    download_data_indexes, index_appender, ProgressBar, PlotType, generate_plot
+    download_data_indexes, index_appender, ProgressBar, PlotType, generate_plot, get_resources
 )
 from libs.tools import beta_comparison_list, simple_moving_avg
 
@@ -57,16 +55,13 @@ def metrics_initializer(duration: str = 'short') -> list:
         list -- data downloaded and sector list
     """
     # pylint: disable=invalid-name
-    metrics_file = os.path.join("resources", "sectors.json")
-    if not os.path.exists(metrics_file):
+    resources = get_resources()
+    if not resources.has('sectors'):
         return None, []
 
-    with open(metrics_file, 'r', encoding='utf-8') as m_file:
-        m_data = json.load(m_file)
-        m_file.close()
-        m_data = m_data.get("Correlation")
+    m_data = resources.correlation
 
-    sectors = m_data['tickers']
+    sectors = list(m_data['tickers'])
     tickers = " ".join(m_data['tickers'])
     START = m_data['start']
 
@@ -9,20 +9,19 @@ clustered oscillator metric on the S&P500 by itself.
 Newer - compares this metric with a correlation metric of each sector.
 """
 
-import os
-import json
 from typing import Tuple, Union
 
 import pandas as pd
 import numpy as np
 
-from libs.tools import (
-    cluster_oscillators, beta_comparison_list, windowed_moving_avg
-)
+from libs.tools import beta_comparison_list, windowed_moving_avg
 from libs.utils import (
-    generate_plot, ProgressBar, index_appender, download_data_indexes, STANDARD_COLORS, PlotType
+    generate_plot, ProgressBar, index_appender, download_data_indexes, STANDARD_COLORS, PlotType,
+    get_resources
 )
 
+from .sector_analysis import sector_analysis
+
 ERROR_COLOR = STANDARD_COLORS["error"]
 WARNING = STANDARD_COLORS["warning"]
 NORMAL_COLOR = STANDARD_COLORS["normal"]
@@ -37,16 +36,20 @@ def market_composite_index(**kwargs) -> Tuple[dict, Union[dict, None], Union[lis
         period {str / list} -- time period for data (e.g. '2y') (default: {None})
         clock {uint64_t} -- time for prog_bar (default: {None})
         data {pd.DataFrame} -- dataset with sector funds (default: {None})
+        sectors {list} -- list of sectors (default: {None})
+        clusters {dict} -- sector_analysis signals with the 'market' function (default: {None})
 
     returns:
         list -- dict contains all mci information, dict fund content, sector list
     """
+    # pylint: disable=too-many-nested-blocks
     config = kwargs.get('config')
     period = kwargs.get('period')
     clock = kwargs.get('clock')
     plot_output = kwargs.get('plot_output', True)
     data = kwargs.get('data')
     sectors = kwargs.get('sectors')
+    clusters = kwargs.get('clusters')
 
     if config is not None:
         period = config['period']
@@ -75,12 +78,16 @@ def market_composite_index(**kwargs) -> Tuple[dict, Union[dict, None], Union[lis
                         data, sectors = metrics_initializer(period=period)
 
                     if data:
-                        prog_bar = ProgressBar(len(sectors) * 2 + 5,
+                        if clusters is None or 'market' not in clusters:
+                            clusters = sector_analysis(data, sectors, clock=clock)
+
+                        prog_bar = ProgressBar(len(sectors) + 5,
                                         name='Market Composite Index', offset=clock)
                         prog_bar.start()
 
                         composite = composite_index(
-                            data, sectors, plot_output=plot_output, progress_bar=prog_bar)
+                            data, sectors, clusters['market'], plot_output=plot_output,
+                            progress_bar=prog_bar)
                         correlations = composite_correlation(
                             data, sectors, plot_output=plot_output, progress_bar=prog_bar)
 
@@ -102,19 +109,16 @@ def metrics_initializer(period='5y', name='Market Composite Index') -> Tuple[dic
     Returns:
         list -- data downloaded, sector list
     """
-    metrics_file = os.path.join("resources", "sectors.json")
-    if not os.path.exists(metrics_file):
+    resources = get_resources()
+    if not resources.has('sectors'):
         print(
-            f"{WARNING}WARNING: '{metrics_file}' not found for " +
+            f"{WARNING}WARNING: '{resources.file('sectors')}' not found for " +
             f"'metrics_initializer'. Failed.{NORMAL_COLOR}")
         return None, []
 
-    with open(metrics_file, 'r', encoding='utf-8') as m_file:
-        m_data = json.load(m_file)
-        m_file.close()
-        m_data = m_data.get("Market_Composite")
+    m_data = resources.market_composite
 
-    sectors = m_data['tickers']
+    sectors = list(m_data['tickers'])
     tickers = " ".join(m_data['tickers'])
 
     tickers = index_appender(tickers)
@@ -167,12 +171,14 @@ def simple_beta_rsq(fund: pd.DataFrame,
     return simple_br
 
 
-def composite_index(data: dict, sectors: list, progress_bar=None, plot_output=True) -> list:
+def composite_index(data: dict, sectors: list, clusters: dict,
+                    progress_bar=None, plot_output=True) -> list:
     """Composite Index
 
     Arguments:
         data {dict} -- data
         sectors {list} -- list of sectors
+        clusters {dict} -- 'market' clustered oscillator signal of each sector
 
     Keyword Arguments:
         progress_bar {ProgressBar} -- (default: {None})
@@ -181,17 +187,7 @@ def composite_index(data: dict, sectors: list, progress_bar=None, plot_output=Tr
     Returns:
         list -- correlation vector
     """
-    composite = []
-    for tick in sectors:
-        cluster = cluster_oscillators(
-            data[tick],
-            plot_output=False,
-            function='market',
-            wma=False,
-            progress_bar=progress_bar)
-
-        graph = cluster['tabular']
-        composite.append(graph)
+    composite = [clusters[tick] for tick in sectors]
 
     composite2 = []
     for i in range(len(composite[0])):
@@ -6,7 +6,8 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDICATOR_NAMES
+from libs.utils import INDICATOR_NAMES, date_axis
+from libs.tools import forward_returns
 
 SP_500_NAMES = ['^GSPC', 'S&P500', 'SP500', 'GSPC', 'INDEX']
 ACCEPTED_ATTS = INDICATOR_NAMES
@@ -25,6 +26,8 @@ def future_returns(fund: pd.DataFrame, **kwargs) -> Union[pd.DataFrame, dict]:
     Optional Args:
         futures {list} -- list of time windows for future trading days (default: {5, 15, 45, 90})
         to_json {bool} -- True outputs dates as json-stringifiable (default: {True})
+        float32 {bool} -- returns as (unrounded) float32 np.ndarrays rather than lists rounded
+                          to 3 decimals; not json-stringifiable (default: {False})
         progress_bar {ProgressBar} -- (default: {None})
 
     Returns:
@@ -32,31 +35,25 @@ def future_returns(fund: pd.DataFrame, **kwargs) -> Union[pd.DataFrame, dict]:
     """
     futures = kwargs.get('futures', [5, 15, 45, 90])
     to_json = kwargs.get('to_json', True)
+    float32 = kwargs.get('float32', False)
     progress_bar = kwargs.get('progress_bar', None)
 
     fr_data = {}
 
     increment = 1.0 / float(len(futures) + 1)
-    for future in futures:
-        f_data = []
-        for i in range(len(fund['Close'])-future):
-            cur = fund['Close'][i]
-            fut = fund['Close'][i+future]
-            val = np.round((fut - cur) / cur * 100.0, 3)
-            f_data.append(val)
-
-        for i in range(future):
-            f_data.append(0.0)
-        fr_data[str(future)] = f_data.copy()
-
-        if progress_bar is not None:
-            progress_bar.uptick(increment=increment)
-
-    f_data = []
-    for index_value in fund.index:
-        f_data.append(index_value.strftime("%Y-%m-%d"))
-
-    fr_data['index'] = f_data
+    returns = forward_returns(fund['Close'].to_numpy(dtype=float), futures)
+    if float32:
+        returns = returns.astype(np.float32)
+    else:
+        returns = np.round(returns, 3)
+
+    for future, f_data in zip(futures, returns):
+        fr_data[str(future)] = f_data if float32 else f_data.tolist()
+
+    if progress_bar is not None:
+        progress_bar.uptick(increment=increment * len(futures))
+
+    fr_data['index'] = list(date_axis(fund).strings)
     if not to_json:
         data_frame = pd.DataFrame.from_dict(fr_data)
         data_frame.set_index('index', inplace=True)
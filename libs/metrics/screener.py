@@ -0,0 +1,278 @@
+"""
+screener.py
+
+Signal-only screen of a whole universe of funds: a subset of the tools (no plots, no metadata API
+calls) run on every fund in parallel processes, reduced by assemble_last_signals to each fund's
+recent signals and metrics, and ranked.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+
+from libs.tools import (
+    cluster_oscillators, full_stochastic, relative_strength_indicator_rsi, ultimate_oscillator,
+    awesome_oscillator, momentum_oscillator, on_balance_volume, triple_moving_average,
+    triple_exp_mov_average, moving_average_swing_trade, hull_moving_average,
+    mov_avg_convergence_divergence, bear_bull_power, total_power, bollinger_bands,
+    commodity_channel_index, rate_of_change_oscillator, know_sure_thing, average_true_range,
+    average_directional_index, parabolic_sar, demand_index, candlesticks
+)
+from libs.tools.returns_kernel import interval_return_stats
+from libs.utils import ProgressBar, suppress_renders, STANDARD_COLORS
+
+from .content_list import assemble_last_signals
+
+WARNING = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+# Metadata key (as in a full run) -> tool, keyword arguments
+SCREEN_TOOLS = {
+    'clustered_osc': (cluster_oscillators, {'function': 'all', 'filter_thresh': 3}),
+    'full_stochastic': (full_stochastic, {}),
+    'rsi': (relative_strength_indicator_rsi, {}),
+    'ultimate': (ultimate_oscillator, {}),
+    'awesome': (awesome_oscillator, {}),
+    'momentum_oscillator': (momentum_oscillator, {}),
+    'on_balance_volume': (on_balance_volume, {}),
+    'simple_moving_average': (triple_moving_average, {}),
+    'exp_moving_average': (triple_exp_mov_average, {}),
+    'sma_swing_trade': (moving_average_swing_trade, {}),
+    'ema_swing_trade': (moving_average_swing_trade, {'function': 'ema'}),
+    'hull_moving_average': (hull_moving_average, {}),
+    'macd': (mov_avg_convergence_divergence, {}),
+    'bear_bull_power': (bear_bull_power, {}),
+    'total_power': (total_power, {}),
+    'bollinger_bands': (bollinger_bands, {}),
+    'commodity_channels': (commodity_channel_index, {}),
+    'rate_of_change': (rate_of_change_oscillator, {}),
+    'know_sure_thing': (know_sure_thing, {}),
+    'average_true_range': (average_true_range, {}),
+    'adx': (average_directional_index, {}),
+    'parabolic_sar': (parabolic_sar, {}),
+    'demand_index': (demand_index, {}),
+    'candlesticks': (candlesticks, {})
+}
+
+# The tools that are quick enough for a daily screen: about 0.1s per 500-period fund on one core
+# (about 11s per hundred funds, divided by the worker processes). The slower ones (clustered_osc,
+# bear_bull_power, on_balance_volume, full_stochastic, commodity_channels, bollinger_bands, ...;
+# 0.03s - 0.5s each) are left to the full run or to the 'tools' option.
+DEFAULT_SCREEN_TOOLS = [
+    'rsi', 'awesome', 'momentum_oscillator', 'exp_moving_average', 'ema_swing_trade',
+    'hull_moving_average', 'macd', 'total_power', 'rate_of_change', 'know_sure_thing',
+    'demand_index'
+]
+
+# Fewest trading periods a tool runs on (shorter funds are not screened with it); other tools run
+# on DEFAULT_MIN_BARS
+SCREEN_MIN_BARS = {
+    'awesome': 60, 'simple_moving_average': 60, 'exp_moving_average': 60, 'sma_swing_trade': 60,
+    'hull_moving_average': 60, 'total_power': 60, 'commodity_channels': 100
+}
+DEFAULT_MIN_BARS = 30
+
+# Funds sent to a worker process at a time
+SCREEN_CHUNK = 8
+
+
+def screen_universe(data: dict, funds: list, **kwargs) -> dict:
+    """Screen Universe
+
+    Arguments:
+        data {dict} -- fund datasets
+        funds {list} -- fund tickers to screen
+
+    Optional Args:
+        tools {list} -- SCREEN_TOOLS keys to run (default: {DEFAULT_SCREEN_TOOLS})
+        lookback {int} -- trading periods into the past to list signals of (default: {10})
+        workers {int} -- processes to screen in (default: {os.cpu_count()})
+        clock {float} -- time for prog_bar (default: {None})
+
+    Returns:
+        dict -- 'table': ranked pd.DataFrame (a row per fund), 'signals': recent signals of every
+                fund (most recent first), 'last_signals': assemble_last_signals content by fund,
+                'failed': reason by fund of the funds not screened (too short, or a tool failed)
+    """
+    # pylint: disable=too-many-locals
+    tools = kwargs.get('tools', DEFAULT_SCREEN_TOOLS)
+    lookback = kwargs.get('lookback', 10)
+    workers = kwargs.get('workers', os.cpu_count() or 1)
+    clock = kwargs.get('clock')
+
+    unknown = [tool for tool in tools if tool not in SCREEN_TOOLS]
+    if unknown:
+        print(f"{WARNING}Warning: unknown screen tools {unknown} skipped.{NORMAL}")
+        tools = [tool for tool in tools if tool in SCREEN_TOOLS]
+
+    failed = {}
+    min_bars = max([DEFAULT_MIN_BARS] + [SCREEN_MIN_BARS.get(tool, 0) for tool in tools])
+    for fund in funds:
+        if data.get(fund) is not None and len(data[fund]) < min_bars:
+            failed[fund] = f"{len(data[fund])} periods (the tools need {min_bars})"
+
+    funds = [fund for fund in funds if data.get(fund) is not None and fund not in failed]
+    chunks = [funds[i:i + SCREEN_CHUNK] for i in range(0, len(funds), SCREEN_CHUNK)]
+    last_signals = {}
+
+    progress_bar = ProgressBar(len(funds), name='Screen', offset=clock)
+    progress_bar.start()
+
+    if min(workers, len(chunks)) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                futures = [
+                    executor.submit(
+                        screen_funds, {fund: data[fund] for fund in chunk}, tools, lookback)
+                    for chunk in chunks
+                ]
+                for future in as_completed(futures):
+                    try:
+                        content = future.result()
+                    except Exception:  # pylint: disable=broad-except
+                        # e.g. a fund that won't pickle; its chunk is retried in this process
+                        continue
+                    last_signals.update(content)
+                    progress_bar.uptick(increment=len(content))
+
+        except (OSError, BrokenProcessPool):
+            # Processes unavailable (e.g. restricted platforms); finish the remainder in this one
+            pass
+
+    for chunk in chunks:
+        remaining = [fund for fund in chunk if fund not in last_signals and fund not in failed]
+        if remaining:
+            last_signals.update(
+                screen_funds({fund: data[fund] for fund in remaining}, tools, lookback))
+            progress_bar.uptick(increment=len(remaining))
+
+    progress_bar.end()
+
+    for fund in funds:
+        if 'error' in last_signals[fund]:
+            failed[fund] = last_signals.pop(fund)['error']
+    if failed:
+        print(f"{WARNING}Warning: {len(failed)} funds not screened: {list(failed)}.{NORMAL}")
+
+    last_signals = {fund: last_signals[fund] for fund in funds if fund in last_signals}
+    return {
+        'table': screen_table(data, last_signals),
+        'signals': screen_signals(last_signals),
+        'last_signals': last_signals,
+        'failed': failed
+    }
+
+
+def screen_funds(datasets: dict, tools: list, lookback: int) -> dict:
+    """Screen Funds
+
+    Runs the tools on each fund without plotting (and without the metadata API). A fund whose
+    tools fail doesn't stop the others; its content is {'error': reason}.
+
+    Arguments:
+        datasets {dict} -- fund datasets by ticker
+        tools {list} -- SCREEN_TOOLS keys to run
+        lookback {int} -- trading periods into the past to list signals of
+
+    Returns:
+        dict -- assemble_last_signals content (or {'error': reason}) by fund
+    """
+    content = {}
+    with suppress_renders():
+        for fund, dataset in datasets.items():
+            meta_sub = {}
+            tool = None
+            try:
+                for tool in tools:
+                    function, tool_kwargs = SCREEN_TOOLS[tool]
+                    meta_sub[tool] = function(
+                        dataset, name=fund, plot_output=False, view='', **tool_kwargs)
+
+                content[fund] = assemble_last_signals(meta_sub, lookback=lookback, name=fund)
+
+            except Exception as error:  # pylint: disable=broad-except
+                content[fund] = {'error': f"{tool}: {type(error).__name__}: {error}"}
+    return content
+
+
+def screen_table(data: dict, last_signals: dict) -> pd.DataFrame:
+    """Screen Table
+
+    Arguments:
+        data {dict} -- fund datasets
+        last_signals {dict} -- assemble_last_signals content by fund
+
+    Returns:
+        pd.DataFrame -- a row per fund: the latest metric, its change over 5 periods, the counts of
+                        recent bullish and bearish signals, the most recent signal, and the mean
+                        and standard deviation of the last year's returns; ranked by the metric
+    """
+    # pylint: disable=too-many-locals
+    rows = []
+    for fund, content in last_signals.items():
+        metrics = np.asarray(content['metrics'], dtype=float)
+        signals = content['signals']
+        row = {
+            'fund': fund,
+            'metric': metrics[-1] if len(metrics) > 0 else 0.0,
+            'metric_change': metrics[-1] - metrics[-6] if len(metrics) > 5 else 0.0,
+            'bullish': sum(1 for signal in signals if signal['type'] == 'bullish'),
+            'bearish': sum(1 for signal in signals if signal['type'] == 'bearish'),
+            'latest_signal': '',
+            'days_ago': None
+        }
+        if signals:
+            row['latest_signal'] = f"{signals[0]['type']} {signals[0]['indicator']}"
+            row['days_ago'] = signals[0]['days_ago']
+        rows.append(row)
+
+    table = pd.DataFrame(rows, columns=[
+        'fund', 'metric', 'metric_change', 'bullish', 'bearish', 'latest_signal', 'days_ago'])
+    table['net_signals'] = table['bullish'] - table['bearish']
+
+    # Return statistics of the last year (or all of a shorter fund's periods); funds of the same
+    # window are computed together as rows of a matrix
+    groups = {}
+    for row, fund in enumerate(table['fund']):
+        close = _close(data[fund])
+        groups.setdefault(min(len(close), 250), []).append((row, close))
+
+    table['return_mean'] = np.nan
+    table['return_std'] = np.nan
+    for periods, members in groups.items():
+        if periods > 1:
+            rows = [row for row, _ in members]
+            batch = np.vstack([close[-periods:] for _, close in members])
+            mean, _, std = interval_return_stats(batch, interval=periods)
+            table.loc[rows, 'return_mean'] = mean * 100.0
+            table.loc[rows, 'return_std'] = std * 100.0
+
+    table = table.sort_values(
+        ['metric', 'net_signals'], ascending=False, kind='stable').reset_index(drop=True)
+    table.index = table.index + 1
+    return table
+
+
+def screen_signals(last_signals: dict) -> list:
+    """Screen Signals
+
+    Arguments:
+        last_signals {dict} -- assemble_last_signals content by fund
+
+    Returns:
+        list -- recent signals of every fund (with a 'fund' key), most recent first
+    """
+    signals = []
+    for fund, content in last_signals.items():
+        for signal in content['signals']:
+            signals.append(dict(signal, fund=fund))
+    signals.sort(key=lambda signal: signal['days_ago'])
+    return signals
+
+
+def _close(fund: pd.DataFrame) -> np.ndarray:
+    if 'Adj Close' in fund:
+        return fund['Adj Close'].to_numpy(dtype=float)
+    return fund['Close'].to_numpy(dtype=float)
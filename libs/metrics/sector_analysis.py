@@ -0,0 +1,94 @@
+"""
+sector_analysis.py
+
+The clustered oscillators of each sector fund, generated once (in parallel processes) for the
+market composite (MCI) and type composite (TCI) indexes to assemble their composites from.
+"""
+import os
+from multiprocessing import Manager
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+from libs.tools import generate_cluster
+from libs.utils import ProgressBar
+
+# Progress of a job reported by generate_cluster while it runs; the rest is ticked on completion
+CLUSTER_PROGRESS = 0.5
+
+
+def sector_analysis(data: dict, sectors: list, **kwargs) -> dict:
+    """Sector Analysis
+
+    Clustered oscillator signals (as cluster_oscillators' 'tabular' with wma=False) of every
+    sector fund, for each oscillator function
+
+    Arguments:
+        data {dict} -- sector fund datasets
+        sectors {list} -- sector fund tickers
+
+    Optional Args:
+        functions {list} -- cluster_oscillators functions to generate (default: {['market']})
+        workers {int} -- processes to generate the signals in (default: {os.cpu_count()})
+        clock {float} -- time for prog_bar (default: {None})
+
+    Returns:
+        dict -- signals by function, then by sector
+    """
+    functions = kwargs.get('functions', ['market'])
+    workers = kwargs.get('workers', os.cpu_count() or 1)
+    clock = kwargs.get('clock')
+
+    jobs = [(function, sector) for function in functions for sector in sectors]
+    clusters = {function: {} for function in functions}
+
+    progress_bar = ProgressBar(len(jobs), name='Sector Analysis', offset=clock)
+    progress_bar.start()
+
+    if min(workers, len(jobs)) > 1:
+        try:
+            _parallel_clusters(data, jobs, clusters, progress_bar, min(workers, len(jobs)))
+
+        except (OSError, BrokenProcessPool):
+            # Processes unavailable (e.g. restricted platforms); finish the remainder in this one
+            pass
+
+    for function, sector in jobs:
+        if sector not in clusters[function]:
+            clusters[function][sector] = generate_cluster(
+                data[sector], function, p_bar=progress_bar)
+            progress_bar.uptick(increment=1.0 - CLUSTER_PROGRESS)
+
+    progress_bar.end()
+    return clusters
+
+
+def _parallel_clusters(data: dict, jobs: list, clusters: dict, progress_bar: ProgressBar,
+                       workers: int):
+    """ generates the jobs' clusters in worker processes, aggregating their progress """
+    if not progress_bar.enabled:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(generate_cluster, data[sector], function)
+                for function, sector in jobs
+            ]
+            for (function, sector), future in zip(jobs, futures):
+                clusters[function][sector] = future.result()
+        return
+
+    with Manager() as manager, ProcessPoolExecutor(max_workers=workers) as executor:
+        report_queue = manager.Queue()
+        reporter = progress_bar.reporter(report_queue)
+        futures = {
+            executor.submit(generate_cluster, data[sector], function, p_bar=reporter):
+            (function, sector)
+            for function, sector in jobs
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending, timeout=progress_bar.min_interval or None, return_when=FIRST_COMPLETED)
+            progress_bar.drain(report_queue)
+            for future in done:
+                function, sector = futures[future]
+                clusters[function][sector] = future.result()
+                progress_bar.uptick(increment=1.0 - CLUSTER_PROGRESS)
@@ -1,13 +1,14 @@
 """ type composite index """
-import os
-import json
 from typing import Tuple, Union
 
-from libs.tools import cluster_oscillators, windowed_moving_avg
+from libs.tools import windowed_moving_avg
 from libs.utils import (
-    download_data_indexes, ProgressBar, index_appender, PlotType, STANDARD_COLORS, generate_plot
+    download_data_indexes, ProgressBar, index_appender, PlotType, STANDARD_COLORS, generate_plot,
+    get_resources
 )
 
+from .sector_analysis import sector_analysis
+
 ERROR_COLOR = STANDARD_COLORS["error"]
 WARNING = STANDARD_COLORS["warning"]
 NORMAL = STANDARD_COLORS["normal"]
@@ -25,6 +26,7 @@ def type_composite_index(**kwargs) -> Tuple[dict, Union[dict, None], Union[list,
         clock {float} -- time for prog_bar (default: {None})
         data {pd.DataFrame} -- fund datasets (default: {None})
         sectors {list} -- list of sectors (default: {None})
+        clusters {dict} -- sector_analysis signals with the 'market' function (default: {None})
 
     returns:
         list -- dict contains all tci information, data, sectors
@@ -36,6 +38,7 @@ def type_composite_index(**kwargs) -> Tuple[dict, Union[dict, None], Union[list,
     clock = kwargs.get('clock')
     data = kwargs.get('data')
     sectors = kwargs.get('sectors')
+    clusters = kwargs.get('clusters')
 
     if config is not None:
         period = config['period']
@@ -65,23 +68,15 @@ def type_composite_index(**kwargs) -> Tuple[dict, Union[dict, None], Union[list,
                             m_data, period='2y')
 
                     if data:
+                        if clusters is None or 'market' not in clusters:
+                            clusters = sector_analysis(data, sectors, clock=clock)
+
                         prog_bar = ProgressBar(
-                            19, name='Type Composite Index', offset=clock)
+                            8, name='Type Composite Index', offset=clock)
                         prog_bar.start()
 
                         tci = {}
-                        composite = {}
-                        for sect in sectors:
-                            cluster = cluster_oscillators(
-                                data[sect],
-                                plot_output=False,
-                                function='market',
-                                wma=False,
-                                progress_bar=prog_bar
-                            )
-
-                            graph = cluster['tabular']
-                            composite[sect] = graph
+                        composite = clusters['market']
 
                         defensive = type_composites(
                             composite, m_data, type_type='Defensive')
@@ -164,7 +159,7 @@ def metrics_initializer(m_data: dict, period='2y'):
     Returns:
         list -- downloaded_data, sector_list, index, metrics_file data
     """
-    sectors = m_data['Components']
+    sectors = list(m_data['Components'])
     tickers = " ".join(sectors)
     tickers = index_appender(tickers)
     all_tickers = tickers.split(' ')
@@ -188,19 +183,14 @@ def get_metrics_content() -> dict:
     Returns:
         dict -- metrics file data
     """
-    metrics_file = os.path.join("resources", "sectors.json")
-    if not os.path.exists(metrics_file):
+    resources = get_resources()
+    if not resources.has('sectors'):
         print(
-            f"{WARNING}WARNING: '{metrics_file}' not found for " +
+            f"{WARNING}WARNING: '{resources.file('sectors')}' not found for " +
             f"'metrics_initializer'. Failed.{NORMAL}")
         return None, [], None
 
-    with open(metrics_file, encoding='utf-8') as m_file:
-        m_data = json.load(m_file)
-        m_file.close()
-        m_data = m_data.get("Type_Composite")
-
-    return m_data
+    return resources.type_composite
 
 
 def type_composites(composite: dict, m_data: dict, type_type='Defensive') -> list:
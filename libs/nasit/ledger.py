@@ -7,7 +7,7 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from libs.utils import download_data, PlotType, generate_plot
+from libs.utils import download_data, PlotType, generate_plot, naive_dates
 from libs.tools.metadata_tools.dividends import get_dividends
 
 
@@ -151,13 +151,17 @@ def extract_funds(ledger: pd.DataFrame, start_index: int) -> list:
 def create_fund(content: dict) -> dict:
     """Create Fund
 
+    Builds the fund as a position matrix: the ledger's actions are mapped to bars (a date that is
+    not a trading date applies on the next bar), their share and cash changes summed cumulatively,
+    and the holdings valued at each bar's close.
+
     Arguments:
         content {dict} -- data object with all fund data
 
     Returns:
         dict -- updates content with actual fund
     """
-    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    # pylint: disable=too-many-locals
     ledger = content['ledger']
     data = content['raw']
 
@@ -170,97 +174,62 @@ def create_fund(content: dict) -> dict:
         i += 1
         temp_tick = ledger['Stock'][i]
 
-    composite = {
-        '_cash_': {
-            'value': [float(content['start_capital'])] * len(data[temp_tick]['Close'])
+    full_dates = naive_dates(data[temp_tick].index)
+    bars = full_dates.searchsorted(
+        pd.DatetimeIndex(pd.to_datetime(ledger['Date'], format="%m/%d/%Y")))
+    in_range = bars < len(full_dates)
+
+    tickers = [ticker for ticker in content['funds'] if ticker in data]
+    columns = {ticker: col for col, ticker in enumerate(tickers)}
+    stocks = np.array(['_' not in ticker for ticker in ledger['Stock']])
+
+    actions = ledger['Action'].to_numpy()
+    amounts = ledger['Shares'].to_numpy(dtype=float)
+    flows = amounts * ledger['Price of Action'].to_numpy(dtype=float)
+
+    # Shares bought (+) or sold (-) of each stock row; cash in (+) or out (-) of every row
+    share_signs = np.where(actions == 'Buy', 1.0, np.where(actions == 'Sell', -1.0, 0.0))
+    cash_signs = np.where(stocks, -share_signs, np.where(
+        np.isin(actions, ['Deposit', 'Sell']), 1.0,
+        np.where(np.isin(actions, ['Withdraw', 'Buy']), -1.0, 0.0)))
+
+    rows = stocks & in_range & ledger['Stock'].isin(columns).to_numpy()
+    share_deltas = np.zeros((len(full_dates), len(tickers)))
+    np.add.at(share_deltas,
+              (bars[rows], [columns[ticker] for ticker in ledger['Stock'][rows]]),
+              share_signs[rows] * amounts[rows])
+    shares = np.cumsum(share_deltas, axis=0)
+
+    cash_flows = np.zeros(len(full_dates))
+    np.add.at(cash_flows, bars[in_range], cash_signs[in_range] * flows[in_range])
+    cash = float(content['start_capital']) + np.cumsum(cash_flows)
+
+    closes = np.column_stack([
+        data[ticker]['Close'].set_axis(naive_dates(data[ticker].index)).reindex(
+            full_dates, method='ffill').to_numpy(dtype=float)
+        for ticker in tickers
+    ]) if tickers else np.zeros((len(full_dates), 0))
+    values = np.nan_to_num(shares * closes)
+
+    composite = {'_cash_': {'value': cash.tolist()}}
+    for ticker, col in columns.items():
+        composite[ticker] = {
+            'value': values[:, col].tolist(),
+            'shares': shares[:, col].tolist()
         }
-    }
-
-    full_dates = data[temp_tick].index
-
-    for i, ticker in enumerate(ledger['Stock']):
-        if '_' in ticker:
-            action = ledger['Action'][i]
-
-            date = date_converter(ledger['Date'][i])
-            idx = 0
-            for a_val, ind in enumerate(full_dates):
-                if ind == date:
-                    idx = a_val
-                    break
-
-            if action == 'Deposit':
-                action = 'Sell'
-            if action == 'Withdraw':
-                action = 'Buy'
-
-            if action == 'Buy':
-                composite['_cash_']['value'][idx] -= float(ledger['Shares'][i]) * \
-                    float(ledger['Price of Action'][i])
-            if action == 'Sell':
-                composite['_cash_']['value'][idx] += float(ledger['Shares'][i]) * \
-                    float(ledger['Price of Action'][i])
-            continue
-
-        t_data = data[ticker]
-
-        if ticker not in composite:
-            composite[ticker] = {
-                'value': [0.0] * len(t_data.index),
-                'shares': [0] * len(t_data.index)
-            }
-
-        action = ledger['Action'][i]
-        date = date_converter(ledger['Date'][i])
-
-        for j, close in enumerate(t_data['Close']):
-
-            if t_data.index[j] == date:
-                if action == 'Buy':
-                    composite[ticker]['shares'][j] += int(ledger['Shares'][i])
-                    composite[ticker]['value'][j] += float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-                    composite['_cash_']['value'][j] -= float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-
-                elif action == 'Sell':
-                    composite[ticker]['shares'][j] -= int(ledger['Shares'][i])
-                    composite[ticker]['value'][j] -= float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-                    composite['_cash_']['value'][j] += float(ledger['Shares'][i]) * \
-                        float(ledger['Price of Action'][i])
-
-            else:
-                if j > 0:
-                    composite[ticker]['shares'][j] = composite[ticker]['shares'][j-1]
-                    composite[ticker]['value'][j] = composite[ticker]['shares'][j] * close
-                    composite['_cash_']['value'][j] = composite['_cash_']['value'][j-1]
 
     content['details'] = composite
-
-    value = []
-    for i in range(len(data[temp_tick]['Close'])):
-        val = 0.0
-        for _, value in composite.items():
-            val += value['value'][i]
-        value.append(val)
-
-    content['tabular'] = value
+    content['tabular'] = (cash + np.sum(values, axis=1)).tolist()
 
     start_price = 25.0
-    price = [start_price]
-    for i in range(1, len(data[temp_tick]['Close'])):
-        prc = start_price * (content['tabular'][i] / content['start_capital'])
-        price.append(prc)
-
-    content['price'] = price
+    price = start_price * np.asarray(content['tabular']) / content['start_capital']
+    price[0] = start_price
+    content['price'] = price.tolist()
 
     bench = [start_price]
     if '^GSPC' in data:
-        for i in range(1, len(data['^GSPC'])):
-            prc = start_price * (data['^GSPC']['Close']
-                                 [i] / data['^GSPC']['Close'][0])
-            bench.append(prc)
+        bench_closes = data['^GSPC']['Close'].to_numpy(dtype=float)
+        bench = (start_price * bench_closes / bench_closes[0]).tolist()
 
     content['bench'] = bench
 
@@ -314,19 +283,12 @@ def date_to_index(date, content: dict, try_again=False) -> int:
 
     data = content['raw']
     temp_tick = list(data.keys())[0]
-    date_list = data[temp_tick].index
-
-    idx = None
-    for a_val, date_x in enumerate(date_list):
-        if date == date_x:
-            idx = a_val
-            break
+    date_list = naive_dates(data[temp_tick].index)
 
-        if try_again:
-            if date <= date_x:
-                idx = a_val
-                break
-    return idx
+    idx = int(date_list.searchsorted(date))
+    if idx < len(date_list) and (try_again or date_list[idx] == date):
+        return idx
+    return None
 
 
 def generate_dividends(content: dict) -> dict:
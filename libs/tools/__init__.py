@@ -1,7 +1,8 @@
 """ Main tools """
 from .math_functions import lower_low, higher_high, bull_bear_th
 from .math_functions import beta_comparison, beta_comparison_list
-from .math_functions import risk_comparison
+from .math_functions import risk_comparison, risk_comparison_table
+from .returns_kernel import forward_returns
 
 from .moving_average import exponential_moving_avg, simple_moving_avg
 from .moving_average import weighted_moving_avg, windowed_moving_avg
@@ -13,7 +14,7 @@ from .hull_moving_average import hull_moving_average
 from .trends import get_trend_lines, trend_simple_forecast, auto_trend
 from .resistance_support import find_resistance_support_lines
 
-from .true_strength import relative_strength
+from .true_strength import relative_strength, relative_strength_matrix, relative_strength_matrices
 
 from .rsi import relative_strength_indicator_rsi
 from .ultimate_oscillator import ultimate_oscillator
@@ -23,7 +24,7 @@ from .momentum_oscillator import momentum_oscillator
 from .rate_of_change import rate_of_change_oscillator, roc_signal
 from .know_sure_thing import know_sure_thing
 
-from .clusters import cluster_oscillators
+from .clusters import cluster_oscillators, generate_cluster
 
 from .macd import mov_avg_convergence_divergence
 from .bear_bull_power import bear_bull_power
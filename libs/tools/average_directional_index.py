@@ -4,7 +4,7 @@ from typing import Union
 
 import pandas as pd
 
-from libs.utils import INDEXES, PlotType, generate_plot
+from libs.utils import INDEXES, PlotType, generate_plot, date_axis
 from libs.features import normalize_signals
 
 from .trends import auto_trend
@@ -209,7 +209,7 @@ def adx_metrics(fund: pd.DataFrame, adx: dict, **kwargs) -> dict:
     signal = adx['tabular']['adx']
     for i in range(1, len(signal)):
         data = None
-        date = fund.index[i].strftime("%Y-%m-%d")
+        date = date_axis(fund).strings[i]
 
         trend = 0.0
         state = 'none'
@@ -2,7 +2,7 @@
 import os
 import pandas as pd
 
-from libs.utils import generate_plot, PlotType, INDEXES
+from libs.utils import generate_plot, PlotType, INDEXES, date_axis
 from libs.features import normalize_signals
 from .moving_average import exponential_moving_avg
 
@@ -156,7 +156,7 @@ def atr_indicators(fund: pd.DataFrame, atr_dict: dict, **kwargs) -> dict:
     metrics = [0.0] * len(ema_1)
     signals = []
     for i in range(1, len(ema_1)):
-        date = fund.index[i].strftime("%Y-%m-%d")
+        date = date_axis(fund).strings[i]
         data = None
 
         if states[i] == 'u3' and states[i-1] != 'u3':
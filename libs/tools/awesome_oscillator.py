@@ -3,7 +3,7 @@ import os
 
 import pandas as pd
 
-from libs.utils import PlotType, generate_plot, dates_extractor_list
+from libs.utils import PlotType, generate_plot, dates_extractor_list, date_axis
 from libs.features import normalize_signals
 from libs.utils import INDEXES
 
@@ -195,7 +195,7 @@ def ao_feature_detection(signal: list, position: pd.DataFrame = None, **kwargs)
     is_positive = signal[0] > 0.0
     for i, sig in enumerate(signal):
         if is_positive and (sig < 0.0):
-            date = position.index[i].strftime("%Y-%m-%d")
+            date = date_axis(position).strings[i]
             feat = {
                 'index': i,
                 'value': 'zero crossover',
@@ -205,7 +205,7 @@ def ao_feature_detection(signal: list, position: pd.DataFrame = None, **kwargs)
             features.append(feat)
             is_positive = False
         if (not is_positive) and (sig > 0.0):
-            date = position.index[i].strftime("%Y-%m-%d")
+            date = date_axis(position).strings[i]
             feat = {
                 'index': i,
                 'value': 'zero crossover',
@@ -267,7 +267,7 @@ def twin_peaks_detection(signal: list, position: pd.DataFrame) -> list:
                 if signal[i] < signal[i-1]:
                     # Condition found!
                     state = 'bear_peaks'
-                    date = position.index[i].strftime("%Y-%m-%d")
+                    date = date_axis(position).strings[i]
                     twin_peaks = {
                         'index': i,
                         'value': 'twin peaks',
@@ -299,7 +299,7 @@ def twin_peaks_detection(signal: list, position: pd.DataFrame) -> list:
             if signal[i] > min_:
                 if signal[i] > signal[i-1]:
                     state = 'bull_peaks'
-                    date = position.index[i].strftime("%Y-%m-%d")
+                    date = date_axis(position).strings[i]
                     twin_peaks = {
                         'index': i,
                         'value': 'twin peaks',
@@ -347,7 +347,7 @@ def saucer_detection(signal: list, position: pd.DataFrame) -> list:
                 state = 'neg'
             elif signal[i] > signal[i-1]:
                 state = 'pos'
-                date = position.index[i].strftime("%Y-%m-%d")
+                date = date_axis(position).strings[i]
                 saucer = {
                     'index': i,
                     'value': 'saucer',
@@ -375,7 +375,7 @@ def saucer_detection(signal: list, position: pd.DataFrame) -> list:
                 state = 'pos'
             elif signal[i] < signal[i-1]:
                 state = 'neg'
-                date = position.index[i].strftime("%Y-%m-%d")
+                date = date_axis(position).strings[i]
                 saucer = {
                     'index': i,
                     'value': 'saucer',
@@ -4,7 +4,7 @@ import os
 import pandas as pd
 from scipy.stats import linregress
 
-from libs.utils import dates_extractor_list, INDEXES, generate_plot, PlotType
+from libs.utils import dates_extractor_list, INDEXES, generate_plot, PlotType, date_axis
 from libs.tools import exponential_moving_avg
 from libs.features import normalize_signals
 
@@ -157,7 +157,7 @@ def bear_bull_feature_detection(bear_bull: dict, position: pd.DataFrame, **kwarg
 
         for i in range(1, len(ema)):
             data = None
-            date = position.index[i].strftime("%Y-%m-%d")
+            date = date_axis(position).strings[i]
 
             if ema_slopes[i] > 0.0:
                 if bear_bull['tabular']['bears'][i] < 0.0:
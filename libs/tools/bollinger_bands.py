@@ -4,7 +4,7 @@ import os
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, PlotType, generate_plot
+from libs.utils import INDEXES, PlotType, generate_plot, date_axis
 from libs.features import normalize_signals
 
 from .moving_average import simple_moving_avg, exponential_moving_avg
@@ -181,7 +181,7 @@ def bollinger_band_features(bol_bands: dict, position: pd.DataFrame, plot_output
     """
     features = []
     for indicator in bol_bands['indicators']:
-        date = position.index[indicator['index']].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[indicator['index']]
         data = {
             "type": indicator['type'],
             "value": f"{indicator['style']} feature detection",
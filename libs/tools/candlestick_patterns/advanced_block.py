@@ -1,23 +1,18 @@
 """ advanced block """
-from typing import Union
+from typing import List, Union
 
-def advance_block(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, BODY_SHORT
+
+
+def advance_block(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ advance block """
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'above':
-        if trading_candle[0]['candlestick']['color'] == 'white':
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
-            if basic_1['Open'] > basic_0['Open'] and basic_1['Open'] < basic_0['Close'] and \
-                    basic_1['Close'] > basic_0['Close'] and \
-                        trading_candle[1]['candlestick']['color'] == 'white':
-                candle_2 = trading_candle[2]['candlestick']
-                if candle_2[body] == 'short' and candle_2['color'] == 'white':
-                    basic_2 = trading_candle[2]['basic']
-                    if basic_2['Open'] > basic_1['Open'] and \
-                        basic_2['Open'] < basic_1['Close'] and \
-                            basic_2['Close'] > basic_1['Close']:
-                        return {"type": 'bearish', "style": '-'}
-    return None
+    bearish = (day_0.trend == TREND_ABOVE) & day_0.white & \
+        (day_1.open > day_0.open) & (day_1.open < day_0.close) & \
+        (day_1.close > day_0.close) & day_1.white & \
+        (day_2.body(body) == BODY_SHORT) & day_2.white & \
+        (day_2.open > day_1.open) & (day_2.open < day_1.close) & (day_2.close > day_1.close)
+    return [(bearish, 'bearish', '-')]
@@ -1,30 +1,17 @@
 """ belt hold """
-from typing import Union
+from typing import List, Union
 
-def belt_hold(trading_candle: list, _: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW
+
+
+def belt_hold(days: CandleWindow, _: Union[str, None] = None) -> List[PatternMatch]:
     """ belt hold """
     thresh = 0.005
-    if trading_candle[0].get('trend') == 'below':
-        candle = trading_candle[0].get('candlestick')
-        if candle.get('color') == 'white':
-            basic = trading_candle[0].get('basic')
-            high = basic.get('High')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * thresh
-            op_low = _open - low
-            if (op_low <= hl_thr) and (high > basic.get('Close')):
-                return {"type": 'bullish', "style": '+'}
+    day_0 = days[0]
+    op_low = day_0.open - day_0.low
 
-    if trading_candle[0].get('trend') == 'above':
-        candle = trading_candle[0].get('candlestick')
-        if candle.get('color') == 'black':
-            basic = trading_candle[0].get('basic')
-            high = basic.get('High')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * (1.0 - thresh)
-            op_low = _open - low
-            if (op_low >= hl_thr) and (low < basic.get('Close')):
-                return {"type": 'bearish', "style": '-'}
-    return None
+    bullish = (day_0.trend == TREND_BELOW) & day_0.white & \
+        (op_low <= (day_0.high - day_0.low) * thresh) & (day_0.high > day_0.close)
+    bearish = (day_0.trend == TREND_ABOVE) & day_0.black & \
+        (op_low >= (day_0.high - day_0.low) * (1.0 - thresh)) & (day_0.low < day_0.close)
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
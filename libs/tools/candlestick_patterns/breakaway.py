@@ -1,53 +1,31 @@
 """ breakaway """
-from typing import Union
+from typing import List, Union
 
-def breakaway(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import (
+    CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG, BODY_SHORT
+)
+
+
+def breakaway(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ breakaway """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
+    day_0, day_1, day_2, day_3, day_4 = days[0], days[1], days[2], days[3], days[4]
 
-    if trading_candle[0]['trend'] == 'below':
-        if trading_candle[0]['candlestick'][body] == 'long' and \
-            trading_candle[0]['candlestick']['color'] == 'black':
-            if trading_candle[0]['basic']['Low'] > trading_candle[1]['basic']['High']:
-                candle_1 = trading_candle[1]['candlestick']
-
-                if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                    basic_2 = trading_candle[2]['basic']
-                    basic_1 = trading_candle[1]['basic']
-                    if (basic_2['Close'] < basic_1['Open']) and (basic_2['Open'] < basic_1['Open']):
-                        if basic_2['Low'] < basic_1['Low']:
-                            candle_3 = trading_candle[3]['candlestick']
-
-                            if candle_3[body] == 'short' and candle_3['color'] == 'black':
-                                if trading_candle[3]['basic']['Low'] < basic_2['Low']:
-                                    candle_4 = trading_candle[4]['candlestick']
-                                    if candle_4[body] == 'long' and candle_4['color'] == 'white':
-                                        basic_4 = trading_candle[4]['basic']
-                                        if basic_4['Close'] > basic_1['Open'] and \
-                                            basic_4['Close'] <= trading_candle[0]['basic']['Close']:
-                                            return {"type": 'bullish', "style": 'breakaway +'}
-
-    if trading_candle[0]['trend'] == 'above':
-        if trading_candle[0]['candlestick'][body] == 'long' and \
-            trading_candle[0]['candlestick']['color'] == 'white':
-            if trading_candle[0]['basic']['High'] < trading_candle[1]['basic']['Low']:
-                candle_1 = trading_candle[1]['candlestick']
+    bullish = (day_0.trend == TREND_BELOW) & \
+        (day_0.body(body) == BODY_LONG) & day_0.black & (day_0.low > day_1.high) & \
+        (day_1.body(body) == BODY_SHORT) & day_1.black & \
+        (day_2.close < day_1.open) & (day_2.open < day_1.open) & (day_2.low < day_1.low) & \
+        (day_3.body(body) == BODY_SHORT) & day_3.black & (day_3.low < day_2.low) & \
+        (day_4.body(body) == BODY_LONG) & day_4.white & \
+        (day_4.close > day_1.open) & (day_4.close <= day_0.close)
 
-                if candle_1[body] == 'short' and candle_1['color'] == 'white':
-                    basic_2 = trading_candle[2]['basic']
-                    basic_1 = trading_candle[1]['basic']
-                    if (basic_2['Close'] > basic_1['Open']) and (basic_2['Open'] > basic_1['Open']):
-                        if basic_2['High'] > basic_1['High']:
-                            candle_3 = trading_candle[3]['candlestick']
+    bearish = (day_0.trend == TREND_ABOVE) & \
+        (day_0.body(body) == BODY_LONG) & day_0.white & (day_0.high < day_1.low) & \
+        (day_1.body(body) == BODY_SHORT) & day_1.white & \
+        (day_2.close > day_1.open) & (day_2.open > day_1.open) & (day_2.high > day_1.high) & \
+        (day_3.body(body) == BODY_SHORT) & day_3.white & (day_3.high > day_2.high) & \
+        (day_4.body(body) == BODY_LONG) & day_4.black & \
+        (day_4.close < day_1.open) & (day_4.close >= day_0.close)
 
-                            if candle_3[body] == 'short' and candle_3['color'] == 'white':
-                                if trading_candle[3]['basic']['High'] > basic_2['High']:
-                                    candle_4 = trading_candle[4]['candlestick']
-                                    if candle_4[body] == 'long' and candle_4['color'] == 'black':
-                                        basic_4 = trading_candle[4]['basic']
-                                        if basic_4['Close'] < basic_1['Open'] and \
-                                            basic_4['Close'] >= trading_candle[0]['basic']['Close']:
-                                            return {"type": 'bearish', "style": 'breakaway -'}
-    return None
+    return [(bullish, 'bullish', 'breakaway +'), (bearish, 'bearish', 'breakaway -')]
@@ -1,44 +1,23 @@
 """ dark cloud or piercing line """
-from typing import Union
+from typing import List, Union
 
-def dark_cloud_or_piercing_line(trading_candle: list,
-                                body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def dark_cloud_or_piercing_line(days: CandleWindow,
+                                body: Union[str, None] = None) -> List[PatternMatch]:
     """ dark_cloud_or_piercing_line """
     if not body:
         body = 'body'
+    day_0, day_1 = days[0], days[1]
+    mid_pt = ((day_0.close - day_0.open) / 2.0) + day_0.open
 
     # Dark Cloud
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0.get(body) == 'long':
-            if candle_0.get('color') == 'white':
-                basic_0 = trading_candle[0].get('basic')
-                high_0 = basic_0.get('High')
-                basic_1 = trading_candle[1].get('basic')
-                open_1 = basic_1.get('Open')
-                if open_1 > high_0:
-                    close_1 = basic_1.get('Close')
-                    close_0 = basic_0.get('Close')
-                    open_0 = basic_0.get('Open')
-                    mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                    if close_1 <= mid_pt:
-                        return {'type': 'bearish', 'style': 'darkcloud'}
+    dark_cloud = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & \
+        day_0.white & (day_1.open > day_0.high) & (day_1.close <= mid_pt)
 
     # Piercing Line
-    elif trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0.get(body) == 'long':
-            if candle_0.get('color') == 'black':
-                basic_0 = trading_candle[0].get('basic')
-                low_0 = basic_0.get('Low')
-                basic_1 = trading_candle[1].get('basic')
-                open_1 = basic_1.get('Open')
-                if open_1 < low_0:
-                    close_1 = basic_1.get('Close')
-                    close_0 = basic_0.get('Close')
-                    open_0 = basic_0.get('Open')
-                    mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                    if close_1 >= mid_pt:
-                        return {'type': 'bullish', 'style': 'piercing line'}
+    piercing_line = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & \
+        day_0.black & (day_1.open < day_0.low) & (day_1.close >= mid_pt)
 
-    return None
+    return [(dark_cloud, 'bearish', 'darkcloud'), (piercing_line, 'bullish', 'piercing line')]
@@ -0,0 +1,230 @@
+""" candlestick day features stored as numpy columns """
+from collections.abc import Sequence
+from typing import List, Tuple
+
+import numpy as np
+
+TREND_ABOVE = 1
+TREND_AT = 0
+TREND_BELOW = -1
+
+BODY_LONG = 1
+BODY_NORMAL = 0
+BODY_SHORT = -1
+
+TREND_CODES = {'above': TREND_ABOVE, 'at': TREND_AT, 'below': TREND_BELOW}
+BODY_CODES = {'long': BODY_LONG, 'normal': BODY_NORMAL, 'short': BODY_SHORT}
+TREND_NAMES = {code: name for name, code in TREND_CODES.items()}
+BODY_NAMES = {code: name for name, code in BODY_CODES.items()}
+
+CANDLE_DTYPE = np.dtype([
+    ('Open', np.float64),
+    ('Close', np.float64),
+    ('High', np.float64),
+    ('Low', np.float64),
+    ('trend', np.int8),
+    ('body', np.int8),
+    ('vol_body', np.int8),
+    ('white', np.bool_),
+    ('doji', np.bool_),
+    ('shadow_ratio', np.float64)
+])
+
+# (mask, 'bullish' or 'bearish', style) - earlier entries take precedence over later ones
+PatternMatch = Tuple[np.ndarray, str, str]
+
+
+class CandleFeatures():
+    """CandleFeatures
+
+    Day classifications of a fund held as a numpy structured array (one field per feature)
+    """
+
+    def __init__(self, days: np.ndarray):
+        self.days = days
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @classmethod
+    def from_classification(cls, trading_candles: List[dict]):
+        """From Classification
+
+        Arguments:
+            trading_candles {list} -- candle objects generated from day_classification
+
+        Returns:
+            CandleFeatures -- feature columns of the same candles
+        """
+        days = np.zeros(len(trading_candles), dtype=CANDLE_DTYPE)
+        for i, candle in enumerate(trading_candles):
+            basic = candle['basic']
+            stick = candle['candlestick']
+            days[i] = (
+                basic['Open'], basic['Close'], basic['High'], basic['Low'],
+                TREND_CODES[candle['trend']],
+                BODY_CODES[stick['body']],
+                BODY_CODES[stick['vol_body']],
+                stick['color'] == 'white',
+                stick['doji'],
+                stick['shadow_ratio']
+            )
+        return cls(days)
+
+    def classification(self):
+        """Classification
+
+        Returns:
+            DayClassification -- lazily materialized list-of-dicts view of the days
+        """
+        return DayClassification(self)
+
+    def window(self, days_needed: int):
+        """Window
+
+        Arguments:
+            days_needed {int} -- number of days that make up a pattern
+
+        Returns:
+            CandleWindow -- shifted day columns aligned to the last day of the pattern
+        """
+        return CandleWindow(self.days, days_needed)
+
+
+class DayClassification(Sequence):
+    """DayClassification
+
+    Read-only view of CandleFeatures in the original day_classification form (a dict per day).
+    The dicts are only built the first time the view is read.
+    """
+
+    def __init__(self, features: CandleFeatures):
+        self.features = features
+        self._days = None
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def __getitem__(self, index):
+        return self.materialize()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, DayClassification)):
+            return self.materialize() == list(other)
+        return NotImplemented
+
+    def materialize(self) -> List[dict]:
+        """ builds (once) and returns the list of day dicts """
+        if self._days is None:
+            days = self.features.days
+            columns = zip(
+                days['Close'].tolist(), days['Open'].tolist(), days['High'].tolist(),
+                days['Low'].tolist(), days['trend'].tolist(), days['body'].tolist(),
+                days['vol_body'].tolist(), days['white'].tolist(), days['doji'].tolist(),
+                days['shadow_ratio'].tolist()
+            )
+            self._days = [
+                {
+                    'basic': {'Close': close, 'Open': open_, 'High': high, 'Low': low},
+                    'trend': TREND_NAMES[trend],
+                    'candlestick': {
+                        'body': BODY_NAMES[body],
+                        'vol_body': BODY_NAMES[vol_body],
+                        'color': 'white' if white else 'black',
+                        'doji': doji,
+                        'shadow_ratio': shadow_ratio
+                    }
+                }
+                for close, open_, high, low, trend, body, vol_body, white, doji, shadow_ratio
+                in columns
+            ]
+        return self._days
+
+
+class CandleWindow():
+    """CandleWindow
+
+    An n-day pattern view of CandleFeatures. window[k] holds, at index i, the candle of the k-th
+    day of a pattern ending on day i. 'valid' masks out indexes too early for a full pattern.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, days: np.ndarray, days_needed: int):
+        self._days = days
+        self.days_needed = days_needed
+        self.valid = np.arange(len(days)) >= (days_needed - 1)
+
+    def __getitem__(self, day: int):
+        return ShiftedCandle(self._days, self.days_needed - 1 - day)
+
+
+class ShiftedCandle():
+    """ShiftedCandle
+
+    Feature columns of a single pattern day, shifted forward by 'offset' bars
+    """
+
+    def __init__(self, days: np.ndarray, offset: int):
+        self._days = days
+        self._offset = offset
+        self._columns = {}
+
+    def _column(self, field: str) -> np.ndarray:
+        if field not in self._columns:
+            column = self._days[field]
+            if self._offset > 0:
+                shifted = np.zeros_like(column)
+                if self._offset < len(column):
+                    shifted[self._offset:] = column[:-self._offset]
+                column = shifted
+            self._columns[field] = column
+        return self._columns[field]
+
+    def body(self, body: str = 'body') -> np.ndarray:
+        """ body size class codes, either 'body' (quartile) or 'vol_body' (volatility) """
+        return self._column(body)
+
+    @property
+    def open(self) -> np.ndarray:
+        """ open prices """
+        return self._column('Open')
+
+    @property
+    def close(self) -> np.ndarray:
+        """ close prices """
+        return self._column('Close')
+
+    @property
+    def high(self) -> np.ndarray:
+        """ high prices """
+        return self._column('High')
+
+    @property
+    def low(self) -> np.ndarray:
+        """ low prices """
+        return self._column('Low')
+
+    @property
+    def trend(self) -> np.ndarray:
+        """ trend codes of close vs. sma-10 """
+        return self._column('trend')
+
+    @property
+    def white(self) -> np.ndarray:
+        """ close above open """
+        return self._column('white')
+
+    @property
+    def black(self) -> np.ndarray:
+        """ close at or below open """
+        return ~self._column('white')
+
+    @property
+    def doji(self) -> np.ndarray:
+        """ doji days """
+        return self._column('doji')
+
+    @property
+    def shadow_ratio(self) -> np.ndarray:
+        """ (high - low) / |close - open| """
+        return self._column('shadow_ratio')
@@ -1,25 +1,18 @@
 """ deliberation """
-from typing import Union
+from typing import List, Union
 
-def deliberation(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, BODY_LONG, BODY_SHORT
+
+
+def deliberation(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ deliberation """
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    # pylint: disable=too-many-nested-blocks
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'long' and candle_0['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                mid_pt = (basic_0['Close'] - basic_0['Open']) * 0.5
-                basic_1 = trading_candle[1]['basic']
-                if (basic_1['Open'] > mid_pt) and (basic_1['Open'] < basic_0['Close']) and \
-                        (basic_1['Close'] > basic_0['Close']):
-                    candle_2 = trading_candle[2]['candlestick']
-                    if candle_2[body] == 'short' or candle_2['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        if basic_2['Open'] > basic_1['Close']:
-                            return {"type": 'bearish', "style": '-'}
-    return None
+    mid_pt = (day_0.close - day_0.open) * 0.5
+    bearish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_1.body(body) == BODY_LONG) & \
+        (day_1.open > mid_pt) & (day_1.open < day_0.close) & (day_1.close > day_0.close) & \
+        ((day_2.body(body) == BODY_SHORT) | day_2.white) & (day_2.open > day_1.close)
+    return [(bearish, 'bearish', '-')]
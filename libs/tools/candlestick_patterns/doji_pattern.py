@@ -1,46 +1,33 @@
 """ DOJI Patterns """
-from typing import Union
+from typing import List, Union
 
-def doji_pattern(trading_candle: list, _: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_SHORT
+
+
+def doji_pattern(days: CandleWindow, _: Union[str, None] = None) -> List[PatternMatch]:
     """ doji pattern """
     thresh = 0.05
-    day_candle = trading_candle[0]
-    if day_candle.get('candlestick', {}).get('doji'):
-        close = day_candle['basic']['Close']
-        high = day_candle['basic']['Close']
-        low = day_candle['basic']['Low']
+    day_0 = days[0]
+    close = day_0.close
+    high = day_0.close
+    low = day_0.low
 
-        clo_low = close - low
-        hi_low = high - low
-        if clo_low >= ((1.0 - thresh) * hi_low):
-            return {'type': 'bullish', 'style': 'dragonfly'}
-        if clo_low <= (thresh * hi_low):
-            return {'type': 'bearish', 'style': 'gravestone'}
-    return None
+    clo_low = close - low
+    hi_low = high - low
+    return [
+        (day_0.doji & (clo_low >= ((1.0 - thresh) * hi_low)), 'bullish', 'dragonfly'),
+        (day_0.doji & (clo_low <= (thresh * hi_low)), 'bearish', 'gravestone')
+    ]
 
 
-def doji_star(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+def doji_star(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ doji star """
     if not body:
         body = 'body'
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0['color'] == 'black' and candle_0[body] != 'short':
-            basic_1 = trading_candle[1].get('basic')
-            basic_0 = trading_candle[0].get('basic')
-            if basic_1.get('High') <= basic_0.get('Close'):
-                candle_1 = trading_candle[1].get('candlestick')
-                if candle_1.get('doji'):
-                    return {"type": 'bullish', "style": "+"}
-
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0['color'] == 'white' and candle_0[body] != 'short':
-            basic_1 = trading_candle[1].get('basic')
-            basic_0 = trading_candle[0].get('basic')
-            if basic_1.get('Low') >= basic_0.get('Close'):
-                candle_1 = trading_candle[1].get('candlestick')
-                if candle_1.get('doji'):
-                    return {"type": 'bearish', "style": "-"}
-    return None
+    bullish = (day_0.trend == TREND_BELOW) & day_0.black & (day_0.body(body) != BODY_SHORT) & \
+        (day_1.high <= day_0.close) & day_1.doji
+    bearish = (day_0.trend == TREND_ABOVE) & day_0.white & (day_0.body(body) != BODY_SHORT) & \
+        (day_1.low >= day_0.close) & day_1.doji
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
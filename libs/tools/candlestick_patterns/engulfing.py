@@ -1,30 +1,19 @@
 """ engulfing """
-from typing import Union
+from typing import List, Union
 
-def engulfing(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def engulfing(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ engulfing """
     if not body:
         body = 'body'
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0.get('color') == 'black':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1[body] == 'long' and candle_1['color'] == 'white':
-                basic_0 = trading_candle[0].get('basic')
-                basic_1 = trading_candle[1].get('basic')
-                if basic_0.get('High') <= basic_1.get('Close'):
-                    if basic_0.get('Low') >= basic_1.get('Open'):
-                        return {"type": 'bullish', "style": '+'}
-
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0.get('color') == 'white':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1[body] == 'long' and candle_1['color'] == 'black':
-                basic_0 = trading_candle[0].get('basic')
-                basic_1 = trading_candle[1].get('basic')
-                if basic_0.get('High') <= basic_1.get('Open'):
-                    if basic_0.get('Low') >= basic_1.get('Close'):
-                        return {"type": 'bearish', "style": '-'}
-    return None
+    bullish = (day_0.trend == TREND_BELOW) & day_0.black & \
+        (day_1.body(body) == BODY_LONG) & day_1.white & \
+        (day_0.high <= day_1.close) & (day_0.low >= day_1.open)
+    bearish = (day_0.trend == TREND_ABOVE) & day_0.white & \
+        (day_1.body(body) == BODY_LONG) & day_1.black & \
+        (day_0.high <= day_1.open) & (day_0.low >= day_1.close)
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
@@ -1,67 +1,37 @@
 """ evening and morning star """
-from typing import Union
+from typing import List, Union
 
-def evening_morning_star(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+import numpy as np
+
+from .day_features import (
+    CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG, BODY_SHORT
+)
+
+
+def evening_morning_star(days: CandleWindow,
+                         body: Union[str, None] = None) -> List[PatternMatch]:
     """ evening and morning star """
-    # pylint: disable=too-many-nested-blocks,too-many-branches,too-many-statements
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
+    mid_pt = ((day_0.close - day_0.open) / 2.0) + day_0.open
 
     # Evening star
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = trading_candle[0].get('basic')
-            basic_1 = trading_candle[1].get('basic')
-            close_0 = basic_0.get('Close')
-            open_1 = basic_1.get('Open')
-
-            if open_1 > close_0:
-                candle_1 = trading_candle[1].get('candlestick')
-                if candle_1[body] == 'short':
-                    close_1 = basic_1.get('Close')
-                    if close_1 > close_0:
-                        basic_2 = trading_candle[2].get('basic')
-                        open_2 = basic_2.get('Open')
-
-                        if open_2 < min(close_1, open_1):
-                            open_0 = basic_0.get('Open')
-                            mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                            close_2 = basic_2.get('Close')
-                            if close_2 <= mid_pt:
-                                return_val = {"type": 'bearish', 'style': 'evening star'}
-                                if candle_1['doji']:
-                                    if basic_1['Low'] > max(basic_0['High'], basic_1['High']):
-                                        return_val["style"] = 'abandoned baby -'
-                                    return_val["style"] = 'evening star DOJI'
-                                return return_val
+    evening = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_1.open > day_0.close) & (day_1.body(body) == BODY_SHORT) & \
+        (day_1.close > day_0.close) & (day_2.open < np.minimum(day_1.close, day_1.open)) & \
+        (day_2.close <= mid_pt)
 
     # Morning star
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            basic_0 = trading_candle[0].get('basic')
-            basic_1 = trading_candle[1].get('basic')
-            close_0 = basic_0.get('Close')
-            open_1 = basic_1.get('Open')
-
-            if open_1 < close_0:
-                candle_1 = trading_candle[1].get('candlestick')
-                if candle_1[body] == 'short':
-                    close_1 = basic_1.get('Close')
-                    if close_1 < close_0:
-                        basic_2 = trading_candle[2].get('basic')
-                        open_2 = basic_2.get('Open')
+    morning = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_1.open < day_0.close) & (day_1.body(body) == BODY_SHORT) & \
+        (day_1.close < day_0.close) & (day_2.open > np.maximum(day_1.close, day_1.open)) & \
+        (day_2.close >= mid_pt)
 
-                        if open_2 > max(close_1, open_1):
-                            open_0 = basic_0.get('Open')
-                            mid_pt = ((close_0 - open_0) / 2.0) + open_0
-                            close_2 = basic_2.get('Close')
-                            if close_2 >= mid_pt:
-                                return_val = {'type': 'bullish', 'style': 'morning star'}
-                                if candle_1['doji']:
-                                    if basic_1['High'] < min(basic_0['Low'], basic_1['Low']):
-                                        return_val["style"] = 'abandoned baby +'
-                                    return_val["style"] = 'morning star: DOJI'
-                                return return_val
-    return None
+    # A doji middle day supersedes the plain star (abandoned baby is reported as a doji star)
+    return [
+        (evening & day_1.doji, 'bearish', 'evening star DOJI'),
+        (evening, 'bearish', 'evening star'),
+        (morning & day_1.doji, 'bullish', 'morning star: DOJI'),
+        (morning, 'bullish', 'morning star')
+    ]
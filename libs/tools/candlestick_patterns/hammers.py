@@ -1,50 +1,38 @@
 """ hammers """
-from typing import Union
+from typing import List, Union
 
-def inverted_hammer(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_BELOW, BODY_LONG, BODY_SHORT
+
+
+def inverted_hammer(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ inverted hammer """
     if not body:
         body = 'body'
     ratio = 2.0
     thresh = 0.01
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1].get('candlestick')
-
-            if candle_1[body] == 'short' and candle_1['shadow_ratio'] >= ratio:
-                basic = trading_candle[1].get('basic')
-                high = basic.get('High')
-                close = basic.get('Close')
-                _open = basic.get('Open')
-                low = basic.get('Low')
-                hl_thr = (high - low) * thresh
-                cl_low = close - low
-                op_low = _open - low
-                if (cl_low <= hl_thr) or (op_low <= hl_thr):
-                    return {"type": 'bullish', "style": '+'}
-    return None
+    hl_thr = (day_1.high - day_1.low) * thresh
+    cl_low = day_1.close - day_1.low
+    op_low = day_1.open - day_1.low
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_1.body(body) == BODY_SHORT) & (day_1.shadow_ratio >= ratio) & \
+        ((cl_low <= hl_thr) | (op_low <= hl_thr))
+    return [(bullish, 'bullish', '+')]
 
 
-def hammer_positive(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+def hammer_positive(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ hammer positive """
     if not body:
         body = 'body'
     ratio = 2.0
     thresh = 0.99
+    day_0 = days[0]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle = trading_candle[0].get('candlestick')
-        if candle[body] == 'short' and candle['shadow_ratio'] >= ratio:
-            basic = trading_candle[0].get('basic')
-            high = basic.get('High')
-            close = basic.get('Close')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * thresh
-            cl_low = close - low
-            op_low = _open - low
-            if (cl_low >= hl_thr) or (op_low >= hl_thr):
-                return {"type": 'bullish', "style": '+'}
-    return None
+    hl_thr = (day_0.high - day_0.low) * thresh
+    cl_low = day_0.close - day_0.low
+    op_low = day_0.open - day_0.low
+    bullish = (day_0.trend == TREND_BELOW) & \
+        (day_0.body(body) == BODY_SHORT) & (day_0.shadow_ratio >= ratio) & \
+        ((cl_low >= hl_thr) | (op_low >= hl_thr))
+    return [(bullish, 'bullish', '+')]
@@ -1,24 +1,21 @@
 """ hanging man """
-from typing import Union
+from typing import List, Union
 
-def hanging_man(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, BODY_SHORT
+
+
+def hanging_man(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ hanging man """
     if not body:
         body = 'body'
     ratio = 2.0
     thresh = 0.99
+    day_0 = days[0]
 
-    if trading_candle[0].get('trend') == 'above':
-        candle = trading_candle[0].get('candlestick')
-        if candle[body] == 'short' and candle['shadow_ratio'] >= ratio:
-            basic = trading_candle[0].get('basic')
-            high = basic.get('High')
-            close = basic.get('Close')
-            _open = basic.get('Open')
-            low = basic.get('Low')
-            hl_thr = (high - low) * thresh
-            cl_low = close - low
-            op_low = _open - low
-            if (cl_low >= hl_thr) or (op_low >= hl_thr):
-                return {"type": 'bearish', "style": '-'}
-    return None
+    hl_thr = (day_0.high - day_0.low) * thresh
+    cl_low = day_0.close - day_0.low
+    op_low = day_0.open - day_0.low
+    bearish = (day_0.trend == TREND_ABOVE) & \
+        (day_0.body(body) == BODY_SHORT) & (day_0.shadow_ratio >= ratio) & \
+        ((cl_low >= hl_thr) | (op_low >= hl_thr))
+    return [(bearish, 'bearish', '-')]
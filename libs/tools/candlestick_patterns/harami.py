@@ -1,45 +1,25 @@
 """ harami """
-from typing import Union
+from typing import List, Union
 import numpy as np
 
-def harami(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def harami(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ harami """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
     thresh = 0.01
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0['color'] == 'black' and candle_0[body] == 'long':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1.get('color') == 'white':
-                basic_0 = trading_candle[0].get('basic')
-                basic_1 = trading_candle[1].get('basic')
-
-                if basic_1.get('High') <= basic_0.get('Open'):
-                    if basic_1.get('Low') >= basic_1.get('Close'):
-                        hi_low = basic_1.get('High') - basic_1.get('Low')
-                        op_clo = np.abs(basic_1.get(
-                            'Close') - basic_1.get('Open'))
-                        if op_clo <= (hi_low * thresh):
-                            return {"type": 'bullish', "style": 'cross-+'}
-                        return {"type": 'bullish', "style": "+"}
-
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0['color'] == 'white' and candle_0[body] == 'long':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1.get('color') == 'black':
-                basic_0 = trading_candle[0].get('basic')
-                basic_1 = trading_candle[1].get('basic')
-
-                if basic_1.get('High') <= basic_0.get('Close'):
-                    if basic_1.get('Low') >= basic_1.get('Open'):
-                        hi_low = basic_1.get('High') - basic_1.get('Low')
-                        op_clo = np.abs(basic_1.get(
-                            'Open') - basic_1.get('Close'))
-                        if op_clo <= (hi_low * thresh):
-                            return {"type": 'bearish', "style": 'cross--'}
-                        return {"type": 'bearish', "style": "-"}
-    return None
+    cross = np.abs(day_1.close - day_1.open) <= ((day_1.high - day_1.low) * thresh)
+    bullish = (day_0.trend == TREND_BELOW) & day_0.black & (day_0.body(body) == BODY_LONG) & \
+        day_1.white & (day_1.high <= day_0.open) & (day_1.low >= day_1.close)
+    bearish = (day_0.trend == TREND_ABOVE) & day_0.white & (day_0.body(body) == BODY_LONG) & \
+        day_1.black & (day_1.high <= day_0.close) & (day_1.low >= day_1.open)
+    return [
+        (bullish & cross, 'bullish', 'cross-+'),
+        (bullish, 'bullish', '+'),
+        (bearish & cross, 'bearish', 'cross--'),
+        (bearish, 'bearish', '-')
+    ]
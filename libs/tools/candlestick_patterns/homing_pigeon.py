@@ -1,18 +1,16 @@
 """ homing pigeon """
-from typing import Union
+from typing import List, Union
 
-def homing_pigeon(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_BELOW, BODY_LONG
+
+
+def homing_pigeon(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ homing pigeon """
     if not body:
         body = 'body'
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] != 'long' and candle_1['color'] == 'black':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if (basic_1['Open'] < basic_0['Open']) and (basic_1['Close'] > basic_0['Close']):
-                    return {"type": 'bullish', "style": '+'}
-    return None
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_1.body(body) != BODY_LONG) & day_1.black & \
+        (day_1.open < day_0.open) & (day_1.close > day_0.close)
+    return [(bullish, 'bullish', '+')]
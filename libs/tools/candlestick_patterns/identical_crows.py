@@ -1,39 +1,32 @@
 """ identical crows """
-from typing import Union
+from typing import List, Union
 
-def identical_three_crows(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, BODY_SHORT
+
+
+def identical_three_crows(days: CandleWindow,
+                          body: Union[str, None] = None) -> List[PatternMatch]:
     """ identical crows """
-    # pylint: disable=too-many-locals,too-many-nested-blocks
     if not body:
         body = 'body'
     thresh = 0.03
     size_range = 0.05
+    day_0, day_1, day_2 = days[0], days[1], days[2]
+
+    length_0 = day_0.open - day_0.close
+    length_1 = day_1.open - day_1.close
+    length_2 = day_2.open - day_2.close
+    upper_th = length_0 * (1.0 + size_range)
+    lower_th = length_0 * (1.0 - size_range)
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] != 'short' and candle_1['color'] == 'black':
-                basic_1 = trading_candle[1]['basic']
-                basic_0 = trading_candle[0]['basic']
-                point1 = ((basic_0['Open'] - basic_0['Close']) * thresh) + basic_0['Close']
-                point2 = basic_0['Close'] - \
-                    ((basic_0['Open'] - basic_0['Close']) * thresh)
-                if (basic_1['Open'] <= point1) and (basic_1['Close'] >= point2):
-                    candle_2 = trading_candle[2]['candlestick']
-                    if candle_2[body] != 'short' and candle_2['color'] == 'black':
-                        basic_2 = trading_candle[2]['basic']
-                        point1 = (
-                            (basic_1['Open'] - basic_1['Close']) * thresh) + basic_1['Close']
-                        point2 = basic_1['Close'] - \
-                            ((basic_1['Open'] - basic_1['Close']) * thresh)
-                        if (basic_2['Open'] <= point1) and (basic_2['Open'] >= point2):
-                            length_0 = basic_0['Open'] - basic_0['Close']
-                            upper_th = length_0 * (1.0 + size_range)
-                            lower_th = length_0 * (1.0 - size_range)
-                            length_1 = basic_1['Open'] - basic_1['Close']
-                            length_2 = basic_2['Open'] - basic_2['Close']
-                            if lower_th >= length_1 <= upper_th:
-                                if lower_th >= length_2 <= upper_th:
-                                    return {"type": 'bearish', "style": '-'}
-    return None
+    bearish = (day_0.trend == TREND_ABOVE) & \
+        (day_0.body(body) != BODY_SHORT) & day_0.black & \
+        (day_1.body(body) != BODY_SHORT) & day_1.black & \
+        (day_1.open <= (length_0 * thresh) + day_0.close) & \
+        (day_1.close >= day_0.close - (length_0 * thresh)) & \
+        (day_2.body(body) != BODY_SHORT) & day_2.black & \
+        (day_2.open <= (length_1 * thresh) + day_1.close) & \
+        (day_2.open >= day_1.close - (length_1 * thresh)) & \
+        (lower_th >= length_1) & (length_1 <= upper_th) & \
+        (lower_th >= length_2) & (length_2 <= upper_th)
+    return [(bearish, 'bearish', '-')]
@@ -1,81 +1,45 @@
 """ inside_outside """
-from typing import Union
+from typing import List, Union
 
-def three_outside(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import (
+    CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG, BODY_SHORT
+)
+
+
+def three_outside(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ three outside """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
+    # pylint: disable=comparison-with-itself
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0['color'] == 'black' and candle_0[body] != 'long':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'long' and candle_1['color'] == 'white':
-                basic_1 = trading_candle[1]['basic']
-                basic_0 = trading_candle[0]['basic']
+    bullish = (day_0.trend == TREND_BELOW) & day_0.black & (day_0.body(body) != BODY_LONG) & \
+        (day_1.body(body) == BODY_LONG) & day_1.white & \
+        (day_0.low > day_1.open) & (day_0.high < day_1.close) & day_2.white & \
+        (day_2.open > day_1.open) & (day_2.open < day_1.close) & (day_2.close > day_2.close)
 
-                if (basic_0['Low'] > basic_1['Open']) and (basic_0['High'] < basic_1['Close']):
-                    if trading_candle[2]['candlestick']['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        if (basic_2['Open'] > basic_1['Open']) and \
-                            (basic_2['Open'] < basic_1['Close']) and \
-                                (basic_2['Close'] > basic_2['Close']):
-                            return {"type": 'bullish', "style": 'up'}
+    bearish = (day_0.trend == TREND_ABOVE) & day_0.white & (day_0.body(body) != BODY_LONG) & \
+        (day_1.body(body) == BODY_LONG) & day_1.black & \
+        (day_0.low > day_1.close) & (day_0.high < day_1.open) & day_2.black & \
+        (day_2.open < day_1.open) & (day_2.open > day_1.close) & (day_2.close < day_2.close)
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0['color'] == 'white' and candle_0[body] != 'long':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'long' and candle_1['color'] == 'black':
-                basic_1 = trading_candle[1]['basic']
-                basic_0 = trading_candle[0]['basic']
+    return [(bullish, 'bullish', 'up'), (bearish, 'bearish', 'down')]
 
-                if (basic_0['Low'] > basic_1['Close']) and (basic_0['High'] < basic_1['Open']):
-                    if trading_candle[2]['candlestick']['color'] == 'black':
-                        basic_2 = trading_candle[2]['basic']
-                        if (basic_2['Open'] < basic_1['Open']) and \
-                            (basic_2['Open'] > basic_1['Close']) and \
-                                (basic_2['Close'] < basic_2['Close']):
-                            return {"type": 'bearish', "style": 'down'}
-    return None
 
-
-def three_inside(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+def three_inside(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ three inside """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-
-                if (basic_1['Open'] > basic_0['Close']) and (basic_1['Close'] < basic_0['Open']):
-                    if trading_candle[2]['candlestick']['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        if (basic_2['Open'] > basic_1['Open']) and \
-                                (basic_2['Open'] < basic_1['Close']):
-                            if basic_2['Close'] > basic_0['Open']:
-                                return {"type": 'bullish', "style": 'up'}
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_1.body(body) == BODY_SHORT) & day_1.white & \
+        (day_1.open > day_0.close) & (day_1.close < day_0.open) & day_2.white & \
+        (day_2.open > day_1.open) & (day_2.open < day_1.close) & (day_2.close > day_0.open)
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
+    bearish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_1.body(body) == BODY_SHORT) & day_1.black & \
+        (day_1.open < day_0.close) & (day_1.close > day_0.open) & day_2.black & \
+        (day_2.open > day_1.close) & (day_2.open < day_1.open) & (day_2.close < day_0.open)
 
-                if (basic_1['Open'] < basic_0['Close']) and (basic_1['Close'] > basic_0['Open']):
-                    if trading_candle[2]['candlestick']['color'] == 'black':
-                        basic_2 = trading_candle[2]['basic']
-                        if (basic_2['Open'] > basic_1['Close']) and \
-                                (basic_2['Open'] < basic_1['Open']):
-                            if basic_2['Close'] < basic_0['Open']:
-                                return {"type": 'bearish', "style": 'down'}
-    return None
+    return [(bullish, 'bullish', 'up'), (bearish, 'bearish', 'down')]
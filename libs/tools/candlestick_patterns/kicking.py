@@ -1,48 +1,29 @@
 """ kicking """
-from typing import Union
+from typing import List, Union
 import numpy as np
 
-def kicking(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, BODY_LONG
+
+
+def kicking(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ kicking """
     if not body:
         body = 'body'
     thresh = 0.01
+    day_0, day_1 = days[0], days[1]
 
-    candle_0 = trading_candle[0]['candlestick']
-    candle_1 = trading_candle[1]['candlestick']
-    if candle_0[body] == 'long' and \
-        candle_0['color'] == 'black' and \
-            candle_1[body] == 'long' and \
-            candle_1['color'] == 'white':
-        basic_0 = trading_candle[0]['basic']
-        oc_thr = np.abs(basic_0['Open'] - basic_0['Close']) * thresh
-        hi_op = basic_0['High'] - basic_0['Open']
-        cl_lo = basic_0['Close'] - basic_0['Low']
+    oc_thr_0 = np.abs(day_0.open - day_0.close) * thresh
+    oc_thr_1 = np.abs(day_1.open - day_1.close) * thresh
+    both_long = (day_0.body(body) == BODY_LONG) & (day_1.body(body) == BODY_LONG)
 
-        if (hi_op <= oc_thr) and (cl_lo <= oc_thr):
-            basic_1 = trading_candle[1]['basic']
-            oc_thr = np.abs(basic_1['Open'] - basic_1['Close']) * thresh
-            hi_cl = basic_1['High'] - basic_1['Close']
-            op_lo = basic_1['Open'] - basic_1['Low']
-            if (hi_cl <= oc_thr) and (op_lo <= oc_thr):
-                if basic_0['High'] < basic_1['Low']:
-                    return {"type": 'bullish', "style": '+'}
+    bullish = both_long & day_0.black & day_1.white & \
+        (day_0.high - day_0.open <= oc_thr_0) & (day_0.close - day_0.low <= oc_thr_0) & \
+        (day_1.high - day_1.close <= oc_thr_1) & (day_1.open - day_1.low <= oc_thr_1) & \
+        (day_0.high < day_1.low)
 
-    if candle_0[body] == 'long' and \
-        candle_0['color'] == 'white' and \
-            candle_1[body] == 'long' and \
-            candle_1['color'] == 'black':
-        basic_0 = trading_candle[0]['basic']
-        oc_thr = np.abs(basic_0['Close'] - basic_0['Open']) * thresh
-        hi_op = basic_0['High'] - basic_0['Close']
-        cl_lo = basic_0['Open'] - basic_0['Low']
+    bearish = both_long & day_0.white & day_1.black & \
+        (day_0.high - day_0.close <= oc_thr_0) & (day_0.open - day_0.low <= oc_thr_0) & \
+        (day_1.high - day_1.open <= oc_thr_1) & (day_1.close - day_1.low <= oc_thr_1) & \
+        (day_0.low > day_1.high)
 
-        if (hi_op <= oc_thr) and (cl_lo <= oc_thr):
-            basic_1 = trading_candle[1]['basic']
-            oc_thr = np.abs(basic_1['Open'] - basic_1['Close']) * thresh
-            hi_cl = basic_1['High'] - basic_1['Open']
-            op_lo = basic_1['Close'] - basic_1['Low']
-            if (hi_cl <= oc_thr) and (op_lo <= oc_thr):
-                if basic_0['Low'] > basic_1['High']:
-                    return {"type": 'bearish', "style": '-'}
-    return None
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
@@ -1,69 +1,39 @@
 """ ladder """
-from typing import Union
+from typing import List, Union
 
-def ladder(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import (
+    CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG, BODY_SHORT
+)
+
+
+def ladder(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ ladder """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
     shadow_ratio = 2.0
     thresh = 0.1
+    day_0, day_1, day_2, day_3, day_4 = days[0], days[1], days[2], days[3], days[4]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1]['candlestick']
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
-
-            if candle_1[body] != 'short' and candle_1['color'] == 'black' and \
-                basic_1['Open'] < basic_0['Open'] and basic_1['Open'] > basic_0['Close'] and \
-                    basic_1['Close'] < basic_0['Close']:
-                candle_2 = trading_candle[2]['candlestick']
-                basic_2 = trading_candle[2]['basic']
-                if candle_2[body] != 'short' and candle_2['color'] == 'black' and \
-                    basic_2['Open'] < basic_1['Open'] and \
-                        basic_2['Open'] > basic_1['Close'] and \
-                        basic_2['Close'] < basic_1['Close']:
-                    candle_3 = trading_candle[3]['candlestick']
-
-                    if candle_3[body] == 'short' and candle_3['color'] == 'black' and \
-                            candle_3['shadow_ratio'] >= shadow_ratio:
-                        basic_3 = trading_candle[3]['basic']
-                        oc_thr = (basic_3['Open'] - basic_3['Close']) * thresh
-                        cl_low = basic_3['Close'] - basic_3['Low']
-                        if (basic_3['Close'] < basic_2['Close']) and (cl_low <= oc_thr):
-                            candle_4 = trading_candle[4]['candlestick']
-                            if candle_4[body] == 'long' and candle_4['color'] == 'white' and \
-                                    trading_candle[4]['basic']['Open'] > basic_3['Open']:
-                                return {"type": 'bullish', "style": 'bottom +'}
-
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] != 'short' and candle_0['color'] == 'white':
-            candle_1 = trading_candle[1]['candlestick']
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
+    oc_thr = (day_3.open - day_3.close) * thresh
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) != BODY_SHORT) & day_0.black & \
+        (day_1.body(body) != BODY_SHORT) & day_1.black & \
+        (day_1.open < day_0.open) & (day_1.open > day_0.close) & (day_1.close < day_0.close) & \
+        (day_2.body(body) != BODY_SHORT) & day_2.black & \
+        (day_2.open < day_1.open) & (day_2.open > day_1.close) & (day_2.close < day_1.close) & \
+        (day_3.body(body) == BODY_SHORT) & day_3.black & \
+        (day_3.shadow_ratio >= shadow_ratio) & \
+        (day_3.close < day_2.close) & (day_3.close - day_3.low <= oc_thr) & \
+        (day_4.body(body) == BODY_LONG) & day_4.white & (day_4.open > day_3.open)
 
-            if candle_1[body] != 'short' and candle_1['color'] == 'white' and \
-                basic_1['Open'] > basic_0['Open'] and basic_1['Open'] < basic_0['Close'] and \
-                    basic_1['Close'] > basic_0['Close']:
-                candle_2 = trading_candle[2]['candlestick']
-                basic_2 = trading_candle[2]['basic']
-                if candle_2[body] != 'short' and candle_2['color'] == 'white' and \
-                    basic_2['Open'] > basic_1['Open'] and \
-                        basic_2['Open'] < basic_1['Close'] and \
-                        basic_2['Close'] > basic_1['Close']:
-                    candle_3 = trading_candle[3]['candlestick']
+    # The final day of the bearish ladder is always sized by the quartile 'body'
+    bearish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) != BODY_SHORT) & day_0.white & \
+        (day_1.body(body) != BODY_SHORT) & day_1.white & \
+        (day_1.open > day_0.open) & (day_1.open < day_0.close) & (day_1.close > day_0.close) & \
+        (day_2.body(body) != BODY_SHORT) & day_2.white & \
+        (day_2.open > day_1.open) & (day_2.open < day_1.close) & (day_2.close > day_1.close) & \
+        (day_3.body(body) == BODY_SHORT) & day_3.white & \
+        (day_3.shadow_ratio >= shadow_ratio) & \
+        (day_3.close > day_2.close) & (day_3.high - day_3.close <= oc_thr) & \
+        (day_4.body('body') == BODY_LONG) & day_4.black & (day_4.open < day_3.open)
 
-                    if candle_3[body] == 'short' and candle_3['color'] == 'white' and \
-                            candle_3['shadow_ratio'] >= shadow_ratio:
-                        basic_3 = trading_candle[3]['basic']
-                        oc_thr = (basic_3['Open'] - basic_3['Close']) * thresh
-                        cl_low = basic_3['High'] - basic_3['Close']
-                        if (basic_3['Close'] > basic_2['Close']) and (cl_low <= oc_thr):
-                            candle_4 = trading_candle[4]['candlestick']
-                            if candle_4['body'] == 'long' and candle_4['color'] == 'black' and \
-                                    trading_candle[4]['basic']['Open'] < basic_3['Open']:
-                                return {"type": 'bearish', "style": 'top -'}
-    return None
+    return [(bullish, 'bullish', 'bottom +'), (bearish, 'bearish', 'top -')]
@@ -1,35 +1,26 @@
 """ matching """
-from typing import Union
+from typing import List, Union
 
-def matching_high_low(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def matching_high_low(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ matching high and low """
     if not body:
         body = 'body'
     thresh = 0.03
+    day_0, day_1 = days[0], days[1]
+
+    length_0 = day_0.open - day_0.close
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        day_1.black & (day_1.open < day_0.open) & \
+        (day_1.close <= (length_0 * thresh) + day_0.close) & \
+        (day_1.close >= day_0.close - (length_0 * thresh))
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if trading_candle[1]['candlestick']['color'] == 'black':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                point1 = ((basic_0['Open'] - basic_0['Close']) * thresh) + basic_0['Close']
-                point2 = basic_0['Close'] - \
-                    ((basic_0['Open'] - basic_0['Close']) * thresh)
-                if (basic_1['Open'] < basic_0['Open']) and (basic_1['Close'] <= point1) and \
-                        (basic_1['Close'] >= point2):
-                    return {"type": 'bullish', "style": 'low'}
+    length_0 = day_0.close - day_0.open
+    bearish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        day_1.white & (day_1.open > day_0.open) & \
+        (day_1.close <= (length_0 * thresh) + day_0.close) & \
+        (day_1.close >= day_0.close - (length_0 * thresh))
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if trading_candle[1]['candlestick']['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                point1 = ((basic_0['Close'] - basic_0['Open']) * thresh) + basic_0['Close']
-                point2 = basic_0['Close'] - \
-                    ((basic_0['Close'] - basic_0['Open']) * thresh)
-                if (basic_1['Open'] > basic_0['Open']) and (basic_1['Close'] <= point1) and \
-                        (basic_1['Close'] >= point2):
-                    return {"type": 'bearish', "style": 'high'}
-    return None
+    return [(bullish, 'bullish', 'low'), (bearish, 'bearish', 'high')]
@@ -1,34 +1,19 @@
 """ meeting line """
-from typing import Union
+from typing import List, Union
 import numpy as np
 
-def meeting_line(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_SHORT
+
+
+def meeting_line(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ meeting line """
     if not body:
         body = 'body'
     thresh = 0.01
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] != 'short' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1['color'] == 'white' and candle_1[body] != 'short':
-                basic_1 = trading_candle[1].get('basic')
-                basic_0 = trading_candle[0].get('basic')
-                hl_thr = (basic_1.get('High') - basic_1.get('Low')) * thresh
-                cl_cl = np.abs(basic_0.get('Close') - basic_1.get('Close'))
-                if cl_cl <= hl_thr:
-                    return {"type": 'bullish', "style": "+"}
-
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] != 'short' and candle_0['color'] == 'white':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1['color'] == 'black' and candle_1[body] != 'short':
-                basic_1 = trading_candle[1].get('basic')
-                basic_0 = trading_candle[0].get('basic')
-                hl_thr = (basic_1.get('High') - basic_1.get('Low')) * thresh
-                cl_cl = np.abs(basic_0.get('Close') - basic_1.get('Close'))
-                if cl_cl <= hl_thr:
-                    return {"type": 'bearish', "style": "-"}
-    return None
+    meeting = (day_0.body(body) != BODY_SHORT) & (day_1.body(body) != BODY_SHORT) & \
+        (np.abs(day_0.close - day_1.close) <= (day_1.high - day_1.low) * thresh)
+    bullish = meeting & (day_0.trend == TREND_BELOW) & day_0.black & day_1.white
+    bearish = meeting & (day_0.trend == TREND_ABOVE) & day_0.white & day_1.black
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
@@ -1,40 +1,33 @@
 """ neckline """
-from typing import Union
+from typing import List, Union
 
-def on_in_neck_line(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def on_in_neck_line(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ on in neckline """
-    # pylint: disable=too-many-branches
     if not body:
         body = 'body'
     thresh = 0.05
+    day_0, day_1 = days[0], days[1]
+
+    bearish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        day_1.white & (day_1.open < day_0.low)
+    oc_thr = (day_0.open - day_0.close) * thresh
+    bearish_in = bearish & \
+        (day_1.close >= day_0.close - oc_thr) & (day_1.close <= day_0.close + oc_thr)
+    bearish_on = bearish & (day_1.close <= day_0.close) & (day_1.close >= day_0.low)
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if trading_candle[1]['candlestick']['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_1['Open'] < basic_0['Low']:
-                    oc_thr = (basic_0['Open'] - basic_0['Close']) * thresh
-                    point1 = basic_0['Close'] - oc_thr
-                    point2 = basic_0['Close'] + oc_thr
-                    if basic_1['Close'] >= point1 and basic_1['Close'] <= point2:
-                        return {"type": 'bearish', "style": 'in -'}
-                    if basic_1['Close'] <= basic_0['Close'] and basic_1['Close'] >= basic_0['Low']:
-                        return {"type": 'bearish', "style": 'on -'}
+    bullish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        day_1.black & (day_1.open > day_0.high)
+    oc_thr = (day_0.close - day_0.open) * thresh
+    bullish_in = bullish & \
+        (day_1.close >= day_0.close - oc_thr) & (day_1.close <= day_0.close + oc_thr)
+    bullish_on = bullish & (day_1.close >= day_0.close) & (day_1.close <= day_0.high)
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if trading_candle[1]['candlestick']['color'] == 'black':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_1['Open'] > basic_0['High']:
-                    oc_thr = (basic_0['Close'] - basic_0['Open']) * thresh
-                    point1 = basic_0['Close'] - oc_thr
-                    point2 = basic_0['Close'] + oc_thr
-                    if basic_1['Close'] >= point1 and basic_1['Close'] <= point2:
-                        return {"type": 'bullish', "style": 'in +'}
-                    if basic_1['Close'] >= basic_0['Close'] and basic_1['Close'] <= basic_0['High']:
-                        return {"type": 'bullish', "style": 'on +'}
-    return None
+    return [
+        (bearish_in, 'bearish', 'in -'),
+        (bearish_on, 'bearish', 'on -'),
+        (bullish_in, 'bullish', 'in +'),
+        (bullish_on, 'bullish', 'on +')
+    ]
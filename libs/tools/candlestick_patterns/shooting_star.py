@@ -1,31 +1,23 @@
 """ shooting star """
-from typing import Union
+from typing import List, Union
 
-def shooting_star(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, BODY_LONG, BODY_SHORT
+
+
+def shooting_star(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ shooting star """
-    # pylint: disable=too-many-nested-blocks
     if not body:
         body = 'body'
     ratio = 2.0
     thresh = 0.01
+    day_0, day_1 = days[0], days[1]
 
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = trading_candle[0].get('basic')
-            if basic_0.get('Close') < basic_0.get('High'):
-                candle_1 = trading_candle[1].get('candlestick')
-                if candle_1[body] == 'short' and candle_1['shadow_ratio'] >= ratio:
-                    basic_1 = trading_candle[1].get('basic')
-                    high = basic_1.get('High')
-                    low = basic_1.get('Low')
-                    close = basic_1.get('Close')
-                    _open = basic_1.get('Open')
-
-                    if (_open > basic_0.get('Close')) and (close > basic_0.get('Close')):
-                        hl_thr = (high - low) * thresh
-                        cl_low = close - low
-                        op_low = _open - low
-                        if (cl_low <= hl_thr) or (op_low <= hl_thr):
-                            return {"type": 'bearish', "style": '-'}
-    return None
+    hl_thr = (day_1.high - day_1.low) * thresh
+    cl_low = day_1.close - day_1.low
+    op_low = day_1.open - day_1.low
+    bearish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_0.close < day_0.high) & \
+        (day_1.body(body) == BODY_SHORT) & (day_1.shadow_ratio >= ratio) & \
+        (day_1.open > day_0.close) & (day_1.close > day_0.close) & \
+        ((cl_low <= hl_thr) | (op_low <= hl_thr))
+    return [(bearish, 'bearish', '-')]
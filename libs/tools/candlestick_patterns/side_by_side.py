@@ -1,44 +1,27 @@
 """ side by side """
-from typing import Union
+from typing import List, Union
 
-def side_by_side_white_lines(trading_candle: list,
-                             body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def side_by_side_white_lines(days: CandleWindow,
+                             body: Union[str, None] = None) -> List[PatternMatch]:
     """ side by side white lines """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
-
     thresh = 0.1
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if trading_candle[1]['candlestick']['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_1['Low'] > basic_0['High']:
-                    if trading_candle[2]['candlestick']['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        oc_thr = (basic_1['Close'] - basic_1['Open']) * thresh
-                        point1 = basic_1['Open'] - oc_thr
-                        point2 = basic_1['Open'] + oc_thr
-                        if basic_2['Low'] > basic_0['High'] and basic_2['Open'] >= point1 and \
-                                basic_2['Open'] <= point2 and basic_2['Close'] <= basic_1['Close']:
-                            return {"type": 'bullish', "style": 'white lines +'}
+    day_0, day_1, day_2 = days[0], days[1], days[2]
+
+    oc_thr = (day_1.close - day_1.open) * thresh
+    side_by_side = day_1.white & day_2.white & \
+        (day_2.open >= day_1.open - oc_thr) & (day_2.open <= day_1.open + oc_thr) & \
+        (day_2.close <= day_1.close)
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if trading_candle[1]['candlestick']['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_1['High'] < basic_0['Low']:
-                    if trading_candle[2]['candlestick']['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        oc_thr = (basic_1['Close'] - basic_1['Open']) * thresh
-                        point1 = basic_1['Open'] - oc_thr
-                        point2 = basic_1['Open'] + oc_thr
-                        if basic_2['High'] < basic_0['Low'] and basic_2['Open'] >= point1 and \
-                                basic_2['Open'] <= point2 and basic_2['Close'] <= basic_1['Close']:
-                            return {"type": 'bearish', "style": 'white lines -'}
+    bullish = side_by_side & (day_0.trend == TREND_ABOVE) & \
+        (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_1.low > day_0.high) & (day_2.low > day_0.high)
+    bearish = side_by_side & (day_0.trend == TREND_BELOW) & \
+        (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_1.high < day_0.low) & (day_2.high < day_0.low)
 
-    return None
+    return [(bullish, 'bullish', 'white lines +'), (bearish, 'bearish', 'white lines -')]
@@ -1,66 +1,36 @@
 """ stick sandwich """
-from typing import Union
+from typing import List, Union
 
-def stick_sandwich(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def stick_sandwich(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ stick sandwich """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
     thresh = 0.02
     mf_shadow_ratio = 1.03
     close_thresh = 0.05
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            basic_0 = trading_candle[0]['basic']
-            oc_thr = (basic_0['Open'] - basic_0['Close']) * thresh
-            cl_low = basic_0['Close'] - basic_0['Low']
-            if cl_low <= oc_thr:
-                candle_1 = trading_candle[1]['candlestick']
-
-                if candle_1[body] == 'long' and candle_1['color'] == 'white' and \
-                        candle_1['shadow_ratio'] <= mf_shadow_ratio:
-                    basic_1 = trading_candle[1]['basic']
-                    basic_0 = trading_candle[0]['basic']
-                    if (basic_1['Open'] > basic_0['Close']) and \
-                            (basic_1['Open'] < basic_0['Open']):
-                        candle_2 = trading_candle[2]['candlestick']
-
-                        if candle_2[body] == 'long' and candle_2['color'] == 'black':
-                            basic_2 = trading_candle[2]['basic']
-                            point1 = ((basic_2['Open'] - basic_2['Close']) * close_thresh) + \
-                                basic_2['Close']
-                            point2 = basic_2['Close'] - \
-                                ((basic_2['Open'] - basic_2['Close']) * close_thresh)
-                            if (basic_0['Close'] <= point1) and (basic_0['Close'] >= point2):
-                                if basic_2['Open'] > basic_1['Close']:
-                                    return {"type": 'bullish', "style": '+'}
+    sandwich = (day_0.body(body) == BODY_LONG) & \
+        (day_1.body(body) == BODY_LONG) & (day_1.shadow_ratio <= mf_shadow_ratio) & \
+        (day_2.body(body) == BODY_LONG)
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = trading_candle[0]['basic']
-            oc_thr = (basic_0['Close'] - basic_0['Open']) * thresh
-            cl_low = basic_0['High'] - basic_0['Close']
-            if cl_low <= oc_thr:
-                candle_1 = trading_candle[1]['candlestick']
+    length_2 = day_2.open - day_2.close
+    bullish = sandwich & (day_0.trend == TREND_BELOW) & day_0.black & \
+        (day_0.close - day_0.low <= (day_0.open - day_0.close) * thresh) & day_1.white & \
+        (day_1.open > day_0.close) & (day_1.open < day_0.open) & day_2.black & \
+        (day_0.close <= (length_2 * close_thresh) + day_2.close) & \
+        (day_0.close >= day_2.close - (length_2 * close_thresh)) & \
+        (day_2.open > day_1.close)
 
-                if candle_1[body] == 'long' and candle_1['color'] == 'black' and \
-                        candle_1['shadow_ratio'] <= mf_shadow_ratio:
-                    basic_1 = trading_candle[1]['basic']
-                    basic_0 = trading_candle[0]['basic']
-                    if (basic_1['Open'] > basic_0['Open']) and \
-                            (basic_1['Open'] < basic_0['Close']):
-                        candle_2 = trading_candle[2]['candlestick']
+    length_2 = day_2.close - day_2.open
+    bearish = sandwich & (day_0.trend == TREND_ABOVE) & day_0.white & \
+        (day_0.high - day_0.close <= (day_0.close - day_0.open) * thresh) & day_1.black & \
+        (day_1.open > day_0.open) & (day_1.open < day_0.close) & day_2.white & \
+        (day_0.close <= (length_2 * close_thresh) + day_2.close) & \
+        (day_0.close >= day_2.close - (length_2 * close_thresh)) & \
+        (day_2.open < day_1.close)
 
-                        if candle_2[body] == 'long' and candle_2['color'] == 'white':
-                            basic_2 = trading_candle[2]['basic']
-                            point1 = ((basic_2['Close'] - basic_2['Open']) * close_thresh) + \
-                                basic_2['Close']
-                            point2 = basic_2['Close'] - \
-                                ((basic_2['Close'] - basic_2['Open']) * close_thresh)
-                            if (basic_0['Close'] <= point1) and (basic_0['Close'] >= point2):
-                                if basic_2['Open'] < basic_1['Close']:
-                                    return {"type": 'bearish', "style": '-'}
-    return None
+    return [(bullish, 'bullish', '+'), (bearish, 'bearish', '-')]
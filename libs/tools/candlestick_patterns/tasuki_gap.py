@@ -1,40 +1,24 @@
 """ tasuki gap """
-from typing import Union
+from typing import List, Union
 
-def tasuki_gap_upside_downside(trading_candle: list,
-                               body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG
+
+
+def tasuki_gap_upside_downside(days: CandleWindow,
+                               body: Union[str, None] = None) -> List[PatternMatch]:
     """ tasuki gap upside downside """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
+
+    bullish = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        day_1.white & (day_1.low > day_0.high) & day_2.black & \
+        (day_2.open <= day_1.close) & (day_2.open >= day_1.open) & \
+        (day_2.close < day_1.open) & (day_2.close > day_0.close)
 
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            if trading_candle[1]['candlestick']['color'] == 'white':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_1['Low'] > basic_0['High']:
-                    if trading_candle[2]['candlestick']['color'] == 'black':
-                        basic_2 = trading_candle[2]['basic']
-                        if basic_2['Open'] <= basic_1['Close'] and \
-                                basic_2['Open'] >= basic_1['Open']:
-                            if basic_2['Close'] < basic_1['Open'] and \
-                                    basic_2['Close'] > basic_0['Close']:
-                                return {"type": 'bullish', "style": 'upside +'}
+    bearish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        day_1.black & (day_0.low > day_1.high) & day_2.white & \
+        (day_2.open <= day_1.open) & (day_2.open >= day_1.close) & \
+        (day_2.close > day_1.open) & (day_2.close < day_0.close)
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            if trading_candle[1]['candlestick']['color'] == 'black':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_0['Low'] > basic_1['High']:
-                    if trading_candle[2]['candlestick']['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        if basic_2['Open'] <= basic_1['Open'] and \
-                                basic_2['Open'] >= basic_1['Close']:
-                            if basic_2['Close'] > basic_1['Open'] and \
-                                    basic_2['Close'] < basic_0['Close']:
-                                return {"type": 'bearish', "style": 'downside -'}
-    return None
+    return [(bullish, 'bullish', 'upside +'), (bearish, 'bearish', 'downside -')]
@@ -1,38 +1,21 @@
 """ three line strike """
-from typing import Union
+from typing import List, Union
 
-def three_line_strike(trading_candle: list, _: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW
+
+
+def three_line_strike(days: CandleWindow, _: Union[str, None] = None) -> List[PatternMatch]:
     """ three line strike """
-    # pylint: disable=too-many-nested-blocks
-    if trading_candle[0]['trend'] == 'below':
-        if trading_candle[0]['candlestick']['color'] == 'black' and \
-            trading_candle[1]['candlestick']['color'] == 'black' \
-                and trading_candle[2]['candlestick']['color'] == 'black':
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
+    day_0, day_1, day_2, day_3 = days[0], days[1], days[2], days[3]
 
-            if basic_1['Open'] < basic_0['Open'] and basic_1['Close'] < basic_0['Close']:
-                basic_2 = trading_candle[2]['basic']
-                if basic_2['Open'] < basic_1['Open'] and basic_2['Close'] < basic_1['Close']:
-                    if trading_candle[3]['candlestick']['color'] == 'white':
-                        basic_3 = trading_candle[3]['basic']
-                        if basic_3['Open'] <= basic_2['Close'] and \
-                                basic_3['Close'] >= basic_0['Open']:
-                            return {"type": 'bearish', "style": '-'}
+    bearish = (day_0.trend == TREND_BELOW) & day_0.black & day_1.black & day_2.black & \
+        (day_1.open < day_0.open) & (day_1.close < day_0.close) & \
+        (day_2.open < day_1.open) & (day_2.close < day_1.close) & day_3.white & \
+        (day_3.open <= day_2.close) & (day_3.close >= day_0.open)
 
-    if trading_candle[0]['trend'] == 'above':
-        if trading_candle[0]['candlestick']['color'] == 'white' and \
-            trading_candle[1]['candlestick']['color'] == 'white' \
-                and trading_candle[2]['candlestick']['color'] == 'white':
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
+    bullish = (day_0.trend == TREND_ABOVE) & day_0.white & day_1.white & day_2.white & \
+        (day_1.open > day_0.open) & (day_1.close > day_0.close) & \
+        (day_2.open > day_1.open) & (day_2.close > day_1.close) & day_3.black & \
+        (day_3.open >= day_2.close) & (day_3.close <= day_0.open)
 
-            if basic_1['Open'] > basic_0['Open'] and basic_1['Close'] > basic_0['Close']:
-                basic_2 = trading_candle[2]['basic']
-                if basic_2['Open'] > basic_1['Open'] and basic_2['Close'] > basic_1['Close']:
-                    if trading_candle[3]['candlestick']['color'] == 'black':
-                        basic_3 = trading_candle[3]['basic']
-                        if basic_3['Open'] >= basic_2['Close'] and \
-                                basic_3['Close'] <= basic_0['Open']:
-                            return {"type": 'bullish', "style": '+'}
-    return None
+    return [(bearish, 'bearish', '-'), (bullish, 'bullish', '+')]
@@ -1,95 +1,52 @@
 """ three methods """
-from typing import Union
+from typing import List, Union
+import numpy as np
 
-def upside_downside_gap_three_methods(trading_candle: list, _:
-                                      Union[str, None] = None) -> Union[dict, str]:
+from .day_features import (
+    CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_LONG, BODY_SHORT
+)
+
+
+def upside_downside_gap_three_methods(days: CandleWindow,
+                                      _: Union[str, None] = None) -> List[PatternMatch]:
     """ upside downside gap three methods """
-    if trading_candle[0]['trend'] == 'below':
-        if trading_candle[0]['candlestick']['color'] == 'black' and \
-            trading_candle[1]['candlestick']['color'] == 'black':
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
-            if basic_1['High'] < basic_0['Low'] and \
-                trading_candle[2]['candlestick']['color'] == 'white':
-                basic_2 = trading_candle[2]['basic']
-                if basic_2['Open'] < basic_1['Open'] and basic_2['Open'] > basic_1['Close'] and \
-                        basic_2['Close'] > basic_0['Close'] and basic_2['Close'] < basic_2['Open']:
-                    return {"type": 'bearish', "style": 'downside -'}
+    # pylint: disable=comparison-with-itself
+    day_0, day_1, day_2 = days[0], days[1], days[2]
+
+    bearish = (day_0.trend == TREND_BELOW) & day_0.black & day_1.black & \
+        (day_1.high < day_0.low) & day_2.white & \
+        (day_2.open < day_1.open) & (day_2.open > day_1.close) & \
+        (day_2.close > day_0.close) & (day_2.close < day_2.open)
 
-    if trading_candle[0]['trend'] == 'above':
-        if trading_candle[0]['candlestick']['color'] == 'white' and \
-            trading_candle[1]['candlestick']['color'] == 'white':
-            basic_0 = trading_candle[0]['basic']
-            basic_1 = trading_candle[1]['basic']
-            if basic_1['Low'] > basic_0['High'] and \
-                trading_candle[2]['candlestick']['color'] == 'black':
-                basic_2 = trading_candle[2]['basic']
-                if basic_2['Open'] < basic_1['Close'] and basic_2['Open'] > basic_1['Open'] and \
-                        basic_2['Close'] > basic_0['Open'] and basic_2['Close'] < basic_2['Close']:
-                    return {"type": 'bullish', "style": 'upside +'}
-    return None
+    bullish = (day_0.trend == TREND_ABOVE) & day_0.white & day_1.white & \
+        (day_1.low > day_0.high) & day_2.black & \
+        (day_2.open < day_1.close) & (day_2.open > day_1.open) & \
+        (day_2.close > day_0.open) & (day_2.close < day_2.close)
 
+    return [(bearish, 'bearish', 'downside -'), (bullish, 'bullish', 'upside +')]
 
-def rising_falling_three_methods(trading_candle: list,
-                                 body: Union[str, None] = None) -> Union[dict, None]:
+
+def rising_falling_three_methods(days: CandleWindow,
+                                 body: Union[str, None] = None) -> List[PatternMatch]:
     """ rising falling three methods """
-    # pylint: disable=too-many-nested-blocks,too-many-branches
     if not body:
         body = 'body'
+    day_0, day_1, day_4 = days[0], days[1], days[4]
 
-    # Rising three methods (continuation of bull trend)
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            basic_0 = trading_candle[0].get('basic')
-            high_0 = basic_0.get('High')
-            low_0 = basic_0.get('Low')
-            close_0 = basic_0.get('Close')
-            basic_1 = trading_candle[1].get('basic')
+    contained = (day_0.high >= np.maximum(day_1.open, day_1.close)) & \
+        (day_0.low <= np.minimum(day_1.open, day_1.close)) & (day_1.body(body) == BODY_SHORT)
 
-            if high_0 >= max(basic_1.get('Open'), basic_1.get('Close')):
-                if low_0 <= min(basic_1.get('Open'), basic_1.get('Close')):
-                    if trading_candle[1]['candlestick'][body] == 'short':
-                        basic_2 = trading_candle[1].get('basic')
-
-                        if high_0 >= max(basic_2.get('Open'), basic_2.get('Close')):
-                            if low_0 <= min(basic_2.get('Open'), basic_2.get('Close')):
-                                basic_3 = trading_candle[1].get('basic')
-                                if high_0 >= max(basic_3.get('Open'), basic_3.get('Close')):
-                                    if low_0 <= min(basic_3.get('Open'), basic_3.get('Close')):
-                                        candle_4 = trading_candle[4].get('candlestick')
-                                        if candle_4[body] == 'long' and \
-                                                candle_4['color'] == 'white':
-                                            if trading_candle[4].get('basic', {}).get('Close') \
-                                                > close_0:
-                                                return {"type": 'bullish',
-                                                        "style": 'rising three methods'}
+    # Rising three methods (continuation of bull trend)
+    rising = contained & (day_0.trend == TREND_ABOVE) & \
+        (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_4.body(body) == BODY_LONG) & day_4.white & (day_4.close > day_0.close)
 
     # Falling three methods (continuation of bear trend)
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            basic_0 = trading_candle[0].get('basic')
-            high_0 = basic_0.get('High')
-            low_0 = basic_0.get('Low')
-            close_0 = basic_0.get('Close')
-            basic_1 = trading_candle[1].get('basic')
-
-            if low_0 <= min(basic_1.get('Open'), basic_1.get('Close')):
-                if high_0 >= max(basic_1.get('Open'), basic_1.get('Close')):
-                    if trading_candle[1]['candlestick'][body] == 'short':
-                        basic_2 = trading_candle[1].get('basic')
-                        if low_0 <= min(basic_2.get('Open'), basic_2.get('Close')):
-
-                            if high_0 >= max(basic_2.get('Open'), basic_2.get('Close')):
-                                basic_3 = trading_candle[1].get('basic')
-                                if low_0 <= min(basic_3.get('Open'), basic_3.get('Close')):
-                                    if high_0 >= max(basic_3.get('Open'), basic_3.get('Close')):
-                                        candle_4 = trading_candle[4].get('candlestick')
-                                        if candle_4[body] == 'long' and \
-                                                candle_4['color'] == 'black':
-                                            if trading_candle[4].get('basic', {}).get('Close') \
-                                                < close_0:
-                                                return {"type": 'bearish',
-                                                        "style": 'falling three methods'}
-    return None
+    falling = contained & (day_0.trend == TREND_BELOW) & \
+        (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_4.body(body) == BODY_LONG) & day_4.black & (day_4.close < day_0.close)
+
+    return [
+        (rising, 'bullish', 'rising three methods'),
+        (falling, 'bearish', 'falling three methods')
+    ]
@@ -1,30 +1,20 @@
 """ three river """
-from typing import Union
+from typing import List, Union
 
-def unique_three_river(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_BELOW, BODY_LONG, BODY_SHORT
+
+
+def unique_three_river(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ unique three river """
-    # pylint: disable=too-many-nested-blocks
     if not body:
         body = 'body'
     thresh = 0.02
     shadow_ratio = 2.0
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'black' and \
-                    candle_1['shadow_ratio'] >= shadow_ratio:
-                basic_1 = trading_candle[1]['basic']
-                basic_0 = trading_candle[0]['basic']
-                hi_op = basic_1['High'] - basic_1['Open']
-                oc_thr = (basic_1['Open'] - basic_1['Close']) * thresh
-
-                if (hi_op <= oc_thr) and (basic_1['Open'] < basic_0['Open']) and \
-                        (basic_1['Low'] < basic_0['Close']):
-                    if trading_candle[2]['candlestick']['color'] == 'white':
-                        basic_2 = trading_candle[2]['basic']
-                        if (basic_2['Open'] >= basic_0['Close']) and \
-                                (basic_2['Close'] <= basic_1['Close']):
-                            return {"type": 'bullish', "style": '+'}
-    return None
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_1.body(body) == BODY_SHORT) & day_1.black & (day_1.shadow_ratio >= shadow_ratio) & \
+        (day_1.high - day_1.open <= (day_1.open - day_1.close) * thresh) & \
+        (day_1.open < day_0.open) & (day_1.low < day_0.close) & day_2.white & \
+        (day_2.open >= day_0.close) & (day_2.close <= day_1.close)
+    return [(bullish, 'bullish', '+')]
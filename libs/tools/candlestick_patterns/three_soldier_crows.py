@@ -1,54 +1,33 @@
 """ three soldier crows """
-from typing import Union
+from typing import List, Union
 
-def three_white_soldiers_black_crows(trading_candle: list,
-                                     body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW, BODY_SHORT
+
+
+def three_white_soldiers_black_crows(days: CandleWindow,
+                                     body: Union[str, None] = None) -> List[PatternMatch]:
     """ three white soldiers black crows """
-    # pylint: disable=too-many-branches,too-many-nested-blocks
     if not body:
         body = 'body'
     thresh = 0.3
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0].get('trend') == 'below':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0['color'] == 'white' and candle_0[body] != 'short':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1['color'] == 'white' and candle_1[body] != 'short':
-                basic_0 = trading_candle[0].get('basic')
-                basic_1 = trading_candle[1].get('basic')
-                body_th = ((basic_0.get('Close') - basic_0.get('Open'))
-                           * thresh) + basic_0.get('Open')
-
-                if (basic_1.get('Open') > body_th) and (basic_1['Close'] > basic_0['Close']) \
-                        and (basic_1['Open'] < basic_0['Close']):
-                    candle_2 = trading_candle[2].get('candlestick')
-                    if candle_2['color'] == 'white' and candle_2[body] != 'short':
-                        basic_2 = trading_candle[2].get('basic')
-                        body_th = (
-                            (basic_1['Close'] - basic_1['Open']) * thresh) + basic_1['Open']
-                        if (basic_2['Open'] > body_th) and (basic_2['Close'] > basic_1['Close']) \
-                                and (basic_2['Open'] < basic_1['Close']):
-                            return {"type": 'bullish', "style": 'white soldiers'}
+    body_th_0 = ((day_0.close - day_0.open) * thresh) + day_0.open
+    body_th_1 = ((day_1.close - day_1.open) * thresh) + day_1.open
+    bullish = (day_0.trend == TREND_BELOW) & \
+        day_0.white & (day_0.body(body) != BODY_SHORT) & \
+        day_1.white & (day_1.body(body) != BODY_SHORT) & \
+        (day_1.open > body_th_0) & (day_1.close > day_0.close) & (day_1.open < day_0.close) & \
+        day_2.white & (day_2.body(body) != BODY_SHORT) & \
+        (day_2.open > body_th_1) & (day_2.close > day_1.close) & (day_2.open < day_1.close)
 
-    if trading_candle[0].get('trend') == 'above':
-        candle_0 = trading_candle[0].get('candlestick')
-        if candle_0['color'] == 'black' and candle_0[body] != 'short':
-            candle_1 = trading_candle[1].get('candlestick')
-            if candle_1['color'] == 'black' and candle_1[body] != 'short':
-                basic_0 = trading_candle[0].get('basic')
-                basic_1 = trading_candle[1].get('basic')
-                body_th = ((basic_0.get('Close') - basic_0.get('Open'))
-                           * (1.0 - thresh)) + basic_0.get('Open')
+    body_th_0 = ((day_0.close - day_0.open) * (1.0 - thresh)) + day_0.open
+    body_th_1 = ((day_1.close - day_1.open) * (1.0 - thresh)) + day_1.open
+    bearish = (day_0.trend == TREND_ABOVE) & \
+        day_0.black & (day_0.body(body) != BODY_SHORT) & \
+        day_1.black & (day_1.body(body) != BODY_SHORT) & \
+        (day_1.open < body_th_0) & (day_1.close < day_0.close) & (day_1.open > day_0.close) & \
+        day_2.black & (day_2.body(body) != BODY_SHORT) & \
+        (day_2.open < body_th_1) & (day_2.close < day_1.close) & (day_2.open > day_1.close)
 
-                if (basic_1.get('Open') < body_th) and (basic_1['Close'] < basic_0['Close']) \
-                        and (basic_1['Open'] > basic_0['Close']):
-                    candle_2 = trading_candle[2].get('candlestick')
-                    if candle_2['color'] == 'black' and candle_2[body] != 'short':
-                        basic_2 = trading_candle[2].get('basic')
-                        body_th = (
-                            (basic_1['Close'] - basic_1['Open']) * (1.0 - thresh)) + basic_1['Open']
-                        if (basic_2['Open'] < body_th) and \
-                            (basic_2['Close'] < basic_1['Close']) and \
-                                (basic_2['Open'] > basic_1['Close']):
-                            return {"type": 'bearish', "style": 'black crows'}
-    return None
+    return [(bullish, 'bullish', 'white soldiers'), (bearish, 'bearish', 'black crows')]
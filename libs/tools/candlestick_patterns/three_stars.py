@@ -1,43 +1,30 @@
 """ three stars """
-from typing import Union
+from typing import List, Union
 import numpy as np
 
-def three_stars_in_the_south(trading_candle: list,
-                             body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_BELOW, BODY_LONG, BODY_SHORT
+
+
+def three_stars_in_the_south(days: CandleWindow,
+                             body: Union[str, None] = None) -> List[PatternMatch]:
     """ three stars in the south """
-    # pylint: disable=too-many-locals,too-many-nested-blocks
     if not body:
         body = 'body'
     shadow_ratio = 1.6
     oc_shadow_ratio = 1.03
     thresh = 0.01
     op_thresh = 0.2
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'below':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'black' and \
-                candle_0['shadow_ratio'] >= shadow_ratio:
-            basic_0 = trading_candle[0]['basic']
-            hi_op = basic_0['High'] - basic_0['Open']
-            oc_thr = np.abs(basic_0['Close'] - basic_0['Open']) * thresh
-
-            if hi_op <= oc_thr:
-                candle_1 = trading_candle[1]['candlestick']
-                if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                    basic_1 = trading_candle[1]['basic']
-                    op_point = ((basic_0['Open'] - basic_0['Close']) * op_thresh) + basic_0['Close']
-
-                    if (basic_1['Open'] < op_point) and \
-                        (basic_1['Open'] > basic_0['Close']) and \
-                            (basic_1['Close'] < basic_0['Close']) and \
-                            (basic_1['Low'] > basic_0['Low']):
-                        candle_2 = trading_candle[2]['candlestick']
+    oc_thr = np.abs(day_0.close - day_0.open) * thresh
+    op_point = ((day_0.open - day_0.close) * op_thresh) + day_0.close
+    mid_pt = ((day_1.open - day_1.close) * 0.5) + day_1.close
 
-                        if candle_2['shadow_ratio'] <= oc_shadow_ratio and \
-                                candle_2['color'] == 'black' and candle_2[body] == 'short':
-                            basic_2 = trading_candle[2]['basic']
-                            mid_pt = (
-                                (basic_1['Open'] - basic_1['Close']) * 0.5) + basic_1['Close']
-                            if basic_2['Open'] < mid_pt and basic_2['Close'] < basic_1['Close']:
-                                return {"type": 'bullish', "style": "in the south +"}
-    return None
+    bullish = (day_0.trend == TREND_BELOW) & (day_0.body(body) == BODY_LONG) & day_0.black & \
+        (day_0.shadow_ratio >= shadow_ratio) & (day_0.high - day_0.open <= oc_thr) & \
+        (day_1.body(body) == BODY_SHORT) & day_1.black & \
+        (day_1.open < op_point) & (day_1.open > day_0.close) & \
+        (day_1.close < day_0.close) & (day_1.low > day_0.low) & \
+        (day_2.shadow_ratio <= oc_shadow_ratio) & day_2.black & \
+        (day_2.body(body) == BODY_SHORT) & (day_2.open < mid_pt) & (day_2.close < day_1.close)
+    return [(bullish, 'bullish', 'in the south +')]
@@ -1,21 +1,16 @@
 """ tri star """
-from typing import Union
+from typing import List, Union
 
-def tri_star(trading_candle: list, _: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, TREND_BELOW
+
+
+def tri_star(days: CandleWindow, _: Union[str, None] = None) -> List[PatternMatch]:
     """ tri star """
-    if trading_candle[0]['trend'] == 'below':
-        if trading_candle[0]['candlestick']['doji'] and \
-            trading_candle[1]['candlestick']['doji'] and \
-                trading_candle[2]['candlestick']['doji']:
-            if trading_candle[1]['basic']['Close'] < trading_candle[0]['basic']['Close']:
-                if trading_candle[1]['basic']['Close'] < trading_candle[2]['basic']['Close']:
-                    return {"type": 'bullish', "style": 'tri star +'}
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
-    if trading_candle[0]['trend'] == 'above':
-        if trading_candle[0]['candlestick']['doji'] and \
-            trading_candle[1]['candlestick']['doji'] and \
-                trading_candle[2]['candlestick']['doji']:
-            if trading_candle[1]['basic']['Close'] > trading_candle[0]['basic']['Close']:
-                if trading_candle[1]['basic']['Close'] > trading_candle[2]['basic']['Close']:
-                    return {"type": 'bearish', "style": 'tri star -'}
-    return None
+    all_doji = day_0.doji & day_1.doji & day_2.doji
+    bullish = all_doji & (day_0.trend == TREND_BELOW) & \
+        (day_1.close < day_0.close) & (day_1.close < day_2.close)
+    bearish = all_doji & (day_0.trend == TREND_ABOVE) & \
+        (day_1.close > day_0.close) & (day_1.close > day_2.close)
+    return [(bullish, 'bullish', 'tri star +'), (bearish, 'bearish', 'tri star -')]
@@ -1,32 +1,22 @@
 """ two crows """
-from typing import Union
+from typing import List, Union
 
-def upside_gap_two_crows(trading_candle: list, body: Union[str, None] = None) -> Union[dict, None]:
+from .day_features import CandleWindow, PatternMatch, TREND_ABOVE, BODY_LONG, BODY_SHORT
+
+
+def upside_gap_two_crows(days: CandleWindow, body: Union[str, None] = None) -> List[PatternMatch]:
     """ upside gap two crows """
-    # pylint: disable=too-many-nested-blocks
     if not body:
         body = 'body'
+    day_0, day_1, day_2 = days[0], days[1], days[2]
 
     # Both upside_gap_two_crows and two_crows
-    if trading_candle[0]['trend'] == 'above':
-        candle_0 = trading_candle[0]['candlestick']
-        if candle_0[body] == 'long' and candle_0['color'] == 'white':
-            candle_1 = trading_candle[1]['candlestick']
-            if candle_1[body] == 'short' and candle_1['color'] == 'black':
-                basic_0 = trading_candle[0]['basic']
-                basic_1 = trading_candle[1]['basic']
-                if basic_1['Close'] > basic_0['Close']:
+    crows = (day_0.trend == TREND_ABOVE) & (day_0.body(body) == BODY_LONG) & day_0.white & \
+        (day_1.body(body) == BODY_SHORT) & day_1.black & (day_1.close > day_0.close)
 
-                    if trading_candle[1]['candlestick']['color'] == 'black':
-                        basic_2 = trading_candle[2]['basic']
-                        if (basic_2['Open'] >= basic_1['Open']) and \
-                            (basic_2['Close'] <= basic_1['Close']) and \
-                                (basic_2['Close'] > basic_0['Close']):
-                            return {"type": 'bearish', "style": "upside_gap--"}
+    upside_gap = crows & (day_2.open >= day_1.open) & \
+        (day_2.close <= day_1.close) & (day_2.close > day_0.close)
+    two_crows = crows & (day_2.open > day_1.close) & (day_2.open < day_1.open) & \
+        (day_2.close < day_1.close) & (day_2.close > day_1.open)
 
-                        if (basic_2['Open'] > basic_1['Close']) and \
-                            (basic_2['Open'] < basic_1['Open']) and \
-                                (basic_2['Close'] < basic_1['Close']) and \
-                                (basic_2['Close'] > basic_1['Open']):
-                            return {"type": 'bearish', "style": '-'}
-    return None
+    return [(upside_gap, 'bearish', 'upside_gap--'), (two_crows, 'bearish', '-')]
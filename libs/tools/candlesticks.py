@@ -1,11 +1,11 @@
 """ candlesticks """
 import os
-from typing import Tuple, List
+from typing import Tuple, List, Union
 
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, generate_plot, PlotType
+from libs.utils import INDEXES, generate_plot, PlotType, date_axis
 
 from .moving_average import simple_moving_avg, exponential_moving_avg
 from .moving_average import adjust_signals
@@ -19,6 +19,10 @@ from .candlestick_patterns import (
     meeting_line, harami, engulfing, belt_hold, shooting_star, hammers, hanging_man,
     evening_morning_star
 )
+from .candlestick_patterns.day_features import (
+    CandleFeatures, DayClassification, CANDLE_DTYPE, TREND_ABOVE, TREND_AT, TREND_BELOW,
+    BODY_LONG, BODY_NORMAL, BODY_SHORT
+)
 
 PATTERNS = {
     "doji": {'days': 1, 'function': doji_pattern.doji_pattern},
@@ -102,7 +106,8 @@ def candlesticks(fund: pd.DataFrame, **kwargs) -> dict:
         pbar.uptick(increment=0.1)
 
     candles = pattern_detection(
-        fund, candles, plot_output=plot_output, pbar=pbar)
+        fund, candles, plot_output=plot_output, pbar=pbar,
+        features=candles['classification'].features)
 
     candles['signals'] = get_pattern_signals(candles, fund)
     candles['length_of_data'] = len(fund.index)
@@ -140,7 +145,7 @@ def candlesticks(fund: pd.DataFrame, **kwargs) -> dict:
 def pattern_detection(fund: pd.DataFrame, candles: dict, **kwargs) -> dict:
     """Pattern Detection
 
-    Searches available candlestick patterns on each area of the dataset
+    Scans all available candlestick patterns across the whole dataset at once
 
     Arguments:
         fund {pd.DataFrame} -- fund dataset
@@ -149,6 +154,7 @@ def pattern_detection(fund: pd.DataFrame, candles: dict, **kwargs) -> dict:
     Optional Args:
         plot_output {bool} -- (default: {True})
         pbar {ProgressBar} -- (default: {None})
+        features {CandleFeatures} -- day feature columns (default: {built from classification})
 
     Returns:
         dict -- candlestick data object
@@ -156,32 +162,25 @@ def pattern_detection(fund: pd.DataFrame, candles: dict, **kwargs) -> dict:
     # pylint: disable=too-many-locals
     plot_output = kwargs.get('plot_output', True)
     pbar = kwargs.get('pbar')
+    features = kwargs.get('features')
 
-    if pbar is not None:
-        divisor = 0.7 / float(len(candles['classification']))
+    if features is None:
+        features = classification_features(candles['classification'])
 
-    patterns = []
-    for i in range(len(candles['classification'])):
-        value = {'value': 0, 'patterns': []}
-        for pattern in PATTERNS:
-            val = pattern_library(pattern, candles['classification'], i)
-            if val[0] != 0:
-                value['value'] += val[0]
-                modified_pattern = f"{pattern}: {val[1]}"
-                value['patterns'].append(modified_pattern)
-
-            vol = pattern_library(pattern, candles['classification'], i, body='vol_body')
-            if vol[0] != 0:
-                value['value'] += vol[0]
-                modified_pattern = f"{pattern}: {vol[1]}"
-                value['patterns'].append(modified_pattern)
+    divisor = 0.7 / float(len(PATTERNS))
+
+    patterns = [{'value': 0, 'patterns': []} for _ in range(len(features))]
+    for pattern in PATTERNS:
+        for body in ('body', 'vol_body'):
+            values, styles = pattern_scan(pattern, features, body)
+            for i in np.flatnonzero(values):
+                patterns[i]['value'] += int(values[i])
+                patterns[i]['patterns'].append(f"{pattern}: {styles[i]}")
 
         if pbar is not None:
             pbar.uptick(increment=divisor)
 
-        patterns.append(value)
-
-    patterns2 = filtered_reversal_patterns(fund, candles)
+    patterns2 = filtered_reversal_patterns(fund, candles, features=features)
     tabular = [0.0] * len(patterns)
 
     for i, pattern in enumerate(patterns2):
@@ -236,36 +235,27 @@ def determine_threshold(fund: pd.DataFrame, **kwargs) -> dict:
     Returns:
         dict -- thresholding values
     """
-    # pylint: disable=too-many-locals
     long_percentile = kwargs.get('long_percentile', 75)
     short_percentile = kwargs.get('short_percentile', 25)
     doji_percentile = kwargs.get('doji_percentile', 1)
     doji_ratio = kwargs.get('doji_ratio', 8)
     plot_output = kwargs.get('plot_output', True)
 
-    open_close = []
-    high_low = []
-    for i, open_val in enumerate(fund['Open']):
-        open_close.append(np.abs(open_val - fund['Close'][i]))
-        high_low.append(np.abs(fund['High'][i] - fund['Low'][i]))
+    open_close = np.abs(fund['Open'].to_numpy() - fund['Close'].to_numpy())
+    high_low = np.abs(fund['High'].to_numpy() - fund['Low'].to_numpy()).tolist()
 
-    volatility = exponential_moving_avg(high_low, 25, data_type='list')
-    long_price = []
-    short_price = []
+    volatility = np.array(exponential_moving_avg(high_low, 25, data_type='list'))
     long_thresh = float(long_percentile) / 100.0
     short_thresh = float(short_percentile) * 2.0 / 100.0
-    for i, low in enumerate(fund['Low']):
-        price_l = low + (volatility[i] * long_thresh)
-        price_s = low + (volatility[i] * short_thresh)
-        long_price.append(price_l)
-        short_price.append(price_s)
+    long_price = fund['Low'].to_numpy() + (volatility * long_thresh)
+    short_price = fund['Low'].to_numpy() + (volatility * short_thresh)
 
     thresholds = {}
     thresholds['short'] = np.percentile(open_close, short_percentile)
     thresholds['long'] = np.percentile(open_close, long_percentile)
     thresholds['doji'] = np.percentile(open_close, doji_percentile)
     thresholds['doji_ratio'] = doji_ratio
-    thresholds['volatility'] = {"long": long_price, "short": short_price}
+    thresholds['volatility'] = {"long": long_price.tolist(), "short": short_price.tolist()}
 
     if plot_output:
         print("\r\nThresholding for candlesticks:")
@@ -286,7 +276,7 @@ def determine_threshold(fund: pd.DataFrame, **kwargs) -> dict:
     return thresholds
 
 
-def day_classification(fund: pd.DataFrame, thresholds: dict) -> List[dict]:
+def day_classification(fund: pd.DataFrame, thresholds: dict) -> DayClassification:
     """Day Classification
 
     Arguments:
@@ -294,69 +284,44 @@ def day_classification(fund: pd.DataFrame, thresholds: dict) -> List[dict]:
         thresholds {dict} -- candlestick body sizes
 
     Returns:
-        list[dict] -- each trading period classified by candlesticks
+        DayClassification -- each trading period classified by candlesticks (list-like view of
+                             dicts; the underlying feature columns are at '.features')
     """
-    # pylint: disable=too-many-branches
-    trading_candles = []
-    sma = simple_moving_avg(fund, 10)
-
-    vol_long = thresholds['volatility']['long']
-    vol_short = thresholds['volatility']['short']
-
-    # Classification elements:
-    for i, close in enumerate(fund['Close']):
-        stats = {}
-
-        # Raw, basic values to start
-        stats['basic'] = {}
-        stats['basic']['Close'] = close
-        stats['basic']['Open'] = fund['Open'][i]
-        stats['basic']['High'] = fund['High'][i]
-        stats['basic']['Low'] = fund['Low'][i]
-
-        # Where close appears vs. Trend (sma-10)
-        if close > sma[i]:
-            stats['trend'] = 'above'
-        elif close < sma[i]:
-            stats['trend'] = 'below'
-        else:
-            stats['trend'] = 'at'
+    days = np.zeros(len(fund.index), dtype=CANDLE_DTYPE)
+    close = fund['Close'].to_numpy()
+    open_ = fund['Open'].to_numpy()
+    high = fund['High'].to_numpy()
+    low = fund['Low'].to_numpy()
+    days['Close'] = close
+    days['Open'] = open_
+    days['High'] = high
+    days['Low'] = low
 
-        # Candlestick-esc properties
-        stats['candlestick'] = {}
+    # Where close appears vs. Trend (sma-10)
+    sma = np.array(simple_moving_avg(fund, 10))
+    days['trend'] = np.where(
+        close > sma, TREND_ABOVE, np.where(close < sma, TREND_BELOW, TREND_AT))
 
-        diff = np.abs(close - fund['Open'][i])
-        shadow_length = fund['High'][i] - fund['Low'][i]
+    # Candlestick-esc properties
+    diff = np.abs(close - open_)
+    shadow_length = high - low
 
-        if diff >= thresholds['long']:
-            stats['candlestick']['body'] = 'long'
-        elif diff <= thresholds['short']:
-            stats['candlestick']['body'] = 'short'
-        else:
-            stats['candlestick']['body'] = 'normal'
+    days['body'] = np.where(
+        diff >= thresholds['long'], BODY_LONG,
+        np.where(diff <= thresholds['short'], BODY_SHORT, BODY_NORMAL))
 
-        if fund['High'][i] > vol_long[i]:
-            stats['candlestick']['vol_body'] = 'long'
-        elif fund['High'][i] < vol_short[i]:
-            stats['candlestick']['vol_body'] = 'short'
-        else:
-            stats['candlestick']['vol_body'] = 'normal'
+    vol_long = np.array(thresholds['volatility']['long'])
+    vol_short = np.array(thresholds['volatility']['short'])
+    days['vol_body'] = np.where(
+        high > vol_long, BODY_LONG, np.where(high < vol_short, BODY_SHORT, BODY_NORMAL))
 
-        if close > fund['Open'][i]:
-            stats['candlestick']['color'] = 'white'
-        else:
-            stats['candlestick']['color'] = 'black'
+    days['white'] = close > open_
 
-        stats['candlestick']['doji'] = False
-        stats['candlestick']['shadow_ratio'] = 0.0
-        if diff > 0.0:
-            stats['candlestick']['shadow_ratio'] = shadow_length / diff
-        if diff <= thresholds['doji']:
-            if stats['candlestick']['shadow_ratio'] >= thresholds['doji_ratio']:
-                stats['candlestick']['doji'] = True
+    has_body = diff > 0.0
+    days['shadow_ratio'][has_body] = shadow_length[has_body] / diff[has_body]
+    days['doji'] = (diff <= thresholds['doji']) & (days['shadow_ratio'] >= thresholds['doji_ratio'])
 
-        trading_candles.append(stats)
-    return trading_candles
+    return CandleFeatures(days).classification()
 
 
 def get_pattern_signals(candles: dict, position: pd.DataFrame) -> List[dict]:
@@ -373,7 +338,7 @@ def get_pattern_signals(candles: dict, position: pd.DataFrame) -> List[dict]:
     """
     features = []
     for i, pattern in enumerate(candles['patterns']):
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if pattern['value'] < 0:
             for style in pattern['patterns']:
@@ -400,7 +365,8 @@ def get_pattern_signals(candles: dict, position: pd.DataFrame) -> List[dict]:
 
 def filtered_reversal_patterns(fund: pd.DataFrame,
                                candle: dict,
-                               filter_function='stochastic') -> list:
+                               filter_function='stochastic',
+                               **kwargs) -> list:
     """Filtered Reversal Patterns
 
     citing Greg Morris: Pattern must be in oscillator extreme to be valid
@@ -412,87 +378,100 @@ def filtered_reversal_patterns(fund: pd.DataFrame,
     Keyword Arguments:
         filter_function {str} -- oscillator of choice (default: {'stochastic'})
 
+    Optional Args:
+        features {CandleFeatures} -- day feature columns (default: {built from classification})
+
     Returns:
         list -- list of detected pattern objects
     """
+    # pylint: disable=too-many-locals
+    features = kwargs.get('features')
+    if features is None:
+        features = classification_features(candle['classification'])
+
     filter_signal = []
     zones = [0.0, 0.0]
     if filter_function == 'stochastic':
         stoch_signals = generate_full_stoch_signal(fund, plot_output=False)
-        filter_signal = stoch_signals['smooth_k']
+        filter_signal = np.array(stoch_signals['smooth_k'])
         zones = [80.0, 20.0]
     else:
         return []
 
+    values = np.zeros(len(features), dtype=int)
+    named = [[] for _ in range(len(features))]
+    for pattern_name in ("dark cloud piercing line", "evening morning star"):
+        for body in ("body", "vol_body"):
+            found, styles = pattern_scan(pattern_name, features, body)
+            values += found
+            for i in np.flatnonzero(found):
+                named[i].append(f"{pattern_name}: {styles[i]}")
+
+    in_zone = (filter_signal >= zones[0]) & (filter_signal <= zones[1])
+    in_zone[1:] |= in_zone[:-1]
+    values[1:] = np.where(in_zone[1:], values[1:] * 2, 0)
+
     patterns = []
-    for i in range(len(candle['classification'])):
-        value = {'value': 0, 'patterns': []}
-        for pattern_name in ("dark cloud piercing line", "evening morning star"):
-            for body in ("body", "vol_body"):
-                val = pattern_library(pattern_name, candle['classification'], i, body)
-                if val[0] != 0:
-                    value['value'] += val[0]
-                    modified_pattern = f"{pattern_name}: {val[1]}"
-                    value['patterns'].append(modified_pattern)
-
-        patterns.append(value)
-
-    for i in range(1, len(patterns)):
-        if patterns[i]['value'] != 0:
-            if (filter_signal[i] >= zones[0]) and (filter_signal[i] <= zones[1]):
-                patterns[i]['value'] *= 2
-            elif (filter_signal[i-1] >= zones[0]) and (filter_signal[i-1] <= zones[1]):
-                patterns[i]['value'] *= 2
-            else:
-                patterns[i] = {'value': 0, 'patterns': []}
+    for i, value in enumerate(values):
+        if value != 0:
+            patterns.append({'value': int(value), 'patterns': named[i]})
+        else:
+            patterns.append({'value': 0, 'patterns': []})
 
     return patterns
 
 
+def classification_features(
+        classification: Union[DayClassification, List[dict]]) -> CandleFeatures:
+    """Classification Features
+
+    Arguments:
+        classification {DayClassification, list} -- output of day_classification
+
+    Returns:
+        CandleFeatures -- day feature columns behind the classification
+    """
+    if isinstance(classification, DayClassification):
+        return classification.features
+    return CandleFeatures.from_classification(classification)
+
+
 ###################################
 #   PATTERN DETECTION LIBRARY
 ###################################
 
-def pattern_library(pattern: str,
-                    trading_candles: List[dict],
-                    index: int,
-                    body: str = 'body') -> Tuple[int, str]:
-    """Pattern Library
+def pattern_scan(pattern: str,
+                 features: CandleFeatures,
+                 body: str = 'body') -> Tuple[np.ndarray, np.ndarray]:
+    """Pattern Scan
 
-    Command function for properly configuring and running various pattern detections.
+    Command function for properly configuring and running a pattern detection over every day.
 
     Arguments:
         pattern {str} -- key from PATTERNS object
-        days {list} -- candle objects generated from day_classification
-        index {int} -- index of DataFrame or list
+        features {CandleFeatures} -- day feature columns generated from day_classification
 
     Keyword Arguments:
         body {str} -- body generation style (quartile vs. volatility); (default: {'body'})
 
     Returns:
-        list -- tuple (value of patterns, named pattern)
+        tuple -- (value of pattern per day, named style per day)
     """
-    days_needed = PATTERNS[pattern]['days']
     function = PATTERNS[pattern]['function']
     weight = PATTERNS[pattern].get('weight', 1)
 
-    if index < days_needed - 1:
-        return 0, ''
+    window = features.window(PATTERNS[pattern]['days'])
+    values = np.zeros(len(features), dtype=int)
+    styles = np.full(len(features), '', dtype=object)
+    remaining = window.valid.copy()
 
-    if days_needed == 1:
-        sub_days = trading_candles[index].copy()
-    else:
-        start = (index + 1) - days_needed
-        sub_days = trading_candles[start:index+1].copy()
-
-    if isinstance(sub_days, dict):
-        sub_days = [sub_days]
-
-    detection = function(sub_days, body)
-    if detection:
-        if detection['type'] == 'bearish':
-            return -1 * weight, detection['style']
-        if detection['type'] == 'bullish':
-            return 1 * weight, detection['style']
+    for mask, detection, style in function(window, body):
+        found = mask & remaining
+        if detection == 'bearish':
+            values[found] = -1 * weight
+        else:
+            values[found] = 1 * weight
+        styles[found] = style
+        remaining &= ~found
 
-    return 0, ''
+    return values, styles
@@ -6,7 +6,7 @@ import pandas as pd
 import numpy as np
 
 from libs.utils import (
-    date_extractor, INDEXES, STANDARD_COLORS, PlotType, generate_plot, ProgressBar
+    date_axis, INDEXES, STANDARD_COLORS, PlotType, generate_plot, ProgressBar
 )
 from libs.features import normalize_signals
 
@@ -175,7 +175,7 @@ def cluster_dates(cluster_list: list, fund: pd.DataFrame) -> list:
     dates = []
     for i, cluster in enumerate(cluster_list):
         if cluster != 0:
-            dates.append([date_extractor(fund.index[i], _format='str'),
+            dates.append([date_axis(fund).strings[i],
                           fund['Close'][i], cluster, i])
     return dates
 
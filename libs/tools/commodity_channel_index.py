@@ -1,11 +1,10 @@
 """ commodity channel index """
 import os
-import datetime
 
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, generate_plot, PlotType
+from libs.utils import INDEXES, generate_plot, PlotType, date_axis
 from libs.features import normalize_signals
 
 from .moving_average import typical_price_signal, simple_moving_avg
@@ -219,7 +218,7 @@ def get_crossover_features(position: pd.DataFrame, signal: list, period: str) ->
     features = []
     state = 'x'
     for i, comp in enumerate(signal):
-        date = datetime.datetime.strftime(position.index[i], "%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if state == 'x':
             if comp > 0.0:
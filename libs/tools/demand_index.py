@@ -3,7 +3,7 @@ import os
 
 import pandas as pd
 
-from libs.utils import INDEXES, generate_plot, PlotType
+from libs.utils import INDEXES, generate_plot, PlotType, date_axis
 from libs.features import normalize_signals
 
 from .moving_average import simple_moving_avg, exponential_moving_avg
@@ -278,7 +278,7 @@ def di_crossovers(fund: pd.DataFrame, signal: list) -> list:
     state = 'n'
     data = None
     for i, sig in enumerate(signal):
-        date = fund.index[i].strftime("%Y-%m-%d")
+        date = date_axis(fund).strings[i]
         data = None
 
         if state == 'n':
@@ -377,7 +377,7 @@ def di_divergences(fund: pd.DataFrame, signal: list) -> list:
 
         for i, met in enumerate(meter):
             data = None
-            date = fund.index[i].strftime("%Y-%m-%d")
+            date = date_axis(fund).strings[i]
 
             if met > 0.0:
                 if funder[i] < 0.0:
@@ -408,7 +408,7 @@ def di_divergences(fund: pd.DataFrame, signal: list) -> list:
         state = 'n'
         for i, sig in enumerate(signal):
             data = None
-            date = fund.index[i].strftime("%Y-%m-%d")
+            date = date_axis(fund).strings[i]
 
             if state == 'n':
                 price[0] = fund['Close'][i] - fund_ma[i]
@@ -5,7 +5,7 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from libs.utils import date_extractor, INDEXES, PlotType, generate_plot
+from libs.utils import date_axis, INDEXES, PlotType, generate_plot
 from libs.features import normalize_signals
 
 from .moving_average import exponential_moving_avg
@@ -198,7 +198,7 @@ def get_crossover_features(position: pd.DataFrame, full_stoch: dict, **kwargs) -
         elif state == 'b3':
             if fast < over_bought:
                 bearish.append([
-                    date_extractor(position.index[i], _format='str'),
+                    date_axis(position).strings[i],
                     position['Close'][i],
                     i,
                     "crossover: fast-k/smooth-k"
@@ -223,7 +223,7 @@ def get_crossover_features(position: pd.DataFrame, full_stoch: dict, **kwargs) -
         elif state == 's3':
             if fast > over_sold:
                 bullish.append([
-                    date_extractor(position.index[i], _format='str'),
+                    date_axis(position).strings[i],
                     position['Close'][i],
                     i,
                     "crossover: fast-k/smooth-k"
@@ -255,7 +255,7 @@ def get_crossover_features(position: pd.DataFrame, full_stoch: dict, **kwargs) -
         elif state == 'b3':
             if slow < over_bought:
                 bearish.append([
-                    date_extractor(position.index[i], _format='str'),
+                    date_axis(position).strings[i],
                     position['Close'][i],
                     i,
                     "crossover: smooth-k/slow-d"
@@ -280,7 +280,7 @@ def get_crossover_features(position: pd.DataFrame, full_stoch: dict, **kwargs) -
         elif state == 's3':
             if slow > over_sold:
                 bullish.append([
-                    date_extractor(position.index[i], _format='str'),
+                    date_axis(position).strings[i],
                     position['Close'][i],
                     i,
                     "crossover: smooth-k/slow-d"
@@ -364,7 +364,7 @@ def get_stoch_divergences(position: pd.DataFrame, full_stoch: dict, **kwargs) ->
                 prices[1] = position['Close'][i-1]
                 if (prices[0] < prices[1]) and (s_vals[0] > s_vals[1]):
                     full_stoch['bearish'].append([
-                        date_extractor(position.index[i], _format='str'),
+                        date_axis(position).strings[i],
                         position['Close'][i-1],
                         i,
                         "divergence"
@@ -411,7 +411,7 @@ def get_stoch_divergences(position: pd.DataFrame, full_stoch: dict, **kwargs) ->
                 prices[1] = position['Close'][i-1]
                 if (prices[0] > prices[1]) and (s_vals[0] < s_vals[1]):
                     full_stoch['bullish'].append([
-                        date_extractor(position.index[i], _format='str'),
+                        date_axis(position).strings[i],
                         position['Close'][i-1],
                         i,
                         "divergence"
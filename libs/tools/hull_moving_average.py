@@ -4,7 +4,7 @@ import os
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, PlotType, generate_plot
+from libs.utils import INDEXES, PlotType, generate_plot, date_axis
 from libs.features import normalize_signals
 
 from .moving_average import weighted_moving_avg, simple_moving_avg
@@ -23,6 +23,7 @@ def hull_moving_average(position: pd.DataFrame, **kwargs) -> dict:
         position {pd.DataFrame} -- fund dataset
 
     Optional Args:
+        period {list} -- list of ints for 3 lookback periods (default: {[9, 16, 36]})
         plot_output {bool} -- (default: {True})
         name {str} -- (default: {''})
         progress_bar {ProgressBar} -- (default: {None})
@@ -31,15 +32,17 @@ def hull_moving_average(position: pd.DataFrame, **kwargs) -> dict:
     Returns:
         dict -- hull ma data object
     """
+    period = kwargs.get('period', [9, 16, 36])
     plot_output = kwargs.get('plot_output', True)
     name = kwargs.get('name', '')
     p_bar = kwargs.get('progress_bar')
     view = kwargs.get('view', '')
 
     hull = generate_hull_signal(
-        position, plot_output=plot_output, name=name, p_bar=p_bar, view=view)
+        position, period=period, plot_output=plot_output, name=name, p_bar=p_bar, view=view)
 
-    hull = generate_swing_signal(position, hull, p_bar=p_bar)
+    hull = generate_swing_signal(
+        position, hull, p_bar=p_bar, config=period, max_period=max(period))
     hull = swing_trade_metrics(
         position, hull, plot_output=plot_output, name=name, p_bar=p_bar, view=view)
 
@@ -190,7 +193,7 @@ def generate_swing_signal(position: pd.DataFrame, swings: dict, **kwargs) -> dic
     signal = [0.0] * len(states)
     set_block = 'n'
     for i in range(1, len(signal)):
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
         data = None
 
         if states[i] == 'u2':
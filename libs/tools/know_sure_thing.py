@@ -4,11 +4,11 @@ import os
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, PlotType, generate_plot
+from libs.utils import INDEXES, PlotType, generate_plot, date_axis
 from libs.features import normalize_signals
 
-from .rate_of_change import roc_signal
-from .moving_average import simple_moving_avg, exponential_moving_avg
+from .moving_average import exponential_moving_avg, sma_array
+from .momentum_engine import momentum_engine
 
 
 def know_sure_thing(fund: pd.DataFrame, **kwargs) -> dict:
@@ -20,6 +20,9 @@ def know_sure_thing(fund: pd.DataFrame, **kwargs) -> dict:
         fund {pd.DataFrame} -- fund dataset
 
     Optional Args:
+        periods {list} -- ROC periods (default: {[10, 15, 20, 30]})
+        sma_intervals {list} -- sma intervals corresponding to the ROC periods
+                                (default: {[10, 10, 10, 15]})
         plot_output {bool} -- (default: {True})
         name {str} -- (default: {''})
         views {str} -- (default: {''})
@@ -28,6 +31,8 @@ def know_sure_thing(fund: pd.DataFrame, **kwargs) -> dict:
     Returns:
         dict -- kst data object
     """
+    periods = kwargs.get('periods', [10, 15, 20, 30])
+    sma_intervals = kwargs.get('sma_intervals', [10, 10, 10, 15])
     plot_output = kwargs.get('plot_output', True)
     name = kwargs.get('name', '')
     views = kwargs.get('views', '')
@@ -36,7 +41,8 @@ def know_sure_thing(fund: pd.DataFrame, **kwargs) -> dict:
     kst = {}
 
     signal, signal_line = kst_signal(
-        fund, plot_output=plot_output, name=name, views=views, p_bar=p_bar)
+        fund, periods=periods, sma_intervals=sma_intervals, plot_output=plot_output, name=name,
+        views=views, p_bar=p_bar)
 
     kst['tabular'] = {'signal': signal, 'signal_line': signal_line}
 
@@ -83,24 +89,18 @@ def kst_signal(fund: pd.DataFrame, **kwargs) -> list:
     views = kwargs.get('views', '')
     p_bar = kwargs.get('p_bar')
 
-    increment = 0.7 / float(len(periods) * 3)
-    signal = [0.0] * len(fund['Close'])
+    increment = 0.7 / float(len(periods))
+    engine = momentum_engine(fund)
+    signal = np.zeros(len(fund['Close']))
 
     for i, period in enumerate(periods):
-        roc = roc_signal(fund, period)
-        if p_bar:
-            p_bar.uptick(increment=increment)
-
-        sma = simple_moving_avg(roc, sma_intervals[i], data_type='list')
-        if p_bar:
-            p_bar.uptick(increment=increment)
-
-        for j, sig in enumerate(signal):
-            sig += float(i + 1) * sma[j]
+        sma = engine.smoothed_roc(period, sma_intervals[i])
+        signal[:len(sma)] += float(i + 1) * sma
         if p_bar:
             p_bar.uptick(increment=increment)
 
-    signal_line = simple_moving_avg(signal, 9, data_type='list')
+    signal_line = sma_array(signal, 9).tolist()
+    signal = signal.tolist()
     if p_bar:
         p_bar.uptick(increment=0.1)
 
@@ -146,7 +146,7 @@ def kst_indicators(fund: pd.DataFrame, kst_dict: dict, **kwargs) -> dict:
     state = 'n'
     signals = []
     for i, sig in enumerate(signal):
-        date = fund.index[i].strftime("%Y-%m-%d")
+        date = date_axis(fund).strings[i]
         data = None
 
         if state == 'n':
@@ -186,7 +186,7 @@ def kst_indicators(fund: pd.DataFrame, kst_dict: dict, **kwargs) -> dict:
 
     state = 'n'
     for i, sig in enumerate(signal):
-        date = fund.index[i].strftime("%Y-%m-%d")
+        date = date_axis(fund).strings[i]
         data = None
 
         if state == 'n':
@@ -6,11 +6,13 @@ import pandas as pd
 import numpy as np
 
 from libs.utils import (
-    dates_extractor_list, INDEXES, TREND_COLORS, STANDARD_COLORS, PlotType, generate_plot
+    dates_extractor_list, date_axis, INDEXES, TREND_COLORS, STANDARD_COLORS, PlotType,
+    generate_plot
 )
 from libs.features import normalize_signals
 
-from .moving_average import exponential_moving_avg
+from .moving_average import exponential_moving_avg, ema_array
+from .momentum_engine import momentum_engine
 
 
 RED = TREND_COLORS.get('bad')
@@ -100,22 +102,14 @@ def generate_macd_signal(fund: pd.DataFrame, **kwargs) -> dict:
 
     macd = {}
 
-    ema_twelve = exponential_moving_avg(fund, interval=12)
-    ema_twenty_six = exponential_moving_avg(fund, interval=26)
-    macd_val = []
-
-    for i, ema_12 in enumerate(ema_twelve):
-        if i < 26:
-            macd_val.append(0.0)
-        else:
-            macd_val.append(ema_12 - ema_twenty_six[i])
-
-    macd_sig = exponential_moving_avg(macd_val, interval=9, data_type='list')
+    engine = momentum_engine(fund)
+    macd_line = engine.macd(12, 26)
+    macd_sig = ema_array(macd_line, 9)
 
     # Actual MACD vs. its signal line
-    m_bar = []
-    for i, sig in enumerate(macd_sig):
-        m_bar.append(macd_val[i] - sig)
+    macd_val = macd_line.tolist()
+    m_bar = (macd_line[:len(macd_sig)] - macd_sig).tolist()
+    macd_sig = macd_sig.tolist()
 
     macd['tabular'] = {'macd': macd_val, 'signal_line': macd_sig, 'bar': m_bar}
 
@@ -228,7 +222,7 @@ def get_macd_features(macd: dict, position: pd.DataFrame) -> list:
 
     # Copy divergence features into "features" list
     for div in macd['indicators']:
-        date = position.index[div['index']].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[div['index']]
         data = {
             "type": div['type'],
             "value": "divergence",
@@ -242,7 +236,7 @@ def get_macd_features(macd: dict, position: pd.DataFrame) -> list:
     state = 'n'
     for i, mac in enumerate(macd_raw):
         data = None
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if state == 'n':
             if mac > 0.0:
@@ -289,7 +283,7 @@ def get_macd_features(macd: dict, position: pd.DataFrame) -> list:
     state = 'n'
     for i, mac in enumerate(macd_bar):
         data = None
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if state == 'n':
             if mac > 0.0:
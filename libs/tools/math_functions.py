@@ -1,10 +1,12 @@
 """ math functions """
-from typing import Tuple, Union
+from typing import Dict, Tuple, Union
 
 import pandas as pd
 import numpy as np
 
-from scipy.stats import linregress
+from .returns_kernel import (
+    percent_returns, beta_r_squared, period_returns, interval_return_stats
+)
 
 
 def lower_low(data: Union[list, pd.DataFrame], start_val: float, start_ind: int) -> list:
@@ -136,23 +138,8 @@ def beta_comparison(fund: pd.DataFrame, benchmark: pd.DataFrame) -> Tuple[float,
     if pd.isna(fund['Close'][len(fund['Close'])-1]):
         tot_len -= 1
 
-    fund_return = []
-    fund_return.append(0.0)
-    bench_return = []
-    bench_return.append(0.0)
-    for i in range(1, tot_len):
-        ret = (fund['Close'][i]-fund['Close'][i-1]) / \
-            fund['Close'][i-1] * 100.0
-        fund_return.append(ret)
-        ret = (benchmark['Close'][i]-benchmark['Close']
-               [i-1]) / benchmark['Close'][i-1] * 100.0
-        bench_return.append(ret)
-
-    # slope, intercept, r-correlation, p-value, stderr
-    slope, _, r_value, _, _ = linregress(bench_return, fund_return)
-    r_sqd = r_value ** 2
-
-    return slope, r_sqd
+    return beta_comparison_list(
+        fund['Close'].to_numpy()[:tot_len], benchmark['Close'].to_numpy()[:tot_len])
 
 
 def beta_comparison_list(fund: list, benchmark: list) -> Tuple[float, float]:
@@ -167,23 +154,11 @@ def beta_comparison_list(fund: list, benchmark: list) -> Tuple[float, float]:
     Returns:
         list -- beta, r-squared
     """
-    tot_len = len(fund)
-
-    fund_return = []
-    fund_return.append(0.0)
-    bench_return = []
-    bench_return.append(0.0)
-    for i in range(1, tot_len):
-        ret = (fund[i]-fund[i-1]) / fund[i-1] * 100.0
-        fund_return.append(ret)
-        ret = (benchmark[i]-benchmark[i-1]) / benchmark[i-1] * 100.0
-        bench_return.append(ret)
+    fund = np.asarray(fund, dtype=float)
+    benchmark = np.asarray(benchmark, dtype=float)[:len(fund)]
 
-    # slope, intercept, r-correlation, p-value, stderr
-    slope, _, r_value, _, _ = linregress(bench_return, fund_return)
-    r_sqd = r_value ** 2
-
-    return slope, r_sqd
+    slope, r_sqd = beta_r_squared(percent_returns(fund), percent_returns(benchmark))
+    return slope[()], r_sqd[()]
 
 
 def risk_comparison(fund: pd.DataFrame,
@@ -212,82 +187,140 @@ def risk_comparison(fund: pd.DataFrame,
     Returns:
         dict -- alpha data object
     """
-    # pylint: disable=too-many-locals,too-many-statements
     print_out = kwargs.get('print_out', False)
     sector_data = kwargs.get('sector_data')
 
-    alpha = {}
-    if beta is None or rsqd is None:
-        beta, rsqd = beta_comparison(fund, benchmark)
+    alpha = risk_comparison_table(
+        {'fund': fund}, benchmark, treasury, sector_data={'fund': sector_data})['fund']
 
-    beta = np.round(beta, 4)
-    rsqd = np.round(rsqd, 4)
+    if beta is not None and rsqd is not None:
+        # Given figures replace the calculated market beta / r-squared (and alpha with them)
+        beta = np.round(beta, 4)
+        alpha['beta']['market'] = beta
+        alpha['r_squared']['market'] = np.round(rsqd, 4)
+        returns = alpha['returns']
+        alpha['alpha']['market'] = np.round(returns['fund'] - returns['treasury'] -
+                                            beta * (returns['benchmark'] - returns['treasury']), 4)
 
-    fund_return, fund_stdev = get_returns(fund)
-    bench_return, bench_stdev = get_returns(benchmark)
-    treas_return = treasury['Close'][-1]
+    if print_out:
+        print("\r\n")
+        print(f"\r\nAlpha Market:\t\t{alpha['alpha']['market']}")
+        print(f"Alpha Sector:\t\t{alpha['alpha'].get('sector', 'n/a')}")
+        print(f"Beta Market:\t\t{alpha['beta']['market']}")
+        print(f"Beta Sector:\t\t{alpha['beta'].get('sector', 'n/a')}")
+        print(f"R-Squared Market:\t{alpha['r_squared']['market']}")
+        print(f"R-Squared Sector:\t{alpha['r_squared'].get('sector', 'n/a')}")
+        print(f"Sharpe Ratio:\t\t{alpha['sharpe']}")
+        print(f"Market Sharpe:\t\t{alpha['market_sharpe']}")
+        print(f"Standard Dev:\t\t{alpha['standard_deviation']}")
+        print(f"Market Ratio SD:\t{alpha['standard_dev_ratio']}")
 
-    alpha_sector = "n/a"
-    beta_sector = "n/a"
-    rsqd_sector = "n/a"
-    sharpe_ratio = "n/a"
-    market_sharpe = "n/a"
+    return alpha
+
+
+def risk_comparison_table(funds: Dict[str, pd.DataFrame],
+                          benchmark: pd.DataFrame,
+                          treasury: pd.DataFrame,
+                          **kwargs) -> Dict[str, dict]:
+    """Risk Comparison Table
 
-    if sector_data is not None:
-        sector_return, _ = get_returns(sector_data)
-        beta_sector, rsqd_sector = beta_comparison(fund, sector_data)
-        beta_sector = np.round(beta_sector, 4)
-        rsqd_sector = np.round(rsqd_sector, 4)
-        alpha_sector = np.round(fund_return - treas_return -
-                                beta_sector * (sector_return - treas_return), 4)
+    risk_comparison of many funds vs. one benchmark. Benchmark statistics are computed once, and
+    funds of the same length are computed together as rows of a matrix.
+
+    Arguments:
+        funds {dict} -- fund datasets, by name
+        benchmark {pd.DataFrame} -- benchmark dataset (does not have to be SP500)
+        treasury {pd.DataFrame} -- 11-week treasury bill dataset
 
-    alpha_val = np.round(fund_return - treas_return -
-                         beta * (bench_return - treas_return), 4)
+    Optional Args:
+        sector_data {dict} -- data of the related sector, by fund name (default: {None})
 
+    Returns:
+        dict -- alpha data object of each fund
+    """
+    # pylint: disable=too-many-locals
+    sector_data = kwargs.get('sector_data') or {}
+
+    bench_close = benchmark['Close'].to_numpy(dtype=float)
+    bench_adj = benchmark['Adj Close'].to_numpy(dtype=float)
+    bench_return, bench_stdev = period_returns(bench_adj)
+    _, _, bench_interval_std = interval_return_stats(bench_adj)
+    treas_return = treasury['Close'][-1]
+
+    # Funds of equal length (and trailing 'nan' state) stack into one matrix
+    groups = {}
+    for name, fund in funds.items():
+        tot_len = len(fund['Close'])
+        if pd.isna(fund['Close'][tot_len-1]):
+            tot_len -= 1
+        groups.setdefault((len(fund['Close']), tot_len), []).append(name)
+
+    table = {}
+    for (length, tot_len), names in groups.items():
+        closes = np.array([funds[name]['Close'].to_numpy(dtype=float)[:tot_len]
+                           for name in names]).reshape(len(names), tot_len)
+        adj = np.array([funds[name]['Adj Close'].to_numpy(dtype=float)
+                        for name in names]).reshape(len(names), length)
+
+        betas, rsqds = beta_r_squared(percent_returns(closes),
+                                      percent_returns(bench_close[:tot_len]))
+        fund_returns, fund_stdevs = period_returns(adj)
+        _, _, fund_interval_stds = interval_return_stats(adj)
+
+        for i, name in enumerate(names):
+            table[name] = _risk_ratios(
+                {'beta': betas[i], 'rsqd': rsqds[i], 'return': fund_returns[i],
+                 'stdev': fund_stdevs[i], 'interval_std': fund_interval_stds[i]},
+                {'return': bench_return[()], 'stdev': bench_stdev[()],
+                 'interval_std': bench_interval_std[()]},
+                treas_return)
+
+    for name, alpha in table.items():
+        if sector_data.get(name) is not None:
+            sector_return, _ = get_returns(sector_data[name])
+            beta_sector, rsqd_sector = beta_comparison(funds[name], sector_data[name])
+            beta_sector = np.round(beta_sector, 4)
+            fund_return = alpha['returns']['fund']
+
+            alpha['returns']["sector"] = sector_return
+            alpha['alpha']["sector"] = np.round(fund_return - treas_return -
+                                                beta_sector * (sector_return - treas_return), 4)
+            alpha['beta']["sector"] = beta_sector
+            alpha['r_squared']["sector"] = np.round(rsqd_sector, 4)
+
+    return {name: table[name] for name in funds}
+
+
+def _risk_ratios(fund: dict, bench: dict, treas_return: float) -> dict:
+    """ alpha data object of a fund from its and the benchmark's return statistics """
+    beta = np.round(fund['beta'], 4)
+    fund_return = fund['return']
+    fund_stdev = fund['stdev']
+
+    sharpe_ratio = "n/a"
+    market_sharpe = "n/a"
     if fund_stdev != 0.0:
         sharpe_ratio = np.round((fund_return - treas_return) / fund_stdev, 4)
-        if bench_stdev != 0.0:
-            bench_sharpe = np.round((bench_return - treas_return) / bench_stdev, 4)
+        if bench['stdev'] != 0.0:
+            bench_sharpe = np.round((bench['return'] - treas_return) / bench['stdev'], 4)
             market_sharpe = np.round(sharpe_ratio / bench_sharpe, 4)
 
-    fund_stdev = np.round(fund_stdev, 4)
-
-    alpha['alpha'] = {"market": alpha_val}
+    alpha = {}
+    alpha['alpha'] = {
+        "market": np.round(fund_return - treas_return -
+                           beta * (bench['return'] - treas_return), 4)
+    }
     alpha['beta'] = {"market": beta}
-    alpha['r_squared'] = {"market": rsqd}
+    alpha['r_squared'] = {"market": np.round(fund['rsqd'], 4)}
     alpha['sharpe'] = sharpe_ratio
     alpha['market_sharpe'] = market_sharpe
-    alpha['standard_deviation'] = fund_stdev
+    alpha['standard_deviation'] = np.round(fund_stdev, 4)
     alpha['returns'] = {
         'fund': fund_return,
-        'benchmark': bench_return,
+        'benchmark': bench['return'],
         'treasury': treas_return
     }
-
-    _, _, fund_interval_std = get_interval_standard_dev(fund)
-    _, _, bench_interval_std = get_interval_standard_dev(benchmark)
-
-    alpha['standard_dev_ratio'] = np.round(fund_interval_std/bench_interval_std, 4)
-
-    if sector_data is not None:
-        alpha['returns']["sector"] = sector_return
-        alpha['alpha']["sector"] = alpha_sector
-        alpha['beta']["sector"] = beta_sector
-        alpha['r_squared']["sector"] = rsqd_sector
-
-    if print_out:
-        print("\r\n")
-        print(f"\r\nAlpha Market:\t\t{alpha_val}")
-        print(f"Alpha Sector:\t\t{alpha_sector}")
-        print(f"Beta Market:\t\t{beta}")
-        print(f"Beta Sector:\t\t{beta_sector}")
-        print(f"R-Squared Market:\t{rsqd}")
-        print(f"R-Squared Sector:\t{rsqd_sector}")
-        print(f"Sharpe Ratio:\t\t{sharpe_ratio}")
-        print(f"Market Sharpe:\t\t{market_sharpe}")
-        print(f"Standard Dev:\t\t{fund_stdev}")
-        print(f"Market Ratio SD:\t{alpha['standard_dev_ratio']}")
-
+    alpha['standard_dev_ratio'] = np.round(fund['interval_std'] / bench['interval_std'], 4)
     return alpha
 
 
@@ -303,69 +336,8 @@ def get_returns(data: pd.DataFrame, output: str = 'annual') -> Union[float, floa
     Returns:
         list -- return, standard deviation
     """
-    # pylint: disable=too-many-locals
-    # Determine intervals for returns, start with annual
-    interval = 250
-
-    years = int(len(data['Close']) / interval)
-    if years == 0:
-        years = 1
-    quarters = 4 * years
-
-    if len(data['Close']) <= interval:
-        interval = 200
-
-    annual_returns = 0.0
-    annual_std = []
-    for i in range(years):
-        ars = (data['Adj Close'][(i+1) * interval] - data['Adj Close']
-               [i * interval]) / data['Adj Close'][i * interval] * 100.0
-        annual_returns += ars
-        annual_std.append(ars)
-
-    annual_returns /= float(years)
-    annual_returns = (data['Adj Close'][-1] - data['Adj Close']
-                      [-interval]) / data['Adj Close'][-interval] * 100.0
-
-    # Determine intervals for returns, next with quarterly
-    q_returns = 0.0
-    q_std = []
-    qrs_2 = 0.0
-    counter = 0
-    for i in range(quarters):
-        multiple = 62
-        if i % 2 != 0:
-            multiple = 63
-        counter += multiple
-
-        qrs = (data['Adj Close'][counter] - data['Adj Close']
-               [counter - multiple]) / data['Adj Close'][counter - multiple] * 100.0
-        q_returns += qrs
-        qrs_2 += qrs
-        if i % 4 == 3:
-            q_std.append(qrs_2)
-            qrs_2 = 0.0
-
-    q_returns /= float(quarters)
-    q_returns *= 4.0
-
-    q_returns = 0.0
-    for i in range(4):
-        start = -1 + -1 * int(62.5 * float(i))
-        subtract = -1 * int(62.5 * float(i + 1))
-        qrs = (data['Adj Close'][start] - data['Adj Close']
-               [subtract]) / data['Adj Close'][subtract] * 100.0
-        q_returns += qrs
-
-    std_1 = np.std(annual_std)
-    std_2 = np.std(q_std)
-
-    returns = np.mean([q_returns, annual_returns])
-    st_devs = np.mean([std_1, std_2])
-    if output == 'quarterly':
-        returns /= 4.0
-
-    return returns, st_devs
+    returns, st_devs = period_returns(data['Adj Close'].to_numpy(dtype=float), output=output)
+    return returns[()], st_devs[()]
 
 
 def get_interval_standard_dev(data: pd.DataFrame, interval: int=250) -> Tuple[float, float, float]:
@@ -380,9 +352,6 @@ def get_interval_standard_dev(data: pd.DataFrame, interval: int=250) -> Tuple[fl
     Returns:
         Tuple[float, float, float]: mean, median, std
     """
-    data_slice = data['Adj Close'][-interval:]
-    returns = [0.0] * len(data_slice)
-    for i in range(1, len(data_slice)):
-        returns[i] = (data_slice[i] - data_slice[i-1]) / data_slice[i-1]
-
-    return np.mean(returns), np.median(returns), np.std(returns)
+    mean, median, std = interval_return_stats(
+        data['Adj Close'].to_numpy(dtype=float), interval=interval)
+    return mean[()], median[()], std[()]
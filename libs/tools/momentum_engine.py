@@ -0,0 +1,119 @@
+""" shared ema / rate-of-change series of a fund for the momentum tools """
+import weakref
+from typing import Union
+
+import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .moving_average import ema_array, sma_array
+
+
+class MomentumEngine():
+    """MomentumEngine
+
+    Computes (once) and caches the EMAs, rates of change and their smoothed forms of a fund's
+    closes that MACD, KST, ROC, and the momentum oscillator are built from. Arrays returned are
+    shared by every caller, so callers copy (e.g. .tolist()) rather than modify them.
+    """
+
+    def __init__(self, closes: Union[list, np.ndarray, pd.Series]):
+        # A copy, so the closes the series were computed from outlive changes to the fund's
+        self.closes = np.array(closes, dtype=float)
+        self._series = {}
+
+    def _cached(self, key: tuple, compute):
+        if key not in self._series:
+            self._series[key] = compute()
+        return self._series[key]
+
+    def ema(self, interval: int, ema_factor: float = 2.0) -> np.ndarray:
+        """ exponential moving average of the closes (as exponential_moving_avg) """
+        return self._cached(
+            ('ema', interval, ema_factor),
+            lambda: ema_array(self.closes, interval, ema_factor=ema_factor))
+
+    def roc(self, interval: int) -> np.ndarray:
+        """ percent rate of change of the closes vs. 'interval' periods ago (0.0 until then) """
+        def compute():
+            signal = np.zeros(len(self.closes))
+            if interval < len(self.closes):
+                signal[interval:] = (
+                    (self.closes[interval:] / self.closes[:len(self.closes)-interval]) - 1.0
+                ) * 100.0
+            return signal
+        return self._cached(('roc', interval), compute)
+
+    def smoothed_roc(self, interval: int, sma_interval: int) -> np.ndarray:
+        """ simple moving average of the 'interval' rate of change """
+        return self._cached(
+            ('smoothed_roc', interval, sma_interval),
+            lambda: sma_array(self.roc(interval), sma_interval))
+
+    def macd(self, short: int = 12, long: int = 26) -> np.ndarray:
+        """ ema(short) - ema(long), 0.0 until the long ema has 'long' periods """
+        def compute():
+            short_ema = self.ema(short)
+            long_ema = self.ema(long)
+            macd = np.zeros(len(short_ema))
+            if len(long_ema) > long:
+                macd[long:] = short_ema[long:] - long_ema[long:]
+            return macd
+        return self._cached(('macd', short, long), compute)
+
+    def cmo(self, interval: int) -> np.ndarray:
+        """ chande momentum: 100 * (ups - downs) / (ups + downs) of the prior 'interval - 2'
+        close-to-close changes (0.0 until 'interval - 1') """
+        def compute():
+            signal = np.zeros(len(self.closes))
+            if interval - 1 >= len(self.closes):
+                return signal
+
+            changes = np.zeros(len(self.closes))
+            changes[1:] = np.diff(self.closes)
+            ups = np.where(changes > 0.0, changes, 0.0)
+            downs = np.where(changes > 0.0, 0.0, np.abs(changes))
+
+            # Day i sums the changes of days i-(interval-2) to i-1
+            width = interval - 2
+            count = len(self.closes) - (interval - 1)
+            if width > 0:
+                sum_up = sliding_window_view(ups[1:len(self.closes)-1], width).sum(axis=1)
+                sum_down = sliding_window_view(downs[1:len(self.closes)-1], width).sum(axis=1)
+            else:
+                sum_up = np.zeros(count)
+                sum_down = np.zeros(count)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                signal[interval-1:] = 100.0 * (sum_up - sum_down) / (sum_up + sum_down)
+            return signal
+        return self._cached(('cmo', interval), compute)
+
+
+_ENGINES = {}
+
+
+def momentum_engine(fund: pd.DataFrame) -> MomentumEngine:
+    """Momentum Engine
+
+    The MomentumEngine of a fund's closes, shared by every tool run on the same fund object while
+    its closes are unchanged (and dropped when that fund is garbage collected).
+
+    Arguments:
+        fund {pd.DataFrame} -- fund dataset
+
+    Returns:
+        MomentumEngine -- cached series of the fund
+    """
+    key = id(fund)
+    closes = fund['Close'].to_numpy(dtype=float)
+    entry = _ENGINES.get(key)
+    if entry is not None:
+        ref, engine = entry
+        # Closes updated in place (even to the same length) are a new engine
+        if ref() is fund and np.array_equal(engine.closes, closes, equal_nan=True):
+            return engine
+
+    engine = MomentumEngine(closes)
+    _ENGINES[key] = (weakref.ref(fund, lambda _: _ENGINES.pop(key, None)), engine)
+    return engine
@@ -4,10 +4,11 @@ import os
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, generate_plot, PlotType
+from libs.utils import INDEXES, generate_plot, PlotType, date_axis
 from libs.features import find_local_extrema, normalize_signals
 
 from .moving_average import simple_moving_avg
+from .momentum_engine import momentum_engine
 
 
 def momentum_oscillator(position: pd.DataFrame, **kwargs) -> dict:
@@ -82,20 +83,7 @@ def generate_momentum_signal(position: pd.DataFrame, **kwargs) -> list:
     name = kwargs.get('name', '')
     view = kwargs.get('view', '')
 
-    signal = []
-    for i in range(interval-1):
-        signal.append(0.0)
-    for i in range(interval-1, len(position['Close'])):
-        sum_up = 0.0
-        sum_down = 0.0
-        for j in range(i-(interval-2), i):
-            if position['Close'][j] > position['Close'][j-1]:
-                sum_up += position['Close'][j] - position['Close'][j-1]
-            else:
-                sum_down += np.abs(position['Close']
-                                   [j] - position['Close'][j-1])
-        cmo = 100.0 * (sum_up - sum_down) / (sum_up + sum_down)
-        signal.append(cmo)
+    signal = momentum_engine(position).cmo(interval).tolist()
 
     name2 = INDEXES.get(name, name)
     generate_plot(
@@ -192,7 +180,7 @@ def feature_matches(mo_extrema: list, position: pd.DataFrame) -> list:
         if maxes[i]['val'] < maxes[i-1]['val']:
             if closes[maxes[i]['index']] >= closes[maxes[i-1]['index']]:
                 # Bearish divergence
-                date = closes.index[maxes[i]['index']].strftime("%Y-%m-%d")
+                date = date_axis(closes).strings[maxes[i]['index']]
                 obj = {
                     "index": maxes[i]['index'],
                     "type": 'bearish',
@@ -206,7 +194,7 @@ def feature_matches(mo_extrema: list, position: pd.DataFrame) -> list:
         if mins[i]['val'] > mins[i-1]['val']:
             if closes[mins[i]['index']] <= closes[mins[i-1]['index']]:
                 # Bullish divergence
-                date = closes.index[mins[i]['index']].strftime("%Y-%m-%d")
+                date = date_axis(closes).strings[mins[i]['index']]
                 obj = {
                     "index": mins[i]['index'],
                     "type": 'bullish',
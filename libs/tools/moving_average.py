@@ -4,8 +4,10 @@ from typing import Union
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
 
-from libs.utils import INDEXES, PlotType, generate_plot
+from libs.utils import INDEXES, PlotType, generate_plot, date_axis
 from .moving_average_utils import adjust_signals, find_crossovers, normalize_signals_local
 
 
@@ -29,20 +31,11 @@ def exponential_moving_avg(dataset: Union[list, pd.DataFrame],
         list -- filtered data
     """
     if data_type == 'DataFrame':
-        data = list(dataset[key])
+        data = dataset[key]
     else:
         data = dataset
 
-    ema = []
-    if interval < len(data) - 3:
-        k = ema_factor / (float(interval) + 1.0)
-        for i in range(interval-1):
-            ema.append(data[i])
-        for i in range(interval-1, len(data)):
-            ema.append(np.mean(data[i-(interval-1):i+1]))
-            if i != interval-1:
-                ema[i] = ema[i-1] * (1.0 - k) + data[i] * k
-    return ema
+    return ema_array(data, interval, ema_factor=ema_factor).tolist()
 
 
 def windowed_moving_avg(dataset: Union[list, pd.DataFrame],
@@ -121,17 +114,60 @@ def simple_moving_avg(dataset: Union[list, pd.DataFrame],
         list -- filtered data
     """
     if data_type == 'DataFrame':
-        data = list(dataset[key])
+        data = dataset[key]
     else:
         data = dataset
 
-    moving_average = []
-    if interval < len(data) - 3:
-        for i in range(interval-1):
-            moving_average.append(data[i])
-        for i in range(interval-1, len(data)):
-            average = np.mean(data[i-(interval-1):i+1])
-            moving_average.append(average)
+    return sma_array(data, interval).tolist()
+
+
+def ema_array(data: Union[list, np.ndarray], interval: int, ema_factor: float = 2.0) -> np.ndarray:
+    """EMA Array
+
+    Array form of exponential_moving_avg: the first 'interval - 1' values are passed through, the
+    next is the mean of the first 'interval' values, and the rest follow the ema recursion.
+
+    Arguments:
+        data {list, np.ndarray} -- signal to filter
+        interval {int} -- window to exponential moving average
+
+    Keyword Arguments:
+        ema_factor {float} -- exponential smoothing factor; (default: {2.0})
+
+    Returns:
+        np.ndarray -- filtered data (empty if the data is not longer than 'interval' + 3)
+    """
+    data = np.asarray(data, dtype=float)
+    if interval >= len(data) - 3:
+        return np.array([])
+
+    k = ema_factor / (float(interval) + 1.0)
+    ema = data.copy()
+    ema[interval-1] = np.mean(data[0:interval])
+    # ema[i] = ema[i-1] * (1 - k) + data[i] * k, as a first-order filter
+    ema[interval:], _ = lfilter(
+        [k], [1.0, -(1.0 - k)], data[interval:], zi=[(1.0 - k) * ema[interval-1]])
+    return ema
+
+
+def sma_array(data: Union[list, np.ndarray], interval: int) -> np.ndarray:
+    """SMA Array
+
+    Array form of simple_moving_avg: the first 'interval - 1' values are passed through.
+
+    Arguments:
+        data {list, np.ndarray} -- signal to filter
+        interval {int} -- window to simple moving average
+
+    Returns:
+        np.ndarray -- filtered data (empty if the data is not longer than 'interval' + 3)
+    """
+    data = np.asarray(data, dtype=float)
+    if interval >= len(data) - 3:
+        return np.array([])
+
+    moving_average = data.copy()
+    moving_average[interval-1:] = sliding_window_view(data, interval).mean(axis=1)
     return moving_average
 
 
@@ -569,7 +605,7 @@ def generate_swing_signal(position: pd.DataFrame,
     signal = [0.0] * len(states)
     set_block = 'n'
     for i in range(1, len(signal)):
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
         data = None
 
         if states[i] == 'u2':
@@ -4,6 +4,8 @@ from typing import Tuple
 import pandas as pd
 import numpy as np
 
+from libs.utils import date_axis
+
 
 def find_crossovers(mov_avg: dict, position: pd.DataFrame) -> list:
     """Find Crossovers
@@ -33,7 +35,7 @@ def find_crossovers(mov_avg: dict, position: pd.DataFrame) -> list:
     state = 'at'
     for i, short in enumerate(t_short):
         data = None
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if state == 'at':
             if short > t_med[i]:
@@ -79,7 +81,7 @@ def find_crossovers(mov_avg: dict, position: pd.DataFrame) -> list:
     state = 'at'
     for i, med in enumerate(t_med):
         data = None
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if state == 'at':
             if med > t_long[i]:
@@ -1,15 +1,15 @@
 """ on balance volume """
 import os
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import pandas as pd
 import numpy as np
 
 from libs.utils import (
-    dates_extractor_list, INDEXES, generate_plot, PlotType
+    dates_extractor_list, date_axis, INDEXES, generate_plot, PlotType
 )
 
-from .moving_average import simple_moving_avg
+from .moving_average import sma_array
 from .trends import get_trend_lines, get_trend_lines_regression
 
 
@@ -50,8 +50,7 @@ def on_balance_volume(fund: pd.DataFrame, **kwargs) -> dict:
         progress_bar=progress_bar,
         view=view)
 
-    dates = [index.strftime('%Y-%m-%d') for index in fund.index]
-    obv_dict['dates'] = dates
+    obv_dict['dates'] = list(date_axis(fund).strings)
 
     # Apply trend analysis to find divergences
     trend_data = {}
@@ -141,13 +140,10 @@ def generate_obv_content(fund: pd.DataFrame, **kwargs) -> dict:
     if progress_bar is not None:
         progress_bar.uptick(increment=0.125)
 
-    volume = []
-    volume.append(fund['Volume'][0])
-    for i in range(1, len(fund['Volume'])):
-        if fund['Close'][i] - fund['Close'][i-1] < 0:
-            volume.append(-1.0 * fund['Volume'][i])
-        else:
-            volume.append(fund['Volume'][i])
+    volume = fund['Volume'].to_numpy(dtype=float)
+    falling = np.zeros(len(volume), dtype=bool)
+    falling[1:] = np.diff(fund['Close'].to_numpy(dtype=float)) < 0
+    volume = np.where(falling, -volume, volume).tolist()
 
     x_dates = dates_extractor_list(fund)
     name3 = INDEXES.get(name, name)
@@ -196,16 +192,14 @@ def generate_obv_signal(fund: pd.DataFrame) -> list:
     Returns:
         list -- on balance volume signal for period of fund
     """
-    obv = []
-    obv.append(0.0)
-    for i in range(1, len(fund['Close'])):
-        if fund['Close'][i] > fund['Close'][i-1]:
-            obv.append(obv[i-1] + fund['Volume'][i])
-        elif fund['Close'][i] == fund['Close'][i-1]:
-            obv.append(obv[i-1])
-        else:
-            obv.append(obv[i-1] - fund['Volume'][i])
-    return obv
+    closes = fund['Close'].to_numpy(dtype=float)
+    volume = fund['Volume'].to_numpy(dtype=float)
+
+    # Volume counts up on up days, not at all on flat days, and down otherwise (NaNs included)
+    signed = np.zeros(len(closes))
+    changes = np.diff(closes)
+    signed[1:] = np.where(changes > 0, volume[1:], np.where(changes == 0, 0.0, -volume[1:]))
+    return np.cumsum(signed).tolist()
 
 
 def obv_feature_detection(obv: list, position: pd.DataFrame, **kwargs) -> Tuple[list, list]:
@@ -234,13 +228,14 @@ def obv_feature_detection(obv: list, position: pd.DataFrame, **kwargs) -> Tuple[
     sma_interval2 = sma_interval * 2
     sma_interval3 = sma_interval2 * 2
 
-    obv_sig = simple_moving_avg(obv, sma_interval, data_type='list')
-    obv_sig2 = simple_moving_avg(obv, sma_interval2, data_type='list')
-    obv_sig3 = simple_moving_avg(obv, sma_interval3, data_type='list')
-    obv_diff = [ob - obv_sig2[i] for i, ob in enumerate(obv)]
+    obv_array = np.asarray(obv, dtype=float)
+    obv_sig = sma_array(obv_array, sma_interval)
+    obv_sig2 = sma_array(obv_array, sma_interval2)
+    obv_sig3 = sma_array(obv_array, sma_interval3)
+    obv_diff = obv_array - obv_sig2
 
     sma_features = find_obv_sma_trends(
-        obv,
+        obv_array,
         [obv_sig, obv_sig2, obv_sig3],
         [sma_interval, sma_interval2, sma_interval3],
         position
@@ -248,7 +243,8 @@ def obv_feature_detection(obv: list, position: pd.DataFrame, **kwargs) -> Tuple[
 
     if plot_output:
         generate_plot(
-            PlotType.GENERIC_PLOTTING, [obv, obv_sig, obv_sig2, obv_sig3], **dict(
+            PlotType.GENERIC_PLOTTING,
+            [obv, obv_sig.tolist(), obv_sig2.tolist(), obv_sig3.tolist()], **dict(
                 title='OBV Signal Line',
                 legend=[
                     'obv', f'sma-{sma_interval}', f"sma-{sma_interval2}", f"sma-{sma_interval3}"
@@ -263,40 +259,30 @@ def obv_feature_detection(obv: list, position: pd.DataFrame, **kwargs) -> Tuple[
     o_filter = generate_obv_o_filter(obv_diff, filter_factor2)
     sig_features = find_obv_sig_vol_spikes(o_filter, position)
 
-    features = []
-    for sig in sig_features:
-        features.append(sig)
-    for sma in sma_features:
-        features.append(sma)
+    features = sig_features + sma_features
 
     o_filter = generate_obv_o_filter(obv_diff, filter_factor)
 
     return o_filter, features
 
 
-def generate_obv_o_filter(obv_diff: list, filter_factor: float) -> list:
+def generate_obv_o_filter(obv_diff: Union[list, np.ndarray], filter_factor: float) -> list:
     """Generate On Balance Volume Filter
 
     Arguments:
-        obv_diff {list} -- oscillator from sma [obv - obv_signal]
+        obv_diff {list, np.ndarray} -- oscillator from sma [obv - obv_signal]
         filter_factor {float} -- threshold divisor (x/filter_factor) for "significant" OBVs
 
     Returns:
         list -- list of significant spikes/drops in volume
     """
-    o_max = np.max(np.abs(obv_diff))
-    o_filter = []
-    for i, obv in enumerate(obv_diff):
-        if obv > o_max / filter_factor:
-            o_filter.append(obv_diff[i])
-        elif obv < (-1 * o_max) / filter_factor:
-            o_filter.append(obv_diff[i])
-        else:
-            o_filter.append(0.0)
-    return o_filter
-
-
-def find_obv_sma_trends(obv: list,
+    obv_diff = np.asarray(obv_diff, dtype=float)
+    threshold = np.max(np.abs(obv_diff)) / filter_factor
+    significant = (obv_diff > threshold) | (obv_diff < -threshold)
+    return np.where(significant, obv_diff, 0.0).tolist()
+
+
+def find_obv_sma_trends(obv: Union[list, np.ndarray],
                         sma_lists: list,
                         interval_lists: list,
                         position: pd.DataFrame) -> List[dict]:
@@ -305,89 +291,68 @@ def find_obv_sma_trends(obv: list,
     Compare OBV against simple moving averages of the OBV
 
     Arguments:
-        obv {list} -- on balance volume signal
-        sma_lists {list} -- list of lists (simple moving averages of obv)
+        obv {list, np.ndarray} -- on balance volume signal
+        sma_lists {list} -- list of lists / arrays (simple moving averages of obv)
         interval_lists {list} -- lookback periods of sma_lists
         position {pd.DataFrame} -- fund dataset
 
     Returns:
         list -- list of trend dictionary objects
     """
+    # pylint: disable=too-many-locals
     if len(sma_lists) != len(interval_lists):
         return []
 
+    obv = np.asarray(obv, dtype=float)
+    dates = date_axis(position).strings
     features = []
-    state = 'at'
-    for i, sma in enumerate(sma_lists):
-        for j, obv_val in enumerate(obv):
-            date = position.index[j].strftime("%Y-%m-%d")
-            data = None
-
-            if state == 'at':
-                if obv_val > sma[j]:
-                    state = 'above'
-                    data = {
-                        "type": 'bullish',
-                        "value": f'sma-{interval_lists[i]} crossover',
-                        "index": j,
-                        "date": date
-                    }
-                elif obv_val < sma[j]:
-                    state = 'below'
-                    data = {
-                        "type": 'bearish',
-                        "value": f'sma-{interval_lists[i]} crossover',
-                        "index": j,
-                        "date": date
-                    }
-
-            elif state == 'above':
-                if obv_val < sma[j]:
-                    state = 'below'
-                    data = {
-                        "type": 'bearish',
-                        "value": f'sma-{interval_lists[i]} crossover',
-                        "index": j,
-                        "date": date
-                    }
-
-            elif state == 'below':
-                if obv_val > sma[j]:
-                    state = 'above'
-                    data = {
-                        "type": 'bullish',
-                        "value": f'sma-{interval_lists[i]} crossover',
-                        "index": j,
-                        "date": date
-                    }
-
-            if data is not None:
-                features.append(data)
+    # Above (1) / below (-1) state; it starts 'at' (0) and carries over from one sma to the next
+    state = 0
+    for sma, interval in zip(sma_lists, interval_lists):
+        sma = np.asarray(sma, dtype=float)[:len(obv)]
+        side = (obv[:len(sma)] > sma).astype(int) - (obv[:len(sma)] < sma).astype(int)
+
+        # Equal values keep the previous state, so only the days on one side can cross
+        sided = np.flatnonzero(side)
+        states = side[sided]
+        previous = np.concatenate([[state], states[:-1]])
+        crossings = sided[states != previous]
+        if len(states) > 0:
+            state = states[-1]
+
+        for index in crossings.tolist():
+            features.append({
+                "type": 'bullish' if side[index] > 0 else 'bearish',
+                "value": f'sma-{interval} crossover',
+                "index": index,
+                "date": dates[index]
+            })
 
     return features
 
 
-def find_obv_sig_vol_spikes(o_filter: list, position: pd.DataFrame) -> List[dict]:
+def find_obv_sig_vol_spikes(o_filter: Union[list, np.ndarray],
+                            position: pd.DataFrame) -> List[dict]:
     """Find On Balance Volume Significant Volume Spikes
 
     Using an "ofilter" signal, generate feature/signals content from list
 
     Arguments:
-        ofilter {list} -- signal of significant volume spikes/drops
+        ofilter {list, np.ndarray} -- signal of significant volume spikes/drops
         position {pd.DataFrame} -- fund dataset
 
     Returns:
         list -- list of spike dictionary objects
     """
-    features = []
-    for i, obf in enumerate(o_filter):
-        if obf > 0.0:
-            date = position.index[i].strftime("%Y-%m-%d")
-            data = {
-                "type": 'bullish',
-                "value": f"significant spike: {int(obf)}",
-                "index": i,
-                "date": date
-            }
-            features.append(data)
-    return features
+    o_filter = np.asarray(o_filter, dtype=float)
+    spikes = np.flatnonzero(o_filter > 0.0)
+    dates = date_axis(position).strings
+    return [
+        {
+            "type": 'bullish',
+            "value": f"significant spike: {int(obf)}",
+            "index": index,
+            "date": dates[index]
+        }
+        for index, obf in zip(spikes.tolist(), o_filter[spikes].tolist())
+    ]
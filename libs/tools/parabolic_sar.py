@@ -5,7 +5,7 @@ import pprint
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES
+from libs.utils import INDEXES, date_axis
 from libs.utils.plot_utils import candlesticks
 
 from .trends import auto_trend
@@ -22,6 +22,8 @@ def parabolic_sar(fund: pd.DataFrame, **kwargs) -> dict:
                                 (default: {None})
 
     Optional Args:
+        af {list} -- acceleration factors, faster first (default: {[0.02, 0.01]})
+        max_factor {float} -- max acceleration factor (default: {0.2})
         plot_output {bool} -- (default: {True})
         name {str} -- (default: {''})
         view {str} -- (default: {''})
@@ -30,6 +32,8 @@ def parabolic_sar(fund: pd.DataFrame, **kwargs) -> dict:
     Returns:
         dict -- SAR data object
     """
+    acc_factor = kwargs.get('af', [0.02, 0.01])
+    max_factor = kwargs.get('max_factor', 0.2)
     plot_output = kwargs.get('plot_output', True)
     name = kwargs.get('name', '')
     view = kwargs.get('view', '')
@@ -37,7 +41,8 @@ def parabolic_sar(fund: pd.DataFrame, **kwargs) -> dict:
 
     sar = {}
     sar = generate_sar(
-        fund, plot_output=plot_output, name=name, view=view, p_bar=p_bar)
+        fund, af=acc_factor, max_factor=max_factor, plot_output=plot_output, name=name,
+        view=view, p_bar=p_bar)
 
     sar = sar_metrics(fund, sar)
 
@@ -148,7 +153,7 @@ def generate_sar(fund: pd.DataFrame, **kwargs) -> dict:
 
         for i in range(period_offset, len(signal)):
             data = None
-            date = fund.index[i].strftime("%Y-%m-%d")
+            date = date_axis(fund).strings[i]
 
             if trend == 'down':
                 sar_i = signal[i-1] - a_f * (signal[i-1] - e_p)
@@ -5,10 +5,11 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from libs.utils import INDEXES, generate_plot, PlotType
+from libs.utils import INDEXES, generate_plot, PlotType, date_axis
 from libs.features import normalize_signals
 
 from .moving_average import adjust_signals, exponential_moving_avg
+from .momentum_engine import momentum_engine
 
 
 def rate_of_change_oscillator(fund: pd.DataFrame,
@@ -111,12 +112,7 @@ def roc_signal(fund: pd.DataFrame, interval: int) -> list:
     Returns:
         list -- ROC signal
     """
-    signal = [0.0] * len(fund['Close'])
-    for i in range(interval, len(signal)):
-        signal[i] = ((fund['Close'][i] / fund['Close']
-                      [i-interval]) - 1.0) * 100.0
-
-    return signal
+    return momentum_engine(fund).roc(interval).tolist()
 
 
 def roc_metrics(fund: pd.DataFrame, roc_dict: dict, **kwargs) -> dict:
@@ -205,7 +201,7 @@ def roc_zero_crossovers(fund: pd.DataFrame, roc_dict: dict, map_tabular: dict, *
         period = roc_dict[tab]
 
         for i, sig in enumerate(tabular[tab]):
-            date = fund.index[i].strftime("%Y-%m-%d")
+            date = date_axis(fund).strings[i]
             data = None
 
             if sh_state == 'n':
@@ -283,7 +279,7 @@ def roc_over_threshold_crossovers(fund: pd.DataFrame, roc_dict: dict,
         period = roc_dict[tab]
 
         for i, sig in enumerate(tabular[tab]):
-            date = fund.index[i].strftime("%Y-%m-%d")
+            date = date_axis(fund).strings[i]
             data = None
 
             if state == 'n':
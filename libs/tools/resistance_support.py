@@ -1,11 +1,12 @@
 """ resistance support """
 import os
-from typing import Tuple, Union
+from typing import List, Tuple, Union
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from libs.utils import generate_plot, PlotType, dates_convert_from_index, INDEXES
+from libs.utils import generate_plot, PlotType, INDEXES
 
 # pylint: disable=pointless-string-statement
 """
@@ -46,6 +47,8 @@ def find_resistance_support_lines(data: pd.DataFrame, **kwargs) -> dict:
     progress_bar = kwargs.get('progress_bar', None)
     view = kwargs.get('view', '')
 
+    closes = data['Close'].to_numpy(dtype=float)
+
     resist_support_lines = {}
     resist_support_lines['support'] = {}
     resist_support_lines['resistance'] = {}
@@ -56,36 +59,34 @@ def find_resistance_support_lines(data: pd.DataFrame, **kwargs) -> dict:
     resistance = {}
     for time in time_frames:
         support[str(time)] = {}
-        x_list, y_list = find_points(data, line_type='support',
-                           time_frame=time, filter_type='windowed')
+        x_list, y_list = find_points(closes, line_type='support',
+                                     time_frame=time, filter_type='windowed')
         support[str(time)]['x'] = x_list
         support[str(time)]['y'] = y_list
         sorted_support = sort_and_group(support)
-        resist_support_lines['support'][str(time)] = cluster_notables(sorted_support, data)
+        resist_support_lines['support'][str(time)] = cluster_notables(sorted_support, closes)
 
         resistance[str(time)] = {}
-        x2_list, y2_list = find_points(data, line_type='resistance', time_frame=time)
+        x2_list, y2_list = find_points(closes, line_type='resistance', time_frame=time)
         resistance[str(time)]['x'] = x2_list
         resistance[str(time)]['y'] = y2_list
         sorted_resistance = sort_and_group(resistance)
         resist_support_lines['resistance'][str(
-            time)] = cluster_notables(sorted_resistance, data)
+            time)] = cluster_notables(sorted_resistance, closes)
 
         if progress_bar is not None:
             progress_bar.uptick(increment=increment)
 
-    x_support, y_support, x_resistance, y_resistance = get_plot_content(
+    support_lines, resistance_lines = get_plot_content(
         data, resist_support_lines, selected_timeframe=str(time_frames[len(time_frames)-1]))
 
     if progress_bar is not None:
         progress_bar.uptick(increment=0.2)
 
-    x_combined, y_combined = res_sup_unions(y_resistance, x_resistance, y_support, x_support)
-    # Odd list behavior when no res/sup lines drawn on appends, so if-else to fix
-    if len(y_combined) > 0:
-        x_p = x_combined.copy()
-        x_p2 = dates_convert_from_index(data, x_p)
-        y_p = y_combined.copy()
+    combined_lines = res_sup_unions(resistance_lines, support_lines)
+    if len(combined_lines) > 0:
+        x_p2 = [data.index[line['start']:line['end']] for line in combined_lines]
+        y_p = [line_values(line) for line in combined_lines]
         x_p2.append(data.index)
         y_p.append(remove_dates_from_close(data))
     else:
@@ -107,7 +108,7 @@ def find_resistance_support_lines(data: pd.DataFrame, **kwargs) -> dict:
     if progress_bar is not None:
         progress_bar.uptick(increment=0.1)
 
-    analysis = detailed_analysis([y_resistance, y_support, y_combined],
+    analysis = detailed_analysis([resistance_lines, support_lines, combined_lines],
         data, key_args={'Colors': colors})
     if progress_bar is not None:
         progress_bar.uptick(increment=0.1)
@@ -117,92 +118,72 @@ def find_resistance_support_lines(data: pd.DataFrame, **kwargs) -> dict:
     return analysis
 
 
-def truncate_points(x_list: list, y_list: list) -> Tuple[list, list]:
+def truncate_points(x_list: np.ndarray, y_list: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """Truncate Points
 
     Shrink list of a resistance/support line so that it doesn't last the entire
     length of the data set (only the valid parts).
 
     Arguments:
-        X {list} -- list of x values
-        Y {list} -- list of y values
+        X {np.ndarray} -- x values
+        Y {np.ndarray} -- y values
 
     Returns:
-        list -- new, adjust lists of x and y values
+        Tuple[np.ndarray, np.ndarray] -- x and y values of the first point at each x, in order
     """
-    new_x = []
-    new_y = []
-    for i, x_val in enumerate(x_list):
-        if x_val not in new_x:
-            new_x.append(x_val)
-            new_y.append(y_list[i])
-    return new_x, new_y
+    _, first = np.unique(x_list, return_index=True)
+    first = np.sort(first)
+    return x_list[first], y_list[first]
 
 
-def find_points(data: pd.DataFrame, time_frame: int, **kwargs) -> Tuple[list, list]:
+def find_points(closes: np.ndarray, time_frame: int, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
     """Find Points
 
+    Lowest (support) or highest (resistance) close of each window; the first one on ties
+
     Arguments:
-        data {pd.DataFrame}
+        closes {np.ndarray} -- fund closes
         timeframe {int} -- time window (number of periods)
 
     Keyword Arguments:
         line_type {str} -- (default: {'support'})
-        filter_type {str} -- signal filter (default: {'windowed'})
+        filter_type {str} -- 'windowed' (back-to-back windows) or 'convolution' (a window starting
+                             at each period) (default: {'windowed'})
 
     Returns:
-        list -- list of points
+        Tuple[np.ndarray, np.ndarray] -- x and y values of the points
     """
     line_type = kwargs.get('line_type', 'support')
     filter_type = kwargs.get('filter_type', 'windowed')
 
-    total_entries = len(data['Close'])
-    if pd.isna(data['Close'][total_entries-1]):
+    total_entries = len(closes)
+    if total_entries > 0 and np.isnan(closes[total_entries-1]):
         total_entries -= 1
+    closes = closes[:total_entries]
 
-    sect_count = 0
-    x_list = []
-    y_list = []
-
+    x_list = np.array([], dtype=int)
+    windows = np.empty((0, time_frame))
     if filter_type == 'windowed':
         sections = int(np.ceil(float(total_entries) / float(time_frame)))
-        while sect_count < sections:
-            left = sect_count * time_frame
-            right = left + time_frame
-            # print(f"tot: {total_entries}, left: {left}, right: {right}")
-            if total_entries < (left + time_frame + 1):
-                right = total_entries
-
-            if line_type == 'support':
-                val = np.min(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-            else:
-                val = np.max(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-
-            x_list.append(point)
-            y_list.append(val)
-
-            sect_count += 1
+        # The last window is short; pad it with values that are never the extreme
+        padded = np.full(sections * time_frame, np.inf if line_type == 'support' else -np.inf)
+        padded[:total_entries] = closes
+        windows = padded.reshape(sections, time_frame)
+        x_list = np.arange(sections) * time_frame
+
+    elif filter_type == 'convolution':
+        count = max(total_entries - time_frame, 0)
+        windows = sliding_window_view(closes, time_frame)[:count]
+        x_list = np.arange(count)
+
+    if len(x_list) > 0:
+        if line_type == 'support':
+            x_list = x_list + np.argmin(windows, axis=1)
+        else:
+            x_list = x_list + np.argmax(windows, axis=1)
+    y_list = closes[x_list]
 
     if filter_type == 'convolution':
-        while sect_count + time_frame < total_entries:
-            left = sect_count
-            right = left + time_frame
-            if total_entries < (left + time_frame + 1):
-                right = total_entries
-
-            if line_type == 'support':
-                val = np.min(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-            else:
-                val = np.max(data['Close'][left:right])
-                point = np.where(data['Close'][left:right] == val)[0][0] + left
-
-            x_list.append(point)
-            y_list.append(val)
-
-            sect_count += 1
         x_list, y_list = truncate_points(x_list, y_list)
 
     return x_list, y_list
@@ -219,87 +200,82 @@ def sort_and_group(points: dict) -> list:
     Returns:
         list -- list of condensed lines
     """
-    x_list = []
-    y_list = []
-    for key in points.keys():
-        x_list.extend(points[key]['x'])
-        y_list.extend(points[key]['y'])
-
-    zipped = list(zip(x_list, y_list))
-    zipped.sort(key=lambda x: x[1])
+    x_list = np.concatenate([points[key]['x'] for key in points])
+    y_list = np.concatenate([points[key]['y'] for key in points])
+
+    order = np.argsort(y_list, kind='stable')
+    x_list = x_list[order].tolist()
+    y_list = y_list[order]
+
+    # Percent change from each price level to the next
+    val = np.diff(y_list) / y_list[:-1] * 100.0
+    near = ((-1 * CLUSTER_THRESHOLD < val) & (val < CLUSTER_THRESHOLD)).tolist()
+
     notables = []
+    noted = set()
     t_note = 0
-    for i in range(1, len(zipped)-1):
-        val = (zipped[i][1] - zipped[i-1][1]) / zipped[i-1][1]
-        val *= 100.0
-        if -1 * CLUSTER_THRESHOLD < val < CLUSTER_THRESHOLD:
-            if zipped[i-1][0] not in notables:
-                notables.append(zipped[i-1][0])
-                t_note += 1
-            if zipped[i][0] not in notables:
-                notables.append(zipped[i][0])
-                t_note += 1
+    for i in range(1, len(x_list)-1):
+        if near[i-1]:
+            for x_val in (x_list[i-1], x_list[i]):
+                if x_val not in noted:
+                    notables.append(x_val)
+                    noted.add(x_val)
+                    t_note += 1
         else:
             if t_note < 2:
                 if len(notables) != 0:
-                    notables.pop(len(notables)-1)
+                    noted.discard(notables.pop())
             t_note = 0
 
     if t_note == 1:
         # Not reset to 0 but not 2+ either... case for last entry
-        notables.pop(len(notables)-1)
+        noted.discard(notables.pop())
 
     return notables
 
 
-def cluster_notables(sorted_x: list, data: pd.DataFrame) -> list:
+def cluster_notables(sorted_x: list, closes: np.ndarray) -> list:
     """Cluster Notables
 
-    Continued grouping of similar signals
+    Continued grouping of similar signals: a new cluster starts wherever the close moves by the
+    CLUSTER_THRESHOLD percent or more from the previous point's. (The last, still open, cluster is
+    not included.)
 
     Arguments:
         sorted_x {list} -- x list of sorted content
-        data {pd.DataFrame} -- fund dataset
+        closes {np.ndarray} -- fund closes
 
     Returns:
         list -- list of clustered lines
     """
-    clusters = []
-    sub = []
     if len(sorted_x) == 0:
         return []
 
-    sub.append(sorted_x[0])
-    for i in range(1, len(sorted_x)):
-        val = (data['Close'][sorted_x[i]] - data['Close']
-               [sub[len(sub)-1]]) / data['Close'][sub[len(sub)-1]] * 100.0
-        if CLUSTER_THRESHOLD > val > -1 * CLUSTER_THRESHOLD:
-            sub.append(sorted_x[i])
-        else:
-            clusters.append(sub)
-            sub = []
-            sub.append(sorted_x[i])
+    sorted_x = np.asarray(sorted_x, dtype=int)
+    prices = closes[sorted_x]
+    val = (prices[1:] - prices[:-1]) / prices[:-1] * 100.0
+    breaks = np.flatnonzero(~((CLUSTER_THRESHOLD > val) & (val > -1 * CLUSTER_THRESHOLD))) + 1
 
     lines = []
-    for chunk in clusters:
-        content = {}
-        ys_list = []
-        for x_val in chunk:
-            ys_list.append(data['Close'][x_val])
-        content['price'] = np.round(np.mean(ys_list), 2)
-        content['x'] = chunk
-        content['start'] = int(np.min(chunk))
-        lines.append(content)
+    starts = np.concatenate([[0], breaks[:-1]])
+    for start, end in zip(starts.tolist(), breaks.tolist()):
+        chunk = sorted_x[start:end]
+        lines.append({
+            'price': np.round(np.mean(prices[start:end]), 2),
+            'x': chunk.tolist(),
+            'start': int(np.min(chunk))
+        })
 
     return lines
 
 
 def get_plot_content(data: pd.DataFrame,
                      rs_lines: dict,
-                     selected_timeframe: str = '144') -> Tuple[list, list, list, list]:
+                     selected_timeframe: str = '144') -> Tuple[List[dict], List[dict]]:
     """Get Plot Content
 
-    Generate plot lists for resistance/support lines
+    Generate lines of the resistance/support levels (each led by the price itself). A line is
+    {'start', 'end', 'price', 'values'}: it spans [start, end) at 'price', or follows 'values'.
 
     Arguments:
         data {pd.DataFrame} -- fund dataset
@@ -309,116 +285,88 @@ def get_plot_content(data: pd.DataFrame,
         selected_timeframe {str} -- timeframe (default: {'144'})
 
     Returns:
-        list -- x-support, y-support, x-resistance, y-resistance lists
+        Tuple[List[dict], List[dict]] -- support lines, resistance lines
     """
-    x_support = []
-    y_support = []
-    x_support.append(list(range(len(data['Close']))))
-    y_support.append(data['Close'])
-
-    x_resistance = []
-    y_resistance = []
-    x_resistance.append(list(range(len(data['Close']))))
-    y_resistance.append(data['Close'])
-
-    if 'support' in rs_lines.keys():
-        if selected_timeframe in rs_lines['support'].keys():
-            for key in rs_lines['support'][selected_timeframe]:
-                x_list = list(range(key['start'], len(data['Close'])))
-                y_list = [key['price']] * len(x_list)
-                x_support.append(x_list)
-                y_support.append(y_list)
-
-    if 'resistance' in rs_lines.keys():
-        if selected_timeframe in rs_lines['resistance'].keys():
-            for key in rs_lines['resistance'][selected_timeframe]:
-                x_list = list(range(key['start'], len(data['Close'])))
-                y_list = [key['price']] * len(x_list)
-                x_resistance.append(x_list)
-                y_resistance.append(y_list)
-
-    return x_support, y_support, x_resistance, y_resistance
-
-
-def res_sup_unions(y_resistance: list, x_resistance: list,
-                   y_support: list, x_support: list) -> Tuple[list, list]:
+    length = len(data['Close'])
+    price_line = {
+        'start': 0, 'end': length, 'price': data['Close'].iloc[0], 'values': data['Close']
+    }
+
+    lines = {}
+    for line_type in ('support', 'resistance'):
+        lines[line_type] = [price_line]
+        for key in rs_lines.get(line_type, {}).get(selected_timeframe, []):
+            lines[line_type].append(
+                {'start': key['start'], 'end': length, 'price': key['price'], 'values': None})
+
+    return lines['support'], lines['resistance']
+
+
+def line_values(line: dict) -> Union[np.ndarray, pd.Series]:
+    """ y values of a line from get_plot_content """
+    if line['values'] is not None:
+        return line['values']
+    return np.full(max(line['end'] - line['start'], 0), line['price'])
+
+
+def res_sup_unions(resistance_lines: List[dict], support_lines: List[dict]) -> List[dict]:
     """Resistance / Support Unions
 
     Join a resistance/support line that becomes a support/resistance line. Combines Resistances and
     Supports within the MAJOR_GROUP_THRESHOLD window.
 
     Arguments:
-        Yr {list} -- y-resistance points
-        Xr {list} -- x-resistance points
-        Ys {list} -- y-support points
-        Xs {list} -- x-support points
+        resistance_lines {list} -- resistance lines (see get_plot_content)
+        support_lines {list} -- support lines
 
     Returns:
-        list -- x-combined points, y-combined points lists
+        list -- combined lines
     """
-    # pylint: disable=too-many-locals
-    y_combined = []
-    x_combined = []
-
-    y_combined.extend(y_resistance)
-    x_combined.extend(x_resistance)
-    y_combined.extend(y_support)
-    x_combined.extend(x_support)
-
-    combined = list(zip(x_combined, y_combined))
-    combined.sort(key=lambda x: x[1][0])
-    x_combined, y_combined = list(zip(*combined))
+    combined = resistance_lines + support_lines
+    combined = [combined[i] for i in np.argsort(
+        [line['price'] for line in combined], kind='stable')]
 
     no_changes = False
     while not no_changes:
         no_changes = True
-        y_u = []
-        x_u = []
+        unions = []
         added_ith = False
 
-        for i in range(1, len(y_combined)):
-            neg = y_combined[i][0] * (1.0 - (MAJOR_GROUP_THRESHOLD / 100.0))
-            pos = y_combined[i][0] * (1.0 + (MAJOR_GROUP_THRESHOLD / 100.0))
+        for i in range(1, len(combined)):
+            neg = combined[i]['price'] * (1.0 - (MAJOR_GROUP_THRESHOLD / 100.0))
+            pos = combined[i]['price'] * (1.0 + (MAJOR_GROUP_THRESHOLD / 100.0))
 
-            if ((y_combined[i-1][0] > neg) and (y_combined[i-1][0] < pos)):
+            if neg < combined[i-1]['price'] < pos:
                 # Two lines are near each other, average and combine. If added_ith=True, pop item
                 # in list before to combine
                 if added_ith:
                     added_ith = False
-                    y_u.pop(len(y_u)-1)
-                    x_u.pop(len(x_u)-1)
-
-                start = min(x_combined[i-1][0], x_combined[i][0])
-                end = max(
-                    x_combined[i-1][len(x_combined[i-1])-1],
-                    x_combined[i][len(x_combined[i])-1]
-                )
-                y_val = [np.round(np.mean([y_combined[i-1][0], y_combined[i][0]]), 2)] * (end-start)
-                x_val = list(range(start, end))
-                x_u.append(x_val)
-                y_u.append(y_val)
+                    unions.pop(len(unions)-1)
+
+                # Joined lines run from the first start up to (not including) the last end point
+                unions.append({
+                    'start': min(combined[i-1]['start'], combined[i]['start']),
+                    'end': max(combined[i-1]['end'], combined[i]['end']) - 1,
+                    'price': np.round(
+                        np.mean([combined[i-1]['price'], combined[i]['price']]), 2),
+                    'values': None
+                })
                 no_changes = False
 
             elif i == 1:
                 # Special case where neither i=0 or i=1 are near, append both
-                x_u.append(x_combined[i-1])
-                x_u.append(x_combined[i])
-                y_u.append(y_combined[i-1])
-                y_u.append(y_combined[i])
+                unions.append(combined[i-1])
+                unions.append(combined[i])
                 added_ith = True
 
             else:
                 # ith case added
-                x_u.append(x_combined[i])
-                y_u.append(y_combined[i])
+                unions.append(combined[i])
                 added_ith = True
 
-        y_val = [y[0] for y in y_u]
-
-        x_combined = x_u.copy()
-        y_combined = y_u.copy()
+        combined = unions
 
-    return x_combined, y_combined
+    return combined
 
 
 def get_nearest_lines(ylist: list,
@@ -428,7 +376,7 @@ def get_nearest_lines(ylist: list,
     """Get Nearest Lines
 
     Arguments:
-        ylist {list} -- list of prices and lines near current price
+        ylist {list} -- sorted list of prices and lines near current price
         cur_price {float}
 
     Keyword Arguments:
@@ -438,102 +386,53 @@ def get_nearest_lines(ylist: list,
     Returns:
         list -- keys, list of price-to-list objects
     """
-    # pylint: disable=too-many-branches,too-many-statements
     if not color:
         color = []
 
-    keys = []
     if support_resistance == 'major':
-        for y_val in range(len(ylist)-1, -1, -1):
-            percent = np.round((ylist[y_val] - cur_price) / cur_price * 100.0, 3)
-            if percent < 0.0:
-                state = 'Support'
-            else:
-                state = 'Resistance'
-
-            y_color = 'black'
-            if len(color) > 0:
-                y_color = color[y_val]
-
-            keys.append(
-                {
-                    'Price': f"{ylist[y_val]}",
-                    'Change': f"{percent}%",
-                    'Color': y_color,
-                    'State': state
-                })
-        return keys
+        indexes = list(range(len(ylist)-1, -1, -1))
+
+    elif support_resistance == 'support':
+        # Nearest lines below the price, closest first
+        count = int(np.searchsorted(ylist, cur_price, side='left'))
+        indexes = []
+        if count != 0:
+            indexes = list(range(count - 1, max(count - 1 - NUM_NEAREST_LINES, -1), -1))
 
-    if support_resistance == 'support':
-        end_cap = 0
-        count = 0
-        modifier = -1
-        while ((count < len(ylist)) and (cur_price > ylist[count])):
-            count += 1
     else:
-        end_cap = len(ylist) - 1
-        count = len(ylist) - 1
-        modifier = 1
-        while ((count >= 0) and (cur_price < ylist[count])):
-            count -= 1
-
-    if count != end_cap:
-        count += modifier
-        if support_resistance == 'support':
-            if (count - NUM_NEAREST_LINES) < 0:
-                for i in range(count, -1, modifier):
-                    percent = np.round(
-                        (ylist[i] - cur_price) / cur_price * 100.0, 3)
-                    if percent < 0.0:
-                        state = 'Support'
-                    else:
-                        state = 'Resistance'
-                    keys.append(
-                        {'Price': f"{ylist[i]}", 'Change': f"{percent}%", 'State': state})
+        # Nearest lines above the price, closest first
+        count = int(np.searchsorted(ylist, cur_price, side='right')) - 1
+        indexes = []
+        if count != len(ylist) - 1:
+            count += 1
+            stop = count + NUM_NEAREST_LINES
+            if stop >= len(ylist) - 1:
+                stop = len(ylist)
+            indexes = list(range(count, stop))
 
-            else:
-                for i in range(count, count - NUM_NEAREST_LINES, -1):
-                    percent = np.round(
-                        (ylist[i] - cur_price) / cur_price * 100.0, 3)
-                    if percent < 0.0:
-                        state = 'Support'
-                    else:
-                        state = 'Resistance'
-                    keys.append(
-                        {'Price': f"{ylist[i]}", 'Change': f"{percent}%", 'State': state})
+    percents = np.round(
+        (np.asarray(ylist, dtype=float)[indexes] - cur_price) / cur_price * 100.0, 3)
 
-        else:
-            if (count + NUM_NEAREST_LINES) >= len(ylist) - 1:
-                for i in range(count, len(ylist), modifier):
-                    percent = np.round(
-                        (ylist[i] - cur_price) / cur_price * 100.0, 3)
-                    if percent < 0.0:
-                        state = 'Support'
-                    else:
-                        state = 'Resistance'
-                    keys.append(
-                        {'Price': f"{ylist[i]}", 'Change': f"{percent}%", 'State': state})
-
-            else:
-                for i in range(count, count + NUM_NEAREST_LINES, modifier):
-                    percent = np.round(
-                        (ylist[i] - cur_price) / cur_price * 100.0, 3)
-                    if percent < 0.0:
-                        state = 'Support'
-                    else:
-                        state = 'Resistance'
-                    keys.append(
-                        {'Price': f"{ylist[i]}", 'Change': f"{percent}%", 'State': state})
+    keys = []
+    for i, percent in zip(indexes, percents):
+        key = {
+            'Price': f"{ylist[i]}",
+            'Change': f"{percent}%"
+        }
+        if support_resistance == 'major':
+            key['Color'] = color[i] if len(color) > 0 else 'black'
+        key['State'] = 'Support' if percent < 0.0 else 'Resistance'
+        keys.append(key)
 
     return keys
 
 
-def detailed_analysis(zipped_content: list, data: pd.DataFrame,
+def detailed_analysis(lines: list, data: pd.DataFrame,
                       key_args: Union[dict, None] = None) -> dict:
     """Detailed Analysis
 
     Arguments:
-        zipped_content {list} -- x and y lists
+        lines {list} -- resistance, support, and combined lines
         data {pd.DataFrame} -- fund dataset
 
     Keyword Arguments:
@@ -553,21 +452,13 @@ def detailed_analysis(zipped_content: list, data: pd.DataFrame,
     if 'Colors' in key_args.keys():
         colors = key_args['Colors']
 
-    y_resistance = zipped_content[0]
-    y_support = zipped_content[1]
-    y_combined = zipped_content[2]
-
-    res = [y[0] for y in y_resistance]
-    sup = [y[0] for y in y_support]
-    maj = [y[0] for y in y_combined]
+    maj = [line['price'] for line in lines[2]]
 
     zipper = list(zip(maj, colors))
     zipper.sort(key=lambda x: x[0])
     maj = [x[0] for x in zipper]
     colors = [y[1] for y in zipper]
 
-    res.sort()
-    sup.sort()
     maj.sort()
 
     # Mutual funds tickers update daily, several hours after close. To accomodate for any pulls of
@@ -598,10 +489,7 @@ def remove_dates_from_close(data_frame: pd.DataFrame) -> list:
     Returns:
         list -- fund dataset without dates
     """
-    fixed_list = []
-    for i in range(len(data_frame)):
-        fixed_list.append(data_frame['Close'][i])
-    return fixed_list
+    return list(data_frame['Close'].to_numpy())
 
 
 def colorize_plots(len_of_plots: int, primary_plot_index: int = None) -> list:
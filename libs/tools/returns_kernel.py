@@ -0,0 +1,146 @@
+""" return / risk statistics of price series, computed along the last axis (one row per fund) """
+from typing import Tuple
+
+import numpy as np
+
+YEAR_PERIODS = 250
+SHORT_YEAR_PERIODS = 200
+# Quarters alternate 62 and 63 trading periods (250 per year)
+QUARTER_PERIODS = (62, 63)
+
+
+def percent_returns(values: np.ndarray) -> np.ndarray:
+    """Percent Returns
+
+    Arguments:
+        values {np.ndarray} -- prices, one series per row (or a single series)
+
+    Returns:
+        np.ndarray -- period-over-period change in percent (0.0 for the first period)
+    """
+    values = np.asarray(values, dtype=float)
+    returns = np.zeros(values.shape)
+    returns[..., 1:] = (values[..., 1:] - values[..., :-1]) / values[..., :-1] * 100.0
+    return returns
+
+
+def forward_returns(values: np.ndarray, futures: list) -> np.ndarray:
+    """Forward Returns
+
+    Arguments:
+        values {np.ndarray} -- prices of a single series
+        futures {list} -- forward windows (number of periods)
+
+    Returns:
+        np.ndarray -- percent change to the price 'future' periods ahead (one row per future; 0.0
+                      where the future is past the end of the data)
+    """
+    values = np.asarray(values, dtype=float)
+    returns = np.zeros((len(futures), len(values)))
+    for row, future in zip(returns, futures):
+        if future < len(values):
+            row[:len(values)-future] = (values[future:] - values[:len(values)-future]) / \
+                values[:len(values)-future] * 100.0
+    return returns
+
+
+def beta_r_squared(returns: np.ndarray, bench_returns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Beta R-Squared
+
+    Least squares fit of each row of returns vs. the benchmark's (as scipy's linregress)
+
+    Arguments:
+        returns {np.ndarray} -- returns, one fund per row (or a single fund)
+        bench_returns {np.ndarray} -- benchmark returns
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- beta (slope), r-squared of each fund
+    """
+    returns = np.asarray(returns, dtype=float)
+    bench = np.asarray(bench_returns, dtype=float)
+    count = bench.shape[-1]
+
+    bench_dev = bench - np.mean(bench)
+    fund_dev = returns - np.mean(returns, axis=-1, keepdims=True)
+
+    ssxm = np.dot(bench_dev, bench_dev) * (1.0 / count)
+    ssxym = np.dot(fund_dev, bench_dev) * (1.0 / count)
+    ssym = np.sum(fund_dev * fund_dev, axis=-1) * (1.0 / count)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r_den = np.sqrt(ssxm * ssym)
+        r_value = np.where(r_den == 0.0, 0.0, np.clip(ssxym / r_den, -1.0, 1.0))
+        slope = ssxym / ssxm
+
+    return slope, r_value ** 2
+
+
+def period_returns(adj_close: np.ndarray, output: str = 'annual') -> Tuple[np.ndarray, np.ndarray]:
+    """Period Returns
+
+    Mean of the last year's return and the sum of the last 4 quarters' returns, with the mean
+    of the standard deviations of yearly and (summed) quarterly returns
+
+    Arguments:
+        adj_close {np.ndarray} -- adjusted closes, one fund per row (or a single fund)
+
+    Keyword Arguments:
+        output {str} -- 'annual' or 'quarterly' return (default: {'annual'})
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] -- returns, standard deviations
+    """
+    # pylint: disable=too-many-locals
+    adj_close = np.asarray(adj_close, dtype=float)
+    length = adj_close.shape[-1]
+
+    years = max(int(length / YEAR_PERIODS), 1)
+    interval = YEAR_PERIODS if length > YEAR_PERIODS else SHORT_YEAR_PERIODS
+
+    # Back-to-back years and quarters from the start of the data
+    year_ends = np.arange(years + 1) * interval
+    annual = _changes(adj_close, year_ends[:-1], year_ends[1:])
+
+    quarter_periods = np.where(np.arange(4 * years) % 2 == 0, *QUARTER_PERIODS)
+    quarter_ends = np.cumsum(quarter_periods)
+    quarters = _changes(adj_close, quarter_ends - quarter_periods, quarter_ends)
+    quarter_years = np.sum(quarters.reshape(quarters.shape[:-1] + (years, 4)), axis=-1)
+
+    # Most recent year and 4 (62.5 period) quarters
+    annual_returns = _changes(adj_close, np.array([-interval]), np.array([-1]))[..., 0]
+    recent = np.arange(5) * 62.5
+    q_returns = np.sum(
+        _changes(adj_close, -recent[1:].astype(int), -1 - recent[:-1].astype(int)), axis=-1)
+
+    returns = (q_returns + annual_returns) / 2.0
+    st_devs = (np.std(annual, axis=-1) + np.std(quarter_years, axis=-1)) / 2.0
+    if output == 'quarterly':
+        returns = returns / 4.0
+
+    return returns, st_devs
+
+
+def interval_return_stats(
+        adj_close: np.ndarray, interval: int = YEAR_PERIODS) -> Tuple[np.ndarray, ...]:
+    """Interval Return Stats
+
+    Arguments:
+        adj_close {np.ndarray} -- adjusted closes, one fund per row (or a single fund)
+
+    Keyword Arguments:
+        interval {int} -- trailing periods (default: {250})
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray] -- mean, median, std of the fractional
+                                                     period-over-period returns
+    """
+    adj_close = np.asarray(adj_close, dtype=float)[..., -interval:]
+    returns = np.zeros(adj_close.shape)
+    returns[..., 1:] = (adj_close[..., 1:] - adj_close[..., :-1]) / adj_close[..., :-1]
+    return (np.mean(returns, axis=-1), np.median(returns, axis=-1),
+            np.std(returns, axis=-1))
+
+
+def _changes(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """ percent change from values at starts to values at ends (positional, may be negative) """
+    return (values[..., ends] - values[..., starts]) / values[..., starts] * 100.0
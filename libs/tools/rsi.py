@@ -6,7 +6,7 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from libs.utils import date_extractor, INDEXES, generate_plot, PlotType
+from libs.utils import date_axis, INDEXES, generate_plot, PlotType
 from libs.features import normalize_signals
 
 from .trends import auto_trend
@@ -271,7 +271,7 @@ def determine_rsi_swing_rejection(position: pd.DataFrame, rsi_data: dict, **kwar
             if sig > maxima:
                 # Have found a bullish breakout!
                 rsi_data['bullish'].append([
-                    date_extractor(position.index[i], _format='str'),
+                    date_axis(position).strings[i],
                     position['Close'][i],
                     i,
                     "swing rejection"
@@ -318,7 +318,7 @@ def determine_rsi_swing_rejection(position: pd.DataFrame, rsi_data: dict, **kwar
         elif state == 8:
             if sig < minima:
                 rsi_data['bearish'].append([
-                    date_extractor(position.index[i], _format='str'),
+                    date_axis(position).strings[i],
                     position['Close'][i],
                     i,
                     "swing rejection"
@@ -463,7 +463,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
                         # Bullish divergence!
                         divs[i] = 1.0
                         rsi_data['bullish'].append([
-                            date_extractor(position.index[i], _format='str'),
+                            date_axis(position).strings[i],
                             position['Close'][i],
                             i,
                             "divergence"
@@ -508,7 +508,7 @@ def rsi_divergence(position: pd.DataFrame, rsi_data: dict, **kwargs) -> dict:
                         # Bearish divergence!
                         divs[i] = -1.0
                         rsi_data['bearish'].append([
-                            date_extractor(position.index[i], _format='str'),
+                            date_axis(position).strings[i],
                             position['Close'][i],
                             i,
                             "divergence"
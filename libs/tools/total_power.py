@@ -5,7 +5,7 @@ import pandas as pd
 import numpy as np
 
 from libs.tools import exponential_moving_avg
-from libs.utils import INDEXES, PlotType, generate_plot
+from libs.utils import INDEXES, PlotType, generate_plot, date_axis
 from libs.features import normalize_signals
 
 
@@ -189,7 +189,7 @@ def total_power_feature_detection(total_power_data: dict, position: pd.DataFrame
 
     tot_above = ''
     for i, tot in enumerate(tab['total']):
-        date = position.index[i].strftime("%Y-%m-%d")
+        date = date_axis(position).strings[i]
 
         if (tot >= 99.0) and (tab['bulls'][i] >= 99.0):
             metrics[i] += 3.0
@@ -2,3 +2,5 @@
 from .trend_of_periods import get_lines_from_period
 from .analysis import generate_analysis
 from .line_utils import filter_nearest_to_signal, consolidate_lines
+from .regression import linear_fit, trimmed_regression
+from .extrema_index import ExtremaIndex
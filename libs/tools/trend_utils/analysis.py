@@ -2,7 +2,7 @@
 import pandas as pd
 from scipy.stats import linregress
 
-from libs.utils import dates_convert_from_index
+from libs.utils import dates_convert_from_index, date_axis
 
 
 def generate_analysis(fund: pd.DataFrame,
@@ -34,11 +34,11 @@ def generate_analysis(fund: pd.DataFrame,
 
         sub['start'] = {}
         sub['start']['index'] = x_val[0]
-        sub['start']['date'] = fund.index[x_val[0]].strftime("%Y-%m-%d")
+        sub['start']['date'] = date_axis(fund).strings[x_val[0]]
 
         sub['end'] = {}
         sub['end']['index'] = x_val[len(x_val)-1]
-        sub['end']['date'] = fund.index[x_val[len(x_val)-1]].strftime("%Y-%m-%d")
+        sub['end']['date'] = date_axis(fund).strings[x_val[len(x_val)-1]]
 
         sub['term'] = len_list[i]
         if sub['slope'] < 0:
@@ -140,9 +140,9 @@ def get_attribute_analysis(fund: pd.DataFrame, x_list: list, y_list: list, conte
                 v_stop_index = touch['index'] - 1 if touch['index'] != 0 else x_list[0]
                 valid_spot = {'start': {}, 'end': {}}
                 valid_spot['start']['index'] = v_start_index
-                valid_spot['start']['date'] = fund.index[v_start_index].strftime("%Y-%m-%d")
+                valid_spot['start']['date'] = date_axis(fund).strings[v_start_index]
                 valid_spot['end']['index'] = v_stop_index
-                valid_spot['end']['date'] = fund.index[v_stop_index].strftime("%Y-%m-%d")
+                valid_spot['end']['date'] = date_axis(fund).strings[v_stop_index]
                 valid.append(valid_spot)
                 b_start_index = touch['index']
                 state = 'below'
@@ -152,9 +152,9 @@ def get_attribute_analysis(fund: pd.DataFrame, x_list: list, y_list: list, conte
                 b_stop_index = touch['index'] - 1 if touch['index'] != 0 else x_list[0]
                 broken_spot = {'start': {}, 'end': {}}
                 broken_spot['start']['index'] = b_start_index
-                broken_spot['start']['date'] = fund.index[b_start_index].strftime("%Y-%m-%d")
+                broken_spot['start']['date'] = date_axis(fund).strings[b_start_index]
                 broken_spot['end']['index'] = b_stop_index
-                broken_spot['end']['date'] = fund.index[b_stop_index].strftime("%Y-%m-%d")
+                broken_spot['end']['date'] = date_axis(fund).strings[b_stop_index]
                 broken.append(broken_spot)
                 v_start_index = touch['index']
                 state = 'above'
@@ -164,18 +164,18 @@ def get_attribute_analysis(fund: pd.DataFrame, x_list: list, y_list: list, conte
             v_stop_index = x_list[len(x_list)-1]
             valid_spot = {'start': {}, 'end': {}}
             valid_spot['start']['index'] = v_start_index
-            valid_spot['start']['date'] = fund.index[v_start_index].strftime("%Y-%m-%d")
+            valid_spot['start']['date'] = date_axis(fund).strings[v_start_index]
             valid_spot['end']['index'] = v_stop_index
-            valid_spot['end']['date'] = fund.index[v_stop_index].strftime("%Y-%m-%d")
+            valid_spot['end']['date'] = date_axis(fund).strings[v_stop_index]
             valid.append(valid_spot)
 
         else:
             b_stop_index = x_list[len(x_list)-1]
             broken_spot = {'start': {}, 'end': {}}
             broken_spot['start']['index'] = b_start_index
-            broken_spot['start']['date'] = fund.index[b_start_index].strftime("%Y-%m-%d")
+            broken_spot['start']['date'] = date_axis(fund).strings[b_start_index]
             broken_spot['end']['index'] = b_stop_index
-            broken_spot['end']['date'] = fund.index[b_stop_index].strftime("%Y-%m-%d")
+            broken_spot['end']['date'] = date_axis(fund).strings[b_stop_index]
             broken.append(broken_spot)
 
     else:
@@ -192,9 +192,9 @@ def get_attribute_analysis(fund: pd.DataFrame, x_list: list, y_list: list, conte
                 v_stop_index = touch['index'] - 1 if touch['index'] != 0 else x_list[0]
                 valid_spot = {'start': {}, 'end': {}}
                 valid_spot['start']['index'] = v_start_index
-                valid_spot['start']['date'] = fund.index[v_start_index].strftime("%Y-%m-%d")
+                valid_spot['start']['date'] = date_axis(fund).strings[v_start_index]
                 valid_spot['end']['index'] = v_stop_index
-                valid_spot['end']['date'] = fund.index[v_stop_index].strftime("%Y-%m-%d")
+                valid_spot['end']['date'] = date_axis(fund).strings[v_stop_index]
                 valid.append(valid_spot)
                 b_start_index = touch['index']
                 state = 'above'
@@ -204,9 +204,9 @@ def get_attribute_analysis(fund: pd.DataFrame, x_list: list, y_list: list, conte
                 b_stop_index = touch['index'] - 1 if touch['index'] != 0 else x_list[0]
                 broken_spot = {'start': {}, 'end': {}}
                 broken_spot['start']['index'] = b_start_index
-                broken_spot['start']['date'] = fund.index[b_start_index].strftime("%Y-%m-%d")
+                broken_spot['start']['date'] = date_axis(fund).strings[b_start_index]
                 broken_spot['end']['index'] = b_stop_index
-                broken_spot['end']['date'] = fund.index[b_stop_index].strftime("%Y-%m-%d")
+                broken_spot['end']['date'] = date_axis(fund).strings[b_stop_index]
                 broken.append(broken_spot)
                 v_start_index = touch['index']
                 state = 'below'
@@ -216,18 +216,18 @@ def get_attribute_analysis(fund: pd.DataFrame, x_list: list, y_list: list, conte
             v_stop_index = x_list[len(x_list)-1]
             valid_spot = {'start': {}, 'end': {}}
             valid_spot['start']['index'] = v_start_index
-            valid_spot['start']['date'] = fund.index[v_start_index].strftime("%Y-%m-%d")
+            valid_spot['start']['date'] = date_axis(fund).strings[v_start_index]
             valid_spot['end']['index'] = v_stop_index
-            valid_spot['end']['date'] = fund.index[v_stop_index].strftime("%Y-%m-%d")
+            valid_spot['end']['date'] = date_axis(fund).strings[v_stop_index]
             valid.append(valid_spot)
 
         else:
             b_stop_index = x_list[len(x_list)-1]
             broken_spot = {'start': {}, 'end': {}}
             broken_spot['start']['index'] = b_start_index
-            broken_spot['start']['date'] = fund.index[b_start_index].strftime("%Y-%m-%d")
+            broken_spot['start']['date'] = date_axis(fund).strings[b_start_index]
             broken_spot['end']['index'] = b_stop_index
-            broken_spot['end']['date'] = fund.index[b_stop_index].strftime("%Y-%m-%d")
+            broken_spot['end']['date'] = date_axis(fund).strings[b_stop_index]
             broken.append(broken_spot)
 
     content['valid_period'] = valid
@@ -0,0 +1,77 @@
+""" Sorted local extrema of a fund with range lookups """
+from typing import List, Tuple
+
+import numpy as np
+
+
+class ExtremaIndex():
+    """ExtremaIndex
+
+    Local minima and maxima of a fund (merged across all filter sizes), sorted and deduplicated by
+    x-index so that the points of any [start, end) window are found with a binary search.
+    """
+
+    def __init__(self, mins: Tuple[np.ndarray, np.ndarray], maxes: Tuple[np.ndarray, np.ndarray]):
+        self.mins_x, self.mins_y = mins
+        self.maxes_x, self.maxes_y = maxes
+
+    @classmethod
+    def from_reconstructed(cls, reconstructed: List[dict]):
+        """From Reconstructed
+
+        Arguments:
+            reconstructed {list} -- reconstructed extrema ({'min': [[x, y]], 'max': [[x, y]]}) of
+                                    each filter size; where an x-index repeats, the first point
+                                    seen is kept
+
+        Returns:
+            ExtremaIndex -- merged index of all of the extrema
+        """
+        mins = _merge([recon['min'] for recon in reconstructed])
+        maxes = _merge([recon['max'] for recon in reconstructed])
+        return cls(mins, maxes)
+
+    def minima(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Minima
+
+        Arguments:
+            start {int} -- first x-index of the window
+            end {int} -- x-index after the end of the window
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray] -- x, y of the minima within [start, end)
+        """
+        return _window(self.mins_x, self.mins_y, start, end)
+
+    def maxima(self, start: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Maxima
+
+        Arguments:
+            start {int} -- first x-index of the window
+            end {int} -- x-index after the end of the window
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray] -- x, y of the maxima within [start, end)
+        """
+        return _window(self.maxes_x, self.maxes_y, start, end)
+
+
+def _merge(point_lists: List[list]) -> Tuple[np.ndarray, np.ndarray]:
+    """ sorted, unique x (first point kept) and matching y of all [x, y] points """
+    points = [point for point_list in point_lists for point in point_list]
+    if len(points) == 0:
+        return np.array([], dtype=int), np.array([], dtype=float)
+
+    x_vals = np.array([point[0] for point in points], dtype=int)
+    y_vals = np.array([point[1] for point in points], dtype=float)
+    unique_x, first = np.unique(x_vals, return_index=True)
+    return unique_x, y_vals[first]
+
+
+def _window(x_vals: np.ndarray,
+            y_vals: np.ndarray,
+            start: int,
+            end: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ points of sorted x_vals within [start, end) """
+    left, right = np.searchsorted(x_vals, [start, end], side='left')
+    return x_vals[left:right], y_vals[left:right]
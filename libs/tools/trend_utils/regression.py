@@ -0,0 +1,150 @@
+""" Iterative-trim linear regression on running sums """
+from typing import Tuple
+
+import numpy as np
+
+# Passes over at most this many points refit from the points: the line runs (nearly) through them,
+# so which of them are strictly above / below it is decided by linregress's rounding
+EXACT_FIT_POINTS = 8
+# As do passes with a point this close to the line of the sums (relative to the values), where the
+# sums' rounding could put it on the other side
+NEAR_LINE = 1e-9
+
+
+def linear_fit(x_vals: np.ndarray, y_vals: np.ndarray) -> Tuple[float, float]:
+    """Linear Fit
+
+    Least-squares line (as linregress's slope, intercept) of a set of points
+
+    Arguments:
+        x_vals {np.ndarray} -- x values
+        y_vals {np.ndarray} -- y values
+
+    Returns:
+        Tuple[float, float] -- slope, intercept (nan, nan for fewer than 2 points)
+    """
+    return _centered_line(np.asarray(x_vals, dtype=float), np.asarray(y_vals, dtype=float))
+
+
+def trimmed_regression(x_vals: np.ndarray,
+                       y_vals: np.ndarray,
+                       keep: str = 'above',
+                       **kwargs) -> Tuple[float, float]:
+    """Trimmed Regression
+
+    Repeatedly fits a line and keeps only the points strictly 'above' (or 'below') it, as the
+    linregress / DataFrame loops did. Sums of the surviving points are carried between passes
+    (less whichever of the trimmed / surviving sets is smaller), so each pass is a single mask
+    over the points; the line returned is refit from its pass's points, as linregress fits it.
+    A pass left with a single point fits a nan line, as linregress does.
+
+    Arguments:
+        x_vals {np.ndarray} -- x values
+        y_vals {np.ndarray} -- y values
+
+    Keyword Arguments:
+        keep {str} -- 'above' or 'below'; side of the line the points must be to survive a pass
+                      (default: {'above'})
+
+    Optional Args:
+        min_points {int} -- passes continue while more points than this survive (default: {0})
+        max_passes {int} -- (default: {None}, unlimited)
+        slope_sign {int} -- passes continue only while each fit's slope has this sign, 1 or -1
+                            (default: {None})
+        final_fit {bool} -- True refits the points that survive the last pass; False returns the
+                            last pass's line (default: {False})
+
+    Returns:
+        Tuple[float, float] -- slope, intercept (nan, nan if never fit or fewer than 2 points)
+    """
+    # pylint: disable=too-many-locals
+    min_points = kwargs.get('min_points', 0)
+    max_passes = kwargs.get('max_passes')
+    slope_sign = kwargs.get('slope_sign')
+    final_fit = kwargs.get('final_fit', False)
+
+    x_vals = np.asarray(x_vals, dtype=float)
+    y_vals = np.asarray(y_vals, dtype=float)
+
+    # Sums of x shifted to the first point, to keep the squares small
+    origin = x_vals[0] if len(x_vals) > 0 else 0.0
+    shifted = x_vals - origin
+    sums = _sums(shifted, y_vals)
+
+    survivors = np.arange(len(x_vals))
+    fitted = None
+
+    passes = 0
+    while len(survivors) > min_points and (max_passes is None or passes < max_passes):
+        if len(survivors) > EXACT_FIT_POINTS:
+            line = _line_from_sums(sums, origin)
+            residuals = _residuals(x_vals[survivors], y_vals[survivors], line)
+            scale = NEAR_LINE * np.max(np.abs(y_vals[survivors]))
+        if len(survivors) <= EXACT_FIT_POINTS or np.any(np.abs(residuals) <= scale):
+            line = _centered_line(x_vals[survivors], y_vals[survivors])
+            residuals = _residuals(x_vals[survivors], y_vals[survivors], line)
+
+        fitted = survivors
+        passes += 1
+        if slope_sign is not None and not line[0] * slope_sign > 0.0:
+            break
+
+        kept = residuals > 0.0 if keep == 'above' else residuals < 0.0
+        if np.all(kept):
+            # Every later pass would be this one again
+            break
+
+        trimmed = survivors[~kept]
+        survivors = survivors[kept]
+        if len(trimmed) < len(survivors):
+            sums = sums - _sums(shifted[trimmed], y_vals[trimmed])
+        else:
+            sums = _sums(shifted[survivors], y_vals[survivors])
+
+    if final_fit:
+        fitted = survivors
+    if fitted is None:
+        return np.nan, np.nan
+    return _centered_line(x_vals[fitted], y_vals[fitted])
+
+
+def _residuals(x_vals: np.ndarray, y_vals: np.ndarray, line: Tuple[float, float]) -> np.ndarray:
+    """ y less the line (positive strictly above it) """
+    return y_vals - (line[0] * x_vals + line[1])
+
+
+def _sums(x_vals: np.ndarray, y_vals: np.ndarray) -> np.ndarray:
+    """ [n, sum x, sum y, sum x^2, sum xy] """
+    return np.array([
+        len(x_vals), np.sum(x_vals), np.sum(y_vals), np.dot(x_vals, x_vals), np.dot(x_vals, y_vals)
+    ], dtype=float)
+
+
+def _line_from_sums(sums: np.ndarray, origin: float) -> Tuple[float, float]:
+    """ slope, intercept of the points summed (x shifted by -origin) """
+    count, sum_x, sum_y, sum_xx, sum_xy = sums
+    if count < 2.0:
+        return np.nan, np.nan
+
+    ss_x = sum_xx - sum_x * sum_x / count
+    ss_xy = sum_xy - sum_x * sum_y / count
+    if ss_x == 0.0:
+        return np.nan, np.nan
+
+    slope = ss_xy / ss_x
+    intercept = sum_y / count - slope * (sum_x / count + origin)
+    return float(slope), float(intercept)
+
+
+def _centered_line(x_vals: np.ndarray, y_vals: np.ndarray) -> Tuple[float, float]:
+    """ slope, intercept from means and (co)variances, rounded as linregress rounds them """
+    if len(x_vals) < 2:
+        return np.nan, np.nan
+
+    ss_x, ss_xy = np.cov(x_vals, y_vals, bias=True).flat[:2]
+    if ss_x == 0.0:
+        return np.nan, np.nan
+
+    slope = ss_xy / ss_x
+    intercept = np.mean(y_vals) - slope * np.mean(x_vals)
+    return float(slope), float(intercept)
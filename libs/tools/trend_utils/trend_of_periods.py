@@ -4,20 +4,21 @@ from typing import Tuple
 
 import pandas as pd
 import numpy as np
-from scipy.stats import linregress
 
 from .trend_utils import line_extender, line_reducer
+from .regression import linear_fit, trimmed_regression
+from .extrema_index import ExtremaIndex
 
 
 def get_lines_from_period(fund: pd.DataFrame,
-                          mins_and_maxes: list,
+                          extrema: ExtremaIndex,
                           interval: int,
                           **kwargs) -> Tuple[list, list]:
     """Get Lines from Period
 
     Arguments:
         fund {pd.DataFrame} -- fund dataset
-        kargs {list} -- mins and maxes of x and y lists
+        extrema {ExtremaIndex} -- sorted mins and maxes of the fund
         interval {int} -- period of time for a look back of a trend
 
     Optional Args:
@@ -27,93 +28,32 @@ def get_lines_from_period(fund: pd.DataFrame,
     Returns:
         Tuple[list,list] -- list of trendlines given the period (x, y)
     """
-    # pylint: disable=too-many-locals,too-many-branches,too-many-statements,chained-comparison
+    # pylint: disable=too-many-locals,too-many-statements
     volatility = kwargs.get('vf', 0.06)
     extension = interval
     break_loop = 50
     cycles = int(np.floor(len(fund['Close']) / interval))
-    mins_y = mins_and_maxes[1]
-    mins_x = mins_and_maxes[0]
-    maxes_y = mins_and_maxes[3]
-    maxes_x = mins_and_maxes[2]
     set_of_x_lists = []
     set_of_y_lists = []
 
+    closes = fund['Close'].to_numpy(dtype=float)
+
     for cycle in range(cycles):
         start = cycle * interval
         end = start + interval
-        data = fund['Close'][start:end].copy()
 
-        reg = linregress(x=list(range(start, end)), y=data)
-        use_min = False
+        reg = linear_fit(np.arange(start, end), closes[start:end])
         if reg[0] >= 0:
-            use_min = True
-
-        count = 0
-        st_count = count
-        if use_min:
-            while (count < len(mins_x)) and (mins_x[count] < start):
-                count += 1
-                st_count = count
-
-            end_count = st_count
-            while (count < len(mins_x)) and (mins_x[count] < end):
-                count += 1
-                end_count = count
-
-            data_y = mins_y[st_count:end_count].copy()
-            data_x = mins_x[st_count:end_count].copy()
-            data_z = {}
-            data_z['x'] = data_x
-            data_z['y'] = data_y
-
-            data_w = pd.DataFrame.from_dict(data_z)
-            data_w.set_index('x')
-            data_v = data_w.copy()
-
-            stop_loop = 0
-            while len(data_w['x']) > 0 and reg[0] > 0.0 and stop_loop < break_loop:
-                reg = linregress(x=data_w['x'], y=data_w['y'])
-                data_v = data_w.copy()
-                data_w = data_w.loc[data_w['y'] < reg[0] * data_w['x'] + reg[1]]
-                stop_loop += 1
-
-            if reg[0] < 0.0:
-                data_w = data_v.copy()
-                if len(data_w) >= 2:
-                    reg = linregress(x=data_w['x'], y=data_w['y'])
-
+            # Rising: fit the lows, trimming to those below the line while it still rises
+            data_x, data_y = extrema.minima(start, end)
+            keep, slope_sign = 'below', 1
         else:
-            while (count < len(maxes_x)) and (maxes_x[count] < start):
-                count += 1
-                st_count = count
-
-            end_count = st_count
-            while (count < len(maxes_x)) and (maxes_x[count] < end):
-                count += 1
-                end_count = count
-
-            data_y = maxes_y[st_count:end_count].copy()
-            data_x = maxes_x[st_count:end_count].copy()
-            data_z = {}
-            data_z['x'] = data_x
-            data_z['y'] = data_y
-
-            data_w = pd.DataFrame.from_dict(data_z)
-            data_w.set_index('x')
-            data_v = data_w.copy()
-
-            stop_loop = 0
-            while len(data_w['x']) > 0 and reg[0] < 0.0 and stop_loop < break_loop:
-                reg = linregress(x=data_w['x'], y=data_w['y'])
-                data_v = data_w.copy()
-                data_w = data_w.loc[data_w['y'] > reg[0] * data_w['x'] + reg[1]]
-                stop_loop += 1
-
-            if reg[0] > 0.0:
-                data_w = data_v.copy()
-                if len(data_w) >= 2:
-                    reg = linregress(x=data_w['x'], y=data_w['y'])
+            data_x, data_y = extrema.maxima(start, end)
+            keep, slope_sign = 'above', -1
+
+        if len(data_x) > 0 and reg[0] * slope_sign > 0.0:
+            reg = trimmed_regression(
+                data_x, data_y, keep=keep, slope_sign=slope_sign, max_passes=break_loop)
 
         end = line_extender(fund, list(range(start, end)), reg)
         if end != 0:
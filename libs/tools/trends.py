@@ -1,19 +1,20 @@
 """ trends """
 import os
 import warnings
-import json
 from typing import Union
 
 import pandas as pd
 import numpy as np
-from scipy.stats import linregress
 
-from libs.utils import generate_plot, PlotType, dates_convert_from_index, INDEXES, STANDARD_COLORS
+from libs.utils import (
+    generate_plot, PlotType, dates_convert_from_index, INDEXES, STANDARD_COLORS, get_resources
+)
 from libs.features import find_filtered_local_extrema, reconstruct_extrema, remove_duplicates
 
 from .moving_average import windowed_moving_avg
 from .trend_utils import (
-    get_lines_from_period, generate_analysis, filter_nearest_to_signal, consolidate_lines
+    get_lines_from_period, generate_analysis, filter_nearest_to_signal, consolidate_lines,
+    trimmed_regression, ExtremaIndex
 )
 
 WARNING = STANDARD_COLORS["warning"]
@@ -57,11 +58,6 @@ def get_trend_lines(fund: pd.DataFrame, **kwargs) -> dict:
     warnings.filterwarnings("ignore", category=RuntimeWarning)
 
     trends = {}
-    mins_y = []
-    mins_x = []
-    maxes_y = []
-    maxes_x = []
-    all_x = []
 
     volatility = 0.06
     if meta is not None:
@@ -70,46 +66,8 @@ def get_trend_lines(fund: pd.DataFrame, **kwargs) -> dict:
             volatility = vol / 100.0
 
     increment = 0.7 / (float(len(interval)) * 3)
-    for i, period in enumerate(interval):
-        ma_size = period
-
-        # ma = windowed_ma_list(fund['Close'], interval=ma_size)
-        weight_strength = 2.0 + (0.1 * float(i))
-        wma = windowed_moving_avg(fund['Close'], ma_size, weight_strength=weight_strength,
-                                 data_type='list', filter_type='exponential')
-        ex = find_filtered_local_extrema(wma)
-        recon = reconstruct_extrema(
-            fund, extrema=ex, ma_size=ma_size, ma_type='windowed')
-
-        # Cleanse data sample for duplicates and errors
-        recon = remove_duplicates(recon, method='point')
-
-        for y_list in recon['min']:
-            if y_list[0] not in mins_x:
-                mins_x.append(y_list[0])
-                mins_y.append(y_list[1])
-            if y_list[0] not in all_x:
-                all_x.append(y_list[0])
-
-        for y_list in recon['max']:
-            if y_list[0] not in maxes_x:
-                maxes_x.append(y_list[0])
-                maxes_y.append(y_list[1])
-            if y_list[0] not in all_x:
-                all_x.append(y_list[0])
-
-        if progress_bar is not None:
-            progress_bar.uptick(increment=increment)
-
-    zipped_min = list(zip(mins_x, mins_y))
-    zipped_min.sort(key=lambda x: x[0])
-    mins_x = [x[0] for x in zipped_min]
-    mins_y = [y[1] for y in zipped_min]
-
-    zipped_max = list(zip(maxes_x, maxes_y))
-    zipped_max.sort(key=lambda x: x[0])
-    maxes_x = [x[0] for x in zipped_max]
-    maxes_y = [y[1] for y in zipped_max]
+    extrema = get_extrema_index(
+        fund, interval=interval, progress_bar=progress_bar, increment=increment)
 
     long_term = trend_window[0]
     intermediate_term = trend_window[1]
@@ -117,13 +75,13 @@ def get_trend_lines(fund: pd.DataFrame, **kwargs) -> dict:
     near_term = trend_window[3]
 
     x_list_0, y_list_0 = get_lines_from_period(
-        fund, [mins_x, mins_y, maxes_x, maxes_y, all_x], interval=long_term, vf=volatility)
+        fund, extrema, interval=long_term, vf=volatility)
     x_list_1, y_list_1 = get_lines_from_period(
-        fund, [mins_x, mins_y, maxes_x, maxes_y, all_x], interval=intermediate_term, vf=volatility)
+        fund, extrema, interval=intermediate_term, vf=volatility)
     x_list_2, y_list_2 = get_lines_from_period(
-        fund, [mins_x, mins_y, maxes_x, maxes_y, all_x], interval=short_term, vf=volatility)
+        fund, extrema, interval=short_term, vf=volatility)
     x_list_3, y_list_3 = get_lines_from_period(
-        fund, [mins_x, mins_y, maxes_x, maxes_y, all_x], interval=near_term, vf=volatility)
+        fund, extrema, interval=near_term, vf=volatility)
 
     if progress_bar is not None:
         progress_bar.uptick(increment=increment*4.0)
@@ -215,6 +173,45 @@ def get_trend_lines(fund: pd.DataFrame, **kwargs) -> dict:
 #############################################################
 
 
+def get_extrema_index(fund: pd.DataFrame, **kwargs) -> ExtremaIndex:
+    """Get Extrema Index
+
+    Local mins and maxes of the windowed-filtered closes of each filter size, merged into one
+    sorted index for the trendline windows to query
+
+    Arguments:
+        fund {pd.DataFrame} -- fund historical data
+
+    Optional Args:
+        interval {list} -- list of windowed filter time periods (default: {[4, 8, 16, 32]})
+        progress_bar {ProgressBar} -- (default: {None})
+        increment {float} -- progress bar uptick per filter size (default: {0.0})
+
+    Returns:
+        ExtremaIndex -- sorted, deduplicated mins and maxes of the fund
+    """
+    interval = kwargs.get('interval', [4, 8, 16, 32])
+    progress_bar = kwargs.get('progress_bar', None)
+    increment = kwargs.get('increment', 0.0)
+
+    reconstructed = []
+    for i, ma_size in enumerate(interval):
+        weight_strength = 2.0 + (0.1 * float(i))
+        wma = windowed_moving_avg(fund['Close'], ma_size, weight_strength=weight_strength,
+                                  data_type='list', filter_type='exponential')
+        ex = find_filtered_local_extrema(wma)
+        recon = reconstruct_extrema(
+            fund, extrema=ex, ma_size=ma_size, ma_type='windowed')
+
+        # Cleanse data sample for duplicates and errors
+        reconstructed.append(remove_duplicates(recon, method='point'))
+
+        if progress_bar is not None:
+            progress_bar.uptick(increment=increment)
+
+    return ExtremaIndex.from_reconstructed(reconstructed)
+
+
 def trend_simple_forecast(trend: dict,
                           future_periods: Union[list, None] = None,
                           return_type='price',
@@ -295,18 +292,14 @@ def auto_trend(data, **kwargs) -> list:
     trend = [0.0] * len(data)
 
     try:
+        values = np.asarray(data, dtype=float)
         periods = [int(period) for period in periods]
         for j, period in enumerate(periods):
             trends = [0.0] * period
 
-            # X range will always be the same for any given period
-            x_period_list = list(range(period))
-            for i in range(period, len(data)):
-                y_list = data[i-period:i].copy()
-                reg = linregress(x_period_list, y_list)
-
-                if return_type == 'slope':
-                    trends.append(reg[0])
+            # Slope of the 'period' points before each point
+            if return_type == 'slope' and len(values) > period:
+                trends.extend(rolling_slopes(values, period)[:-1].tolist())
 
             weight = 1.0
             if j < len(weights):
@@ -329,6 +322,23 @@ def auto_trend(data, **kwargs) -> list:
     return trend
 
 
+def rolling_slopes(values: np.ndarray, period: int) -> np.ndarray:
+    """Rolling Slopes
+
+    Least squares slope (as linregress's) of every window of 'period' consecutive values
+
+    Arguments:
+        values {np.ndarray} -- signal
+        period {int} -- window size
+
+    Returns:
+        np.ndarray -- slope of each window, by window start (len(values) - period + 1)
+    """
+    x_dev = np.arange(period, dtype=float) - (period - 1) / 2.0
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    return (windows @ x_dev) / np.dot(x_dev, x_dev)
+
+
 ######################################################
 DIVISORS = [1, 2, 4, 8]
 
@@ -357,20 +367,15 @@ def get_trend_lines_regression(signal: list, **kwargs) -> dict:
     """
     # pylint: disable=too-many-locals,too-many-branches,too-many-statements
     divisors = DIVISORS
-    config_path = os.path.join("resources", "config.json")
-    if os.path.exists(config_path):
-        with open(config_path, 'r', encoding='utf-8') as cpf:
-            c_data = json.load(cpf)
-            cpf.close()
-
-        ranges = c_data.get('trendlines', {}).get(
-            'divisors', {}).get('ranges', [])
+    trend_config = get_resources().trendline_divisors
+    if trend_config is not None:
+        ranges = trend_config.get('ranges', [])
         ranged = 0
         for range_val in ranges:
             if len(signal) > range_val:
                 ranged += 1
 
-        divs = c_data.get('trendlines', {}).get('divisors', {}).get('divisors')
+        divs = trend_config.get('divisors')
         if divs is not None:
             if len(divs) > ranged:
                 divisors = divs[ranged]
@@ -384,6 +389,8 @@ def get_trend_lines_regression(signal: list, **kwargs) -> dict:
     views = kwargs.get('views', '')
 
     indexes = list(range(len(signal)))
+    x_vals = np.arange(len(signal), dtype=float)
+    values = np.asarray(signal, dtype=float)
 
     if iterations > len(DIVISORS):
         iterations = len(DIVISORS)
@@ -402,26 +409,10 @@ def get_trend_lines_regression(signal: list, **kwargs) -> dict:
         period = int(len(signal) / div)
         for i in range(div):
             for k in range(2):
-                data = {}
-                if i == div-1:
-                    data['value'] = signal[period*i: len(signal)].copy()
-                    data['x'] = indexes[period*i: len(signal)].copy()
-                else:
-                    data['value'] = signal[period*i: period*(i+1)].copy()
-                    data['x'] = indexes[period*i: period*(i+1)].copy()
-
-                data = pd.DataFrame.from_dict(data)
-
-                while len(data['x']) > 4:
-                    reg = linregress(data['x'], data['value'])
-                    if k == 0:
-                        data = data.loc[data['value'] >
-                                        reg[0] * data['x'] + reg[1]]
-                    else:
-                        data = data.loc[data['value'] <
-                                        reg[0] * data['x'] + reg[1]]
-
-                reg = linregress(data['x'], data['value'])
+                end = len(signal) if i == div-1 else period*(i+1)
+                reg = trimmed_regression(
+                    x_vals[period*i: end], values[period*i: end],
+                    keep='above' if k == 0 else 'below', min_points=4, final_fit=True)
                 content = {'slope': reg[0], 'intercept': reg[1]}
                 content['angle'] = np.arctan(
                     reg[0] * scale_change) / np.pi * 180.0
@@ -429,9 +420,7 @@ def get_trend_lines_regression(signal: list, **kwargs) -> dict:
                     content['angle'] = 180.0 + \
                         (np.arctan(reg[0] * scale_change) / np.pi * 180.0)
 
-                line = []
-                for ind in indexes:
-                    line.append(reg[0] * ind + reg[1])
+                line = (reg[0] * x_vals + reg[1]).tolist()
 
                 x_line = indexes.copy()
 
@@ -449,22 +438,9 @@ def get_trend_lines_regression(signal: list, **kwargs) -> dict:
 
         for i in range(period, len(signal), 2):
             for k in range(2):
-                data = {}
-                data['value'] = signal[i-period: i].copy()
-                data['x'] = indexes[i-period: i].copy()
-
-                data = pd.DataFrame.from_dict(data)
-
-                while len(data['x']) > 4:
-                    reg = linregress(data['x'], data['value'])
-                    if k == 0:
-                        data = data.loc[data['value'] >
-                                        reg[0] * data['x'] + reg[1]]
-                    else:
-                        data = data.loc[data['value'] <
-                                        reg[0] * data['x'] + reg[1]]
-
-                reg = linregress(data['x'], data['value'])
+                reg = trimmed_regression(
+                    x_vals[i-period: i], values[i-period: i],
+                    keep='above' if k == 0 else 'below', min_points=4, final_fit=True)
                 content = {'slope': reg[0], 'intercept': reg[1]}
                 content['angle'] = np.arctan(
                     reg[0] * scale_change) / np.pi * 180.0
@@ -472,9 +448,7 @@ def get_trend_lines_regression(signal: list, **kwargs) -> dict:
                     content['angle'] = 180.0 + \
                         (np.arctan(reg[0] * scale_change) / np.pi * 180.0)
 
-                line = []
-                for ind in indexes:
-                    line.append(reg[0] * ind + reg[1])
+                line = (reg[0] * x_vals + reg[1]).tolist()
 
                 x_line = indexes.copy()
 
@@ -6,7 +6,7 @@ import pandas as pd
 import numpy as np
 
 from libs.utils import (
-    generate_plot, PlotType, dates_extractor_list, date_extractor,
+    generate_plot, PlotType, dates_extractor_list, date_axis,
     INDEXES, api_sector_match, api_sector_funds
 )
 
@@ -28,18 +28,156 @@ def normalized_ratio(fund_a: Union[dict, pd.DataFrame], fund_b: Union[dict, pd.D
     Returns:
         list -- normalized ratio list of A/B
     """
-    ratio = []
     if data_type == 'dataframe':
-        divisor = np.round(fund_a[key][0] / fund_b[key][0], 6)
-        for i, close in enumerate(fund_a[key]):
-            ratio.append(np.round((close / fund_b[key][i] / divisor) - 1.0, 6))
+        fund_a = fund_a[key]
+        fund_b = fund_b[key]
+    elif data_type != 'list':
+        return []
 
-    elif data_type == 'list':
-        divisor = np.round(fund_a[0] / fund_b[0], 6)
-        for i, close in enumerate(fund_a):
-            ratio.append(np.round((close / fund_b[i] / divisor) - 1.0, 6))
+    fund_a = np.asarray(fund_a, dtype=float)
+    fund_b = np.asarray(fund_b, dtype=float)[:len(fund_a)]
+    return normalized_ratios(fund_a[np.newaxis], fund_b[np.newaxis])[0, 0].tolist()
 
-    return ratio
+
+def normalized_ratios(funds: np.ndarray, benchmarks: np.ndarray) -> np.ndarray:
+    """Normalized Ratios
+
+    Every fund vs. every benchmark, each ratio normalized to 0.0 at the first period
+
+    Arguments:
+        funds {np.ndarray} -- N funds (N x T)
+        benchmarks {np.ndarray} -- M benchmarks (M x T)
+
+    Returns:
+        np.ndarray -- normalized ratios of each fund to each benchmark (N x M x T)
+    """
+    funds = np.asarray(funds, dtype=float)[:, np.newaxis, :]
+    benchmarks = np.asarray(benchmarks, dtype=float)[np.newaxis, :, :]
+
+    divisor = np.round(funds[..., :1] / benchmarks[..., :1], 6)
+    return np.round((funds / benchmarks / divisor) - 1.0, 6)
+
+
+def period_strengths(funds: np.ndarray, benchmarks: np.ndarray, periods: list) -> dict:
+    """Period Strengths
+
+    Normalized ratio statistics of every fund vs. every benchmark over the last 'period' periods
+    (ratios normalized at the start of each period)
+
+    Arguments:
+        funds {np.ndarray} -- N funds (N x T)
+        benchmarks {list} -- M benchmarks (arrays of any length), aligned to the funds by their ends
+        periods {list} -- P lookback periods
+
+    Returns:
+        dict -- 'avg', 'stdev', 'min', 'max', and 'current' ratio (each N x M x P)
+    """
+    funds = np.asarray(funds, dtype=float)
+
+    stats = {key: [] for key in ('avg', 'stdev', 'min', 'max', 'current')}
+    for period in periods:
+        fund_window = funds[:, funds.shape[1]-period:]
+        bench_window = np.array([
+            bench[len(bench)-period:][:fund_window.shape[1]] for bench in benchmarks
+        ])
+        ratios = normalized_ratios(fund_window, bench_window)
+
+        stats['avg'].append(np.round(np.mean(ratios, axis=-1), 6))
+        stats['stdev'].append(np.round(np.std(ratios, axis=-1), 6))
+        stats['min'].append(np.min(ratios, axis=-1))
+        stats['max'].append(np.max(ratios, axis=-1))
+        stats['current'].append(ratios[..., -1])
+
+    return {key: np.stack(values, axis=-1) for key, values in stats.items()}
+
+
+def relative_strength_matrix(full_data_dict: dict,
+                             fund_names: list,
+                             benchmark_names: list,
+                             **kwargs) -> dict:
+    """Relative Strength Matrix
+
+    Normalized ratios and period strengths of many funds against many benchmarks at once (e.g.
+    all run tickers vs. S&P500, sector funds, and comparison funds). Results of one fund vs. one
+    benchmark are the [fund, benchmark] slices.
+
+    Arguments:
+        full_data_dict {dict} -- all retrieved funds by fund name (funds of equal length)
+        fund_names {list} -- N funds
+        benchmark_names {list} -- M benchmarks
+
+    Optional Args:
+        periods {list} -- lookback periods of period strength (default: {[20, 50, 100]})
+        key {str} -- column key (default: {'Adj Close'})
+
+    Returns:
+        dict -- 'tabular' ratios (N x M x T), 'period' strengths (each N x M x P), 'funds',
+                'benchmarks', and 'periods'
+    """
+    periods = kwargs.get('periods', [20, 50, 100])
+    key = kwargs.get('key', 'Adj Close')
+
+    funds = np.array([full_data_dict[name][key].to_numpy(dtype=float) for name in fund_names])
+    benchmarks = [full_data_dict[name][key].to_numpy(dtype=float) for name in benchmark_names]
+
+    return {
+        'tabular': normalized_ratios(
+            funds, np.array([bench[:funds.shape[1]] for bench in benchmarks])),
+        'period': period_strengths(funds, benchmarks, periods),
+        'funds': list(fund_names),
+        'benchmarks': list(benchmark_names),
+        'periods': list(periods)
+    }
+
+
+def relative_strength_matrices(full_data_dict: dict,
+                               fund_names: list,
+                               benchmark_names: list,
+                               **kwargs) -> dict:
+    """Relative Strength Matrices
+
+    relative_strength_matrix of funds of any lengths: funds of the same length are computed as
+    one matrix. Funds longer than a benchmark (or missing) are left out.
+
+    Arguments:
+        full_data_dict {dict} -- all retrieved funds by fund name
+        fund_names {list} -- funds
+        benchmark_names {list} -- benchmarks
+
+    Optional Args:
+        periods {list} -- lookback periods of period strength (default: {[20, 50, 100]})
+        key {str} -- column key (default: {'Adj Close'})
+
+    Returns:
+        dict -- the relative_strength_matrix content of each fund, by fund name
+    """
+    key = kwargs.get('key', 'Adj Close')
+    benchmark_names = [name for name in benchmark_names if full_data_dict.get(name) is not None]
+    if len(benchmark_names) == 0:
+        return {}
+    max_length = min(len(full_data_dict[name][key]) for name in benchmark_names)
+
+    groups = {}
+    for name in fund_names:
+        if full_data_dict.get(name) is not None and len(full_data_dict[name][key]) <= max_length:
+            groups.setdefault(len(full_data_dict[name][key]), []).append(name)
+
+    matrices = {}
+    for names in groups.values():
+        matrix = relative_strength_matrix(full_data_dict, names, benchmark_names, **kwargs)
+        matrices.update({name: matrix for name in names})
+    return matrices
+
+
+def _matrix_index(strength_matrix: Union[dict, None],
+                  fund_name: str,
+                  bench_name: str) -> Union[Tuple[int, int], None]:
+    """ [fund, benchmark] index of a relative_strength_matrix, if it has both """
+    if strength_matrix is None or fund_name not in strength_matrix['funds'] or \
+            bench_name not in strength_matrix['benchmarks']:
+        return None
+    return (strength_matrix['funds'].index(fund_name),
+            strength_matrix['benchmarks'].index(bench_name))
 
 
 def period_strength(fund_name: str, tickers: dict, periods: list, **kwargs) -> list:
@@ -56,6 +194,8 @@ def period_strength(fund_name: str, tickers: dict, periods: list, **kwargs) -> l
     Optional Args:
         sector {str} -- name of sector, 'VGT' for Tech, for example (default: {''})
         sector_data {pd.DataFrame} -- data of sector (default: {None})
+        strength_matrix {dict} -- relative_strength_matrix of the fund; strengths vs. S&P500 are
+                                  taken from it (default: {None})
 
     Returns:
         list -- list of ratio data objects
@@ -63,63 +203,48 @@ def period_strength(fund_name: str, tickers: dict, periods: list, **kwargs) -> l
     # pylint: disable=too-many-locals
     sector = kwargs.get('sector', '')
     sector_data = kwargs.get('sector_data')
+    strength_matrix = kwargs.get('strength_matrix')
 
-    ratio = []
-    has_sp = False
-    has_sector = False
-
+    benchmarks = {}
     sp_500_data = get_sp_500_df(tickers)
     if sp_500_data is not None:
-        has_sp = True
-    if sector != '':
-        if sector_data is not None:
-            sec = sector_data
-            has_sector = True
+        benchmarks['sp500'] = sp_500_data
+    if sector != '' and sector_data is not None:
+        benchmarks['sector'] = sector_data
 
     fund = tickers[fund_name]
-    for period in periods:
+
+    # Strengths of each benchmark (stat -> value of each period)
+    strengths = {}
+    index = _matrix_index(strength_matrix, fund_name, '^GSPC')
+    if 'sp500' in benchmarks and index is not None and \
+            strength_matrix['periods'] == list(periods):
+        strengths['sp500'] = {
+            stat: values[index] for stat, values in strength_matrix['period'].items()}
+
+    remaining = [bench for bench in benchmarks if bench not in strengths]
+    if len(remaining) > 0:
+        computed = period_strengths(
+            fund['Adj Close'].to_numpy(dtype=float)[np.newaxis],
+            [benchmarks[bench]['Adj Close'].to_numpy(dtype=float) for bench in remaining],
+            periods)
+        for i, bench in enumerate(remaining):
+            strengths[bench] = {stat: values[0, i] for stat, values in computed.items()}
+
+    ratio = []
+    for j, period in enumerate(periods):
         entry = {}
         entry['period'] = period
-        entry['dates'] = date_extractor(fund.index[len(fund.index)-period], _format='str') + \
+        entry['dates'] = date_axis(fund).strings[len(fund.index)-period] + \
             " : " + \
-            date_extractor(fund.index[len(fund.index)-1], _format='str')
+            date_axis(fund).strings[len(fund.index)-1]
 
-        if has_sp:
-            entry['sp500'] = {}
-
-            sp_temp = list(sp_500_data['Adj Close'])
-            sp_temp = sp_temp[len(
-                sp_temp)-period:len(sp_temp)+1]
-
-            f_temp = list(fund['Adj Close'])
-            f_temp = f_temp[len(f_temp)-period:len(f_temp)+1]
-
-            rat = normalized_ratio(f_temp, sp_temp, data_type='list')
-
-            entry['sp500']['avg'] = np.round(np.mean(rat), 6)
-            entry['sp500']['stdev'] = np.round(np.std(rat), 6)
-            entry['sp500']['min'] = np.min(rat)
-            entry['sp500']['max'] = np.max(rat)
-            entry['sp500']['current'] = rat[-1]
-
-        if has_sector:
-            entry['sector'] = {}
-            entry['sector']['name'] = sector
-
-            sp_temp = list(sec['Adj Close'])
-            sp_temp = sp_temp[len(
-                sp_temp)-period:len(sp_temp)+1]
-
-            f_temp = list(fund['Adj Close'])
-            f_temp = f_temp[len(f_temp)-period:len(f_temp)+1]
-
-            rat = normalized_ratio(f_temp, sp_temp, data_type='list')
-
-            entry['sector']['avg'] = np.round(np.mean(rat), 6)
-            entry['sector']['stdev'] = np.round(np.std(rat), 6)
-            entry['sector']['min'] = np.min(rat)
-            entry['sector']['max'] = np.max(rat)
-            entry['sector']['current'] = rat[-1]
+        for bench in benchmarks:
+            entry[bench] = {}
+            if bench == 'sector':
+                entry[bench]['name'] = sector
+            for stat, values in strengths[bench].items():
+                entry[bench][stat] = values[j]
 
         ratio.append(entry)
 
@@ -161,6 +286,9 @@ def relative_strength(primary_name: str, full_data_dict: dict,
         plot_output {bool} -- True to render plot in realtime (default: {True})
         progress_bar {ProgressBar} -- (default: {None})
         view {str} -- Directory of plots (default: {''})
+        strength_matrix {dict} -- relative_strength_matrix of the primary fund (e.g. of
+                                  relative_strength_matrices); comparisons in it are taken from
+                                  it rather than recomputed (default: {None})
 
     Returns:
         list -- dict containing all relative strength information, sector match data
@@ -174,6 +302,7 @@ def relative_strength(primary_name: str, full_data_dict: dict,
     meta = kwargs.get('meta', None)
     sector_data = kwargs.get('sector_data', {})
     view = kwargs.get('view', '')
+    strength_matrix = kwargs.get('strength_matrix')
 
     period = kwargs.get('period', '2y')
     interval = kwargs.get('interval', '1d')
@@ -222,39 +351,60 @@ def relative_strength(primary_name: str, full_data_dict: dict,
         if content is None:
             sector_data[key] = comp_data[key]
 
+    # Comparisons of the primary fund: slices of the strength matrix where it has them (the same
+    # data), the rest rows of one broadcast ratio computation
+    benchmarks = []
     sp_500_data = get_sp_500_df(full_data_dict)
     if sp_500_data is not None:
-        rat_sp = normalized_ratio(full_data_dict[primary_name], sp_500_data)
-    if progress_bar is not None:
-        progress_bar.uptick(increment=0.1)
-
+        benchmarks.append(('market', '^GSPC', sp_500_data))
     if len(sector_data) > 0:
-        rat_sector = normalized_ratio(
-            full_data_dict[primary_name], sector_data[sector])
-    if progress_bar is not None:
-        progress_bar.uptick(increment=0.1)
+        benchmarks.append(('sector', sector, sector_data[sector]))
 
     if len(secondary_fund_names) > 0:
         for sfund in secondary_fund_names:
             if full_data_dict.get(sfund) is not None:
-                rat_secondaries.append(normalized_ratio(
-                    full_data_dict[primary_name], full_data_dict[sfund]))
+                benchmarks.append(('secondary', sfund, full_data_dict[sfund]))
                 secondary_names.append(sfund)
 
             elif sector_data.get(sfund) is not None:
-                rat_secondaries.append(normalized_ratio(
-                    full_data_dict[primary_name], sector_data[sfund]))
+                benchmarks.append(('secondary', sfund, sector_data[sfund]))
                 secondary_names.append(sfund)
 
+    if len(benchmarks) > 0:
+        ratios = [None] * len(benchmarks)
+        for i, (_, name, bench) in enumerate(benchmarks):
+            index = _matrix_index(strength_matrix, primary_name, name)
+            if index is not None and full_data_dict.get(name) is bench:
+                ratios[i] = strength_matrix['tabular'][index]
+
+        remaining = [i for i, ratio in enumerate(ratios) if ratio is None]
+        if len(remaining) > 0:
+            primary = full_data_dict[primary_name]['Adj Close'].to_numpy(dtype=float)
+            computed = normalized_ratios(
+                primary[np.newaxis],
+                np.array([benchmarks[i][2]['Adj Close'].to_numpy(dtype=float)[:len(primary)]
+                          for i in remaining]))[0]
+            for i, ratio in zip(remaining, computed):
+                ratios[i] = ratio
+
+        for i, (comparison, _, _) in enumerate(benchmarks):
+            if comparison == 'market':
+                rat_sp = ratios[i].tolist()
+            elif comparison == 'sector':
+                rat_sector = ratios[i].tolist()
+            else:
+                rat_secondaries.append(ratios[i].tolist())
+
     if progress_bar is not None:
-        progress_bar.uptick(increment=0.2)
+        progress_bar.uptick(increment=0.4)
 
     p_strength = period_strength(primary_name,
                                 full_data_dict,
                                 config=config,
                                 periods=[20, 50, 100],
                                 sector=sector,
-                                sector_data=sector_data.get(sector, None))
+                                sector_data=sector_data.get(sector, None),
+                                strength_matrix=strength_matrix)
 
     r_strength['market'] = {'tabular': rat_sp, 'comparison': 'S&P500'}
     r_strength['sector'] = {'tabular': rat_sector, 'comparison': sector}
@@ -5,7 +5,7 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from libs.utils import date_extractor, INDEXES, PlotType, generate_plot
+from libs.utils import date_axis, INDEXES, PlotType, generate_plot
 from libs.features import normalize_signals
 
 from .math_functions import lower_low, higher_high, bull_bear_th
@@ -198,8 +198,7 @@ def find_ult_osc_features(position: pd.DataFrame, ultimate: dict, **kwargs) -> l
                     if start_ind is not None:
                         trigger.append([
                             "BULLISH",
-                            date_extractor(
-                                position.index[start_ind], _format='str'),
+                            date_axis(position).strings[start_ind],
                             position['Close'][start_ind],
                             start_ind,
                             "divergence (original)"
@@ -224,8 +223,7 @@ def find_ult_osc_features(position: pd.DataFrame, ultimate: dict, **kwargs) -> l
                     if start_ind is not None:
                         trigger.append([
                             "BEARISH",
-                            date_extractor(
-                                position.index[start_ind], _format='str'),
+                            date_axis(position).strings[start_ind],
                             position['Close'][start_ind],
                             start_ind,
                             "divergence (original)"
@@ -279,7 +277,7 @@ def find_ult_osc_features(position: pd.DataFrame, ultimate: dict, **kwargs) -> l
                     if start_ind:
                         trigger.append([
                             "BULLISH",
-                            date_extractor(position.index[start_ind], _format='str'),
+                            date_axis(position).strings[start_ind],
                             position['Close'][start_ind],
                             start_ind,
                             "divergence"
@@ -334,7 +332,7 @@ def find_ult_osc_features(position: pd.DataFrame, ultimate: dict, **kwargs) -> l
                     if start_ind:
                         trigger.append([
                             "BEARISH",
-                            date_extractor(position.index[start_ind], _format='str'),
+                            date_axis(position).strings[start_ind],
                             position['Close'][start_ind],
                             start_ind,
                             "divergence"
@@ -7,6 +7,7 @@ in saved form. Can be used later with more complex ML or analytical tools.
 
 import json
 import os
+from collections.abc import Sequence
 
 
 def metadata_copy(data: dict) -> dict:
@@ -29,6 +30,22 @@ def metadata_copy(data: dict) -> dict:
     return meta
 
 
+def serialize_views(obj):
+    """Serialize Views
+
+    json 'default' hook for list-like views (e.g. lazily built candlestick classifications)
+
+    Arguments:
+        obj {any} -- object json could not serialize
+
+    Returns:
+        list -- materialized contents of the view
+    """
+    if isinstance(obj, Sequence):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def output_to_json(data: dict, config: dict, exclude_tabular: bool = True):
     """Output to JSON
 
@@ -56,9 +73,9 @@ def output_to_json(data: dict, config: dict, exclude_tabular: bool = True):
             for key in meta[fund_name]:
                 print(f"JSON testing {fund_name}: {key}")
                 with open(f'output/temp/__{fund_name}_{key}.json', 'w', encoding='utf-8') as dump_f:
-                    json.dump(meta, dump_f)
+                    json.dump(meta, dump_f, default=serialize_views)
 
     with open(filename, 'w', encoding='utf-8') as dump_f:
-        json.dump(meta, dump_f)
+        json.dump(meta, dump_f, default=serialize_views)
 
     print('\r\nJSON output complete.')
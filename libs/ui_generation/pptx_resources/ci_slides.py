@@ -1,9 +1,9 @@
 """ Composite Index Slide Content"""
-import os
-
 from pptx.presentation import Presentation
 from pptx.util import Inches, Pt
 
+from libs.utils import render_stream
+
 from .slide_utils import slide_title_header
 
 
@@ -18,8 +18,6 @@ BLANK_SLIDE = 6
 CONTENT_W_CAPTION_SLIDE = 7
 PICTURE_W_CAPTION_SLIDE = 8
 
-TEMP_DIR = os.path.join("output", "temp")
-
 NUM_BOND_INDEXES = 3
 
 
@@ -34,8 +32,8 @@ def make_mci_slides(prs: Presentation, analysis: dict) -> Presentation:
         pptx-object -- modified pptx object
     """
     # pylint: disable=too-many-locals,too-many-statements
-    content = os.path.join(TEMP_DIR, "MCI.png")
-    if os.path.exists(content):
+    content = render_stream("MCI.png")
+    if content is not None:
         slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
         slide = slide_title_header(slide, 'Market Composite Index')
 
@@ -46,8 +44,8 @@ def make_mci_slides(prs: Presentation, analysis: dict) -> Presentation:
         slide.shapes.add_picture(
             content, left, top, height=height, width=width)
 
-    content = os.path.join(TEMP_DIR, "MCI_correlations.png")
-    if os.path.exists(content):
+    content = render_stream("MCI_correlations.png")
+    if content is not None:
         slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
         slide = slide_title_header(slide, 'Market Composite Index')
 
@@ -119,8 +117,8 @@ def make_mci_slides(prs: Presentation, analysis: dict) -> Presentation:
                 table.cell(i+2, 3).text_frame.paragraphs[0].font.size = Pt(14)
                 table.cell(i+2, 4).text_frame.paragraphs[0].font.size = Pt(14)
 
-    content = os.path.join(TEMP_DIR, "MCI_net_correlation.png")
-    if os.path.exists(content):
+    content = render_stream("MCI_net_correlation.png")
+    if content is not None:
         slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
         slide = slide_title_header(slide, 'Market Composite Index')
 
@@ -154,8 +152,8 @@ def make_bci_slides(prs: Presentation) -> Presentation:
         else:
             return prs
 
-        content = os.path.join(TEMP_DIR, f"{file_key}_BCI.png")
-        if os.path.exists(content):
+        content = render_stream(f"{file_key}_BCI.png")
+        if content is not None:
 
             title = f"{file_key} Bond Composite Index"
             slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
@@ -167,8 +165,8 @@ def make_bci_slides(prs: Presentation) -> Presentation:
             width = Inches(10.5)
             slide.shapes.add_picture(content, left, top, height=height, width=width)
 
-    content = os.path.join(TEMP_DIR, "combined_BCI.png")
-    if os.path.exists(content):
+    content = render_stream("combined_BCI.png")
+    if content is not None:
 
         title = "Combined Bond Composite Indexes"
         slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
@@ -192,8 +190,8 @@ def make_cci_slides(prs) -> Presentation:
     Returns:
         pptx-object -- presentation object
     """
-    content = os.path.join(TEMP_DIR, "CCI_net_correlation.png")
-    if os.path.exists(content):
+    content = render_stream("CCI_net_correlation.png")
+    if content is not None:
 
         title = "Correlation Composite Index"
         slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
@@ -217,8 +215,8 @@ def make_tci_slides(prs: Presentation) -> Presentation:
     Returns:
         pptx-object -- pptx presentation object
     """
-    content = os.path.join(TEMP_DIR, "tci.png")
-    if os.path.exists(content):
+    content = render_stream("tci.png")
+    if content is not None:
 
         title = "Type Composite Index"
         slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
@@ -1,7 +1,5 @@
 """ Fund Slides """
 import os
-import glob
-import json
 from typing import Union
 
 import numpy as np
@@ -10,7 +8,7 @@ from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN # pylint: disable=no-name-in-module
 from pptx.presentation import Presentation
 
-from libs.utils import INDEXES
+from libs.utils import INDEXES, render_stream, rendered_plots, get_resources
 from libs.tools import trend_simple_forecast
 
 from .slide_utils import slide_title_header, COLOR_TO_RGB, pptx_ui_errors, get_locations
@@ -18,7 +16,6 @@ from .synopsis_slide import generate_synopsis_slide
 
 # Slide Layouts
 BLANK_SLIDE = 6
-TEMP_DIR = os.path.join("output", "temp")
 
 
 def make_fund_slides(prs: Presentation, analysis: dict, **kwargs) -> Presentation:
@@ -35,13 +32,23 @@ def make_fund_slides(prs: Presentation, analysis: dict, **kwargs) -> Presentatio
         prs -- pptx presentation object
     """
     views = kwargs.get('views', '')
+    slide_config = load_slide_config()
     funds = analysis.keys()
     for fund in funds:
         if fund != '_METRICS_':
-            prs = add_fund_content(prs, fund, analysis, views=views)
+            prs = add_fund_content(prs, fund, analysis, views=views, slide_config=slide_config)
     return prs
 
 
+def load_slide_config() -> Union[dict, None]:
+    """Load Slide Config
+
+    Returns:
+        dict -- content of fund_content_slides.json (None if the file is not found)
+    """
+    return get_resources().slide_layouts
+
+
 def add_fund_content(prs: Presentation, fund: str, analysis: dict, **kwargs) -> Presentation:
     """Add Fund Content
 
@@ -52,6 +59,7 @@ def add_fund_content(prs: Presentation, fund: str, analysis: dict, **kwargs) ->
 
     Optional Args:
         views {str} -- (default: {''})
+        slide_config {dict} -- content of fund_content_slides.json (default: {loaded from file})
 
     Returns:
         pptx-object -- modified pptx
@@ -61,7 +69,9 @@ def add_fund_content(prs: Presentation, fund: str, analysis: dict, **kwargs) ->
     if views is None:
         return prs
 
-    content_dir = os.path.join(TEMP_DIR, fund, views)
+    slide_config = kwargs.get('slide_config')
+    if slide_config is None:
+        slide_config = load_slide_config()
 
     # Title slide for a fund
     fund_name = INDEXES.get(fund, fund)
@@ -208,8 +218,8 @@ def add_fund_content(prs: Presentation, fund: str, analysis: dict, **kwargs) ->
 
     has_beta = True
 
-    content = os.path.join(content_dir, f"candlestick_{fund}.png")
-    if os.path.exists(content):
+    content = render_stream(os.path.join(fund, views, f"candlestick_{fund}.png"))
+    if content is not None:
         if has_beta:
             left = Inches(2.6)
         else:
@@ -238,43 +248,35 @@ def add_fund_content(prs: Presentation, fund: str, analysis: dict, **kwargs) ->
     slide = generate_synopsis_slide(slide, analysis, fund, views=views)
 
     indexes = []
-    m_file = os.path.join("libs", "ui_generation", "pptx_resources", "fund_content_slides.json")
-    if os.path.exists(m_file):
-        with open(m_file, 'r', encoding='utf-8') as mfl:
-            m_data = json.load(mfl)
-
+    if slide_config is not None:
         # Slides with 4 plots on each
-        num_quad_slides = m_data.get('info', {}).get('quad_slides', 0)
+        num_quad_slides = slide_config.get('info', {}).get('quad_slides', 0)
         for _ in range(num_quad_slides):
             slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
             slide = slide_title_header(slide, fund, price_details=price_str)
             indexes.append(len(prs.slides) - 1)
 
         # Slides with a single plot (and usually a table)
-        single_slides = m_data.get('info', {}).get('single_slides', 0)
+        single_slides = slide_config.get('info', {}).get('single_slides', 0)
         for _ in range(single_slides):
             slide = prs.slides.add_slide(prs.slide_layouts[BLANK_SLIDE])
             slide = slide_title_header(slide, fund, price_details=price_str)
             indexes.append(len(prs.slides)-1)
 
-    content = os.path.join(content_dir, '*.png')
-    pics = glob.glob(content)
-
-    content_dir2, _ = os.path.split(content_dir)
-    content2 = os.path.join(content_dir2, '*.png')
-    pics2 = glob.glob(content2)
-    pics.extend(pics2)
+    # Plots of the view, then of the fund as a whole (e.g. grades)
+    plots = list(rendered_plots(os.path.join(fund, views)).items())
+    plots.extend(rendered_plots(fund).items())
 
     fund_analysis = analysis[fund]
     current_price = analysis[fund][views]['statistics']['current_price']
-    prs = format_plots(prs, indexes, pics,
-                       fund_analysis=fund_analysis, views=views, current_price=current_price)
+    prs = format_plots(prs, indexes, plots, fund_analysis=fund_analysis, views=views,
+                       current_price=current_price, slide_config=slide_config)
     return prs
 
 
 def format_plots(prs: Presentation,
                  slide_indices: list,
-                 globs: list,
+                 plots: list,
                  fund_analysis: Union[dict, None] = None,
                  **kwargs) -> Presentation:
     """Format Plots
@@ -282,7 +284,7 @@ def format_plots(prs: Presentation,
     Arguments:
         prs {pptx-object} -- entire presentation
         slide_indices {list} -- fund-specific slide numbers in a list for referencing
-        globs {list} -- plot file path list
+        plots {list} -- (plot id, render filename) of each rendered plot (see rendered_plots)
 
     Keyword Arguments:
         fund_analysis {dict} -- fund data object (default: {{}})
@@ -290,6 +292,7 @@ def format_plots(prs: Presentation,
     Optional Args:
         views {str} -- (default: {''})
         current_price {float} -- (default: {None})
+        slide_config {dict} -- content of fund_content_slides.json (default: {None})
 
     Returns:
         pptx-object -- filled in slides with content
@@ -298,23 +301,17 @@ def format_plots(prs: Presentation,
     if not fund_analysis:
         fund_analysis = {}
 
-    if len(globs) == 0:
+    if len(plots) == 0:
         for ind in slide_indices:
             pptx_ui_errors(prs.slides[ind], "No plot files available.")
         return prs
 
-    content_file = os.path.join(
-        "libs", "ui_generation", "pptx_resources", "fund_content_slides.json")
-
-    if not os.path.exists(content_file):
+    slide_config = kwargs.get('slide_config')
+    if slide_config is None:
         for ind in slide_indices:
             pptx_ui_errors(prs.slides[ind], "File 'fund_content_slides.json' not found.")
         return prs
 
-    slide_config = {}
-    with open(content_file, 'r', encoding='utf-8') as c_file:
-        slide_config = json.load(c_file)
-
     views = kwargs.get('views', '')
     current_price = kwargs.get('current_price')
 
@@ -322,12 +319,8 @@ def format_plots(prs: Presentation,
     tables = slide_config.get('tables', [])
     slide_content = slide_config.get('plots', {})
 
-    for picture in globs:
-
-        _, part = os.path.split(picture)
-        splits = part.split('_')
-        splits.pop(-1)
-        part = '_'.join(splits)
+    for part, render in plots:
+        picture = render_stream(render)
 
         if 'resist_support' in part and part in slide_content:
             details = slide_content.get(part, {})
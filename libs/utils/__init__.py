@@ -2,8 +2,14 @@
 from .startup import start_header, logo_renderer
 from .file_io import configure_temp_dir, remove_temp_dir, create_sub_temp_dir
 
-from .data import download_data, download_data_indexes, download_single_fund, download_data_all
+from .data import (
+    download_data, download_data_indexes, download_single_fund, download_data_all,
+    download_dividends
+)
 
+from .resources import (
+    ResourceRegistry, get_resources, use_resources, load_resources, RESOURCE_FILES
+)
 from .api import api_sector_match, api_sector_funds
 
 from .error_handler import has_critical_error
@@ -12,6 +18,11 @@ from .formatting import (
     index_extractor, fund_list_extractor, index_appender, dates_extractor_list, date_extractor,
     dates_convert_from_index
 )
+from .date_axis import DateAxis, date_axis, naive_dates
+
+from .render_registry import (
+    save_render, render_stream, rendered_plots, clear_renders, suppress_renders, renders_suppressed
+)
 
 from .plotting import (
     PlotType, generate_plot, volatility_factor_plot
@@ -21,7 +32,12 @@ from .plot_utils import (
     utils, candlesticks
 )
 
-from .progress_bar import ProgressBar, start_clock
+from .progress_bar import (
+    ProgressBar, ProgressReporter, configure_progress_bars, start_clock
+)
+from .profiler import (
+    Profiler, configure_profiler, profile_stage, profiled, write_profile_report
+)
 
 from .constants import (
     TEXT_COLOR_MAP, STANDARD_COLORS, LOGO_COLORS, TREND_COLORS, EXEMPT_METRICS, PRINT_CONSTANTS,
@@ -1,10 +1,9 @@
 """ API functions """
-import os
-import json
 from typing import Tuple, List, Union
 
 from .data import download_single_fund, download_data_indexes
 from .constants import STANDARD_COLORS
+from .resources import get_resources
 
 
 WARNING = STANDARD_COLORS["warning"]
@@ -35,25 +34,23 @@ def api_sector_match(sector: str,
     period = kwargs.get('period', config['period'])
     interval = kwargs.get('interval', config['interval'])
 
-    sector_match_file = os.path.join("resources", "sectors.json")
-    if not os.path.exists(sector_match_file):
-        print(f"{WARNING}Warning: sector file '{sector_match_file}' not found.{NORMAL}")
+    resources = get_resources()
+    if not resources.has('sectors'):
+        print(f"{WARNING}Warning: sector file '{resources.file('sectors')}' not found.{NORMAL}")
         return None, None
 
-    with open(sector_match_file, encoding='utf-8') as f_sector:
-        matcher = json.load(f_sector)
-        matched_sector_str = matcher.get("Sector", {}).get(sector)
-        if matched_sector_str is None:
-            return None, None
+    matched_sector_str = resources.sector_match.get(sector)
+    if matched_sector_str is None:
+        return None, None
 
-        # To save downloads, if the matched items are already in the ticker list, simply use them
-        tickers = config.get('tickers', '').split(' ')
-        if matched_sector_str in tickers:
-            return matched_sector_str, {}
+    # To save downloads, if the matched items are already in the ticker list, simply use them
+    tickers = config.get('tickers', '').split(' ')
+    if matched_sector_str in tickers:
+        return matched_sector_str, {}
 
-        fund_data = download_single_fund(
-            matched_sector_str, config, period=period, interval=interval, fund_len=fund_len)
-        return matched_sector_str, fund_data
+    fund_data = download_single_fund(
+        matched_sector_str, config, period=period, interval=interval, fund_len=fund_len)
+    return matched_sector_str, fund_data
 
 
 def api_sector_funds(sector_fund: str, fund_len=None, **kwargs) -> Tuple[List[str], dict]:
@@ -75,23 +72,21 @@ def api_sector_funds(sector_fund: str, fund_len=None, **kwargs) -> Tuple[List[st
     period = kwargs.get('period', '2y')
     interval = kwargs.get('interval', '1d')
 
-    sector_match_file = os.path.join("resources", "sectors.json")
-    if not os.path.exists(sector_match_file):
+    resources = get_resources()
+    if not resources.has('sectors'):
         print(
-            f"{WARNING}Warning: sector file '{sector_match_file}' not found.{NORMAL}")
+            f"{WARNING}Warning: sector file '{resources.file('sectors')}' not found.{NORMAL}")
         return [], {}
 
     if sector_fund is None:
         return [], {}
 
-    with open(sector_match_file, encoding='utf-8') as sector_file:
-        matcher = json.load(sector_file)
-        matched = matcher.get("Comparison", {}).get(sector_fund)
-
-        if matched is None:
-            return [], {}
+    matched = resources.sector_comparison.get(sector_fund)
+    if matched is None:
+        return [], {}
 
-        tickers = ' '.join(matched)
-        fund_data, _ = download_data_indexes(
-            indexes=matched, tickers=tickers, fund_len=fund_len, period=period, interval=interval)
-        return matched, fund_data
+    matched = list(matched)
+    tickers = ' '.join(matched)
+    fund_data, _ = download_data_indexes(
+        indexes=matched, tickers=tickers, fund_len=fund_len, period=period, interval=interval)
+    return matched, fund_data
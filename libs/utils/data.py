@@ -8,6 +8,7 @@ import yfinance as yf
 
 from .formatting import fund_list_extractor
 from .constants import STANDARD_COLORS
+from .profiler import profiled
 
 TICKER = STANDARD_COLORS["ticker"]
 NORMAL = STANDARD_COLORS["normal"]
@@ -21,10 +22,42 @@ interval : str
     Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
 """
 
-
+# Bars built from daily history rather than downloaded
+RESAMPLE_RULES = {
+    '1wk': {'rule': 'W-MON', 'closed': 'left', 'label': 'left'},
+    '1mo': {'rule': 'MS'},
+    '3mo': {'rule': 'QS'}
+}
+RESAMPLE_FIELDS = {
+    'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Adj Close': 'last',
+    'Volume': 'sum'
+}
+
+# yfinance only serves a limited history for intraday intervals
+INTRADAY_MAX_PERIOD = {
+    '1m': '5d', '2m': '1mo', '5m': '1mo', '15m': '1mo', '30m': '1mo', '60m': '1y', '90m': '1mo',
+    '1h': '1y'
+}
+
+PERIOD_SPANS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10)
+}
+PERIOD_SESSIONS = {'1d': 1, '5d': 5}
+
+
+@profiled('download')
 def download_data_all(config: dict, **kwargs) -> Tuple[dict, list, list, dict]:
     """Download data (for functions)
 
+    Each base interval (daily or intraday) is downloaded once, for the longest period requested.
+    Shorter periods are sliced from it; weekly/monthly bars are resampled from the daily history.
+
     Arguments:
         config {dict} -- full information dictionary of entire run
 
@@ -35,6 +68,7 @@ def download_data_all(config: dict, **kwargs) -> Tuple[dict, list, list, dict]:
     Returns:
         Tuple[dict, list, list, dict] -- downloaded data, list of funds, periods, config
     """
+    # pylint: disable=too-many-locals
     periods = list(config.get('period', ['2y']))
     interval = config.get('interval', ['1d'])
     tickers = config['tickers']
@@ -48,30 +82,140 @@ def download_data_all(config: dict, **kwargs) -> Tuple[dict, list, list, dict]:
             interval.append('1d')
         config['interval'] = interval
 
-    dataset = {}
-    funds = []
+    downloads = {}
     for i, per in enumerate(periods):
-        inter = interval[i]
+        base = base_interval(interval[i])
+        limit = INTRADAY_MAX_PERIOD.get(base)
+        if (limit is not None) and (period_days(per) > period_days(limit)):
+            print(
+                f"{NOTE}Note: {base} intervals are limited to {limit} " +
+                f"of history ({per} requested).{NORMAL}")
+            per = limit
+        if (base not in downloads) or (period_days(per) > period_days(downloads[base])):
+            downloads[base] = per
+
+    store = {}
+    funds = []
+    for base, per in downloads.items():
         if (start is not None) and (end is not None):
             print(
                 f'Fetching data for {TICKER}{ticker_print}{NORMAL} from dates {start} to {end}...')
-            data = yf.download(tickers=tickers, period=per, interval=inter,
+            data = yf.download(tickers=tickers, period=per, interval=base,
                                group_by='ticker', start=start, end=end)
 
         else:
             print(
                 f'Fetching data for {TICKER}{ticker_print}{NORMAL} ' +
-                f'for {per} at {inter} intervals...')
-            data = yf.download(tickers=tickers, period=per, interval=inter, group_by='ticker')
+                f'for {per} at {base} intervals...')
+            data = yf.download(tickers=tickers, period=per, interval=base, group_by='ticker')
 
         print(" ")
         funds = fund_list_extractor(data, config=config)
-        data = data_format(data, config=config)
+        store[base] = data
+
+    dataset = {}
+    for i, per in enumerate(periods):
+        data = store[base_interval(interval[i])]
+        if (start is None) or (end is None):
+            data = slice_period(data, per)
+        if interval[i] in RESAMPLE_RULES:
+            data = resample_ohlcv(data, interval[i])
 
-        dataset[per] = data
+        dataset[per] = data_format(data, config=config)
     return dataset, funds, periods, config
 
 
+def base_interval(interval: str) -> str:
+    """Base Interval
+
+    Arguments:
+        interval {str} -- requested bar interval
+
+    Returns:
+        str -- interval that is actually downloaded for 'interval'
+    """
+    if interval in RESAMPLE_RULES:
+        return '1d'
+    return interval
+
+
+def period_days(period: str) -> float:
+    """Period Days
+
+    Arguments:
+        period {str} -- yfinance period string
+
+    Returns:
+        float -- approximate calendar days spanned by 'period' (for ranking periods)
+    """
+    today = pd.Timestamp.now().normalize()
+    if period == 'max':
+        return np.inf
+    if period == 'ytd':
+        return float((today - today.replace(month=1, day=1)).days)
+    if period in PERIOD_SESSIONS:
+        return float(PERIOD_SESSIONS[period])
+    return float((today - (today - PERIOD_SPANS[period])).days)
+
+
+def slice_period(data: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Slice Period
+
+    Cuts a longer download down to 'period', counted back from its last bar
+
+    Arguments:
+        data {pd.DataFrame} -- downloaded history (any interval)
+        period {str} -- yfinance period string
+
+    Returns:
+        pd.DataFrame -- history of the last 'period'
+    """
+    if (period == 'max') or (len(data.index) == 0):
+        return data
+
+    last = data.index[-1].normalize()
+    if period in PERIOD_SESSIONS:
+        sessions = data.index.normalize().unique()
+        start = sessions[max(len(sessions) - PERIOD_SESSIONS[period], 0)]
+    elif period == 'ytd':
+        start = last.replace(month=1, day=1)
+    else:
+        start = last - PERIOD_SPANS[period]
+
+    return data[data.index >= start]
+
+
+def resample_ohlcv(data: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Resample OHLCV
+
+    Builds bars of 'interval' (e.g. '1wk', '1mo') from daily bars of one or more funds
+
+    Arguments:
+        data {pd.DataFrame} -- daily history, single fund or 'group_by=ticker' multi-level columns
+        interval {str} -- key of RESAMPLE_RULES
+
+    Returns:
+        pd.DataFrame -- resampled history, in the same column layout
+    """
+    rule = RESAMPLE_RULES[interval]
+    fields = {}
+    for column in data.columns:
+        field = column[-1] if isinstance(column, tuple) else column
+        if field in RESAMPLE_FIELDS:
+            fields.setdefault(RESAMPLE_FIELDS[field], []).append(column)
+
+    resampled = pd.concat([
+        getattr(data[columns].resample(
+            rule['rule'], closed=rule.get('closed'), label=rule.get('label')), how)()
+        for how, columns in fields.items()
+    ], axis=1)
+    resampled = resampled[[column for column in data.columns if column in resampled.columns]]
+
+    # Periods without a single trade (e.g. holiday weeks) are dropped rather than zero-volume bars
+    return resampled[resampled[fields['last']].notna().any(axis=1)]
+
+
+@profiled('download')
 def download_data_indexes(indexes: list, tickers: str, **kwargs) -> Tuple[dict, list]:
     """Download Data Indexes
 
@@ -109,6 +253,49 @@ def download_data_indexes(indexes: list, tickers: str, **kwargs) -> Tuple[dict,
     return data, indexes
 
 
+@profiled('download')
+def download_dividends(funds: list, **kwargs) -> dict:
+    """Download Dividends
+
+    Cash dividends of all of the funds in a single download
+
+    Arguments:
+        funds {list} -- list of funds
+
+    Optional Args:
+        period {str} -- (default: {'2y'})
+        start {str} -- date (default: {None})
+        end {str} -- date (default: {None})
+
+    Returns:
+        dict -- dividends per share (pd.Series by ex-date) by fund
+    """
+    period = kwargs.get('period', '2y')
+    start = kwargs.get('start')
+    end = kwargs.get('end')
+
+    if (start is not None) and (end is not None):
+        data = yf.download(tickers=' '.join(funds), start=start, end=end, interval='1d',
+                           group_by='ticker', actions=True)
+    else:
+        data = yf.download(tickers=' '.join(funds), period=period, interval='1d',
+                           group_by='ticker', actions=True)
+
+    dividends = {}
+    for fund in funds:
+        if isinstance(data.columns, pd.MultiIndex):
+            if fund not in data.columns.get_level_values(0):
+                continue
+            fund_divs = data[fund].get('Dividends')
+        else:
+            fund_divs = data.get('Dividends')
+        if fund_divs is not None:
+            fund_divs = fund_divs.fillna(0.0)
+            dividends[fund] = fund_divs[fund_divs != 0.0]
+    return dividends
+
+
+@profiled('download')
 def download_data(config: dict, **kwargs) -> Tuple[dict, list]:
     """Download data (for functions)
 
@@ -159,6 +346,7 @@ def download_data(config: dict, **kwargs) -> Tuple[dict, list]:
     return data, funds
 
 
+@profiled('download')
 def download_single_fund(fund: str, config: dict, fund_len=None, **kwargs) -> dict:
     """Download Single Fund (api, etc.)
 
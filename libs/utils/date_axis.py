@@ -0,0 +1,88 @@
+""" date axis of a dataset, converted once and shared by tools, plots and exporters """
+import weakref
+from datetime import datetime
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+
+class DateAxis():
+    """DateAxis
+
+    The calendar dates (time of day and timezone dropped, as date_extractor) of a dataset's index
+    in each of the forms the tools, plots and exporters use. Each form is converted on first use
+    and kept; lists and arrays returned are shared by every caller, so callers copy them rather
+    than modify them.
+    """
+
+    def __init__(self, index: pd.Index):
+        self._dates = naive_dates(index).normalize()  # pylint: disable=no-member
+        self._forms = {}
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def _cached(self, key: str, compute):
+        if key not in self._forms:
+            self._forms[key] = compute()
+        return self._forms[key]
+
+    @property
+    def values(self) -> np.ndarray:
+        """ datetime64[D] dates """
+        return self._cached('values', lambda: self._dates.values.astype('datetime64[D]'))
+
+    @property
+    def strings(self) -> List[str]:
+        """ '%Y-%m-%d' dates (as date_extractor(_format='str')) """
+        return self._cached('strings', lambda: np.datetime_as_string(self.values).tolist())
+
+    @property
+    def datetimes(self) -> List[datetime]:
+        """ datetime dates at midnight (as dates_extractor_list) """
+        return self._cached('datetimes', lambda: list(self._dates.to_pydatetime()))
+
+
+def naive_dates(index: pd.Index) -> pd.DatetimeIndex:
+    """Naive Dates
+
+    Arguments:
+        index {pd.Index} -- dates, tz-aware or not
+
+    Returns:
+        pd.DatetimeIndex -- the dates without their timezone (local, exchange times, as the str()
+                            of a tz-aware timestamp gives)
+    """
+    dates = pd.DatetimeIndex(index)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+    return dates
+
+
+_AXES = {}
+
+
+def date_axis(data: Union[pd.DataFrame, pd.Series, pd.Index]) -> DateAxis:
+    """Date Axis
+
+    The DateAxis of a dataset's index, shared by every caller with the same index object (and
+    dropped when that index is garbage collected).
+
+    Arguments:
+        data {pd.DataFrame, pd.Series, pd.Index} -- dataset with dates as the 'index' (or index)
+
+    Returns:
+        DateAxis -- cached dates of the index
+    """
+    index = data if isinstance(data, pd.Index) else data.index
+    key = id(index)
+    entry = _AXES.get(key)
+    if entry is not None:
+        ref, length, axis = entry
+        if ref() is index and length == len(index):
+            return axis
+
+    axis = DateAxis(index)
+    _AXES[key] = (weakref.ref(index, lambda _: _AXES.pop(key, None)), len(index), axis)
+    return axis
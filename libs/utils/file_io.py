@@ -3,6 +3,8 @@ import os
 import shutil
 from typing import Union
 
+from .render_registry import clear_renders
+
 
 def configure_temp_dir():
     """ Configure Temporary Directory """
@@ -15,7 +17,8 @@ def configure_temp_dir():
 
 
 def remove_temp_dir():
-    """ Remove Temporary Directory """
+    """ Remove Temporary Directory (and the plots rendered into it) """
+    clear_renders()
     out_path = os.path.join("output", "temp")
     if os.path.exists(out_path):
         shutil.rmtree(out_path)
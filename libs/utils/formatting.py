@@ -2,6 +2,8 @@
 from datetime import datetime
 import pandas as pd
 
+from .date_axis import date_axis
+
 
 def index_extractor(tickers) -> str:
     """ tickers is a str of tickers, separated by a space """
@@ -59,19 +61,9 @@ def dates_extractor_list(data_frame: pd.DataFrame) -> list:
     Returns:
         list -- list of dates separated '%Y-%m-%d' or indexes (for a list)
     """
-    dates = []
     if isinstance(data_frame, list):
-        for i in range(len(data_frame)):
-            dates.append(i)
-
-    else:
-        for date_item in data_frame.index:
-            date = str(date_item)
-            date = date.split(' ', maxsplit=1)[0]
-            date = datetime.strptime(date, '%Y-%m-%d')
-            dates.append(date)
-
-    return dates
+        return list(range(len(data_frame)))
+    return list(date_axis(data_frame).datetimes)
 
 
 def date_extractor(date, _format=None):
@@ -120,13 +112,8 @@ def dates_convert_from_index(data_frame: pd.DataFrame, list_of_xlists: list, to_
     """
     new_l_of_xls = []
     if len(list_of_xlists) > 0:
+        dates = date_axis(data_frame).strings if to_str else data_frame.index
         for xlist in list_of_xlists:
-            new_xlist = []
-            for x_val in xlist:
-                if to_str:
-                    date = data_frame.index[x_val].strftime("%Y-%m-%d")
-                else:
-                    date = data_frame.index[x_val]
-                new_xlist.append(date)
+            new_xlist = [dates[x_val] for x_val in xlist]
             new_l_of_xls.append(new_xlist)
     return new_l_of_xls
@@ -4,6 +4,7 @@ import os
 from pandas.plotting import register_matplotlib_converters
 import matplotlib.pyplot as plt
 
+from ..render_registry import save_render
 from .utils import plot_xaxis_disperse, WARNING, NORMAL
 
 def bar_chart(data: list, **kwargs):
@@ -100,10 +101,7 @@ def bar_chart(data: list, **kwargs):
                 plt.clf()
                 return
 
-            filename = os.path.join(temp_path, filename)
-            if os.path.exists(filename):
-                os.remove(filename)
-            plt.savefig(filename)
+            save_render(filename)
 
         else:
             plt.show()
@@ -9,6 +9,7 @@ from pandas.plotting import register_matplotlib_converters
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
+from ..render_registry import save_render, renders_suppressed
 from .utils import plot_xaxis_disperse, WARNING, NORMAL
 
 
@@ -40,6 +41,8 @@ def candlestick_plot(data: pd.DataFrame, **kwargs):
         None
     """
     # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    if renders_suppressed():
+        return
     register_matplotlib_converters()
 
     title = kwargs.get('title', '')
@@ -162,10 +165,7 @@ def candlestick_plot(data: pd.DataFrame, **kwargs):
                 plt.clf()
                 return
 
-            filename = os.path.join(temp_path, filename)
-            if os.path.exists(filename):
-                os.remove(filename)
-            plt.savefig(filename)
+            save_render(filename)
 
         else:
             plt.show()
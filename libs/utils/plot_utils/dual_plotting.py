@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 
 from libs.utils import dates_extractor_list
 
+from ..render_registry import save_render
 from .utils import plot_xaxis_disperse, WARNING, NORMAL, is_data_list
 
 
@@ -145,17 +146,13 @@ def dual_plotting(y_list_1: list, y_list_2: list, y1_label: str, y2_label: str,
     try:
         if save_fig:
             temp_path = os.path.join("output", "temp")
-            filename = os.path.join(temp_path, filename)
-
             if not os.path.exists(temp_path):
                 # For functions, this directory may not exist.
                 plt.close(fig)
                 plt.clf()
                 return
 
-            if os.path.exists(filename):
-                os.remove(filename)
-            plt.savefig(filename, bbox_inches="tight")
+            save_render(filename, bbox_inches="tight")
 
         else:
             # Case of functions, show the plot and not save it.
@@ -7,6 +7,7 @@ import matplotlib.pyplot as plt
 
 from libs.utils import dates_extractor_list
 
+from ..render_registry import save_render
 from .utils import plot_xaxis_disperse, WARNING, NORMAL
 
 
@@ -106,11 +107,7 @@ def generic_plotting(list_of_plots: list, **kwargs):
                 plt.clf()
                 return None
 
-            filename = os.path.join(temp_path, filename)
-            if os.path.exists(filename):
-                os.remove(filename)
-
-            plt.savefig(filename)
+            save_render(filename)
 
         else:
             plt.show()
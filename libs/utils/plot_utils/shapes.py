@@ -9,6 +9,7 @@ from pandas.plotting import register_matplotlib_converters
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
+from ..render_registry import save_render
 from .utils import plot_xaxis_disperse, WARNING, NORMAL
 
 
@@ -119,11 +120,7 @@ def shape_plotting(main_plot: pd.DataFrame, **kwargs):
                 plt.clf()
                 return
 
-            filename = os.path.join(temp_path, filename)
-            if os.path.exists(filename):
-                os.remove(filename)
-
-            plt.savefig(filename)
+            save_render(filename)
 
         else:
             plt.show()
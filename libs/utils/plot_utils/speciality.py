@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 
 from libs.utils import dates_extractor_list
 
+from ..render_registry import save_render
 from .utils import plot_xaxis_disperse, WARNING, NORMAL
 
 
@@ -67,11 +68,7 @@ def specialty_plotting(list_of_plots: list, **kwargs):
                 plt.clf()
                 return
 
-            filename = os.path.join(temp_path, filename)
-            if os.path.exists(filename):
-                os.remove(filename)
-
-            plt.savefig(filename)
+            save_render(filename)
 
         else:
             plt.show()
@@ -14,6 +14,7 @@ from matplotlib.patches import Rectangle
 
 from intellistop import VFStopsResultType
 
+from .render_registry import save_render, renders_suppressed
 from .plot_utils import (
     bar_charting, candlesticks, utils, dual_plotting, generic, speciality, shapes
 )
@@ -56,6 +57,8 @@ def generate_plot(plot_type: PlotType, fund: pd.DataFrame, **kwargs):
     # save_fig = not plot_output
     # fund_name = kwargs.get('name', '')
     # view = kwargs.get('view', '')
+    if renders_suppressed():
+        return
     kwargs['save_fig'] = not kwargs.get('plot_output', False)
     FUNCTIONS.get(plot_type, {})(fund, **kwargs)
 
@@ -202,10 +205,7 @@ def volatility_factor_plot(prices: list, dates: list, vf_data: VFStopsResultType
                 plt.clf()
                 return
 
-            filename = os.path.join(temp_path, filename)
-            if os.path.exists(filename):
-                os.remove(filename)
-            plt.savefig(filename)
+            save_render(filename)
 
         else:
             plt.show()
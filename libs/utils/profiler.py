@@ -0,0 +1,252 @@
+""" per-stage timing and memory of a run (enabled with '--profile') """
+import os
+import sys
+import csv
+import json
+import time
+import cProfile
+import functools
+import contextlib
+from datetime import datetime
+from typing import Union
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is then not recorded
+    resource = None
+
+from .constants import STANDARD_COLORS
+
+NOTE = STANDARD_COLORS["warning"]
+NORMAL = STANDARD_COLORS["normal"]
+
+PROFILE_DIR = os.path.join("output", "profile")
+REPORT_FIELDS = ['kind', 'name', 'fund', 'period', 'parent', 'wall', 'cpu', 'peak_rss_mb',
+                 'rss_growth_mb']
+
+_NO_STAGE = contextlib.nullcontext()
+
+
+class Profiler():
+    """Profiler
+
+    Records the wall time, cpu time, and peak memory (RSS) of each stage of a run: downloads, tools
+    (by fund and period), indexes, and exporters. Stages may be nested; each record names its
+    parent stages. When disabled (the default), stages are a shared no-op context.
+    """
+
+    def __init__(self, enabled: bool = False, dumps: bool = False, directory: str = PROFILE_DIR):
+        self.enabled = enabled
+        self.dumps = dumps
+        self.directory = directory
+        self.records = []
+        self._stack = []
+        self._dumping = False
+
+    def stage(self, kind: str, name: str, fund: Union[str, None] = None,
+              period: Union[str, None] = None):
+        """Stage
+
+        Arguments:
+            kind {str} -- 'download', 'tool', 'index', 'export', etc.
+            name {str} -- name of the stage, e.g. 'rsi'
+
+        Keyword Arguments:
+            fund {str} -- fund the stage is run on (default: {None})
+            period {str} -- period of the fund (default: {None})
+
+        Returns:
+            context manager -- timed context of the stage
+        """
+        if not self.enabled:
+            return _NO_STAGE
+        return self._record(kind, name, fund, period)
+
+    @contextlib.contextmanager
+    def _record(self, kind: str, name: str, fund: Union[str, None], period: Union[str, None]):
+        record = {
+            'kind': kind, 'name': name, 'fund': fund, 'period': period,
+            'parent': '/'.join(self._stack)
+        }
+        # Records are kept in the order the stages start
+        self.records.append(record)
+        self._stack.append(name)
+
+        # Only one cProfile profiler can be active, so nested stages fall under the outermost
+        profile = None
+        if self.dumps and not self._dumping:
+            profile = cProfile.Profile()
+            self._dumping = True
+
+        rss_start = peak_rss_mb()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if profile is not None:
+            profile.enable()
+
+        try:
+            yield
+
+        finally:
+            if profile is not None:
+                profile.disable()
+                self._dumping = False
+
+            record['wall'] = time.perf_counter() - wall
+            record['cpu'] = time.process_time() - cpu
+            record['peak_rss_mb'] = peak_rss_mb()
+            record['rss_growth_mb'] = None
+            if rss_start is not None:
+                record['rss_growth_mb'] = record['peak_rss_mb'] - rss_start
+            self._stack.pop()
+
+            if profile is not None:
+                self._dump(profile, len(self.records) - 1, record)
+
+    def _dump(self, profile: cProfile.Profile, index: int, record: dict):
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        parts = [f"{index:04d}", record['kind'], record['name'], record['fund'], record['period']]
+        filename = '_'.join(str(part).replace('^', '') for part in parts if part is not None)
+        profile.dump_stats(os.path.join(self.directory, f"{filename}.prof"))
+
+    def summary(self) -> list:
+        """Summary
+
+        Returns:
+            list -- total wall and cpu time of each (kind, name) stage, slowest first
+        """
+        totals = {}
+        for record in self.records:
+            if 'wall' not in record:
+                continue
+            total = totals.setdefault(
+                (record['kind'], record['name']),
+                {'kind': record['kind'], 'name': record['name'], 'calls': 0, 'wall': 0.0,
+                 'cpu': 0.0})
+            total['calls'] += 1
+            total['wall'] += record['wall']
+            total['cpu'] += record['cpu']
+        return sorted(totals.values(), key=lambda total: total['wall'], reverse=True)
+
+    def write_report(self, top: int = 10) -> Union[str, None]:
+        """Write Report
+
+        Writes the records and summary as JSON and the records as CSV to the profile directory
+        and prints the slowest stages
+
+        Keyword Arguments:
+            top {int} -- slowest stages printed (default: {10})
+
+        Returns:
+            str -- path of the JSON report (None if disabled or nothing was recorded)
+        """
+        if not self.enabled or len(self.records) == 0:
+            return None
+
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = os.path.join(self.directory, f"profile_{stamp}")
+
+        summary = self.summary()
+        content = {
+            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'summary': summary,
+            'records': self.records
+        }
+        with open(f"{filename}.json", 'w', encoding='utf-8') as report_file:
+            json.dump(content, report_file, indent=4)
+
+        with open(f"{filename}.csv", 'w', encoding='utf-8', newline='') as report_file:
+            writer = csv.DictWriter(report_file, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+
+        print(f"\r\n{NOTE}Profile (slowest stages):{NORMAL}")
+        for total in summary[:top]:
+            print(f"  {total['kind']:>8} {total['name']:<30} {total['calls']:>4}x " +
+                  f"{total['wall']:9.3f}s wall {total['cpu']:9.3f}s cpu")
+        print(f"Profile written to '{filename}.json' / '.csv'.")
+        return f"{filename}.json"
+
+
+def peak_rss_mb() -> Union[float, None]:
+    """ peak resident memory of the process so far, in MB (None where unavailable) """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / (1024.0 * 1024.0)
+    return peak / 1024.0
+
+
+_PROFILER = Profiler()
+
+
+def configure_profiler(config: dict) -> Profiler:
+    """Configure Profiler
+
+    Enables profiling with the '--profile' tag (or '--cprofile', which adds a cProfile dump of
+    each stage) or the 'Profile' property of a core.json-like file:
+    {"Profile": {"run": true, "dumps": false}}
+
+    Arguments:
+        config {dict} -- controlling config dictionary
+
+    Returns:
+        Profiler -- the run's profiler
+    """
+    # pylint: disable=global-statement
+    global _PROFILER
+    props = config.get('properties', {}).get('Profile', {})
+    state = config.get('state', '')
+    _PROFILER = Profiler(
+        enabled=('profile' in state) or props.get('run', False),
+        dumps=('profile_dump' in state) or props.get('dumps', False))
+    return _PROFILER
+
+
+def profile_stage(kind: str, name: str, fund: Union[str, None] = None,
+                  period: Union[str, None] = None):
+    """Profile Stage
+
+    Arguments:
+        kind {str} -- 'download', 'tool', 'index', 'export', etc.
+        name {str} -- name of the stage, e.g. 'rsi'
+
+    Keyword Arguments:
+        fund {str} -- fund the stage is run on (default: {None})
+        period {str} -- period of the fund (default: {None})
+
+    Returns:
+        context manager -- timed context of the stage (a no-op unless profiling is enabled)
+    """
+    return _PROFILER.stage(kind, name, fund=fund, period=period)
+
+
+def profiled(kind: str):
+    """Profiled
+
+    Decorator profiling each call of a function as a stage named after the function (with its
+    'period' keyword argument, if any)
+
+    Arguments:
+        kind {str} -- 'download', 'tool', 'index', 'export', etc.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _PROFILER.enabled:
+                return function(*args, **kwargs)
+            with _PROFILER.stage(kind, function.__name__, period=kwargs.get('period')):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def write_profile_report() -> Union[str, None]:
+    """ writes the run's profile report (see Profiler.write_report) if profiling is enabled """
+    return _PROFILER.write_report()
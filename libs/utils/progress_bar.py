@@ -2,7 +2,7 @@
 ProgressBar utility class
 """
 import time
-import numpy as np
+import queue
 
 from .constants import TEXT_COLOR_MAP, STANDARD_COLORS
 
@@ -12,13 +12,22 @@ FUND_COLOR = TEXT_COLOR_MAP["cyan"]
 
 EFFECTIVE_TIME_START = 120
 
+# Shared by every ProgressBar (see configure_progress_bars)
+SETTINGS = {
+    'enabled': True,
+    # Most redraws per second of a bar; upticks in between are coalesced into the next redraw
+    'max_rate': 10.0
+}
+
 
 class ProgressBar():
     """ProgressBar
 
-    Useful class to track progress of a function or analysis set
+    Useful class to track progress of a function or analysis set. Redraws are rate-limited (see
+    configure_progress_bars); start, end, and reaching the total always redraw. Bars created
+    while progress bars are disabled do nothing on start/update/uptick.
     """
-    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-instance-attributes,method-hidden
 
     def __init__(self, total_items: int, name: str = '',
                  stopwatch: bool = True, offset: float = None):
@@ -30,36 +39,86 @@ class ProgressBar():
         self.start_time = offset
         self.show_clock = stopwatch
         self.clock = self.start_time
+        self.enabled = SETTINGS['enabled']
+        self.min_interval = 1.0 / SETTINGS['max_rate'] if SETTINGS['max_rate'] > 0 else 0.0
+        self._last_draw = None
+
+        if not self.enabled:
+            # Headless runs: the per-call cost is a no-op call
+            self.start = self.update = self.uptick = _no_op
 
     def start(self):
         """ Kicks off class timer, etc. """
         if self.start_time is None:
             self.start_time = time.time()
-        self.print_progress_bar(self.iteration, self.total, obj=self.name)
+        self._draw(self.iteration, force=True)
 
     def update(self, iteration: int):
         """ Manual changing of the progress bar """
-        self.print_progress_bar(iteration, self.total, obj=self.name)
+        self._draw(iteration)
 
     def uptick(self, increment=1.0):
         """ Automatic updating of the progress bar """
         self.iteration += increment
-        self.print_progress_bar(self.iteration, self.total, obj=self.name)
+        self._draw(self.iteration)
 
     def end(self) -> float:
         """ Sets all progress to 100% and returns time of completion """
-        self.print_progress_bar(self.total, self.total, obj=self.name)
+        if self.enabled:
+            self._draw(self.total, force=True)
         return time.time()
 
     def interrupt(self, message: str = ''):
         """ Stops p-bar operation (not to 100%) and provides a message for stoppage """
-        clear_bar = ''
-        for _ in range(self.length_of_bar):
-            clear_bar += ' '
-        clear_bar += '\r'
-        print(clear_bar)
+        if self.enabled:
+            clear_bar = ''
+            for _ in range(self.length_of_bar):
+                clear_bar += ' '
+            clear_bar += '\r'
+            print(clear_bar)
         print(message)
 
+    def reporter(self, report_queue) -> 'ProgressReporter':
+        """Reporter
+
+        Arguments:
+            report_queue {queue} -- queue shared with worker processes (e.g. of a
+                                    multiprocessing.Manager)
+
+        Returns:
+            ProgressReporter -- stand-in for this bar in workers (see drain)
+        """
+        return ProgressReporter(report_queue)
+
+    def drain(self, report_queue):
+        """Drain
+
+        Applies every increment its reporters have queued so far as a single uptick
+
+        Arguments:
+            report_queue {queue} -- queue of the reporters
+        """
+        increment = 0.0
+        while True:
+            try:
+                increment += report_queue.get_nowait()
+            except queue.Empty:
+                break
+        if increment > 0.0:
+            self.uptick(increment=increment)
+
+    def _draw(self, iteration: float, force: bool = False):
+        if self.start_time is None:
+            self.start_time = time.time()
+
+        now = time.monotonic()
+        if not force and (iteration < self.total) and (self._last_draw is not None) and \
+                (now - self._last_draw < self.min_interval):
+            return
+
+        self._last_draw = now
+        self.print_progress_bar(iteration, self.total, obj=self.name)
+
     # Print iterations progress - courtesy of Greenstick (stackoverflow:
     # https://stackoverflow.com/questions/3173320/text-progress-bar-in-the-console)
 
@@ -102,8 +161,7 @@ class ProgressBar():
 
         stopwatch = ""
         if self.show_clock:
-            self.clock = np.round(
-                time.time() - self.start_time, 0)
+            self.clock = float(round(time.time() - self.start_time))
 
             num_spaces = EFFECTIVE_TIME_START - effective_length
             stopwatch = " " * num_spaces
@@ -126,6 +184,40 @@ class ProgressBar():
             print('')
 
 
+class ProgressReporter():
+    """ProgressReporter
+
+    Picklable stand-in for a ProgressBar in worker processes: upticks are put on a queue that the
+    parent's ProgressBar applies with drain()
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, report_queue):
+        self.queue = report_queue
+
+    def uptick(self, increment=1.0):
+        """ Queues an increment for the parent's progress bar """
+        self.queue.put(increment)
+
+
+def configure_progress_bars(enabled: bool = True, max_rate: float = 10.0):
+    """Configure Progress Bars
+
+    Applies to progress bars created afterwards
+
+    Keyword Arguments:
+        enabled {bool} -- False for headless runs; bars print nothing (default: {True})
+        max_rate {float} -- most redraws per second of a bar (0 redraws on every update)
+                            (default: {10.0})
+    """
+    SETTINGS['enabled'] = enabled
+    SETTINGS['max_rate'] = max_rate
+
+
 def start_clock() -> float:
     """ Wrapper function for time keeping """
     return time.time()
+
+
+def _no_op(*_args, **_kwargs):
+    return None
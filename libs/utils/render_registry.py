@@ -0,0 +1,107 @@
+""" rendered plots (encoded PNGs) of a run, kept in memory for the exporters """
+import io
+import os
+import contextlib
+from typing import Dict, Union
+
+import matplotlib.pyplot as plt
+
+# Encoded images by filename (relative to output/temp, as the plots' 'filename'), in render order
+_RENDERS = {}
+_STATE = {'suppressed': False}
+
+
+def render_key(filename: str) -> str:
+    """Render Key
+
+    Arguments:
+        filename {str} -- plot filename, relative to output/temp (an extension-less name is a PNG,
+                          as plt.savefig would save it)
+
+    Returns:
+        str -- normalized key of the render
+    """
+    filename = os.path.normpath(filename)
+    if os.path.splitext(filename)[1] == '':
+        filename = f"{filename}.png"
+    return filename
+
+
+def save_render(filename: str, **kwargs):
+    """Save Render
+
+    Encodes the current figure as a PNG and keeps it (replacing any earlier render of filename)
+
+    Arguments:
+        filename {str} -- plot filename, relative to output/temp
+
+    Optional Args:
+        All plt.savefig keyword arguments (e.g. bbox_inches)
+    """
+    stream = io.BytesIO()
+    plt.savefig(stream, format='png', **kwargs)
+    key = render_key(filename)
+    _RENDERS.pop(key, None)
+    _RENDERS[key] = stream.getvalue()
+
+
+def render_stream(filename: str) -> Union[io.BytesIO, None]:
+    """Render Stream
+
+    Arguments:
+        filename {str} -- plot filename, relative to output/temp
+
+    Returns:
+        io.BytesIO -- the encoded image (None if filename was not rendered)
+    """
+    image = _RENDERS.get(render_key(filename))
+    if image is None:
+        return None
+    return io.BytesIO(image)
+
+
+def rendered_plots(directory: str) -> Dict[str, str]:
+    """Rendered Plots
+
+    Renders directly within a directory, by plot id: the filename without its extension and its
+    last '_' part (the fund name), e.g. 'RSI_standard' of 'SPY/2y/RSI_standard_SPY.png'
+
+    Arguments:
+        directory {str} -- directory relative to output/temp, e.g. os.path.join(fund, view)
+
+    Returns:
+        Dict[str, str] -- render keys by plot id, in render order
+    """
+    directory = os.path.normpath(directory)
+    plots = {}
+    for key in _RENDERS:
+        path, name = os.path.split(key)
+        if os.path.normpath(path) == directory:
+            plot_id = '_'.join(os.path.splitext(name)[0].split('_')[:-1])
+            plots[plot_id] = key
+    return plots
+
+
+def clear_renders():
+    """ drops every render """
+    _RENDERS.clear()
+
+
+def renders_suppressed() -> bool:
+    """ whether plots are skipped (see suppress_renders) """
+    return _STATE['suppressed']
+
+
+@contextlib.contextmanager
+def suppress_renders():
+    """Suppress Renders
+
+    Context in which generate_plot (and candlestick_plot) return without building a figure, e.g.
+    when only the tools' signals are needed
+    """
+    previous = _STATE['suppressed']
+    _STATE['suppressed'] = True
+    try:
+        yield
+    finally:
+        _STATE['suppressed'] = previous
@@ -0,0 +1,188 @@
+""" resource files of a run (sectors, trendline config, slide layouts), parsed once and shared """
+import os
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, Union
+
+# Resource name -> file (relative to the working directory, as the run's other files)
+RESOURCE_FILES = {
+    'sectors': os.path.join("resources", "sectors.json"),
+    'config': os.path.join("resources", "config.json"),
+    'slide_layouts': os.path.join(
+        "libs", "ui_generation", "pptx_resources", "fund_content_slides.json")
+}
+
+
+class ResourceRegistry():
+    """ResourceRegistry
+
+    Read-only views of the run's resource files. Each file is parsed on first use and kept;
+    mappings are MappingProxyType and lists are tuples, so every caller shares (and cannot modify)
+    the same content. A registry pickles as its parsed content, so it can be handed to worker
+    processes without re-reading the files.
+    """
+
+    def __init__(self, files: Union[dict, None] = None, contents: Union[dict, None] = None):
+        """ResourceRegistry
+
+        Keyword Arguments:
+            files {dict} -- resource name -> file, replacing those of RESOURCE_FILES
+                            (default: {None})
+            contents {dict} -- resource name -> parsed content, used instead of reading the file
+                               (e.g. in tests) (default: {None})
+        """
+        self._files = dict(RESOURCE_FILES)
+        self._files.update(files or {})
+        self._raw = {}
+        self._views = {}
+        for name, content in (contents or {}).items():
+            self._set(name, content)
+
+    def __reduce__(self):
+        for name in self._files:
+            self.resource(name)
+        return (ResourceRegistry, (self._files, self._raw))
+
+    def _set(self, name: str, content: Any):
+        self._raw[name] = content
+        self._views[name] = _freeze(content)
+
+    def resource(self, name: str) -> Union[Mapping, None]:
+        """Resource
+
+        Arguments:
+            name {str} -- resource name, e.g. 'sectors'
+
+        Returns:
+            Mapping -- read-only content of the resource (None if its file is not found)
+        """
+        if name not in self._views:
+            content = None
+            path = self._files.get(name)
+            if path is not None and os.path.exists(path):
+                with open(path, 'r', encoding='utf-8') as r_file:
+                    content = json.load(r_file)
+            self._set(name, content)
+        return self._views[name]
+
+    def has(self, name: str) -> bool:
+        """ whether the resource was found """
+        return self.resource(name) is not None
+
+    def file(self, name: str) -> Union[str, None]:
+        """ file of the resource (for messages) """
+        return self._files.get(name)
+
+    def sectors(self, section: str) -> Union[Mapping, None]:
+        """Sectors
+
+        Arguments:
+            section {str} -- section of sectors.json, e.g. 'Market_Composite'
+
+        Returns:
+            Mapping -- read-only section (None if sectors.json or the section is not found)
+        """
+        content = self.resource('sectors')
+        if content is None:
+            return None
+        return content.get(section)
+
+    @property
+    def sector_match(self) -> Mapping:
+        """ sector name -> sector fund """
+        return self.sectors('Sector') or MappingProxyType({})
+
+    @property
+    def sector_comparison(self) -> Mapping:
+        """ sector fund -> comparable funds """
+        return self.sectors('Comparison') or MappingProxyType({})
+
+    @property
+    def bond_weights(self) -> Union[Mapping, None]:
+        """ bond type -> {fund: weight} """
+        return self.sectors('Bond_Weight')
+
+    @property
+    def correlation(self) -> Union[Mapping, None]:
+        """ correlation composite index funds ('tickers', 'start') """
+        return self.sectors('Correlation')
+
+    @property
+    def market_composite(self) -> Union[Mapping, None]:
+        """ market composite index funds ('tickers') """
+        return self.sectors('Market_Composite')
+
+    @property
+    def type_composite(self) -> Union[Mapping, None]:
+        """ type composite index funds ('Components') and their weights by type """
+        return self.sectors('Type_Composite')
+
+    @property
+    def trendline_divisors(self) -> Union[Mapping, None]:
+        """ trendline regression divisors ('ranges', 'divisors') of config.json """
+        content = self.resource('config')
+        if content is None:
+            return None
+        return content.get('trendlines', {}).get('divisors', MappingProxyType({}))
+
+    @property
+    def slide_layouts(self) -> Union[Mapping, None]:
+        """ fund content slide layouts (fund_content_slides.json) """
+        return self.resource('slide_layouts')
+
+
+def _freeze(content: Any) -> Any:
+    if isinstance(content, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in content.items()})
+    if isinstance(content, list):
+        return tuple(_freeze(value) for value in content)
+    return content
+
+
+_REGISTRY = None
+
+
+def get_resources() -> ResourceRegistry:
+    """Get Resources
+
+    Returns:
+        ResourceRegistry -- the process' registry (created on first use)
+    """
+    # pylint: disable=global-statement
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = ResourceRegistry()
+    return _REGISTRY
+
+
+def use_resources(registry: Union[ResourceRegistry, None] = None) -> ResourceRegistry:
+    """Use Resources
+
+    Replaces the process' registry, e.g. with one of injected contents (tests) or one passed to a
+    worker process
+
+    Keyword Arguments:
+        registry {ResourceRegistry} -- registry to use (default: {None}, a new one read from the
+                                       files)
+
+    Returns:
+        ResourceRegistry -- the process' registry
+    """
+    # pylint: disable=global-statement
+    global _REGISTRY
+    _REGISTRY = registry if registry is not None else ResourceRegistry()
+    return _REGISTRY
+
+
+def load_resources() -> ResourceRegistry:
+    """Load Resources
+
+    Parses every resource file of a fresh registry (at the start of a run)
+
+    Returns:
+        ResourceRegistry -- the process' registry
+    """
+    registry = use_resources()
+    for name in RESOURCE_FILES:
+        registry.resource(name)
+    return registry
@@ -323,6 +323,15 @@ def header_options_parse(input_str: str, config: dict) -> list:
     if '--debug' in i_keys:
         config = add_str_to_dict_key(config, 'state', 'debug')
 
+    if '--profile' in i_keys:
+        config = add_str_to_dict_key(config, 'state', 'profile')
+
+    if '--cprofile' in i_keys:
+        config = add_str_to_dict_key(config, 'state', 'profile_dump')
+
+    if '--quiet' in i_keys:
+        config = add_str_to_dict_key(config, 'state', 'quiet')
+
     # Exporting of data from metadata.json to dataframe-like file
     if '--export' in i_keys:
         config = add_str_to_dict_key(config, 'state', 'function run')
@@ -583,6 +592,19 @@ def header_options_parse(input_str: str, config: dict) -> list:
             config, 'run_functions', 'last_signals', type_='list')
         config['tickers'] = ' '.join(ticker_keys)
 
+    if ('--screen' in i_keys) or ('--screener' in i_keys):
+        config = add_str_to_dict_key(
+            config, 'run_functions', 'screen', type_='list')
+        if ticker_keys:
+            # Otherwise the universe is the tickers of '--core' (or '--test')
+            config['tickers'] = ' '.join(ticker_keys)
+
+    if '--sweep' in i_keys:
+        config = add_str_to_dict_key(
+            config, 'run_functions', 'sweep', type_='list')
+        if ticker_keys:
+            config['tickers'] = ' '.join(ticker_keys)
+
     if ('--function' in i_keys) or ('--f' in i_keys):
         config = add_str_to_dict_key(config, 'state', 'function run')
         return config, ticker_keys
@@ -4,7 +4,7 @@ from libs.ui_generation import output_to_json
 from libs.ui_generation import create_pdf
 
 from libs.metrics import metadata_to_dataset
-from libs.utils import remove_temp_dir
+from libs.utils import remove_temp_dir, profile_stage
 
 
 def run_exports(analysis: dict, script: list):
@@ -18,10 +18,14 @@ def run_exports(analysis: dict, script: list):
     """
     config = script[3]
 
-    create_slides(analysis, config=config)
-    output_to_json(analysis, config)
-    create_pdf(analysis, config=config)
+    with profile_stage('export', 'pptx'):
+        create_slides(analysis, config=config)
+    with profile_stage('export', 'json'):
+        output_to_json(analysis, config)
+    with profile_stage('export', 'pdf'):
+        create_pdf(analysis, config=config)
 
-    metadata_to_dataset(config=config)
+    with profile_stage('export', 'metadata_dataset'):
+        metadata_to_dataset(config=config)
 
     remove_temp_dir()
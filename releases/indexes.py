@@ -1,10 +1,43 @@
 """ Custom Indexes """
-from typing import Tuple
+from typing import Tuple, Union
 
 from libs.metrics import market_composite_index
 from libs.metrics import bond_composite_index
 from libs.metrics import correlation_composite_index
 from libs.metrics import type_composite_index
+from libs.metrics import sector_analysis
+from libs.utils import profile_stage
+from libs.metrics.market_composite_index import metrics_initializer as mci_initializer
+from libs.metrics.correlation_index import metrics_initializer as cci_initializer
+from libs.metrics.type_composite_index import (
+    metrics_initializer as tci_initializer, get_metrics_content
+)
+
+
+def sector_datasets(config: dict) -> Tuple[Union[dict, None], Union[list, None]]:
+    """Sector Datasets
+
+    Downloads the sector funds once for MCI, CCI, and TCI, for the first of them enabled (in the
+    order that they are run) with that index's time period.
+
+    Arguments:
+        config {dict} -- controlling config dictionary
+
+    Returns:
+        list -- data downloaded, sector list (None, None if no sector index is enabled)
+    """
+    props = config.get('properties', {}).get('Indexes', {})
+
+    if props.get('Market Sector'):
+        return mci_initializer(period=config['period'])
+
+    if props.get('Correlation', {}).get('run', False):
+        return cci_initializer(props['Correlation'].get('type', 'long'))
+
+    if props.get('Type Sector'):
+        return tci_initializer(get_metrics_content(), period='2y')
+
+    return None, None
 
 
 def run_indexes(analysis: dict, script: list, clock=None) -> Tuple[dict, float]:
@@ -24,16 +57,32 @@ def run_indexes(analysis: dict, script: list, clock=None) -> Tuple[dict, float]:
     """
     config = script[3]
 
+    # Sector funds are downloaded and their oscillators clustered once for MCI, CCI, and TCI
+    with profile_stage('download', 'sector_datasets'):
+        data, sectors = sector_datasets(config)
+    clusters = None
+    props = config.get('properties', {}).get('Indexes', {})
+    if data and (props.get('Market Sector') or props.get('Type Sector')):
+        with profile_stage('index', 'sector_analysis'):
+            clusters = sector_analysis(data, sectors, clock=clock)
+
     analysis['_METRICS_'] = {}
-    analysis['_METRICS_']['mci'], data, sectors = market_composite_index(
-        config=config, plot_output=False, clock=clock)
+    with profile_stage('index', 'mci'):
+        analysis['_METRICS_']['mci'], _, _ = market_composite_index(
+            config=config, plot_output=False, clock=clock, data=data, sectors=sectors,
+            clusters=clusters)
 
-    bond_composite_index(config=config, plot_output=False, clock=clock)
+    with profile_stage('index', 'bci'):
+        analysis['_METRICS_']['bci'] = bond_composite_index(
+            config=config, plot_output=False, clock=clock)
 
-    analysis['_METRICS_']['correlation'], data, sectors = correlation_composite_index(
-        config=config, plot_output=False, clock=clock, data=data, sectors=sectors)
+    with profile_stage('index', 'correlation'):
+        analysis['_METRICS_']['correlation'], _, _ = correlation_composite_index(
+            config=config, plot_output=False, clock=clock, data=data, sectors=sectors)
 
-    analysis['_METRICS_']['tci'], data, sectors = type_composite_index(
-        config=config, plot_output=False, clock=clock, data=data, sectors=sectors)
+    with profile_stage('index', 'tci'):
+        analysis['_METRICS_']['tci'], _, _ = type_composite_index(
+            config=config, plot_output=False, clock=clock, data=data, sectors=sectors,
+            clusters=clusters)
 
     return analysis, clock
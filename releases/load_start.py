@@ -3,7 +3,7 @@ from typing import Tuple, Union, List
 
 from libs.utils import (
     download_data_all, has_critical_error, index_appender, remove_temp_dir, configure_temp_dir,
-    TEXT_COLOR_MAP
+    configure_profiler, configure_progress_bars, load_resources, TEXT_COLOR_MAP
 )
 from libs.functions import only_functions_handler
 
@@ -29,11 +29,16 @@ def init_script(config: dict) -> Tuple[
     if config['state'] == 'halt':
         return None, None, None, None
 
+    configure_progress_bars(enabled='quiet' not in config['state'])
+    load_resources()
+
     if 'function' in config['state']:
         # If only simple functions are desired, they go into this handler
         only_functions_handler(config)
         return None, None, None, None
 
+    configure_profiler(config)
+
     if 'no_index' not in config['state']:
         config['tickers'] = index_appender(config['tickers'])
         config['process_steps'] = config['process_steps'] + 2
@@ -12,13 +12,14 @@
 #   detection (Head and Shoulders, Pennants).
 #
 """
+import functools
 from typing import Tuple
 
 # Imports that are custom tools that are the crux of this program
 from libs.tools import (
     full_stochastic, ultimate_oscillator, cluster_oscillators, relative_strength_indicator_rsi,
-    awesome_oscillator, momentum_oscillator, relative_strength, moving_average_swing_trade,
-    triple_moving_average, triple_exp_mov_average, hull_moving_average,
+    awesome_oscillator, momentum_oscillator, relative_strength, relative_strength_matrices,
+    moving_average_swing_trade, triple_moving_average, triple_exp_mov_average, hull_moving_average,
     mov_avg_convergence_divergence, on_balance_volume, demand_index, find_resistance_support_lines,
     get_trend_lines, get_high_level_stats, bear_bull_power, total_power, bollinger_bands,
     commodity_channel_index, candlesticks, risk_comparison, rate_of_change_oscillator,
@@ -30,7 +31,7 @@ from libs.features import feature_detection_head_and_shoulders, analyze_price_ga
 
 # Imports that are generic file/string/object/date utility functions
 from libs.utils import (
-    date_extractor, create_sub_temp_dir, INDEXES, SKIP_INDEXES, ProgressBar, start_clock
+    date_axis, create_sub_temp_dir, INDEXES, SKIP_INDEXES, ProgressBar, start_clock, profile_stage
 )
 
 # Imports that drive custom metrics for market analysis
@@ -60,6 +61,14 @@ def run_prod(script: list) -> Tuple[dict, float]:
     analysis = {}
     clock = start_clock()
 
+    # Ratios of every fund vs. the S&P500, computed once per period for all of the funds
+    strength_matrices = {period: {} for period in periods}
+    if 'no_index' not in config['state']:
+        run_funds = [fund_name for fund_name in funds if fund_name not in SKIP_INDEXES]
+        for period in periods:
+            strength_matrices[period] = relative_strength_matrices(
+                dataset[period], run_funds, ['^GSPC'])
+
     for fund_name in funds:
 
         if fund_name in SKIP_INDEXES:
@@ -72,19 +81,21 @@ def run_prod(script: list) -> Tuple[dict, float]:
 
         analysis[fund_name] = {}
 
-        analysis[fund_name]['metadata'] = get_api_metadata(
-            fund_name,
-            max_close=max(dataset[periods[0]][fund_name]['Close']),
-            data=dataset[periods[0]][fund_name])
+        with profile_stage('download', 'metadata', fund=fund_name):
+            analysis[fund_name]['metadata'] = get_api_metadata(
+                fund_name,
+                max_close=max(dataset[periods[0]][fund_name]['Close']),
+                data=dataset[periods[0]][fund_name])
 
         ###################### START OF PERIOD LOOPING #############################
         for i, period in enumerate(periods):
             fund_data = {}
 
             fund = dataset[period][fund_name]
+            stage = functools.partial(profile_stage, 'tool', fund=fund_name, period=period)
 
-            start = date_extractor(fund.index[0], _format='str')
-            end = date_extractor(fund.index[-1], _format='str')
+            start = date_axis(fund).strings[0]
+            end = date_axis(fund).strings[-1]
             fund_data['dates_covered'] = {
                 'start': str(start), 'end': str(end)}
             fund_data['name'] = fund_name
@@ -93,144 +104,179 @@ def run_prod(script: list) -> Tuple[dict, float]:
             prog_bar = ProgressBar(config['process_steps'], name=fund_print2, offset=clock)
             prog_bar.start()
 
-            fund_data['statistics'] = get_high_level_stats(fund)
+            with stage('statistics'):
+                fund_data['statistics'] = get_high_level_stats(fund)
 
-            fund_data['clustered_osc'] = cluster_oscillators(
-                fund,
-                function='all',
-                filter_thresh=3,
-                name=fund_name,
-                plot_output=False,
-                progress_bar=prog_bar,
-                view=period)
+            with stage('clustered_osc'):
+                fund_data['clustered_osc'] = cluster_oscillators(
+                    fund,
+                    function='all',
+                    filter_thresh=3,
+                    name=fund_name,
+                    plot_output=False,
+                    progress_bar=prog_bar,
+                    view=period)
 
-            fund_data['full_stochastic'] = full_stochastic(
-                fund, name=fund_name, plot_output=False,
-                out_suppress=False, progress_bar=prog_bar, view=period)
+            with stage('full_stochastic'):
+                fund_data['full_stochastic'] = full_stochastic(
+                    fund, name=fund_name, plot_output=False,
+                    out_suppress=False, progress_bar=prog_bar, view=period)
 
-            fund_data['rsi'] = relative_strength_indicator_rsi(
-                fund, name=fund_name, plot_output=False,
-                out_suppress=False, progress_bar=prog_bar, view=period)
+            with stage('rsi'):
+                fund_data['rsi'] = relative_strength_indicator_rsi(
+                    fund, name=fund_name, plot_output=False,
+                    out_suppress=False, progress_bar=prog_bar, view=period)
 
-            fund_data['ultimate'] = ultimate_oscillator(
-                fund, name=fund_name, plot_output=False,
-                out_suppress=False, progress_bar=prog_bar, view=period)
+            with stage('ultimate'):
+                fund_data['ultimate'] = ultimate_oscillator(
+                    fund, name=fund_name, plot_output=False,
+                    out_suppress=False, progress_bar=prog_bar, view=period)
 
-            fund_data['awesome'] = awesome_oscillator(
-                fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
+            with stage('awesome'):
+                fund_data['awesome'] = awesome_oscillator(
+                    fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
 
-            fund_data['momentum_oscillator'] = momentum_oscillator(
-                fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
+            with stage('momentum_oscillator'):
+                fund_data['momentum_oscillator'] = momentum_oscillator(
+                    fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
 
-            fund_data['on_balance_volume'] = on_balance_volume(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('on_balance_volume'):
+                fund_data['on_balance_volume'] = on_balance_volume(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['simple_moving_average'] = triple_moving_average(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('simple_moving_average'):
+                fund_data['simple_moving_average'] = triple_moving_average(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['exp_moving_average'] = triple_exp_mov_average(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('exp_moving_average'):
+                fund_data['exp_moving_average'] = triple_exp_mov_average(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['sma_swing_trade'] = moving_average_swing_trade(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('sma_swing_trade'):
+                fund_data['sma_swing_trade'] = moving_average_swing_trade(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['ema_swing_trade'] = moving_average_swing_trade(
-                fund, function='ema', plot_output=False,
-                name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('ema_swing_trade'):
+                fund_data['ema_swing_trade'] = moving_average_swing_trade(
+                    fund, function='ema', plot_output=False,
+                    name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['hull_moving_average'] = hull_moving_average(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('hull_moving_average'):
+                fund_data['hull_moving_average'] = hull_moving_average(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['macd'] = mov_avg_convergence_divergence(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('macd'):
+                fund_data['macd'] = mov_avg_convergence_divergence(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['bear_bull_power'] = bear_bull_power(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('bear_bull_power'):
+                fund_data['bear_bull_power'] = bear_bull_power(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['total_power'] = total_power(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('total_power'):
+                fund_data['total_power'] = total_power(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['bollinger_bands'] = bollinger_bands(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('bollinger_bands'):
+                fund_data['bollinger_bands'] = bollinger_bands(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['commodity_channels'] = commodity_channel_index(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('commodity_channels'):
+                fund_data['commodity_channels'] = commodity_channel_index(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['rate_of_change'] = rate_of_change_oscillator(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('rate_of_change'):
+                fund_data['rate_of_change'] = rate_of_change_oscillator(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['know_sure_thing'] = know_sure_thing(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('know_sure_thing'):
+                fund_data['know_sure_thing'] = know_sure_thing(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['average_true_range'] = average_true_range(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('average_true_range'):
+                fund_data['average_true_range'] = average_true_range(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['adx'] = average_directional_index(
-                fund, atr=fund_data['average_true_range']['tabular'], plot_output=False,
-                name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('adx'):
+                fund_data['adx'] = average_directional_index(
+                    fund, atr=fund_data['average_true_range']['tabular'], plot_output=False,
+                    name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['parabolic_sar'] = parabolic_sar(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('parabolic_sar'):
+                fund_data['parabolic_sar'] = parabolic_sar(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
-            fund_data['demand_index'] = demand_index(
-                fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
+            with stage('demand_index'):
+                fund_data['demand_index'] = demand_index(
+                    fund, plot_output=False, name=fund_name, progress_bar=prog_bar, view=period)
 
             if 'no_index' not in config['state']:
-                strength, match_data = relative_strength(
-                    fund_name,
-                    full_data_dict=dataset[period],
-                    config=config,
-                    plot_output=False,
-                    meta=analysis[fund_name]['metadata'],
-                    progress_bar=prog_bar,
-                    period=period,
-                    interval=config['interval'][i],
-                    view=period
-                )
-                fund_data['relative_strength'] = strength
-
-                fund_data['statistics']['risk_ratios'] = risk_comparison(
-                    fund, dataset[period]['^GSPC'], dataset[period]['^IRX'],
-                    sector_data=match_data)
+                with stage('relative_strength'):
+                    strength, match_data = relative_strength(
+                        fund_name,
+                        full_data_dict=dataset[period],
+                        config=config,
+                        plot_output=False,
+                        meta=analysis[fund_name]['metadata'],
+                        progress_bar=prog_bar,
+                        period=period,
+                        interval=config['interval'][i],
+                        view=period,
+                        strength_matrix=strength_matrices[period].get(fund_name)
+                    )
+                    fund_data['relative_strength'] = strength
+
+                with stage('risk_ratios'):
+                    fund_data['statistics']['risk_ratios'] = risk_comparison(
+                        fund, dataset[period]['^GSPC'], dataset[period]['^IRX'],
+                        sector_data=match_data)
                 prog_bar.uptick()
 
             # Support and Resistance Analysis
-            fund_data['support_resistance'] = find_resistance_support_lines(
-                fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
+            with stage('support_resistance'):
+                fund_data['support_resistance'] = find_resistance_support_lines(
+                    fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
 
             # Feature Detection Block
             fund_data['features'] = {}
-            fund_data['features']['head_shoulders'] = feature_detection_head_and_shoulders(
-                fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
+            with stage('head_shoulders'):
+                fund_data['features']['head_shoulders'] = feature_detection_head_and_shoulders(
+                    fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
 
-            fund_data['candlesticks'] = candlesticks(
-                fund, name=fund_name, plot_output=False, view=period, progress_bar=prog_bar)
+            with stage('candlesticks'):
+                fund_data['candlesticks'] = candlesticks(
+                    fund, name=fund_name, plot_output=False, view=period, progress_bar=prog_bar)
 
-            fund_data['price_gaps'] = analyze_price_gaps(
-                fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
+            with stage('price_gaps'):
+                fund_data['price_gaps'] = analyze_price_gaps(
+                    fund, name=fund_name, plot_output=False, progress_bar=prog_bar, view=period)
 
             # Get Trendlines
-            fund_data['trendlines'] = get_trend_lines(
-                fund,
-                name=fund_name,
-                plot_output=False,
-                progress_bar=prog_bar,
-                view=period,
-                meta=analysis[fund_name]['metadata'])
+            with stage('trendlines'):
+                fund_data['trendlines'] = get_trend_lines(
+                    fund,
+                    name=fund_name,
+                    plot_output=False,
+                    progress_bar=prog_bar,
+                    view=period,
+                    meta=analysis[fund_name]['metadata'])
 
             # Various Fund-specific Metrics
-            fund_data['futures'] = future_returns(fund, progress_bar=prog_bar)
+            with stage('futures'):
+                fund_data['futures'] = future_returns(fund, progress_bar=prog_bar)
 
             # Parse through indicators and pull out latest signals (must be last)
-            fund_data['last_signals'] = assemble_last_signals(
-                fund_data, fund=fund, name=fund_name, view=period,
-                progress_bar=prog_bar, plot_output=False)
+            with stage('last_signals'):
+                fund_data['last_signals'] = assemble_last_signals(
+                    fund_data, fund=fund, name=fund_name, view=period,
+                    progress_bar=prog_bar, plot_output=False)
 
             prog_bar.end()
 
             analysis[fund_name][period] = fund_data
 
-        analysis[fund_name]['synopsis'] = generate_synopsis(
-            analysis, name=fund_name)
+        with profile_stage('tool', 'synopsis', fund=fund_name):
+            analysis[fund_name]['synopsis'] = generate_synopsis(
+                analysis, name=fund_name)
 
     return analysis, clock
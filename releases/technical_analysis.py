@@ -15,7 +15,7 @@
 from typing import Union
 
 # Imports from libraries
-from libs.utils import start_clock
+from libs.utils import start_clock, write_profile_report
 
 # Imports from releases
 from .load_start import init_script
@@ -48,6 +48,7 @@ def technical_analysis(config: dict) -> Union[float, None]:
     analysis, clock = run_prod(script)
     analysis, clock = run_indexes(analysis, script, clock=clock)
     run_exports(analysis, script)
+    write_profile_report()
 
     return clock
 